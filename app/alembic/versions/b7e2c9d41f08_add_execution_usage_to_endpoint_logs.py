@@ -0,0 +1,38 @@
+"""add_execution_usage_to_endpoint_logs
+
+Additive, non-destructive migration: records the upstream GPU execution time,
+queue delay, cold-start flag and main upstream attributed to each request.
+
+Revision ID: b7e2c9d41f08
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e2c9d41f08"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("endpoint_logs", sa.Column("gpu_seconds", sa.Float(), nullable=True))
+    op.add_column(
+        "endpoint_logs", sa.Column("queue_seconds", sa.Float(), nullable=True)
+    )
+    op.add_column("endpoint_logs", sa.Column("cold_start", sa.Boolean(), nullable=True))
+    op.add_column("endpoint_logs", sa.Column("upstream", sa.String(), nullable=True))
+    op.create_index(
+        op.f("ix_endpoint_logs_upstream"), "endpoint_logs", ["upstream"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_endpoint_logs_upstream"), table_name="endpoint_logs")
+    op.drop_column("endpoint_logs", "upstream")
+    op.drop_column("endpoint_logs", "cold_start")
+    op.drop_column("endpoint_logs", "queue_seconds")
+    op.drop_column("endpoint_logs", "gpu_seconds")
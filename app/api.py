@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -14,21 +15,26 @@ from slowapi.middleware import SlowAPIMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.core.config import settings
 from app.core.exceptions import (
     APIException,
     api_exception_handler,
     validation_exception_handler,
 )
 from app.docs import description, tags_metadata
+from app.integrations.runpod import close_runpod_clients
+from app.integrations.runpod_webhooks import get_completion_hub
 from app.middleware import MonitoringMiddleware
 from app.routers import admin_billing
 from app.routers.admin_analytics import router as admin_analytics_router
+from app.routers.admin_keep_warm import router as admin_keep_warm_router
 from app.routers.audio import router as audio_router
 from app.routers.auth import router as auth_router
 from app.routers.chat import router as chat_router
 from app.routers.dashboard import router as dashboard_router
 from app.routers.google_analytics import router as google_analytics_router
 from app.routers.inference import router as inference_router
+from app.routers.jobs import router as jobs_router
 from app.routers.language import router as language_router
 from app.routers.orpheus_tts import router as orpheus_tts_router
 from app.routers.runpod_tts import router as runpod_tts_router
@@ -39,7 +45,11 @@ from app.routers.translation import router as translation_router
 from app.routers.tts import router as modal_tts_router
 from app.routers.upload import router as upload_router
 from app.routers.webhooks import router as webhooks_router
+from app.services.audio_worker import close_audio_worker
+from app.services.modal_stt_service import close_modal_stt_service
 from app.services.redis_client import init_redis_client
+from app.services.transcription_job_service import close_transcription_job_service
+from app.services.tts_service import close_tts_service
 from app.utils.rate_limit import limiter
 
 load_dotenv()
@@ -74,7 +84,11 @@ class LargeUploadMiddleware(BaseHTTPMiddleware):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application startup event")
-    await init_redis_client()  # Fails open: logs and returns None on failure.
+    redis = await init_redis_client()  # Fails open: returns None on failure.
+
+    if settings.runpod_webhook_url:
+        # Relay RunPod completion callbacks between instances over Redis.
+        get_completion_hub().start(redis)
 
     try:
         from app.services.orpheus_tts_service import get_orpheus_tts_service
@@ -83,8 +97,37 @@ async def lifespan(app: FastAPI):
     except Exception as e:  # noqa: BLE001
         logger.warning(f"Orpheus speakers warm-up failed: {e}")
 
+    try:
+        from app.utils.token_budget import get_tokenizer
+
+        # Load the Sunflower tokenizer off the event loop so the first chat
+        # request does not pay for it.
+        await asyncio.to_thread(get_tokenizer)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Sunflower tokenizer warm-up failed: {e}")
+
+    keep_warm = None
+    if settings.keep_warm_enabled:
+        try:
+            from app.services.keep_warm_service import get_keep_warm_scheduler
+
+            keep_warm = get_keep_warm_scheduler()
+            keep_warm.start()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Keep-warm scheduler failed to start: {e}")
+
     yield
 
+    if keep_warm is not None:
+        await keep_warm.stop()
+
+    await close_transcription_job_service()
+    await get_completion_hub().stop()
+    await close_runpod_clients()
+    await close_modal_stt_service()
+    await close_tts_service()
+    close_audio_worker()
+
 
 app = FastAPI(
     title="Sunbird AI API",
@@ -170,6 +213,7 @@ app.include_router(auth_router, prefix="/auth", tags=["Authentication Endpoints"
 # Task endpoints
 app.include_router(stt_router, prefix="/tasks", tags=["legacy/deprecated"])
 app.include_router(audio_router, prefix="/tasks")
+app.include_router(jobs_router, prefix="/tasks")
 app.include_router(translation_router, prefix="/tasks", tags=["Translation"])
 app.include_router(language_router, prefix="/tasks", tags=["Language"])
 # NOTE: inference_router endpoints are all deprecated, so tags are set
@@ -210,6 +254,11 @@ app.include_router(
     prefix="/api/admin/analytics/billing",
     tags=["Admin Billing Analytics"],
 )
+app.include_router(
+    admin_keep_warm_router,
+    prefix="/api/admin/keep-warm",
+    tags=["Admin Keep-Warm"],
+)
 app.include_router(
     google_analytics_router,
     prefix="/api/admin/google-analytics",
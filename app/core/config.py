@@ -5,10 +5,11 @@ Centralized configuration management using Pydantic Settings.
 Supports environment variables and .env files.
 """
 
+import json
 from functools import lru_cache
 from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -41,12 +42,44 @@ class Settings(BaseSettings):
     request_timeout_seconds: int = Field(
         default=120, description="Timeout for TTS API requests in seconds"
     )
+    tts_max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Connection limit of the shared TTS API HTTP client.",
+    )
+    tts_max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        description="Idle keep-alive connections kept open to the TTS API.",
+    )
+    tts_keepalive_expiry_seconds: float = Field(
+        default=60.0,
+        description="Seconds an idle TTS API connection is kept open.",
+    )
+    tts_http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 with the TTS API (requires the h2 package).",
+    )
 
     # Modal STT Service Configuration
     modal_stt_api_url: str = Field(
         default="https://sb-modal-ws--asr-whisper-large-v3-salt-model-transcribe.modal.run",
         description="Modal Whisper ASR API URL for speech-to-text",
     )
+    modal_stt_max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Connection limit of the shared Modal STT HTTP client.",
+    )
+    modal_stt_max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        description="Idle keep-alive connections kept open to Modal STT.",
+    )
+    modal_stt_keepalive_expiry_seconds: float = Field(
+        default=60.0,
+        description="Seconds an idle Modal STT connection is kept open.",
+    )
     max_text_length: int = Field(
         default=10000, description="Maximum allowed text length for TTS"
     )
@@ -66,6 +99,22 @@ class Settings(BaseSettings):
     signed_url_expiry_minutes: int = Field(
         default=30, description="Expiry time for signed URLs in minutes"
     )
+    # Signed URL cache (see app/utils/url_signer.py)
+    signed_url_cache_max_entries: int = Field(
+        default=4096,
+        ge=0,
+        description="Signed GET URLs kept per process for reuse; 0 disables.",
+    )
+    signed_url_cache_margin_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Stop reusing a cached signed URL this long before it expires.",
+    )
+    signed_url_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Concurrent signing calls when signing a batch.",
+    )
 
     # Server Configuration
     host: str = Field(default="0.0.0.0", description="Server host")
@@ -313,6 +362,472 @@ class Settings(BaseSettings):
         ),
     )
 
+    # Sunflower prompt budgeting
+    sunflower_tokenizer_name: str = Field(
+        default="Sunbird/Sunflower-14B",
+        description=(
+            "Hugging Face repo whose tokenizer.json is used to count Sunflower "
+            "prompt tokens. Loaded lazily; a character heuristic is used when "
+            "the tokenizer cannot be loaded."
+        ),
+    )
+    sunflower_context_window_tokens: int = Field(
+        default=8192,
+        ge=512,
+        description="Context window (prompt + completion) of the Sunflower deployment.",
+    )
+    sunflower_completion_reserve_tokens: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Tokens reserved for the completion when a request does not set "
+            "max_tokens. History is trimmed to fit the remaining budget."
+        ),
+    )
+    sunflower_min_prompt_tokens: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Prompt tokens always left available: a max_tokens close to the "
+            "context window is clamped instead of trimming away all history."
+        ),
+    )
+
+    # Sunflower adaptive timeouts and hedged requests
+    sunflower_api_base_url: str = Field(
+        default="https://api.runpod.ai/v2",
+        description=(
+            "Base URL for the RunPod serverless API; the OpenAI-compatible "
+            "route is {base}/{endpoint_id}/openai/v1. Override to point at a "
+            "local fake server in tests."
+        ),
+    )
+    sunflower_default_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description=(
+            "Per-request timeout used until enough latency samples exist; also "
+            "the upper bound for adaptive timeouts (covers cold starts)."
+        ),
+    )
+    sunflower_min_timeout_seconds: float = Field(
+        default=15.0,
+        gt=0,
+        description="Lower bound for adaptive per-request timeouts.",
+    )
+    sunflower_timeout_p99_multiplier: float = Field(
+        default=3.0,
+        ge=1.0,
+        description="Adaptive timeout = observed p99 latency x this multiplier.",
+    )
+    sunflower_latency_window: int = Field(
+        default=200,
+        ge=10,
+        description="Number of recent request latencies kept per endpoint.",
+    )
+    sunflower_latency_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description=("Samples required before adaptive timeouts and hedging kick in."),
+    )
+    sunflower_hedge_routes_raw: str = Field(
+        default="",
+        alias="SUNFLOWER_HEDGE_ROUTES",
+        description=(
+            "Comma-separated routes that send a hedged duplicate request once "
+            "the observed p95 latency has passed (e.g. 'chat_completions,"
+            "translate'). Hedging costs GPU time, so it is off by default."
+        ),
+    )
+    sunflower_hedge_min_delay_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Never hedge earlier than this, even when p95 is lower.",
+    )
+    chat_stream_coalesce_ms: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Merge streamed chat deltas into one SSE chunk per window (ms). "
+            "0 sends one chunk per upstream delta."
+        ),
+    )
+    chat_stream_coalesce_chars: int = Field(
+        default=256,
+        ge=1,
+        description="Flush a coalesced SSE chunk once this many characters are buffered.",
+    )
+
+    @property
+    def sunflower_hedge_routes(self) -> list[str]:
+        """Parsed list of routes with Sunflower request hedging enabled."""
+        return [
+            part.strip()
+            for part in self.sunflower_hedge_routes_raw.split(",")
+            if part.strip()
+        ]
+
+    # Per-upstream admission control (see app/services/upstream_limiter.py)
+    upstream_admission_enabled: bool = Field(
+        default=True,
+        description="Cap in-flight requests per upstream and queue by tier.",
+    )
+    upstream_default_max_in_flight: int = Field(
+        default=16,
+        ge=1,
+        description="Per-process in-flight cap for upstreams without an override.",
+    )
+    upstream_max_in_flight_raw: str = Field(
+        default="sunflower=32",
+        alias="UPSTREAM_MAX_IN_FLIGHT",
+        description=(
+            "Comma-separated name=limit overrides for the in-flight cap, e.g. "
+            "'sunflower=32,runpod_asr=8,modal_stt=8,orpheus=8'."
+        ),
+    )
+    upstream_queue_deadline_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description=(
+            "Longest a request may wait for an upstream slot. Requests whose "
+            "estimated wait exceeds this are shed with 503 and Retry-After."
+        ),
+    )
+
+    @property
+    def upstream_max_in_flight(self) -> dict[str, int]:
+        """Parsed per-upstream in-flight caps (malformed entries ignored)."""
+        limits: dict[str, int] = {}
+        for part in self.upstream_max_in_flight_raw.split(","):
+            name, _, value = part.partition("=")
+            name, value = name.strip(), value.strip()
+            if name and value.isdigit() and int(value) > 0:
+                limits[name] = int(value)
+        return limits
+
+    # Keep-warm scheduler for serverless endpoints (Sunflower, ASR, Orpheus)
+    keep_warm_enabled: bool = Field(
+        default=False,
+        description=(
+            "Run the in-app keep-warm scheduler that pings serverless endpoints "
+            "during business hours and after traffic. Costs idle GPU time."
+        ),
+    )
+    keep_warm_tick_seconds: int = Field(
+        default=30,
+        ge=5,
+        description="How often the scheduler re-evaluates endpoint policies.",
+    )
+    keep_warm_timezone: str = Field(
+        default="Africa/Kampala",
+        description="IANA timezone used to interpret keep-warm business hours.",
+    )
+    keep_warm_policies_raw: str = Field(
+        default="",
+        alias="KEEP_WARM_POLICIES",
+        description=(
+            "JSON object of per-endpoint policy overrides keyed by endpoint "
+            "name (sunflower, asr, orpheus), e.g. "
+            '\'{"orpheus": {"enabled": false}, "sunflower": '
+            '{"idle_gap_seconds": 120, "business_hours_end": 23}}\'.'
+        ),
+    )
+
+    @property
+    def keep_warm_policies(self) -> dict[str, dict]:
+        """Parsed per-endpoint keep-warm overrides (empty on invalid JSON)."""
+        if not self.keep_warm_policies_raw.strip():
+            return {}
+        try:
+            parsed = json.loads(self.keep_warm_policies_raw)
+        except ValueError:
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        return {k: v for k, v in parsed.items() if isinstance(v, dict)}
+
+    # Asynchronous job API (see app/services/transcription_job_service.py)
+    transcription_job_ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        ge=60,
+        description="How long finished transcription jobs can be fetched.",
+    )
+    transcription_job_memory_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description=(
+            "Job documents kept in process memory while Redis is unavailable; "
+            "the oldest are dropped first."
+        ),
+    )
+    transcription_job_callback_allow_private: bool = Field(
+        default=False,
+        description=(
+            "Allow job callback URLs that resolve to loopback, private or "
+            "link-local addresses. Local development only."
+        ),
+    )
+
+    # Transcription cache (see app/services/transcription_cache.py)
+    transcription_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse transcripts of audio that was already transcribed.",
+    )
+    transcription_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=60,
+        description="How long cached transcripts are kept in Redis.",
+    )
+    transcription_cache_local_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=0,
+        description="Size bound of each instance's in-process transcript cache.",
+    )
+
+    # Long-audio chunking (see app/services/chunked_transcription.py)
+    stt_chunking_enabled: bool = Field(
+        default=False,
+        description=(
+            "Transcribe long RunPod audio as parallel VAD-aligned chunks "
+            "instead of trimming it to MAX_AUDIO_DURATION_MINUTES. Each "
+            "recording can then cost up to STT_LONG_AUDIO_MAX_MINUTES of ASR."
+        ),
+    )
+    stt_chunking_min_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Audio longer than this is chunked (capped by the trim limit).",
+    )
+    stt_chunk_target_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Preferred chunk length; chunks are cut at the next pause.",
+    )
+    stt_chunk_max_seconds: float = Field(
+        default=180.0,
+        gt=0,
+        description=(
+            "Hard chunk length limit when no pause is found; at least "
+            "STT_CHUNK_TARGET_SECONDS."
+        ),
+    )
+    stt_chunk_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Chunks of one recording transcribed at the same time.",
+    )
+    stt_long_audio_max_minutes: int = Field(
+        default=180,
+        ge=1,
+        description="Chunked audio beyond this length is trimmed.",
+    )
+
+    # ASR input normalization (see app/utils/audio_normalize.py)
+    stt_normalize_audio: bool = Field(
+        default=False,
+        description="Re-encode uploads to 16 kHz mono before ASR upload.",
+    )
+    stt_normalize_codec: str = Field(
+        default="opus",
+        pattern="^(opus|flac)$",
+        description="Codec for normalized audio: opus or flac.",
+    )
+    stt_normalize_opus_bitrate: str = Field(
+        default="32k",
+        description="ffmpeg bitrate for normalized Opus audio.",
+    )
+    stt_normalize_max_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Concurrent ffmpeg normalization processes per worker.",
+    )
+
+    # Batch transcription (see app/services/transcription_batch_service.py)
+    stt_batch_max_items: int = Field(
+        default=1000,
+        ge=1,
+        description="Largest number of blobs accepted in one batch.",
+    )
+    stt_batch_default_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Items of a batch transcribed at once by default.",
+    )
+    stt_batch_max_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="Upper bound on a batch's requested concurrency.",
+    )
+
+    # Speech cache (see app/services/speech_cache.py)
+    tts_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse stored audio for identical speech requests.",
+    )
+    tts_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=60,
+        description="How long speech cache entries are kept in Redis; keep "
+        "below the audio bucket's lifecycle age.",
+    )
+
+    # Audio worker pool (see app/services/audio_worker.py)
+    audio_worker_processes: int = Field(
+        default=2,
+        ge=0,
+        description="Processes decoding/encoding audio per API worker; "
+        "0 runs audio jobs in threads instead.",
+    )
+    audio_worker_max_queue: int = Field(
+        default=32,
+        ge=1,
+        description="Audio jobs queued or running before new ones are "
+        "rejected with 503.",
+    )
+    audio_worker_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds a caller waits for one audio job.",
+    )
+
+    # Long-text speech chunking (see app/services/chunked_speech.py)
+    tts_chunking_enabled: bool = Field(
+        default=False,
+        description=(
+            "Synthesize long Modal texts as parallel sentence-aligned chunks "
+            "instead of one request. Chunks are joined with crossfades, so "
+            "prosody across sentence boundaries can differ from one request."
+        ),
+    )
+    tts_chunking_min_chars: int = Field(
+        default=400,
+        ge=1,
+        description="Texts longer than this are chunked.",
+    )
+    tts_chunk_max_chars: int = Field(
+        default=250,
+        ge=20,
+        description="Longest chunk; whole sentences are packed up to it.",
+    )
+    tts_chunk_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Chunk requests of one text in flight at the same time.",
+    )
+    tts_chunk_retries: int = Field(
+        default=1,
+        ge=0,
+        description="Retries of a chunk request that failed upstream.",
+    )
+    tts_chunk_crossfade_ms: float = Field(
+        default=40.0,
+        ge=0,
+        description="Crossfade between consecutive chunks' audio.",
+    )
+
+    # Streamed TTS uploads (see app/utils/storage.py)
+    tts_stream_upload_chunk_kb: int = Field(
+        default=256,
+        ge=256,
+        multiple_of=256,
+        description=(
+            "Resumable-upload chunk size for audio uploaded while it streams; "
+            "at most this much audio is held in memory."
+        ),
+    )
+
+    # RunPod completion webhooks (see app/integrations/runpod_webhooks.py)
+    runpod_webhook_url: str = Field(
+        default="",
+        description=(
+            "Public URL of POST /tasks/webhooks/runpod. When set together "
+            "with RUNPOD_WEBHOOK_SECRET, RunPod jobs are submitted with this "
+            "webhook and waiters are woken by the callback instead of "
+            "polling. Empty disables webhooks."
+        ),
+    )
+    runpod_webhook_secret: str = Field(
+        default="",
+        description=(
+            "Shared token appended to the webhook URL as its last path "
+            "segment and checked on every callback. RunPod does not sign "
+            "webhooks, so webhooks stay off and callbacks are refused "
+            "until this is set."
+        ),
+    )
+    runpod_webhook_grace_seconds: float = Field(
+        default=15.0,
+        ge=0.0,
+        description=(
+            "How long a waiter relies on the webhook alone before it falls "
+            "back to polling the job status (the webhook still wins if it "
+            "arrives later)."
+        ),
+    )
+
+    # Execution-cost attribution (see app/utils/execution_usage.py)
+    execution_cold_start_threshold_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        description=(
+            "Queue delay at or above which an upstream job is recorded as a "
+            "cold start in endpoint_logs."
+        ),
+    )
+    execution_default_cost_per_second: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "Fallback USD per GPU-second for upstreams without billing data "
+            "or an EXECUTION_COST_PER_SECOND entry (0 leaves them unpriced)."
+        ),
+    )
+    execution_cost_per_second_raw: str = Field(
+        default="",
+        alias="EXECUTION_COST_PER_SECOND",
+        description=(
+            "Comma-separated upstream=usd_per_second rates used when billing "
+            "analytics has no data for an upstream, e.g. "
+            "'modal_stt=0.00036,<runpod-endpoint-id>=0.00044'."
+        ),
+    )
+
+    execution_modal_apps_raw: str = Field(
+        default="",
+        alias="EXECUTION_MODAL_APPS",
+        description=(
+            "Comma-separated upstream=modal_app pairs mapping the upstream "
+            "names recorded in endpoint_logs to Modal billing apps (app id or "
+            "name), e.g. 'modal_stt=ap-123abc'. Mapped upstreams are priced "
+            "at the app's billed cost over their recorded GPU-seconds."
+        ),
+    )
+
+    @property
+    def execution_modal_apps(self) -> dict[str, str]:
+        """Parsed Modal app id/name -> recorded upstream name."""
+        apps: dict[str, str] = {}
+        for part in self.execution_modal_apps_raw.split(","):
+            upstream, _, app = part.partition("=")
+            if upstream.strip() and app.strip():
+                apps[app.strip()] = upstream.strip()
+        return apps
+
+    @property
+    def execution_cost_per_second(self) -> dict[str, float]:
+        """Parsed per-upstream GPU-second rates (malformed entries ignored)."""
+        rates: dict[str, float] = {}
+        for part in self.execution_cost_per_second_raw.split(","):
+            name, _, value = part.partition("=")
+            name = name.strip()
+            try:
+                rate = float(value)
+            except ValueError:
+                continue
+            if name and rate >= 0:
+                rates[name] = rate
+        return rates
+
     # Orpheus TTS Configuration (Modal-deployed vLLM inference)
     orpheus_modal_url: Optional[str] = Field(
         default=None,
@@ -358,6 +873,15 @@ class Settings(BaseSettings):
         description="Base sleep before a single retry on transient Modal errors.",
     )
 
+    @model_validator(mode="after")
+    def _check_stt_chunk_lengths(self) -> "Settings":
+        # plan_chunks cannot cut at a pause after the hard limit.
+        if self.stt_chunk_max_seconds < self.stt_chunk_target_seconds:
+            raise ValueError(
+                "STT_CHUNK_MAX_SECONDS must be at least STT_CHUNK_TARGET_SECONDS"
+            )
+        return self
+
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
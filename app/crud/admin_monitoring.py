@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import distinct, func
+from sqlalchemy import case, distinct, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -116,3 +116,36 @@ async def get_unique_users(
         query = query.filter(EndpointLog.organization == organization)
     result = await db.execute(query)
     return [row[0] for row in result.all() if row[0]]
+
+
+_USAGE_GROUP_COLUMNS = {
+    "user": EndpointLog.username,
+    "organization": EndpointLog.organization,
+    "endpoint": EndpointLog.endpoint,
+}
+USAGE_GROUP_BYS = tuple(_USAGE_GROUP_COLUMNS)
+
+
+async def get_execution_usage_since(
+    db: AsyncSession, since: datetime, group_by: str = "user"
+) -> List[Tuple[str, str, int, float, float, int]]:
+    """Upstream execution per group key and upstream since ``since``.
+
+    Returns ``(key, upstream, requests, gpu_seconds, queue_seconds,
+    cold_starts)`` rows; only requests that recorded upstream usage count.
+    """
+    column = _USAGE_GROUP_COLUMNS[group_by]
+    result = await db.execute(
+        select(
+            column,
+            EndpointLog.upstream,
+            func.count(EndpointLog.id),
+            func.sum(EndpointLog.gpu_seconds),
+            func.sum(EndpointLog.queue_seconds),
+            func.sum(case((EndpointLog.cold_start.is_(True), 1), else_=0)),
+        )
+        .filter(EndpointLog.date >= since)
+        .filter(EndpointLog.gpu_seconds.isnot(None))
+        .group_by(column, EndpointLog.upstream)
+    )
+    return [tuple(row) for row in result.all()]
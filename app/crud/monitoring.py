@@ -1,7 +1,7 @@
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from fastapi import Request
 from sqlalchemy import func
@@ -13,6 +13,7 @@ from app.models import monitoring as models
 from app.models.users import User
 from app.schemas import monitoring as schemas
 from app.schemas.monitoring import EndpointLog
+from app.utils.execution_usage import ExecutionUsage
 
 logging.basicConfig(level=logging.INFO)
 
@@ -40,6 +41,10 @@ async def create_endpoint_log(log: schemas.EndpointLog, db: AsyncSession):
         organization=log.organization,
         organization_type=log.organization_type,
         sector=log.sector,
+        gpu_seconds=log.gpu_seconds,
+        queue_seconds=log.queue_seconds,
+        cold_start=log.cold_start,
+        upstream=log.upstream,
     )
     db.add(db_log)
     await db.commit()
@@ -52,6 +57,7 @@ async def log_endpoint(
     start_time: float,
     end_time: float,
     endpoint_path: str = None,
+    usage: Optional[ExecutionUsage] = None,
 ):
     try:
         if endpoint_path is None:
@@ -64,6 +70,11 @@ async def log_endpoint(
             organization_type=getattr(user, "organization_type", None),
             sector=getattr(user, "sector", None),
         )
+        if usage is not None and usage.jobs:
+            endpoint_log.gpu_seconds = usage.gpu_seconds
+            endpoint_log.queue_seconds = usage.queue_seconds
+            endpoint_log.cold_start = usage.cold_start
+            endpoint_log.upstream = usage.upstream
         await create_endpoint_log(endpoint_log, db)
     except Exception as e:
         logging.error(f"Error: {str(e)}")
@@ -65,6 +65,14 @@ from app.services.speech_service import SpeechService, get_speech_service
 from app.services.storage_service import StorageService
 from app.services.storage_service import get_storage_service as get_new_storage_service
 from app.services.stt_service import STTService, get_stt_service
+from app.services.transcription_batch_service import (
+    TranscriptionBatchService,
+    get_transcription_batch_service,
+)
+from app.services.transcription_job_service import (
+    TranscriptionJobService,
+    get_transcription_job_service,
+)
 from app.services.transcription_service import (
     TranscriptionService,
     get_transcription_service,
@@ -88,6 +96,12 @@ ModalSTTServiceDep = Annotated[ModalSTTService, Depends(get_modal_stt_service)]
 TranscriptionServiceDep = Annotated[
     TranscriptionService, Depends(get_transcription_service)
 ]
+TranscriptionJobServiceDep = Annotated[
+    TranscriptionJobService, Depends(get_transcription_job_service)
+]
+TranscriptionBatchServiceDep = Annotated[
+    TranscriptionBatchService, Depends(get_transcription_batch_service)
+]
 TTSServiceDep = Annotated[TTSService, Depends(get_tts_service)]
 OrpheusTTSServiceDep = Annotated[OrpheusTTSService, Depends(get_orpheus_tts_service)]
 TranslationServiceDep = Annotated[TranslationService, Depends(get_translation_service)]
@@ -235,6 +249,8 @@ __all__ = [
     "STTServiceDep",
     "ModalSTTServiceDep",
     "TranscriptionServiceDep",
+    "TranscriptionJobServiceDep",
+    "TranscriptionBatchServiceDep",
     "TTSServiceDep",
     "OrpheusTTSServiceDep",
     "TranslationServiceDep",
@@ -261,6 +277,8 @@ __all__ = [
     "STTService",
     "ModalSTTService",
     "TranscriptionService",
+    "TranscriptionJobService",
+    "TranscriptionBatchService",
     "TTSService",
     "OrpheusTTSService",
     "TranslationService",
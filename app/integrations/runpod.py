@@ -14,6 +14,22 @@ RunPod is used for:
 Architecture:
     Services -> RunPodClient -> RunPod Serverless API
 
+The client owns one long-lived aiohttp session (connection pool) and talks to
+the serverless REST API directly: submit with /run, then poll /status until a
+final state. The final status document carries the output and the job details
+(delayTime, executionTime, workerId), so nothing is fetched twice and nothing
+blocks the event loop. Call ``close()`` on shutdown.
+
+Status polling is multiplexed: each client owns one ``StatusPoller`` (see
+runpod_poller.py) that checks all of the endpoint's outstanding jobs from a
+single loop with per-job adaptive intervals, instead of one polling loop per
+waiting request. ``get_status_poller_snapshots()`` reports in-flight counts
+and queue-to-completion latency per endpoint.
+
+When RUNPOD_WEBHOOK_URL is configured, jobs are submitted with that webhook
+and the waiter is woken by the completion callback (see runpod_webhooks.py);
+/status is only polled if no callback arrives within the grace period.
+
 Usage:
     from app.integrations.runpod import RunPodClient, get_runpod_client
 
@@ -25,6 +41,9 @@ Usage:
     client = RunPodClient(endpoint_id="my-endpoint", api_key="my-key")
     result = await client.run_job(payload, timeout=300)
 
+    # Async replacement for runpod.Endpoint(...).run_sync(payload, timeout)
+    output = await run_runpod_job({"input": {"task": "summarise", "text": text}})
+
 Example:
     >>> client = RunPodClient()
     >>> payload = {"input": {"text": "Hello", "target_lang": "lug"}}
@@ -36,14 +55,75 @@ Example:
 import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+import aiohttp
+import runpod
 
-import requests
-from runpod import AsyncioEndpoint, AsyncioJob, http_client
+from app.core.config import settings
+from app.integrations.runpod_poller import FINAL_STATUSES, StatusPoller
+from app.integrations.runpod_webhooks import get_completion_hub
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Per-HTTP-call timeout; job completion is bounded separately by run_job.
+REQUEST_TIMEOUT_SECONDS = 30
+CONNECTION_POOL_SIZE = 100
+# Extra polling after run_job's timeout before the job is cancelled.
+TIMEOUT_POLL_ATTEMPTS = 6
+TIMEOUT_POLL_INTERVAL = 5
+
+# Callbacks invoked as ``observer(endpoint_id, job_details)`` after every job.
+JobObserver = Callable[[str, Dict[str, Any]], None]
+_job_observers: List[JobObserver] = []
+
+# Fire-and-forget cancellations; referenced so they are not garbage collected.
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def register_job_observer(observer: JobObserver) -> None:
+    """Register a callback notified with the job details of every finished job.
+
+    Lets higher layers (keep-warm scheduling, metrics) watch RunPod traffic
+    and ``delayTime`` without the client depending on them. Observers must be
+    cheap and must not raise; errors are logged and ignored.
+    """
+    if observer not in _job_observers:
+        _job_observers.append(observer)
+
+
+def unregister_job_observer(observer: JobObserver) -> None:
+    """Remove a previously registered job observer (no-op if absent)."""
+    if observer in _job_observers:
+        _job_observers.remove(observer)
+
+
+def _notify_job_observers(endpoint_id: str, job_details: Dict[str, Any]) -> None:
+    for observer in list(_job_observers):
+        try:
+            observer(endpoint_id, job_details)
+        except Exception as e:  # noqa: BLE001 — observers never break a job
+            logger.warning(f"RunPod job observer failed: {e}")
+
+
+def _configured_webhook_url() -> str:
+    """RUNPOD_WEBHOOK_URL with the shared secret as its last path segment.
+
+    Empty (webhooks disabled) unless both are set: the callback route
+    refuses unauthenticated callbacks, so a webhook without a secret could
+    never be delivered.
+    """
+    url = settings.runpod_webhook_url
+    if not url:
+        return ""
+    if not settings.runpod_webhook_secret:
+        logger.warning("RUNPOD_WEBHOOK_URL is set without RUNPOD_WEBHOOK_SECRET")
+        return ""
+    return f"{url.rstrip('/')}/{quote(settings.runpod_webhook_secret, safe='')}"
+
 
 class RunPodClient:
     """Client for interacting with RunPod's serverless API.
@@ -70,6 +150,8 @@ class RunPodClient:
         endpoint_id: Optional[str] = None,
         api_key: Optional[str] = None,
         default_timeout: int = 600,
+        webhook_url: Optional[str] = None,
+        webhook_grace_seconds: Optional[float] = None,
     ) -> None:
         """Initialize the RunPod client.
 
@@ -77,6 +159,11 @@ class RunPodClient:
             endpoint_id: RunPod endpoint ID. Defaults to RUNPOD_ENDPOINT_ID env var.
             api_key: RunPod API key. Defaults to RUNPOD_API_KEY env var.
             default_timeout: Default timeout in seconds for job completion.
+            webhook_url: Completion webhook URL sent with every job.
+                Defaults to RUNPOD_WEBHOOK_URL plus RUNPOD_WEBHOOK_SECRET as
+                its last path segment; empty disables webhooks.
+            webhook_grace_seconds: How long to wait for the webhook before
+                polling. Defaults to RUNPOD_WEBHOOK_GRACE_SECONDS.
 
         Example:
             >>> # Use environment variables
@@ -92,42 +179,151 @@ class RunPodClient:
         self.endpoint_id = endpoint_id or os.getenv("RUNPOD_ENDPOINT_ID")
         self.api_key = api_key or os.getenv("RUNPOD_API_KEY")
         self.default_timeout = default_timeout
+        self.webhook_url = (
+            webhook_url if webhook_url is not None else _configured_webhook_url()
+        )
+        self.webhook_grace_seconds = (
+            webhook_grace_seconds
+            if webhook_grace_seconds is not None
+            else settings.runpod_webhook_grace_seconds
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.status_poller = StatusPoller(
+            self.endpoint_id or "", fetch=self._get_job_details
+        )
 
         if not self.endpoint_id:
             logger.warning("RUNPOD_ENDPOINT_ID not set - RunPod calls will fail")
         if not self.api_key:
             logger.warning("RUNPOD_API_KEY not set - RunPod calls will fail")
 
-    def _get_job_details_sync(self, endpoint_id: str, job_id: str) -> Dict[str, Any]:
-        """Fetch job details from RunPod REST API synchronously.
-
-        This is a fallback method to get detailed job information when
-        the async SDK doesn't provide enough details.
-
-        Args:
-            endpoint_id: The RunPod endpoint ID.
-            job_id: The job ID to fetch details for.
+    # ---- HTTP session ----
 
-        Returns:
-            Dictionary containing job details from the REST API.
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the client's long-lived session, creating it on first use.
 
-        Example:
-            >>> details = client._get_job_details_sync("ep-123", "job-456")
-            >>> print(details["status"])
-            "COMPLETED"
+        aiohttp sessions are bound to the event loop they were created on, so a
+        new session is opened if the loop has changed (e.g. between tests).
+        Creation has no await, so concurrent callers cannot race here.
         """
-        url = f"https://api.runpod.ai/v2/{endpoint_id}/status/{job_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}",
+                },
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+                connector=aiohttp.TCPConnector(
+                    limit=CONNECTION_POOL_SIZE, keepalive_timeout=60
+                ),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Stop status polling and close the HTTP session (safe to repeat)."""
+        await self.status_poller.stop()
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Failed to close RunPod session: {e}")
+
+    def _url(self, action: str, job_id: Optional[str] = None) -> str:
+        url = f"{runpod.endpoint_url_base}/{self.endpoint_id}/{action}"
+        return f"{url}/{job_id}" if job_id else url
+
+    # ---- job lifecycle ----
+
+    async def _submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit a job and return RunPod's response (contains ``id``)."""
+        session = await self._get_session()
+        # Same request body the runpod SDK's AsyncioEndpoint.run sends.
+        body: Dict[str, Any] = {"input": payload}
+        if self.webhook_url:
+            body["webhook"] = self.webhook_url
+        async with session.post(self._url("run"), json=body) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _get_job_details(self, job_id: str) -> Dict[str, Any]:
+        """Fetch a job's status document (status, output, delayTime, ...)."""
+        session = await self._get_session()
         try:
-            resp = requests.get(url, headers=headers, timeout=30)
-            return resp.json()
-        except Exception as e:
+            async with session.get(self._url("status", job_id)) as resp:
+                return await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             logger.warning(f"Failed to fetch job details: {e}")
             return {"status": "UNKNOWN", "error": str(e)}
 
+    async def _cancel(self, job_id: str) -> None:
+        session = await self._get_session()
+        try:
+            async with session.post(self._url("cancel", job_id)) as resp:
+                await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Failed to cancel job {job_id}: {e}")
+
+    async def _poll_until_final(
+        self,
+        job_id: str,
+        details: Dict[str, Any],
+        submitted_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Wait for the endpoint's status poller to see a final state.
+
+        Returns the final status document, which doubles as job details.
+        """
+        return await self.status_poller.wait(job_id, details, submitted_at)
+
+    async def _await_final(
+        self,
+        job_id: str,
+        details: Dict[str, Any],
+        submitted_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Wait for the job's final status document.
+
+        With a webhook configured, the completion callback resolves the wait.
+        /status is polled only when no callback has arrived within
+        ``webhook_grace_seconds``, and a callback that lands during polling
+        still ends the wait.
+        """
+        if not self.webhook_url or details.get("status") in FINAL_STATUSES:
+            return await self._poll_until_final(job_id, details, submitted_at)
+
+        hub = get_completion_hub()
+        callback = hub.expect(job_id)
+        poller = None
+        try:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(callback), self.webhook_grace_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.info(
+                    f"No webhook for job {job_id} after "
+                    f"{self.webhook_grace_seconds}s, falling back to polling"
+                )
+            poller = asyncio.ensure_future(
+                self._poll_until_final(job_id, details, submitted_at)
+            )
+            await asyncio.wait({callback, poller}, return_when=asyncio.FIRST_COMPLETED)
+            if callback.done() and not callback.cancelled():
+                return callback.result()
+            return poller.result()
+        finally:
+            if poller is not None:
+                poller.cancel()
+            hub.discard(job_id)
+
     async def run_job(
         self,
         payload: Dict[str, Any],
@@ -138,6 +334,10 @@ class RunPodClient:
         Submits a job to the RunPod serverless endpoint and polls for
         completion. Handles timeout scenarios with extended polling.
 
+        All HTTP goes through the client's shared session without blocking
+        the event loop, and the final status response is returned as the job
+        details, so completed jobs are not re-fetched.
+
         Args:
             payload: The input payload for the RunPod worker.
             timeout: Timeout in seconds. Defaults to self.default_timeout.
@@ -149,7 +349,6 @@ class RunPodClient:
 
         Raises:
             ValueError: If endpoint_id is not configured.
-            TimeoutError: If the job doesn't complete within the timeout.
 
         Example:
             >>> payload = {"input": {"audio_base64": "..."}}
@@ -162,78 +361,123 @@ class RunPodClient:
 
         timeout = timeout or self.default_timeout
 
-        async with http_client.AsyncClientSession() as session:
-            logger.info("Starting RunPod job...")
-            logger.debug(f"Payload keys: {list(payload.keys())}")
-
-            endpoint = AsyncioEndpoint(self.endpoint_id, session)
-            job: AsyncioJob = await endpoint.run(payload)
-
-            # Fetch initial job details
-            status = await job.status()
-            logger.info(f"Initial job status: {status}")
-            job_details = self._get_job_details_sync(job.endpoint_id, job.job_id)
-            logger.debug(f"Job details: {job_details}")
-
-            try:
-                # Wait for job output with timeout
-                out = await job.output(timeout=timeout)
-                job_details = self._get_job_details_sync(job.endpoint_id, job.job_id)
-                logger.info("Job completed successfully")
-                return out, job_details
-
-            except TimeoutError:
-                logger.warning(f"Job timed out after {timeout}s, polling for status...")
-                return await self._handle_timeout(job, job_details)
+        logger.info("Starting RunPod job...")
+        logger.debug(f"Payload keys: {list(payload.keys())}")
+        submitted_at = time.monotonic()
+        job_details = await self._submit(payload)
+        job_id = job_details["id"]
+        logger.info(f"Initial job status: {job_details.get('status')}")
 
-    async def _handle_timeout(
-        self,
-        job: AsyncioJob,
-        initial_details: Dict[str, Any],
-    ) -> Tuple[Any, Dict[str, Any]]:
+        try:
+            job_details = await asyncio.wait_for(
+                self._await_final(job_id, job_details, submitted_at), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Job timed out after {timeout}s, polling for status...")
+            return await self._handle_timeout(job_id)
+
+        logger.info("Job completed successfully")
+        _notify_job_observers(self.endpoint_id, job_details)
+        return job_details.get("output"), job_details
+
+    async def _handle_timeout(self, job_id: str) -> Tuple[Any, Dict[str, Any]]:
         """Handle job timeout with extended polling.
 
         When a job times out, this method performs additional polling
         to check if the job completes shortly after the timeout.
 
         Args:
-            job: The AsyncioJob instance.
-            initial_details: Initial job details from before timeout.
+            job_id: The RunPod job ID.
 
         Returns:
             A tuple of (output, job_details).
         """
-        poll_attempts = 6
-        poll_interval = 5
+        poll_attempts = TIMEOUT_POLL_ATTEMPTS
 
         for attempt in range(poll_attempts):
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(TIMEOUT_POLL_INTERVAL)
 
-            status = await job.status()
+            job_details = await self._get_job_details(job_id)
+            status = job_details.get("status")
             logger.info(f"Poll attempt {attempt + 1}/{poll_attempts}: status={status}")
 
-            job_details = self._get_job_details_sync(job.endpoint_id, job.job_id)
-
-            if isinstance(status, dict) and status.get("status") in (
-                "COMPLETED",
-                "FAILED",
-            ):
-                try:
-                    out = await job.output(timeout=30)
-                    logger.info("Job completed after extended polling")
-                    return out, job_details
-                except TimeoutError:
-                    continue
+            if status in ("COMPLETED", "FAILED"):
+                logger.info("Job completed after extended polling")
+                _notify_job_observers(self.endpoint_id, job_details)
+                return job_details.get("output"), job_details
 
         # Last resort: cancel the job
         logger.warning("Job did not complete after polling, cancelling...")
-        job.cancel()
-        status = await job.status()
-        job_details = self._get_job_details_sync(job.endpoint_id, job.job_id)
+        await self._cancel(job_id)
+        job_details = await self._get_job_details(job_id)
+        status = job_details.get("status")
         logger.info(f"Job cancelled, final status: {status}")
 
         return {"status": status}, job_details
 
+    async def run_until_complete(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """Async drop-in for ``runpod.Endpoint(...).run_sync(payload, timeout)``.
+
+        Accepts the same payloads as the SDK (either the worker input or
+        ``{"input": {...}}``) and returns the worker output. Unlike ``run_job``
+        there is no grace period: the job is cancelled as soon as ``timeout``
+        expires, and also when the awaiting task is cancelled (for example a
+        client disconnect), so abandoned jobs do not keep a worker busy.
+
+        Args:
+            payload: Worker input, optionally wrapped in ``{"input": ...}``.
+            timeout: Timeout in seconds. Defaults to self.default_timeout.
+
+        Returns:
+            The job's ``output`` (None if the job failed or was cancelled).
+
+        Raises:
+            ValueError: If endpoint_id is not configured.
+            TimeoutError: If the job did not finish within ``timeout``.
+            ConnectionError: If the job could not be submitted.
+        """
+        if not self.endpoint_id:
+            raise ValueError("RUNPOD_ENDPOINT_ID is not configured")
+
+        timeout = timeout or self.default_timeout
+        # Same unwrapping rule as the SDK's Endpoint.run_sync.
+        job_input = payload["input"] if payload.get("input") else payload
+
+        submitted_at = time.monotonic()
+        try:
+            job_details = await self._submit(job_input)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Failed to submit RunPod job: {e}") from e
+        job_id = job_details["id"]
+
+        try:
+            job_details = await asyncio.wait_for(
+                self._await_final(job_id, job_details, submitted_at), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Job {job_id} timed out after {timeout}s, cancelling")
+            await self._cancel(job_id)
+            raise TimeoutError(f"RunPod job {job_id} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            logger.info(f"Caller went away, cancelling RunPod job {job_id}")
+            task = asyncio.ensure_future(self._cancel(job_id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+            raise
+
+        status = job_details.get("status")
+        if status != "COMPLETED":
+            logger.warning(
+                f"RunPod job {job_id} finished with status {status}: "
+                f"{job_details.get('error')}"
+            )
+        _notify_job_observers(self.endpoint_id, job_details)
+        return job_details.get("output")
+
 
 def normalize_runpod_response(resp: Any) -> Dict[str, Any]:
     """Normalize a RunPod response into a consistent shape.
@@ -301,11 +545,18 @@ def normalize_runpod_response(resp: Any) -> Dict[str, Any]:
 # -----------------------------------------------------------------------------
 
 _runpod_client: Optional[RunPodClient] = None
+# Clients for endpoints other than the default one, keyed by endpoint ID.
+_endpoint_clients: Dict[str, RunPodClient] = {}
 
 
-def get_runpod_client() -> RunPodClient:
+def get_runpod_client(endpoint_id: Optional[str] = None) -> RunPodClient:
     """Get or create the RunPod client singleton.
 
+    Args:
+        endpoint_id: Optional endpoint to talk to. Each endpoint gets one
+            shared client (and connection pool); None means the default
+            RUNPOD_ENDPOINT_ID client.
+
     Returns:
         RunPodClient instance configured with environment settings.
 
@@ -316,7 +567,12 @@ def get_runpod_client() -> RunPodClient:
     global _runpod_client
     if _runpod_client is None:
         _runpod_client = RunPodClient()
-    return _runpod_client
+    if endpoint_id is None or endpoint_id == _runpod_client.endpoint_id:
+        return _runpod_client
+    client = _endpoint_clients.get(endpoint_id)
+    if client is None:
+        client = _endpoint_clients[endpoint_id] = RunPodClient(endpoint_id=endpoint_id)
+    return client
 
 
 def reset_runpod_client() -> None:
@@ -326,6 +582,43 @@ def reset_runpod_client() -> None:
     """
     global _runpod_client
     _runpod_client = None
+    _endpoint_clients.clear()
+
+
+async def close_runpod_clients() -> None:
+    """Close the HTTP sessions of every RunPod client created so far."""
+    clients = list(_endpoint_clients.values())
+    if _runpod_client is not None:
+        clients.append(_runpod_client)
+    for client in clients:
+        await client.close()
+
+
+def get_status_poller_snapshots() -> List[Dict[str, Any]]:
+    """In-flight jobs, status requests and completion latency per endpoint."""
+    clients = list(_endpoint_clients.values())
+    if _runpod_client is not None:
+        clients.insert(0, _runpod_client)
+    return [client.status_poller.snapshot() for client in clients]
+
+
+async def run_runpod_job(
+    payload: Dict[str, Any],
+    timeout: int = 600,
+    endpoint_id: Optional[str] = None,
+) -> Any:
+    """Run a RunPod job without blocking the event loop and return its output.
+
+    The async replacement for ``runpod.Endpoint(endpoint_id).run_sync(...)``;
+    see ``RunPodClient.run_until_complete`` for timeout and cancellation.
+
+    Example:
+        >>> output = await run_runpod_job(
+        ...     {"input": {"task": "summarise", "text": text}}, timeout=600
+        ... )
+    """
+    client = get_runpod_client(endpoint_id)
+    return await client.run_until_complete(payload, timeout=timeout)
 
 
 # -----------------------------------------------------------------------------
@@ -360,6 +653,11 @@ __all__ = [
     "RunPodClient",
     "get_runpod_client",
     "reset_runpod_client",
+    "close_runpod_clients",
+    "get_status_poller_snapshots",
+    "run_runpod_job",
     "normalize_runpod_response",
     "run_job_and_get_output",
+    "register_job_observer",
+    "unregister_job_observer",
 ]
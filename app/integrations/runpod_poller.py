@@ -0,0 +1,285 @@
+"""
+Multiplexed RunPod job status poller.
+
+Without this, every waiting job ran its own /status polling loop, so N
+concurrent STT or translation jobs meant N independent timers and bursts of
+status requests that hit RunPod's API rate limits. ``StatusPoller`` keeps one
+background loop per endpoint that tracks all outstanding job ids:
+
+    - each job has its own adaptive interval: quick checks at first (short
+      jobs such as translation finish in about a second), backing off to
+      ``max_interval`` and, once a job has been running for
+      ``long_job_after`` seconds, to ``long_job_interval``;
+    - the loop starts a check for each job as it falls due, with at most
+      ``max_concurrent_requests`` status requests in flight, and resolves
+      each job's future when it reaches a final state. Checks run
+      independently, each bounded by ``request_timeout``, so one slow
+      /status response only delays its own job;
+    - several waiters on the same job id share one check.
+
+RunPod's serverless API has no multi-job status call, so "batching" means one
+tick per endpoint with deduplicated, rate-bounded per-job requests.
+
+``snapshot()`` reports in-flight jobs, status requests sent and
+queue-to-completion latency (submission until the final status was seen).
+
+Usage:
+    poller = StatusPoller("endpoint-id", fetch=client._get_job_details)
+    details = await poller.wait(job_id, initial_details)
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Job states after which RunPod will not change the status document again.
+FINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT"})
+INITIAL_INTERVAL = 0.25
+MAX_INTERVAL = 1.0
+BACKOFF_FACTOR = 1.5
+# Jobs still running after this long (transcription, diarization) are
+# checked every LONG_JOB_INTERVAL seconds instead of every MAX_INTERVAL.
+LONG_JOB_AFTER_SECONDS = 30.0
+LONG_JOB_INTERVAL = 3.0
+MAX_CONCURRENT_REQUESTS = 10
+# Deadline of one /status request; a timed-out check is retried after backoff.
+STATUS_REQUEST_TIMEOUT = 10.0
+# Completed-job latencies kept for snapshot() percentiles.
+LATENCY_WINDOW = 500
+
+StatusFetcher = Callable[[str], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class _TrackedJob:
+    future: "asyncio.Future[Dict[str, Any]]"
+    submitted_at: float
+    next_check: float
+    interval: float
+    waiters: int = 0
+    checking: bool = False
+
+
+class StatusPoller:
+    """One status polling loop shared by all outstanding jobs of an endpoint."""
+
+    def __init__(
+        self,
+        endpoint_id: str,
+        fetch: StatusFetcher,
+        initial_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        long_job_after: Optional[float] = None,
+        long_job_interval: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+    ) -> None:
+        """Create a poller; unset tuning arguments use the module constants."""
+        self.endpoint_id = endpoint_id
+        self._fetch = fetch
+        self.initial_interval = _or(initial_interval, INITIAL_INTERVAL)
+        self.max_interval = _or(max_interval, MAX_INTERVAL)
+        self.long_job_after = _or(long_job_after, LONG_JOB_AFTER_SECONDS)
+        self.long_job_interval = _or(long_job_interval, LONG_JOB_INTERVAL)
+        self.max_concurrent_requests = _or(
+            max_concurrent_requests, MAX_CONCURRENT_REQUESTS
+        )
+        self.request_timeout = _or(request_timeout, STATUS_REQUEST_TIMEOUT)
+        self._jobs: Dict[str, _TrackedJob] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.status_requests = 0
+        self.completed = 0
+
+    # ---- waiting ----
+
+    async def wait(
+        self,
+        job_id: str,
+        details: Dict[str, Any],
+        submitted_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Wait until ``job_id`` reaches a final state and return its details.
+
+        Args:
+            job_id: RunPod job id.
+            details: The latest status document (e.g. the /run response);
+                returned as-is if it is already final.
+            submitted_at: ``time.monotonic()`` at submission, for latency
+                reporting. Defaults to now.
+
+        Cancelling the caller only stops this waiter; the job stays tracked
+        while other waiters remain.
+        """
+        if details.get("status") in FINAL_STATUSES:
+            return details
+        self._bind_loop()
+        job = self._track(job_id, submitted_at)
+        job.waiters += 1
+        try:
+            return await asyncio.shield(job.future)
+        finally:
+            job.waiters -= 1
+            if job.waiters <= 0 and self._jobs.get(job_id) is job:
+                del self._jobs[job_id]
+                if not job.future.done():
+                    job.future.cancel()
+                self._wakeup.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs currently being polled."""
+        return len(self._jobs)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def snapshot(self) -> Dict[str, Any]:
+        latencies = list(self._latencies)
+        return {
+            "endpoint_id": self.endpoint_id,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "status_requests": self.status_requests,
+            "latency_avg_seconds": (
+                round(statistics.fmean(latencies), 3) if latencies else None
+            ),
+            "latency_p50_seconds": _percentile(latencies, 0.5),
+            "latency_p95_seconds": _percentile(latencies, 0.95),
+        }
+
+    async def stop(self) -> None:
+        """Stop the loop and cancel every outstanding wait."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for job in self._jobs.values():
+            job.future.cancel()
+        self._jobs.clear()
+
+    # ---- internals ----
+
+    def _bind_loop(self) -> None:
+        # Futures and the loop task belong to one event loop; start afresh if
+        # the loop changed (e.g. between tests).
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._jobs.clear()
+            self._task = None
+            self._wakeup = asyncio.Event()
+
+    def _track(self, job_id: str, submitted_at: Optional[float]) -> _TrackedJob:
+        job = self._jobs.get(job_id)
+        if job is None:
+            now = time.monotonic()
+            job = _TrackedJob(
+                future=self._loop.create_future(),
+                submitted_at=submitted_at if submitted_at is not None else now,
+                next_check=now + self.initial_interval,
+                interval=self.initial_interval,
+            )
+            self._jobs[job_id] = job
+            self._wakeup.set()
+        if not self.running:
+            self._task = self._loop.create_task(self._run())
+        return job
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        checks: Set["asyncio.Task[None]"] = set()
+        try:
+            while self._jobs:
+                now = time.monotonic()
+                for job_id, job in list(self._jobs.items()):
+                    if not job.checking and job.next_check <= now:
+                        job.checking = True
+                        check = asyncio.create_task(self._check(job_id, job, semaphore))
+                        checks.add(check)
+                        check.add_done_callback(checks.discard)
+                pending = [
+                    job.next_check for job in self._jobs.values() if not job.checking
+                ]
+                # Woken early by a finished check, a new job or a departed waiter.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        max(min(pending) - now, 0) if pending else None,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for check in checks:
+                check.cancel()
+            await asyncio.gather(*checks, return_exceptions=True)
+
+    async def _check(
+        self, job_id: str, job: _TrackedJob, semaphore: asyncio.Semaphore
+    ) -> None:
+        try:
+            await self._check_once(job_id, job, semaphore)
+        finally:
+            job.checking = False
+            self._wakeup.set()
+
+    async def _check_once(
+        self, job_id: str, job: _TrackedJob, semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
+            if job.future.done():
+                return
+            self.status_requests += 1
+            try:
+                details = await asyncio.wait_for(
+                    self._fetch(job_id), self.request_timeout
+                )
+            except Exception as e:  # noqa: BLE001 — retried after backoff
+                logger.warning(f"Status check for RunPod job {job_id} failed: {e!r}")
+                details = {"status": "UNKNOWN"}
+
+        now = time.monotonic()
+        if details.get("status") in FINAL_STATUSES:
+            if self._jobs.get(job_id) is job:
+                del self._jobs[job_id]
+            if not job.future.done():
+                job.future.set_result(details)
+                self.completed += 1
+                self._latencies.append(now - job.submitted_at)
+            return
+
+        ceiling = (
+            self.long_job_interval
+            if now - job.submitted_at >= self.long_job_after
+            else self.max_interval
+        )
+        job.interval = min(job.interval * BACKOFF_FACTOR, ceiling)
+        job.next_check = now + job.interval
+
+
+def _or(value, default):
+    return default if value is None else value
+
+
+def _percentile(values: list, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return round(ordered[index], 3)
+
+
+__all__ = ["FINAL_STATUSES", "StatusPoller"]
@@ -0,0 +1,232 @@
+"""
+RunPod Completion Webhooks.
+
+RunPod serverless calls the ``webhook`` URL passed on ``/run`` with the final
+job status document (id, status, output, delayTime, executionTime, ...) once
+the job finishes. ``JobCompletionHub`` turns those callbacks into resolved
+futures so ``RunPodClient`` can wait for a job without polling /status.
+
+With several API instances, the callback can land on a different instance
+than the one waiting. When the receiving instance has no local waiter, it
+publishes the document on a Redis channel. Every instance subscribes to that
+channel and resolves its own waiters. Without Redis the hub still works for
+the single-instance case. A waiter whose callback never arrives falls back to
+polling after the configured grace period (see ``RunPodClient``).
+
+Callbacks that arrive before the waiter has registered (the job can finish
+before the ``/run`` response is processed) are kept briefly and handed to the
+waiter when it registers.
+
+Usage:
+    from app.integrations.runpod_webhooks import get_completion_hub
+
+    hub = get_completion_hub()
+    future = hub.expect(job_id)
+    details = await future
+    hub.discard(job_id)
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Module-level logger
+logger = logging.getLogger(__name__)
+
+CHANNEL = "runpod:jobs:completed"
+# Callbacks for jobs nobody is (yet) waiting on are kept this long.
+EARLY_COMPLETION_TTL_SECONDS = 120
+EARLY_COMPLETION_MAX_ENTRIES = 1000
+# Delay before re-subscribing after the pub/sub connection drops.
+RESUBSCRIBE_DELAY_SECONDS = 5
+
+
+class JobCompletionHub:
+    """Resolves waiting RunPod jobs from webhook callbacks.
+
+    Attributes:
+        instance_id: Random ID of this process, used to skip its own
+            pub/sub messages.
+        delivered: Callbacks that resolved a waiter on this instance.
+        relayed: Callbacks published for other instances.
+    """
+
+    def __init__(self, redis: Optional[Any] = None) -> None:
+        """Initialize the hub.
+
+        Args:
+            redis: Optional ``SafeRedis`` used to relay callbacks between
+                instances. Can also be supplied later via ``start``.
+        """
+        self.instance_id = uuid.uuid4().hex
+        self.delivered = 0
+        self.relayed = 0
+        self._redis = redis
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._early: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+
+    # ---- waiters ----
+
+    def expect(self, job_id: str) -> asyncio.Future:
+        """Return a future resolved with the job's final status document."""
+        future = self._waiters.get(job_id)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[job_id] = future
+        early = self._early.pop(job_id, None)
+        if early is not None and not future.done():
+            future.set_result(early[1])
+        return future
+
+    def discard(self, job_id: str) -> None:
+        """Stop waiting for ``job_id`` (call once the job is finished)."""
+        future = self._waiters.pop(job_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for f in self._waiters.values() if not f.done())
+
+    def resolve(self, details: Dict[str, Any]) -> bool:
+        """Resolve the local waiter for ``details["id"]``.
+
+        Returns:
+            True if a waiter on this instance was resolved. Otherwise the
+            document is kept for a late-registering waiter and False is
+            returned.
+        """
+        job_id = details.get("id")
+        if not job_id:
+            return False
+        future = self._waiters.get(job_id)
+        if future is not None and not future.done():
+            future.set_result(details)
+            self.delivered += 1
+            return True
+        self._remember_early(job_id, details)
+        return False
+
+    def _remember_early(self, job_id: str, details: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        self._early[job_id] = (now, details)
+        self._early.move_to_end(job_id)
+        while self._early:
+            oldest_id, (seen_at, _) = next(iter(self._early.items()))
+            if (
+                len(self._early) <= EARLY_COMPLETION_MAX_ENTRIES
+                and now - seen_at <= EARLY_COMPLETION_TTL_SECONDS
+            ):
+                break
+            del self._early[oldest_id]
+
+    async def deliver(self, details: Dict[str, Any]) -> bool:
+        """Handle a webhook callback received by this instance.
+
+        Resolves a local waiter if there is one; otherwise relays the
+        document to the other instances over Redis.
+
+        Returns:
+            True if the callback was handled locally or relayed.
+        """
+        if self.resolve(details):
+            return True
+        if self._redis is None:
+            return False
+        message = json.dumps({"origin": self.instance_id, "details": details})
+        receivers = await self._redis.publish(CHANNEL, message)
+        if receivers is None:
+            return False
+        self.relayed += 1
+        return True
+
+    # ---- cross-instance relay ----
+
+    def start(self, redis: Optional[Any] = None) -> None:
+        """Subscribe to relayed callbacks in the background (needs Redis)."""
+        if redis is not None:
+            self._redis = redis
+        if self._redis is None or self.running:
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Cancel the pub/sub listener."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._redis.backend.pubsub()
+                await pubsub.subscribe(CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._on_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 — keep relaying after outages
+                logger.warning(f"RunPod completion relay dropped: {e}")
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:  # noqa: BLE001
+                        pass
+            await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+
+    def _on_message(self, data: Any) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed RunPod completion message")
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        details = message.get("details")
+        if isinstance(details, dict):
+            self.resolve(details)
+
+
+# -----------------------------------------------------------------------------
+# Singleton and Dependency Injection
+# -----------------------------------------------------------------------------
+
+_completion_hub: Optional[JobCompletionHub] = None
+
+
+def get_completion_hub() -> JobCompletionHub:
+    """Get or create the process-wide completion hub."""
+    global _completion_hub
+    if _completion_hub is None:
+        _completion_hub = JobCompletionHub()
+    return _completion_hub
+
+
+def reset_completion_hub() -> None:
+    """Reset the completion hub singleton (for tests)."""
+    global _completion_hub
+    _completion_hub = None
+
+
+__all__ = [
+    "CHANNEL",
+    "JobCompletionHub",
+    "get_completion_hub",
+    "reset_completion_hub",
+]
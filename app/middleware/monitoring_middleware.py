@@ -7,7 +7,8 @@ endpoint paths, and request duration for analytics and usage monitoring.
 
 Architecture:
     Request -> Monitoring Middleware -> Route Handler -> Response
-    Middleware logs: username, endpoint, organization, execution time
+    Middleware logs: username, endpoint, organization, execution time,
+    and the upstream GPU time / queue delay / cold start the request caused
 
 Usage:
     from app.middleware.monitoring_middleware import MonitoringMiddleware
@@ -45,7 +46,14 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.crud.monitoring import log_endpoint
 from app.crud.users import get_user_by_username
 from app.database.db import async_session_maker
+from app.integrations.runpod import register_job_observer
 from app.utils.auth import ALGORITHM, SECRET_KEY
+from app.utils.execution_usage import (
+    ExecutionUsage,
+    observe_runpod_job,
+    start_execution_tracking,
+    stop_execution_tracking,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -83,6 +91,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self.monitor_path_prefix = monitor_path_prefix
+        register_job_observer(observe_runpod_job)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -112,9 +121,13 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         # Extract user information from token
         user_info = await self._extract_user_info(request)
 
-        # Time the request
+        # Time the request and collect the upstream execution it causes
+        usage = start_execution_tracking()
         start_time = time.time()
-        response = await call_next(request)
+        try:
+            response = await call_next(request)
+        finally:
+            stop_execution_tracking()
         end_time = time.time()
 
         # Log monitoring data if user was successfully extracted
@@ -127,6 +140,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
                 end_time=end_time,
                 organization_type=user_info.get("organization_type"),
                 sector=user_info.get("sector"),
+                usage=usage,
             )
 
         return response
@@ -204,6 +218,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         end_time: float,
         organization_type: Optional[str] = None,
         sector: Optional[list] = None,
+        usage: Optional[ExecutionUsage] = None,
     ) -> None:
         """
         Log request monitoring data to the database.
@@ -217,6 +232,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             endpoint: The API endpoint path.
             start_time: Request start timestamp.
             end_time: Request end timestamp.
+            usage: Upstream execution attributed to the request, if any.
 
         Notes:
             - Uses async database session for non-blocking operation
@@ -243,6 +259,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
                     start_time=start_time,
                     end_time=end_time,
                     endpoint_path=endpoint,
+                    usage=usage,
                 )
 
                 logger.info(
@@ -327,9 +344,14 @@ async def log_request(request: Request, call_next: Callable) -> Response:  # noq
     except Exception as e:
         logger.error(f"Error extracting authentication info: {e}")
 
-    # Time the request
+    # Time the request and collect the upstream execution it causes
+    register_job_observer(observe_runpod_job)
+    usage = start_execution_tracking()
     start_time = time.time()
-    response = await call_next(request)
+    try:
+        response = await call_next(request)
+    finally:
+        stop_execution_tracking()
     end_time = time.time()
 
     # Log endpoint usage if user was successfully authenticated
@@ -352,6 +374,7 @@ async def log_request(request: Request, call_next: Callable) -> Response:  # noq
                     request=request,
                     start_time=start_time,
                     end_time=end_time,
+                    usage=usage,
                 )
 
                 logger.info(
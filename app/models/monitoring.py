@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Column, DateTime, Float, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String
 from sqlalchemy.sql import func
 
 from app.database.db import Base
@@ -15,3 +15,8 @@ class EndpointLog(Base):
     date = Column(DateTime(timezone=True), default=func.now())
     organization_type = Column(String, nullable=True, default=None)
     sector = Column(JSON, nullable=True, default=None)
+    # Upstream execution attributed to the request (app/utils/execution_usage.py)
+    gpu_seconds = Column(Float, nullable=True, default=None)
+    queue_seconds = Column(Float, nullable=True, default=None)
+    cold_start = Column(Boolean, nullable=True, default=None)
+    upstream = Column(String, nullable=True, default=None, index=True)
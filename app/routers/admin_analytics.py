@@ -7,19 +7,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestError
 from app.crud.admin_monitoring import (
+    USAGE_GROUP_BYS,
     get_unique_organization_types,
     get_unique_organizations,
     get_unique_sectors,
 )
-from app.deps import get_current_admin, get_db
+from app.deps import BillingAnalyticsServiceDep, get_current_admin, get_db
+from app.integrations.runpod import get_status_poller_snapshots
 from app.schemas.users import User
+from app.services.audio_worker import get_audio_worker
+from app.services.speech_cache import get_speech_cache
+from app.services.transcription_cache import get_transcription_cache
 from app.utils.admin_monitoring_utils import (
+    get_admin_execution_cost_stats,
     get_admin_org_stats,
     get_admin_org_type_stats,
     get_admin_overview_stats,
     get_admin_sector_stats,
 )
 from app.utils.monitoring_utils import parse_time_range
+from app.utils.url_signer import get_url_signer
 
 router = APIRouter()
 
@@ -158,6 +165,68 @@ async def get_by_sector(
     }
 
 
+@router.get("/execution-costs")
+async def get_execution_costs(
+    billing: BillingAnalyticsServiceDep,
+    time_range: str = "7d",
+    group_by: str = "user",
+    current_user: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """GPU-seconds, queue delay, cold starts and estimated cost per group.
+
+    Costs use the effective rate per RunPod endpoint / Modal app from billing
+    analytics, falling back to EXECUTION_COST_PER_SECOND.
+    """
+    _validate_time_range(time_range)
+    if group_by not in USAGE_GROUP_BYS:
+        raise BadRequestError(
+            f"Invalid group_by '{group_by}'. Use: {', '.join(USAGE_GROUP_BYS)}."
+        )
+    stats = await get_admin_execution_cost_stats(db, billing, time_range, group_by)
+    return {"time_range": time_range, **stats}
+
+
+@router.get("/transcription-cache")
+async def get_transcription_cache_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """Transcription cache hits, misses and hit rate on this instance."""
+    return get_transcription_cache().snapshot()
+
+
+@router.get("/speech-cache")
+async def get_speech_cache_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """Speech cache hits, misses and hit rate on this instance."""
+    return get_speech_cache().snapshot()
+
+
+@router.get("/audio-worker")
+async def get_audio_worker_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """Audio worker pool queue depth and per-operation latencies."""
+    return get_audio_worker().snapshot()
+
+
+@router.get("/signed-urls")
+async def get_signed_url_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """Signed URL cache hits and signing calls on this instance."""
+    return get_url_signer().snapshot()
+
+
+@router.get("/runpod-polling")
+async def get_runpod_polling_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """RunPod jobs being polled and queue-to-completion latency per endpoint."""
+    return {"endpoints": get_status_poller_snapshots()}
+
+
 @router.get("/export")
 async def export_csv(  # noqa: C901
     view: str = "overview",
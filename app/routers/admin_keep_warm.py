@@ -0,0 +1,27 @@
+"""Admin keep-warm endpoints: scheduler state and manual warm-up pings."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.core.exceptions import NotFoundError
+from app.deps import CurrentAdminDep
+from app.schemas.keep_warm import EndpointWarmStatus, KeepWarmStatusResponse
+from app.services.keep_warm_service import get_keep_warm_scheduler
+
+router = APIRouter()
+
+
+@router.get("", response_model=KeepWarmStatusResponse)
+async def get_keep_warm_status(current_user: CurrentAdminDep):
+    return get_keep_warm_scheduler().snapshot()
+
+
+@router.post("/{endpoint}/ping", response_model=EndpointWarmStatus)
+async def ping_endpoint(endpoint: str, current_user: CurrentAdminDep):
+    """Send a warm-up ping now, bypassing policy and the cross-instance lock."""
+    scheduler = get_keep_warm_scheduler()
+    if endpoint not in scheduler:
+        raise NotFoundError(resource="Keep-warm endpoint", resource_id=endpoint)
+    await scheduler.ping(endpoint, force=True)
+    return next(e for e in scheduler.snapshot()["endpoints"] if e["name"] == endpoint)
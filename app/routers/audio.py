@@ -1,10 +1,12 @@
 """Unified audio router (OpenAI-style).
 
 Hosts the consolidated Speech-to-Text endpoint ``POST /tasks/audio/transcriptions``
-that supersedes the legacy /stt, /stt_from_gcs, /org/stt, and /modal/stt routes.
+that supersedes the legacy /stt, /stt_from_gcs, /org/stt, and /modal/stt routes,
+and its batch variant ``POST /tasks/audio/transcriptions/batch``.
 Also hosts the unified TTS endpoint ``POST /tasks/audio/speech``.
 """
 
+import asyncio
 import logging
 import os
 import tempfile
@@ -24,6 +26,7 @@ from fastapi import (
     Request,
     UploadFile,
 )
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
@@ -38,6 +41,7 @@ from app.deps import (
     LegacyStorageServiceDep,
     QuotaServiceDep,
     SpeechServiceDep,
+    TranscriptionBatchServiceDep,
     TranscriptionServiceDep,
     TTSServiceDep,
     get_current_user,
@@ -45,7 +49,7 @@ from app.deps import (
 )
 from app.models.enums import TTSResponseMode
 from app.routers.stt import _schedule_stt_feedback
-from app.routers.tts import _stream_audio, _stream_audio_with_url
+from app.routers.tts import _stream_audio, _stream_audio_with_url, _stream_headers
 from app.schemas.speech import (
     RefreshedUrlResponse,
     SpeechBatchItemResponse,
@@ -59,6 +63,8 @@ from app.schemas.stt import (
     CHUNK_SIZE,
     SttbLanguage,
     STTTranscript,
+    TranscriptionBatchAccepted,
+    TranscriptionBatchRequest,
     TranscriptionPlatform,
 )
 from app.schemas.tts import TTSRequest as ModalTTSRequest
@@ -68,7 +74,10 @@ from app.services.stt_service import (
     AudioValidationError,
     TranscriptionError,
 )
+from app.services.transcription_batch_service import NDJSON_CONTENT_TYPE, to_ndjson
+from app.services.upstream_limiter import upstream_slot
 from app.utils.audio import get_audio_extension
+from app.utils.audio_frames import wants_frames
 from app.utils.feedback import INFERENCE_TYPES, save_api_inference
 from app.utils.quota_guard import check_quota
 from app.utils.rate_limit import get_account_type_limit, limiter
@@ -149,43 +158,48 @@ async def create_transcription(  # noqa: C901
     file_path: Optional[str] = None
     try:
         if platform == TranscriptionPlatform.modal:
-            audio_bytes = await audio.read()
-            result = await transcription_service.transcribe(
-                platform="modal",
-                language=language.value,
-                adapter=adapter_value,
-                audio_bytes=audio_bytes,
-            )
+            async with upstream_slot("modal_stt", current_user):
+                result = await transcription_service.transcribe(
+                    platform="modal",
+                    language=language.value,
+                    adapter=adapter_value,
+                    audio_stream=audio,
+                )
         elif gcs_blob_name:
-            result = await transcription_service.transcribe(
-                platform="runpod",
-                language=language.value,
-                adapter=adapter_value,
-                gcs_blob_name=gcs_blob_name,
-                whisper=resolved_whisper,
-                recognise_speakers=resolved_speakers,
-            )
+            async with upstream_slot("runpod_asr", current_user):
+                result = await transcription_service.transcribe(
+                    platform="runpod",
+                    language=language.value,
+                    adapter=adapter_value,
+                    gcs_blob_name=gcs_blob_name,
+                    whisper=resolved_whisper,
+                    recognise_speakers=resolved_speakers,
+                )
         else:
             content_type = audio.content_type
             file_extension = get_audio_extension(audio.filename)
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=file_extension
-            ) as temp_file:
-                file_path = temp_file.name
-                async with aiofiles.open(file_path, "wb") as out_file:
-                    while content := await audio.read(CHUNK_SIZE):
-                        await out_file.write(content)
-            result = await transcription_service.transcribe(
-                platform="runpod",
-                language=language.value,
-                adapter=adapter_value,
-                org=org,
-                whisper=resolved_whisper,
-                recognise_speakers=resolved_speakers,
-                file_path=file_path,
-                file_extension=file_extension,
-                content_type=content_type,
-            )
+            if org:
+                with tempfile.NamedTemporaryFile(
+                    delete=False, suffix=file_extension
+                ) as temp_file:
+                    file_path = temp_file.name
+                    async with aiofiles.open(file_path, "wb") as out_file:
+                        while content := await audio.read(CHUNK_SIZE):
+                            await out_file.write(content)
+            async with upstream_slot("runpod_asr", current_user):
+                # Standard uploads are piped straight into cloud storage.
+                result = await transcription_service.transcribe(
+                    platform="runpod",
+                    language=language.value,
+                    adapter=adapter_value,
+                    org=org,
+                    whisper=resolved_whisper,
+                    recognise_speakers=resolved_speakers,
+                    file_path=file_path,
+                    file_extension=file_extension,
+                    content_type=content_type,
+                    audio_stream=None if org else audio,
+                )
 
         elapsed_time = time.time() - start_time
 
@@ -271,6 +285,56 @@ async def create_transcription(  # noqa: C901
                 pass
 
 
+@router.post(
+    "/audio/transcriptions/batch",
+    summary="Transcribe a batch of GCS blobs (RunPod)",
+    description=(
+        "Transcribes up to STT_BATCH_MAX_ITEMS GCS blobs, given as a list or "
+        "as a manifest blob with one name per line, with a bounded number in "
+        "flight. Results stream back as NDJSON (application/x-ndjson) in "
+        "completion order: one object per blob with its 'index' and "
+        "'status' ('ok' or 'error'), then a 'summary' object. With "
+        "write_results the NDJSON is written to "
+        "batch-results/<user_id>/<batch_id>.ndjson instead and the request "
+        "returns 202 at once. Manifests must be under "
+        "batch-manifests/<user_id>/. Counts as one request against quota."
+    ),
+    responses={
+        200: {"content": {NDJSON_CONTENT_TYPE: {}}},
+        202: {"model": TranscriptionBatchAccepted},
+    },
+    tags=["Speech-to-Text"],
+)
+@limiter.limit(get_account_type_limit)
+async def create_transcription_batch(
+    request: Request,
+    quota: QuotaServiceDep,
+    batches: TranscriptionBatchServiceDep,
+    body: TranscriptionBatchRequest = Body(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Transcribe many GCS blobs, streaming NDJSON or writing it to a blob."""
+    await check_quota(quota, db, current_user)
+    blob_names = await batches.resolve_blob_names(body, current_user)
+    options = batches.options(body)
+
+    if body.write_results:
+        batch_id, results_blob_name = batches.start(current_user, blob_names, options)
+        accepted = TranscriptionBatchAccepted(
+            batch_id=batch_id,
+            items=len(blob_names),
+            results_blob_name=results_blob_name,
+        )
+        return JSONResponse(status_code=202, content=accepted.model_dump())
+
+    async def lines():
+        async for item in batches.run(current_user, blob_names, options):
+            yield to_ndjson(item)
+
+    return StreamingResponse(lines(), media_type=NDJSON_CONTENT_TYPE)
+
+
 @router.post(
     "/audio/speech",
     response_model=SpeechResponse,
@@ -309,11 +373,26 @@ async def create_speech(  # noqa: C901
             text=body.text, speaker_id=speaker, response_mode=body.response_mode
         )
         if body.response_mode == TTSResponseMode.STREAM:
+            # Long texts stream chunk by chunk as each sentence group renders.
+            chunked = speech_service.stream_chunked(body)
+            if chunked is not None:
+                return StreamingResponse(
+                    chunked, media_type="audio/wav", headers=_stream_headers(modal_req)
+                )
             return await _stream_audio(modal_req, tts_service)
-        return await _stream_audio_with_url(modal_req, storage_service, tts_service)
+        return await _stream_audio_with_url(
+            modal_req,
+            storage_service,
+            tts_service,
+            framed=wants_frames(request.headers.get("accept", "")),
+        )
 
     try:
-        result = await speech_service.synthesize(body)
+        if body.model == TTSModel.orpheus_3b_tts:
+            async with upstream_slot("orpheus", current_user):
+                result = await speech_service.synthesize(body)
+        else:
+            result = await speech_service.synthesize(body)
         request_id = uuid.uuid4().hex
 
         response = SpeechResponse(
@@ -383,7 +462,8 @@ async def create_speech_batch(
     await check_quota(quota, db, current_user)
 
     try:
-        batch = await speech_service.synthesize_batch(body)
+        async with upstream_slot("orpheus", current_user):
+            batch = await speech_service.synthesize_batch(body)
         request_id = uuid.uuid4().hex
 
         results = [
@@ -413,6 +493,7 @@ async def create_speech_batch(
             timings_ms={
                 "inference_ms": batch.inference_ms,
                 "upload_ms": batch.upload_ms,
+                "signed_url_ms": batch.signed_url_ms,
                 "total_ms": batch.total_ms,
             },
         )
@@ -551,7 +632,9 @@ async def refresh_speech_url(
 ) -> RefreshedUrlResponse:
     """Return a freshly signed URL for a stored audio object."""
     try:
-        signed_url, expires_at = storage_service.get_signed_url_for_file(gcs_object)
+        signed_url, expires_at = await asyncio.to_thread(
+            storage_service.get_signed_url_for_file, gcs_object
+        )
     except Exception as e:
         raise NotFoundError(
             resource="Audio file",
@@ -16,16 +16,17 @@ Spec:
     docs/superpowers/specs/2026-06-12-chat-completions-design.md
 """
 
-import json
 import logging
 import time
 import uuid
 from typing import Any, Dict, Generator, List, Optional
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Request
 from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 
+from app.core.config import settings
 from app.core.exceptions import (
     BadRequestError,
     ExternalServiceError,
@@ -47,10 +48,17 @@ from app.services.inference_service import (
     InferenceService,
     InferenceTimeoutError,
     ModelLoadingError,
+    hedging_enabled,
+)
+from app.services.upstream_limiter import (
+    acquire_upstream_slot,
+    release_after,
+    upstream_slot,
 )
 from app.utils.feedback import INFERENCE_TYPES, save_api_inference
 from app.utils.quota_guard import check_quota
 from app.utils.rate_limit import get_account_type_limit, limiter
+from app.utils.token_budget import fit_messages_to_budget
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +68,12 @@ router = APIRouter()
 # InferenceService.endpoints).
 INTERNAL_MODEL_TYPE = "qwen"
 
+# Route name matched against SUNFLOWER_HEDGE_ROUTES (non-streaming only).
+HEDGE_ROUTE = "chat_completions"
+
+# Admission-control upstream (see app/services/upstream_limiter.py).
+UPSTREAM = "sunflower"
+
 
 def _completion_id() -> str:
     """Generate an OpenAI-style completion id."""
@@ -68,7 +82,10 @@ def _completion_id() -> str:
 
 def _prepare_messages(chat_request: ChatCompletionRequest) -> List[Dict[str, str]]:
     """Convert request messages to dicts, injecting the default system message
-    when the client did not provide one (mirrors the legacy endpoints)."""
+    when the client did not provide one (mirrors the legacy endpoints).
+
+    The oldest history turns are trimmed to the Sunflower prompt token budget
+    so long conversations succeed on the first upstream call."""
     messages = [
         {"role": m.role, "content": m.content.strip()} for m in chat_request.messages
     ]
@@ -76,7 +93,9 @@ def _prepare_messages(chat_request: ChatCompletionRequest) -> List[Dict[str, str
         messages.insert(
             0, {"role": "system", "content": InferenceService.SYSTEM_MESSAGE}
         )
-    return messages
+    return fit_messages_to_budget(
+        messages, max_completion_tokens=chat_request.max_tokens
+    )
 
 
 def _validate_model(chat_request: ChatCompletionRequest) -> None:
@@ -140,40 +159,42 @@ async def _create_chat_completion(
     """Non-streaming path: run inference and build a chat.completion object."""
     start_time = time.time()
 
-    try:
-        result = await run_in_threadpool(
-            lambda: service.run_inference(
-                messages=messages,
-                model_type=INTERNAL_MODEL_TYPE,
-                temperature=chat_request.temperature,
-                max_tokens=chat_request.max_tokens,
-                top_p=chat_request.top_p,
-                stop=chat_request.stop,
+    async with upstream_slot(UPSTREAM, user):
+        try:
+            result = await run_in_threadpool(
+                lambda: service.run_inference(
+                    messages=messages,
+                    model_type=INTERNAL_MODEL_TYPE,
+                    temperature=chat_request.temperature,
+                    max_tokens=chat_request.max_tokens,
+                    top_p=chat_request.top_p,
+                    stop=chat_request.stop,
+                    hedge=hedging_enabled(HEDGE_ROUTE),
+                )
             )
-        )
-    except ModelLoadingError as e:
-        logger.error(f"Model loading error: {e}")
-        raise ServiceUnavailableError(
-            message=(
-                "The AI model is currently loading. This usually takes "
-                "2-3 minutes. Please try again shortly."
+        except ModelLoadingError as e:
+            logger.error(f"Model loading error: {e}")
+            raise ServiceUnavailableError(
+                message=(
+                    "The AI model is currently loading. This usually takes "
+                    "2-3 minutes. Please try again shortly."
+                )
+            )
+        except InferenceTimeoutError as e:
+            logger.error(f"Inference timeout: {e}")
+            raise ServiceUnavailableError(
+                message="The request timed out. Please try again with a shorter prompt."
+            )
+        except ValueError as e:
+            logger.error(f"Invalid request: {e}")
+            raise BadRequestError(message=f"Invalid request: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected inference error: {e}")
+            raise ExternalServiceError(
+                service_name="Sunflower Inference Service",
+                message="An unexpected error occurred during inference. Please try again.",
+                original_error=str(e),
             )
-        )
-    except InferenceTimeoutError as e:
-        logger.error(f"Inference timeout: {e}")
-        raise ServiceUnavailableError(
-            message="The request timed out. Please try again with a shorter prompt."
-        )
-    except ValueError as e:
-        logger.error(f"Invalid request: {e}")
-        raise BadRequestError(message=f"Invalid request: {str(e)}")
-    except Exception as e:
-        logger.error(f"Unexpected inference error: {e}")
-        raise ExternalServiceError(
-            service_name="Sunflower Inference Service",
-            message="An unexpected error occurred during inference. Please try again.",
-            original_error=str(e),
-        )
 
     content = (result or {}).get("content")
     if not content:
@@ -263,42 +284,57 @@ async def _fetch_first_stream_item(stream_gen: Any) -> Any:
     return first_item
 
 
-def _event_stream(
-    completion_id: str,
-    created: int,
-    model: str,
-    first_item: Any,
-    stream_gen: Any,
-    accumulated: List[str],
-) -> Generator[str, None, None]:
-    """Sync generator that emits OpenAI SSE chunks from a stream_gen iterator.
+class _SSEFramer:
+    """Builds ``chat.completion.chunk`` SSE frames for one completion.
 
-    Yields one role-priming chunk, then one content chunk per delta item,
-    then a finish chunk, an optional usage chunk, and finally ``data: [DONE]``.
-    Midstream exceptions yield an SSE error event before the terminal DONE.
+    Content frames are hot (one per flush), so their JSON is assembled from a
+    pre-serialized prefix and suffix around an orjson-encoded content string
+    rather than validating and dumping a pydantic model per delta. The output
+    is byte-compatible with ``ChatCompletionChunk.model_dump_json()``.
     """
 
-    def _sse_chunk(
+    def __init__(self, completion_id: str, created: int, model: str) -> None:
+        self.completion_id = completion_id
+        self.created = created
+        self.model = model
+        head = orjson.dumps(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+            }
+        )[:-1]
+        self._content_prefix = (
+            b"data: " + head + b',"choices":[{"index":0,"delta":{"role":null,"content":'
+        )
+        self._content_suffix = b'},"finish_reason":null}],"usage":null}\n\n'
+
+    def content(self, text: str) -> bytes:
+        return self._content_prefix + orjson.dumps(text) + self._content_suffix
+
+    def chunk(
+        self,
         delta: ChatCompletionChunkDelta,
         finish_reason: Optional[str] = None,
-    ) -> str:
+    ) -> bytes:
         chunk = ChatCompletionChunk(
-            id=completion_id,
-            created=created,
-            model=model,
+            id=self.completion_id,
+            created=self.created,
+            model=self.model,
             choices=[
                 ChatCompletionChunkChoice(
                     index=0, delta=delta, finish_reason=finish_reason
                 )
             ],
         )
-        return f"data: {chunk.model_dump_json()}\n\n"
+        return b"data: " + chunk.model_dump_json().encode() + b"\n\n"
 
-    def _sse_usage_chunk(usage: Dict[str, Any]) -> str:
+    def usage(self, usage: Dict[str, Any]) -> bytes:
         chunk = ChatCompletionChunk(
-            id=completion_id,
-            created=created,
-            model=model,
+            id=self.completion_id,
+            created=self.created,
+            model=self.model,
             choices=[],
             usage=ChatCompletionUsage(
                 prompt_tokens=usage.get("prompt_tokens"),
@@ -306,27 +342,76 @@ def _event_stream(
                 total_tokens=usage.get("total_tokens"),
             ),
         )
-        return f"data: {chunk.model_dump_json()}\n\n"
+        return b"data: " + chunk.model_dump_json().encode() + b"\n\n"
+
+
+def _event_stream(  # noqa: C901
+    completion_id: str,
+    created: int,
+    model: str,
+    first_item: Any,
+    stream_gen: Any,
+    accumulated: List[str],
+    coalesce_ms: Optional[int] = None,
+    coalesce_chars: Optional[int] = None,
+) -> Generator[bytes, None, None]:
+    """Sync generator that emits OpenAI SSE chunks from a stream_gen iterator.
+
+    Yields one role-priming chunk, then content chunks, then a finish chunk,
+    an optional usage chunk, and finally ``data: [DONE]``. Midstream
+    exceptions yield an SSE error event before the terminal DONE.
 
+    With a coalescing window (``CHAT_STREAM_COALESCE_MS``), consecutive deltas
+    are merged into one content chunk until the window has elapsed or
+    ``coalesce_chars`` characters are buffered. The window is checked as each
+    delta arrives, so a buffered delta waits at most one inter-token gap past
+    the window. A window of 0 emits one chunk per delta.
+    """
+    if coalesce_ms is None:
+        coalesce_ms = settings.chat_stream_coalesce_ms
+    if coalesce_chars is None:
+        coalesce_chars = settings.chat_stream_coalesce_chars
+    window = coalesce_ms / 1000.0
+
+    framer = _SSEFramer(completion_id, created, model)
     usage_stats: Optional[Dict[str, Any]] = None
+    pending: List[str] = []
+    pending_chars = 0
+    pending_since = 0.0
     try:
-        yield _sse_chunk(ChatCompletionChunkDelta(role="assistant", content=""))
+        yield framer.chunk(ChatCompletionChunkDelta(role="assistant", content=""))
         item = first_item
         while item is not None:
             if item.get("type") == "delta":
                 text = item.get("content") or ""
                 if text:
                     accumulated.append(text)
-                    yield _sse_chunk(ChatCompletionChunkDelta(content=text))
+                    if not pending:
+                        pending_since = time.monotonic()
+                    pending.append(text)
+                    pending_chars += len(text)
+                    if (
+                        pending_chars >= coalesce_chars
+                        or time.monotonic() - pending_since >= window
+                    ):
+                        yield framer.content("".join(pending))
+                        pending.clear()
+                        pending_chars = 0
             elif item.get("type") == "usage":
                 usage_stats = item.get("usage")
             item = next(stream_gen, None)
 
-        yield _sse_chunk(ChatCompletionChunkDelta(), finish_reason="stop")
+        if pending:
+            yield framer.content("".join(pending))
+            pending.clear()
+        yield framer.chunk(ChatCompletionChunkDelta(), finish_reason="stop")
         if usage_stats:
-            yield _sse_usage_chunk(usage_stats)
+            yield framer.usage(usage_stats)
     except Exception as e:
         logger.error(f"Error during chat completion stream: {e}")
+        if pending:
+            # Deliver what the client has already paid for before the error.
+            yield framer.content("".join(pending))
         error_payload = {
             "error": {
                 "message": (
@@ -336,9 +421,9 @@ def _event_stream(
                 "type": "server_error",
             }
         }
-        yield f"data: {json.dumps(error_payload)}\n\n"
+        yield b"data: " + orjson.dumps(error_payload) + b"\n\n"
     finally:
-        yield "data: [DONE]\n\n"
+        yield b"data: [DONE]\n\n"
 
 
 async def _save_stream_feedback(
@@ -378,16 +463,22 @@ async def _stream_chat_completion(
     created = int(time.time())
     start_time = time.time()
 
-    stream_gen = service.run_inference_stream(
-        messages=messages,
-        model_type=INTERNAL_MODEL_TYPE,
-        temperature=chat_request.temperature,
-        max_tokens=chat_request.max_tokens,
-        top_p=chat_request.top_p,
-        stop=chat_request.stop,
-    )
-
-    first_item = await _fetch_first_stream_item(stream_gen)
+    # The slot is held until the last chunk is sent, not just the first.
+    lease = await acquire_upstream_slot(UPSTREAM, user)
+    try:
+        stream_gen = service.run_inference_stream(
+            messages=messages,
+            model_type=INTERNAL_MODEL_TYPE,
+            temperature=chat_request.temperature,
+            max_tokens=chat_request.max_tokens,
+            top_p=chat_request.top_p,
+            stop=chat_request.stop,
+        )
+        first_item = await _fetch_first_stream_item(stream_gen)
+    except BaseException:
+        if lease is not None:
+            lease.release()
+        raise
 
     accumulated: List[str] = []
 
@@ -401,13 +492,16 @@ async def _stream_chat_completion(
     )
 
     return StreamingResponse(
-        _event_stream(
-            completion_id,
-            created,
-            chat_request.model,
-            first_item,
-            stream_gen,
-            accumulated,
+        release_after(
+            _event_stream(
+                completion_id,
+                created,
+                chat_request.model,
+                first_item,
+                stream_gen,
+                accumulated,
+            ),
+            lease,
         ),
         media_type="text/event-stream",
         headers={
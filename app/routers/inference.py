@@ -47,6 +47,7 @@ from app.services.inference_service import (
     get_inference_service,
     run_inference,
 )
+from app.services.upstream_limiter import upstream_slot
 from app.utils.feedback import INFERENCE_TYPES, save_api_inference
 from app.utils.quota_guard import check_quota
 from app.utils.rate_limit import get_account_type_limit, limiter
@@ -219,36 +220,37 @@ async def sunflower_inference(  # noqa: C901
         logging.info(f"Temperature: {chat_request.temperature}")
 
         # Call the inference with retry logic
-        try:
-            response = run_inference(
-                messages=messages_dict,
-                model_type=chat_request.model_type,
-                stream=chat_request.stream,
-                custom_system_message=chat_request.system_message,
-            )
+        async with upstream_slot("sunflower", user):
+            try:
+                response = run_inference(
+                    messages=messages_dict,
+                    model_type=chat_request.model_type,
+                    stream=chat_request.stream,
+                    custom_system_message=chat_request.system_message,
+                )
 
-            logging.info(f"Sunflower inference successful for user {user.id}")
+                logging.info(f"Sunflower inference successful for user {user.id}")
 
-        except ModelLoadingError as e:
-            logging.error(f"Model loading error: {e}")
-            raise ServiceUnavailableError(
-                message="The AI model is currently loading. This usually takes 2-3 minutes. Please try again shortly."
-            )
-        except TimeoutError as e:
-            logging.error(f"Inference timeout: {e}")
-            raise ServiceUnavailableError(
-                message="The request timed out. Please try again with a shorter prompt or check your network connection."  # noqa: E501
-            )
-        except ValueError as e:
-            logging.error(f"Invalid request: {e}")
-            raise BadRequestError(message=f"Invalid request: {str(e)}")
-        except Exception as e:
-            logging.error(f"Unexpected inference error: {e}")
-            raise ExternalServiceError(
-                service_name="Sunflower Inference Service",
-                message="An unexpected error occurred during inference. Please try again.",
-                original_error=str(e),
-            )
+            except ModelLoadingError as e:
+                logging.error(f"Model loading error: {e}")
+                raise ServiceUnavailableError(
+                    message="The AI model is currently loading. This usually takes 2-3 minutes. Please try again shortly."  # noqa: E501
+                )
+            except TimeoutError as e:
+                logging.error(f"Inference timeout: {e}")
+                raise ServiceUnavailableError(
+                    message="The request timed out. Please try again with a shorter prompt or check your network connection."  # noqa: E501
+                )
+            except ValueError as e:
+                logging.error(f"Invalid request: {e}")
+                raise BadRequestError(message=f"Invalid request: {str(e)}")
+            except Exception as e:
+                logging.error(f"Unexpected inference error: {e}")
+                raise ExternalServiceError(
+                    service_name="Sunflower Inference Service",
+                    message="An unexpected error occurred during inference. Please try again.",
+                    original_error=str(e),
+                )
 
         # Process the response
         if not response or not response.get("content"):
@@ -414,31 +416,32 @@ async def sunflower_simple_inference(  # noqa: C901
         logging.info(f"Instruction length: {len(instruction)} characters")
 
         # Call the inference
-        try:
-            response = run_inference(
-                instruction=instruction.strip(),
-                model_type=model_type,
-                stream=False,
-                custom_system_message=system_message,
-            )
+        async with upstream_slot("sunflower", user):
+            try:
+                response = run_inference(
+                    instruction=instruction.strip(),
+                    model_type=model_type,
+                    stream=False,
+                    custom_system_message=system_message,
+                )
 
-        except ModelLoadingError as e:
-            logging.error(f"Model loading error: {e}")
-            raise ServiceUnavailableError(
-                message="The AI model is currently loading. Please wait 2-3 minutes and try again."
-            )
-        except TimeoutError as e:
-            logging.error(f"Inference timeout: {e}")
-            raise ServiceUnavailableError(
-                message="Request timed out. Please try again with a shorter instruction."
-            )
-        except Exception as e:
-            logging.error(f"Inference error: {e}")
-            raise ExternalServiceError(
-                service_name="Sunflower Inference Service",
-                message="Inference failed. Please try again.",
-                original_error=str(e),
-            )
+            except ModelLoadingError as e:
+                logging.error(f"Model loading error: {e}")
+                raise ServiceUnavailableError(
+                    message="The AI model is currently loading. Please wait 2-3 minutes and try again."
+                )
+            except TimeoutError as e:
+                logging.error(f"Inference timeout: {e}")
+                raise ServiceUnavailableError(
+                    message="Request timed out. Please try again with a shorter instruction."
+                )
+            except Exception as e:
+                logging.error(f"Inference error: {e}")
+                raise ExternalServiceError(
+                    service_name="Sunflower Inference Service",
+                    message="Inference failed. Please try again.",
+                    original_error=str(e),
+                )
 
         end_time = time.time()
         total_time = end_time - start_time
@@ -0,0 +1,153 @@
+"""Asynchronous job router.
+
+Long-running transcription and diarization accepted as background jobs:
+
+    - POST /tasks/jobs/transcriptions: validate and accept a job (HTTP 202)
+    - GET /tasks/jobs/{job_id}: job status and, once finished, the result
+
+Inputs mirror ``POST /tasks/audio/transcriptions``; the optional
+``callback_url`` is POSTed the final job document. It must resolve to a public
+address (see ``app.utils.callback_url``).
+"""
+
+import logging
+import tempfile
+from typing import Optional
+
+import aiofiles
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequestError
+from app.deps import (
+    QuotaServiceDep,
+    TranscriptionJobServiceDep,
+    TranscriptionServiceDep,
+    get_current_user,
+    get_db,
+)
+from app.schemas.jobs import TranscriptionJob, TranscriptionJobAccepted
+from app.schemas.stt import CHUNK_SIZE, SttbLanguage, TranscriptionPlatform
+from app.services.transcription_job_service import TranscriptionJobRequest
+from app.utils.audio import get_audio_extension
+from app.utils.callback_url import UnsafeCallbackURL, resolve_callback_url
+from app.utils.quota_guard import check_quota
+from app.utils.rate_limit import get_account_type_limit, limiter
+
+logging.basicConfig(level=logging.INFO)
+
+router = APIRouter()
+
+
+async def _validate_callback_url(callback_url: Optional[str]) -> Optional[str]:
+    if not callback_url:
+        return None
+    try:
+        await resolve_callback_url(callback_url)
+    except UnsafeCallbackURL as e:
+        raise BadRequestError(message=str(e))
+    return callback_url
+
+
+@router.post(
+    "/jobs/transcriptions",
+    status_code=202,
+    response_model=TranscriptionJobAccepted,
+    summary="Start an asynchronous transcription job",
+    description=(
+        "Accepts the same inputs as /tasks/audio/transcriptions but returns a "
+        "job id immediately. Poll GET /tasks/jobs/{job_id} for the result, or "
+        "pass callback_url to be POSTed the final job document."
+    ),
+    tags=["Speech-to-Text"],
+)
+@limiter.limit(get_account_type_limit)
+async def create_transcription_job(
+    request: Request,
+    quota: QuotaServiceDep,
+    transcription_service: TranscriptionServiceDep,
+    jobs: TranscriptionJobServiceDep,
+    language: SttbLanguage = Form(..., description="Target language code."),
+    audio: UploadFile = File(default=None, description="Audio file to transcribe."),
+    gcs_blob_name: Optional[str] = Form(
+        default=None, description="GCS blob name (RunPod only)."
+    ),
+    platform: TranscriptionPlatform = Form(
+        default=TranscriptionPlatform.runpod,
+        description="Transcription platform: 'runpod' (default) or 'modal'.",
+    ),
+    adapter: SttbLanguage = Form(
+        default=None,
+        description="Language adapter (RunPod only). Defaults to the language.",
+    ),
+    whisper: bool = Form(default=False, description="Use Whisper (RunPod only)."),
+    recognise_speakers: bool = Form(
+        default=False,
+        description="Enable speaker diarization (RunPod only).",
+    ),
+    org: bool = Form(
+        default=False, description="Use the RunPod organization workflow."
+    ),
+    callback_url: Optional[str] = Form(
+        default=None,
+        description="Optional http(s) URL POSTed the job document when it finishes.",
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> TranscriptionJobAccepted:
+    """Validate a transcription request and run it in the background."""
+    await check_quota(quota, db, current_user)
+
+    has_audio = audio is not None and bool(audio.filename)
+    resolved_whisper, resolved_speakers = transcription_service.validate_and_normalize(
+        platform=platform.value,
+        has_audio=has_audio,
+        gcs_blob_name=gcs_blob_name,
+        org=org,
+        whisper=whisper,
+        recognise_speakers=recognise_speakers,
+    )
+    job_request = TranscriptionJobRequest(
+        platform=platform.value,
+        language=language.value,
+        adapter=(adapter or language).value,
+        org=org,
+        whisper=resolved_whisper,
+        recognise_speakers=resolved_speakers,
+        gcs_blob_name=gcs_blob_name,
+        callback_url=await _validate_callback_url(callback_url),
+    )
+
+    if has_audio:
+        # The upload is gone once this request ends; the job owns a copy.
+        job_request.content_type = audio.content_type
+        job_request.file_extension = get_audio_extension(audio.filename)
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=job_request.file_extension
+        ) as temp_file:
+            job_request.file_path = temp_file.name
+        async with aiofiles.open(job_request.file_path, "wb") as out_file:
+            while content := await audio.read(CHUNK_SIZE):
+                await out_file.write(content)
+
+    job = await jobs.submit(current_user, job_request)
+    return TranscriptionJobAccepted(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=str(request.url_for("get_job", job_id=job.job_id).path),
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=TranscriptionJob,
+    summary="Get an asynchronous job",
+    tags=["Speech-to-Text"],
+)
+async def get_job(
+    job_id: str,
+    jobs: TranscriptionJobServiceDep,
+    current_user=Depends(get_current_user),
+) -> TranscriptionJob:
+    """Return the status (and result, once finished) of one of your jobs."""
+    return await jobs.get(job_id, current_user)
@@ -36,6 +36,7 @@ from app.schemas.orpheus_tts import (
     OrpheusTTSRequest,
     OrpheusTTSResponse,
 )
+from app.services.upstream_limiter import upstream_slot
 from app.utils.deprecation import (
     SUCCESSOR_SPEECH,
     SUCCESSOR_SPEECH_BATCH,
@@ -136,16 +137,17 @@ async def synthesize_tts(
         "Deprecated endpoint /tasks/modal/orpheus/tts called; use POST /tasks/audio/speech"
     )
     add_deprecation_headers(http_response, SUCCESSOR_SPEECH)
-    result = await service.synthesize(
-        text=body.text,
-        speaker_id=body.speaker_id,
-        language=body.language,
-        seed=body.seed,
-        temperature=body.temperature,
-        top_p=body.top_p,
-        repetition_penalty=body.repetition_penalty,
-        max_tokens=body.max_tokens,
-    )
+    async with upstream_slot("orpheus", current_user):
+        result = await service.synthesize(
+            text=body.text,
+            speaker_id=body.speaker_id,
+            language=body.language,
+            seed=body.seed,
+            temperature=body.temperature,
+            top_p=body.top_p,
+            repetition_penalty=body.repetition_penalty,
+            max_tokens=body.max_tokens,
+        )
     request_id = uuid.uuid4().hex
 
     response = OrpheusTTSResponse(
@@ -226,7 +228,8 @@ async def synthesize_tts_batch(
         }
         for it in body.items
     ]
-    batch = await service.synthesize_batch(items_payload)
+    async with upstream_slot("orpheus", current_user):
+        batch = await service.synthesize_batch(items_payload)
     request_id = uuid.uuid4().hex
 
     results = [
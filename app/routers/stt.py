@@ -27,11 +27,9 @@ import datetime
 import logging
 import os
 import shutil
-import tempfile
 import time
 from typing import Optional
 
-import aiofiles
 from dotenv import load_dotenv
 from fastapi import (
     APIRouter,
@@ -54,7 +52,8 @@ from app.core.exceptions import (
 )
 from app.crud.audio_transcription import create_audio_transcription
 from app.deps import ModalSTTServiceDep, QuotaServiceDep, get_current_user, get_db
-from app.schemas.stt import CHUNK_SIZE, SttbLanguage, STTTranscript
+from app.schemas.stt import SttbLanguage, STTTranscript
+from app.services.modal_stt_service import iter_upload
 from app.services.stt_service import (
     AudioProcessingError,
     AudioValidationError,
@@ -62,6 +61,7 @@ from app.services.stt_service import (
     TranscriptionError,
     get_stt_service,
 )
+from app.services.upstream_limiter import upstream_slot
 from app.utils.audio import get_audio_extension
 from app.utils.deprecation import (
     SUCCESSOR_TRANSCRIPTIONS,
@@ -135,13 +135,14 @@ async def speech_to_text_from_gcs(
     add_deprecation_headers(http_response, SUCCESSOR_TRANSCRIPTIONS)
 
     try:
-        result = await service.transcribe_from_gcs(
-            gcs_blob_name=gcs_blob_name,
-            language=language.value,
-            adapter=adapter.value,
-            whisper=whisper,
-            recognise_speakers=recognise_speakers,
-        )
+        async with upstream_slot("runpod_asr", current_user):
+            result = await service.transcribe_from_gcs(
+                gcs_blob_name=gcs_blob_name,
+                language=language.value,
+                adapter=adapter.value,
+                whisper=whisper,
+                recognise_speakers=recognise_speakers,
+            )
 
         # Save transcription to DB if valid
         audio_transcription_id = None
@@ -207,7 +208,7 @@ async def speech_to_text_from_gcs(
             service_name="STT Transcription Service",
             message=str(e),
         )
-    except (BadRequestError, ExternalServiceError):
+    except (BadRequestError, ExternalServiceError, ServiceUnavailableError):
         raise
     except Exception as e:
         logging.error(f"Unexpected error in speech_to_text_from_gcs: {str(e)}")
@@ -297,25 +298,17 @@ async def speech_to_text(  # noqa: C901
                 ],
             )
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=file_extension
-        ) as temp_file:
-            file_path = temp_file.name
-            # Stream the file in chunks to avoid memory issues
-            async with aiofiles.open(file_path, "wb") as out_file:
-                while content := await audio.read(CHUNK_SIZE):
-                    await out_file.write(content)
-
-        # Transcribe
-        result = await service.transcribe_uploaded_file(
-            file_path=file_path,
-            file_extension=file_extension,
-            language=language.value,
-            adapter=adapter.value,
-            whisper=whisper,
-            recognise_speakers=recognise_speakers,
-        )
+        # Transcribe; the upload is piped straight into cloud storage
+        async with upstream_slot("runpod_asr", current_user):
+            result = await service.transcribe_upload_stream(
+                audio,
+                file_extension,
+                content_type=content_type,
+                language=language.value,
+                adapter=adapter.value,
+                whisper=whisper,
+                recognise_speakers=recognise_speakers,
+            )
 
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -385,7 +378,12 @@ async def speech_to_text(  # noqa: C901
             service_name="STT Transcription Service",
             message=str(e),
         )
-    except (BadRequestError, ValidationError, ExternalServiceError):
+    except (
+        BadRequestError,
+        ValidationError,
+        ExternalServiceError,
+        ServiceUnavailableError,
+    ):
         raise
     except Exception as e:
         logging.error(f"Unexpected error in speech_to_text: {str(e)}")
@@ -469,10 +467,11 @@ async def speech_to_text_org(
             shutil.copyfileobj(audio.file, buffer)
 
         # Transcribe
-        result = await service.transcribe_org_audio(
-            file_path=file_path,
-            recognise_speakers=recognise_speakers,
-        )
+        async with upstream_slot("runpod_asr", current_user):
+            result = await service.transcribe_org_audio(
+                file_path=file_path,
+                recognise_speakers=recognise_speakers,
+            )
 
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -507,6 +506,8 @@ async def speech_to_text_org(
             service_name="STT Transcription Service",
             message=str(e),
         )
+    except ServiceUnavailableError:
+        raise
     except TimeoutError:
         raise ServiceUnavailableError(message="Service unavailable due to timeout")
     except ConnectionError:
@@ -591,18 +592,16 @@ async def modal_speech_to_text(
     add_deprecation_headers(http_response, SUCCESSOR_TRANSCRIPTIONS)
 
     try:
-        # Read audio bytes from uploaded file
-        audio_data = await audio.read()
-
         logging.info(
-            f"Modal STT: received {len(audio_data)} bytes from file "
+            f"Modal STT: received {audio.size} bytes from file "
             f"'{audio.filename}', language={language}"
         )
 
-        # Call the Modal Whisper ASR service
-        transcription = await modal_stt_service.transcribe(
-            audio_data, language=language
-        )
+        # Stream the upload to the Modal Whisper ASR service
+        async with upstream_slot("modal_stt", current_user):
+            transcription = await modal_stt_service.transcribe(
+                iter_upload(audio), language=language
+            )
         logging.info(f"Modal STT: transcription result - {transcription[:100]}...")
 
         elapsed_time = time.time() - start_time
@@ -4,7 +4,6 @@ import os
 import time
 
 import requests
-import runpod
 from dotenv import load_dotenv
 from fastapi import (
     APIRouter,
@@ -23,6 +22,7 @@ from tenacity import (
 )
 
 from app.deps import QuotaServiceDep, get_current_user, get_db
+from app.integrations.runpod import run_runpod_job
 from app.schemas.tasks import SummarisationRequest, SummarisationResponse, TTSRequest
 from app.utils.deprecation import SUCCESSOR_SPEECH, add_deprecation_headers
 from app.utils.feedback import INFERENCE_TYPES, save_api_inference
@@ -36,8 +36,6 @@ logging.basicConfig(level=logging.INFO)
 
 PER_MINUTE_RATE_LIMIT = os.getenv("PER_MINUTE_RATE_LIMIT", 10)
 RUNPOD_ENDPOINT_ID = os.getenv("RUNPOD_ENDPOINT_ID")
-# Set RunPod API Key
-runpod.api_key = os.getenv("RUNPOD_API_KEY")
 
 # Inference type constants — preserved for backward-compatible imports.
 INFERENCE_CHAT = INFERENCE_TYPES["chat"]
@@ -92,8 +90,9 @@ except Exception as e:
     ),  # Retry on these exceptions
     reraise=True,  # Reraise the exception if all retries fail
 )
-async def call_endpoint_with_retry(endpoint, data):
-    return endpoint.run_sync(data, timeout=600)  # Timeout in seconds
+async def call_endpoint_with_retry(data):
+    # Timeout in seconds; the job is cancelled on timeout or client disconnect.
+    return await run_runpod_job(data, timeout=600, endpoint_id=RUNPOD_ENDPOINT_ID)
 
 
 @router.post(
@@ -113,7 +112,6 @@ async def summarise(
     supported for now are English (eng) and Luganda (lug).
     """
     await check_quota(quota, db, current_user)
-    endpoint = runpod.Endpoint(RUNPOD_ENDPOINT_ID)
     request_response = {}
     data = {
         "input": {
@@ -125,7 +123,7 @@ async def summarise(
     start_time = time.time()
 
     try:
-        request_response = await call_endpoint_with_retry(endpoint, data)
+        request_response = await call_endpoint_with_retry(data)
         logging.info(f"Response: {request_response}")
     except TimeoutError as e:
         logging.error(f"Job timed out: {str(e)}")
@@ -208,7 +206,6 @@ async def text_to_speech(  # noqa: C901
     )
     add_deprecation_headers(http_response, SUCCESSOR_SPEECH)
 
-    endpoint = runpod.Endpoint(RUNPOD_ENDPOINT_ID)
     user = current_user
 
     text = tts_request.text
@@ -272,7 +269,7 @@ async def text_to_speech(  # noqa: C901
 
     start_time = time.time()
     try:
-        request_response = await call_endpoint_with_retry(endpoint, data)
+        request_response = await call_endpoint_with_retry(data)
     except TimeoutError as e:
         logging.error(f"Job timed out: {str(e)}")
         raise HTTPException(
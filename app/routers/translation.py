@@ -33,6 +33,7 @@ from app.schemas.translation import (
     WorkerTranslationResponse,
 )
 from app.services.inference_service import InferenceTimeoutError, ModelLoadingError
+from app.services.upstream_limiter import upstream_slot
 from app.utils.feedback import INFERENCE_TYPES, save_api_inference
 from app.utils.languages import UnsupportedLanguageError, resolve_language
 from app.utils.quota_guard import check_quota
@@ -117,37 +118,39 @@ async def translate(  # noqa: C901
 
     start_time = time.time()
 
-    try:
-        result = await service.translate_via_sunflower(
-            text=translation_request.text,
-            target_language=target,
-            source_language=source,
-        )
-    except ModelLoadingError as e:
-        logging.error(f"Model loading error during translation: {e}")
-        raise ServiceUnavailableError(
-            message=(
-                "The AI model is currently loading. This usually takes "
-                "2-3 minutes. Please try again shortly."
+    async with upstream_slot("sunflower", current_user):
+        try:
+            result = await service.translate_via_sunflower(
+                text=translation_request.text,
+                target_language=target,
+                source_language=source,
+            )
+        except ModelLoadingError as e:
+            logging.error(f"Model loading error during translation: {e}")
+            raise ServiceUnavailableError(
+                message=(
+                    "The AI model is currently loading. This usually takes "
+                    "2-3 minutes. Please try again shortly."
+                )
+            )
+        except InferenceTimeoutError as e:
+            logging.error(f"Translation timed out: {e}")
+            raise ServiceUnavailableError(
+                message="The request timed out. Please try again with a shorter text."
+            )
+        except ValueError as e:
+            logging.error(f"Invalid translation request: {e}")
+            raise BadRequestError(message=f"Invalid request: {str(e)}")
+        except Exception as e:
+            logging.error(f"Unexpected error during translation: {e}")
+            raise ExternalServiceError(
+                service_name="Sunflower Translation Service",
+                message=(
+                    "An unexpected error occurred during translation. "
+                    "Please try again."
+                ),
+                original_error=str(e),
             )
-        )
-    except InferenceTimeoutError as e:
-        logging.error(f"Translation timed out: {e}")
-        raise ServiceUnavailableError(
-            message="The request timed out. Please try again with a shorter text."
-        )
-    except ValueError as e:
-        logging.error(f"Invalid translation request: {e}")
-        raise BadRequestError(message=f"Invalid request: {str(e)}")
-    except Exception as e:
-        logging.error(f"Unexpected error during translation: {e}")
-        raise ExternalServiceError(
-            service_name="Sunflower Translation Service",
-            message=(
-                "An unexpected error occurred during translation. " "Please try again."
-            ),
-            original_error=str(e),
-        )
 
     if not result.translated_text:
         raise ExternalServiceError(
@@ -4,14 +4,16 @@ API Routes
 All TTS API endpoints.
 """
 
+import asyncio
 import base64
 import json
 import logging
 import time
-from io import BytesIO
+from contextlib import aclosing
+from typing import AsyncIterator, Union
 
 import httpx
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -32,6 +34,12 @@ from app.schemas.tts import (
     TTSResponse,
     TTSStreamFinalResponse,
 )
+from app.utils.audio_frames import (
+    FRAMES_MEDIA_TYPE,
+    audio_frame,
+    control_frame,
+    wants_frames,
+)
 from app.utils.deprecation import (
     SUCCESSOR_SPEECH,
     SUCCESSOR_SPEECH_URL,
@@ -112,6 +120,7 @@ async def generate_tts(
     storage_service: LegacyStorageServiceDep,
     tts_service: TTSServiceDep,
     background_tasks: BackgroundTasks,
+    http_request: Request,
     http_response: Response,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
@@ -133,7 +142,12 @@ async def generate_tts(
     if request.response_mode == TTSResponseMode.STREAM:
         return await _stream_audio(request, tts_service)
     elif request.response_mode == TTSResponseMode.BOTH:
-        return await _stream_audio_with_url(request, storage_service, tts_service)
+        return await _stream_audio_with_url(
+            request,
+            storage_service,
+            tts_service,
+            framed=wants_frames(http_request.headers.get("accept", "")),
+        )
 
     # URL mode (default)
     start_time = time.time()
@@ -151,7 +165,9 @@ async def generate_tts(
         blob = await storage_service.upload_audio_async(audio_data, file_name)
 
         # Generate signed URL
-        signed_url, expires_at = storage_service.generate_signed_url(blob)
+        signed_url, expires_at = await asyncio.to_thread(
+            storage_service.generate_signed_url, blob
+        )
 
         # Estimate duration
         duration_estimate = tts_service.estimate_duration(request.text)
@@ -265,7 +281,9 @@ async def refresh_signed_url(
     )
     add_deprecation_headers(http_response, SUCCESSOR_SPEECH_URL)
     try:
-        signed_url, expires_at = storage_service.get_signed_url_for_file(file_name)
+        signed_url, expires_at = await asyncio.to_thread(
+            storage_service.get_signed_url_for_file, file_name
+        )
 
         return TTSResponse(
             success=True,
@@ -301,80 +319,114 @@ async def _stream_audio(
     return StreamingResponse(
         audio_generator(),
         media_type="audio/wav",
-        headers={
-            "Content-Disposition": 'attachment; filename="tts_output.wav"',
-            "X-Speaker-ID": str(request.speaker_id.value),
-            "X-Speaker-Name": request.speaker_id.display_name,
-            "X-Text-Length": str(len(request.text)),
-        },
+        headers=_stream_headers(request),
     )
 
 
+def _stream_headers(request: TTSRequest) -> dict:
+    """Headers of a raw audio/wav streaming response."""
+    return {
+        "Content-Disposition": 'attachment; filename="tts_output.wav"',
+        "X-Speaker-ID": str(request.speaker_id.value),
+        "X-Speaker-Name": request.speaker_id.display_name,
+        "X-Text-Length": str(len(request.text)),
+    }
+
+
 async def _stream_audio_with_url(
     request: TTSRequest,
     storage_service: LegacyStorageServiceDep,
     tts_service: TTSServiceDep,
+    framed: bool = False,
 ) -> StreamingResponse:
     """
-    Stream audio chunks and upload the complete audio to GCP Storage.
-
-    Uses Server-Sent Events (SSE) format to send:
-    1. Audio chunks (base64 encoded)
-    2. Final message with signed URL
-    """
+    Stream audio chunks while uploading them to GCP Storage.
 
-    async def audio_generator_with_upload():
-        audio_buffer = BytesIO()
-        total_bytes = 0
-
-        try:
-            # Stream audio chunks
-            async for chunk in tts_service.generate_audio_stream(
-                text=request.text, speaker_id=request.speaker_id
-            ):
-                audio_buffer.write(chunk)
-                total_bytes += len(chunk)
-
-                # Send chunk as SSE event
-                chunk_b64 = base64.b64encode(chunk).decode("utf-8")
-                event_data = json.dumps(
-                    {"event": "audio_chunk", "data": chunk_b64, "bytes": len(chunk)}
-                )
-                yield f"data: {event_data}\n\n"
-
-            # Upload complete audio to GCP
-            audio_data = audio_buffer.getvalue()
-            file_name = storage_service.generate_file_name(
-                request.text, request.speaker_id
-            )
-            blob = await storage_service.upload_audio_async(audio_data, file_name)
-
-            # Generate signed URL
-            signed_url, expires_at = storage_service.generate_signed_url(blob)
-
-            # Send final event with URL
-            final_response = TTSStreamFinalResponse(
-                audio_url=signed_url,
-                expires_at=expires_at,
-                file_name=file_name,
-                total_bytes=total_bytes,
-            )
-            yield f"data: {final_response.model_dump_json()}\n\n"
-
-        except Exception as e:
-            error_event = json.dumps({"event": "error", "error": str(e)})
-            yield f"data: {error_event}\n\n"
+    The upload is a resumable one fed as chunks arrive (see
+    ``GCPStorageService.open_streaming_upload``), so the signed URL follows
+    the last chunk almost immediately. Two transports:
 
+    - Server-Sent Events (default): audio chunks as base64 JSON events,
+      then a final message with the signed URL;
+    - binary frames (``framed``, see ``app.utils.audio_frames``): raw audio
+      frames, then the final message as a trailing control frame.
+    """
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Speaker-ID": str(request.speaker_id.value),
+        "X-Speaker-Name": request.speaker_id.display_name,
+        "X-Text-Length": str(len(request.text)),
+    }
+    events = _audio_with_upload(request, storage_service, tts_service)
+    if framed:
+        return StreamingResponse(
+            _frame_events(events), media_type=FRAMES_MEDIA_TYPE, headers=headers
+        )
     return StreamingResponse(
-        audio_generator_with_upload(),
+        _sse_events(events),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Speaker-ID": str(request.speaker_id.value),
-            "X-Speaker-Name": request.speaker_id.display_name,
-            "X-Text-Length": str(len(request.text)),
-        },
+        headers={**headers, "Connection": "keep-alive"},
+    )
+
+
+async def _sse_events(events: AsyncIterator) -> AsyncIterator[str]:
+    """Encode ``_audio_with_upload`` output as Server-Sent Events."""
+    try:
+        async with aclosing(events):
+            async for item in events:
+                if isinstance(item, bytes):
+                    chunk_b64 = base64.b64encode(item).decode("utf-8")
+                    event_data = json.dumps(
+                        {"event": "audio_chunk", "data": chunk_b64, "bytes": len(item)}
+                    )
+                    yield f"data: {event_data}\n\n"
+                else:
+                    yield f"data: {item.model_dump_json()}\n\n"
+    except Exception as e:
+        error_event = json.dumps({"event": "error", "error": str(e)})
+        yield f"data: {error_event}\n\n"
+
+
+async def _frame_events(events: AsyncIterator) -> AsyncIterator[bytes]:
+    """Encode ``_audio_with_upload`` output as binary frames."""
+    try:
+        async with aclosing(events):
+            async for item in events:
+                if isinstance(item, bytes):
+                    yield audio_frame(item)
+                else:
+                    yield control_frame(item.model_dump(mode="json"))
+    except Exception as e:
+        yield control_frame({"event": "error", "error": str(e)})
+
+
+async def _audio_with_upload(
+    request: TTSRequest,
+    storage_service: LegacyStorageServiceDep,
+    tts_service: TTSServiceDep,
+) -> AsyncIterator[Union[bytes, TTSStreamFinalResponse]]:
+    """Yield audio chunks as they are uploaded, then the final URL message."""
+    file_name = storage_service.generate_file_name(request.text, request.speaker_id)
+    upload = storage_service.open_streaming_upload(file_name)
+    try:
+        async for chunk in tts_service.generate_audio_stream(
+            text=request.text, speaker_id=request.speaker_id
+        ):
+            await upload.write(chunk)
+            yield chunk
+        blob = await upload.finish()
+    except BaseException:
+        await upload.abort()
+        raise
+
+    signed_url, expires_at = await asyncio.to_thread(
+        storage_service.generate_signed_url, blob
+    )
+    yield TTSStreamFinalResponse(
+        audio_url=signed_url,
+        expires_at=expires_at,
+        file_name=file_name,
+        total_bytes=upload.bytes_written,
     )
 
 
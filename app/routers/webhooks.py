@@ -7,6 +7,7 @@ primarily for WhatsApp Business API webhook handling.
 Endpoints:
     - POST /webhook: Handle incoming WhatsApp webhooks
     - GET /webhook: Verify webhook endpoint ownership
+    - POST /webhooks/runpod/{token}: RunPod job completion callbacks
 
 Architecture:
     Routes -> WhatsAppService -> WhatsApp API
@@ -34,6 +35,7 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.exceptions import AuthorizationError, BadRequestError
+from app.integrations.runpod_webhooks import get_completion_hub
 from app.integrations.whatsapp_store import save_response
 from app.schemas.webhooks import WebhookResponse
 from app.services.message_processor import OptimizedMessageProcessor, ResponseType
@@ -492,3 +494,46 @@ async def verify_webhook(
     raise BadRequestError(
         message="Missing required parameters for webhook verification"
     )
+
+
+@router.post("/webhooks/runpod/{token:path}", include_in_schema=False)
+async def runpod_job_webhook(request: Request, token: str) -> dict:
+    """
+    Receive RunPod serverless completion callbacks.
+
+    RunPod POSTs the final job status document (id, status, output,
+    delayTime, ...) to the webhook URL given on ``/run``. The document
+    resolves the waiting request on this instance, or is relayed to the
+    other instances over Redis.
+
+    RunPod neither signs callbacks nor sends custom headers, so the shared
+    secret is the last path segment of the URL (kept out of the query
+    string). Callbacks are refused while no secret is configured.
+
+    Raises:
+        AuthorizationError: If RUNPOD_WEBHOOK_SECRET is unset or ``token``
+            does not match it.
+        BadRequestError: If the body is not a job status document.
+    """
+    secret = settings.runpod_webhook_secret
+    if not secret or not hmac.compare_digest(token.encode(), secret.encode()):
+        logging.warning("Rejected RunPod webhook with an invalid token")
+        raise AuthorizationError(message="Invalid webhook token")
+
+    try:
+        details = await request.json()
+    except ValueError:
+        raise BadRequestError(message="Webhook body must be JSON")
+    if not isinstance(details, dict) or not details.get("id"):
+        raise BadRequestError(message="Webhook body must include a job id")
+
+    delivered = await get_completion_hub().deliver(details)
+    logging.info(
+        "RunPod webhook for job %s (%s), delivered=%s",
+        details.get("id"),
+        details.get("status"),
+        delivered,
+    )
+    # Always 200: RunPod retries non-2xx callbacks, and an unmatched
+    # callback simply means the waiter already finished by polling.
+    return {"status": "ok", "delivered": delivered}
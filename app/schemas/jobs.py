@@ -0,0 +1,85 @@
+"""
+Asynchronous Job Schema Definitions.
+
+This module contains Pydantic models for the asynchronous job API, which
+accepts long-running work (RunPod transcription and diarization), returns a
+job id immediately and lets the client poll for, or be called back with,
+the result.
+
+Usage:
+    from app.schemas.jobs import (
+        JobStatus,
+        TranscriptionJob,
+        TranscriptionJobAccepted,
+    )
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.stt import STTTranscript
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an asynchronous job.
+
+    Attributes:
+        queued: Accepted, waiting for an upstream slot.
+        running: Being processed.
+        succeeded: Finished; ``result`` is set.
+        failed: Finished with an error; ``error`` is set.
+    """
+
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+    @property
+    def is_final(self) -> bool:
+        return self in (JobStatus.succeeded, JobStatus.failed)
+
+
+class TranscriptionJobAccepted(BaseModel):
+    """Response returned when a transcription job is accepted (HTTP 202)."""
+
+    job_id: str = Field(..., description="Identifier of the new job")
+    status: JobStatus = Field(..., description="Initial job status")
+    status_url: str = Field(..., description="Path to poll for the job status")
+
+
+class TranscriptionJob(BaseModel):
+    """State of an asynchronous transcription job.
+
+    Example:
+        {
+            "job_id": "6f1c...",
+            "status": "succeeded",
+            "platform": "runpod",
+            "language": "lug",
+            "created_at": "2026-01-05T10:00:00Z",
+            "updated_at": "2026-01-05T10:03:12Z",
+            "result": {"audio_transcription": "Oli otya", ...},
+            "error": null
+        }
+    """
+
+    job_id: str = Field(..., description="Job identifier")
+    status: JobStatus = Field(..., description="Current job status")
+    platform: str = Field(..., description="Transcription platform")
+    language: str = Field(..., description="Target language code")
+    created_at: datetime = Field(..., description="When the job was accepted")
+    updated_at: datetime = Field(..., description="Last status change")
+    result: Optional[STTTranscript] = Field(
+        None, description="Transcription result once the job succeeded"
+    )
+    error: Optional[str] = Field(None, description="Failure reason if it failed")
+    callback_url: Optional[str] = Field(
+        None, description="URL notified with this document when the job finishes"
+    )
+    callback_status: Optional[int] = Field(
+        None, description="HTTP status returned by the callback URL, if called"
+    )
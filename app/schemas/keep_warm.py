@@ -0,0 +1,48 @@
+"""Schemas for the admin keep-warm endpoints."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class WarmPolicySchema(BaseModel):
+    enabled: bool
+    business_hours_start: int
+    business_hours_end: int
+    business_days: list[int]
+    idle_gap_seconds: int
+    warm_after_traffic_seconds: int
+    cold_start_threshold_seconds: float
+
+
+class EndpointWarmStatus(BaseModel):
+    """Policy and observed state for one serverless endpoint.
+
+    Timestamps are Unix epoch seconds. ``last_delay_seconds`` is RunPod's
+    ``delayTime`` where available, otherwise the ping wall time.
+    """
+
+    name: str
+    policy: WarmPolicySchema
+    in_business_hours: bool
+    due: bool
+    last_traffic_at: Optional[float] = None
+    last_ping_at: Optional[float] = None
+    last_ping_ok: Optional[bool] = None
+    last_ping_seconds: Optional[float] = None
+    last_delay_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    pings_sent: int = 0
+    ping_failures: int = 0
+    cold_starts: int = 0
+    in_flight: bool = False
+
+
+class KeepWarmStatusResponse(BaseModel):
+    enabled: bool
+    running: bool
+    timezone: str
+    tick_seconds: float
+    endpoints: list[EndpointWarmStatus]
@@ -13,5 +13,9 @@ class EndpointLog(BaseModel):
     date: Optional[datetime] = None
     organization_type: Optional[str] = None
     sector: Optional[List[str]] = None
+    gpu_seconds: Optional[float] = None
+    queue_seconds: Optional[float] = None
+    cold_start: Optional[bool] = None
+    upstream: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
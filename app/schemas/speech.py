@@ -42,7 +42,8 @@ class SpeechRequest(BaseModel):
     )
     response_mode: TTSResponseMode = Field(
         default=TTSResponseMode.URL,
-        description="url (signed URL), stream (raw audio), or both (SSE). "
+        description="url (signed URL), stream (raw audio), or both (SSE; binary "
+        "frames with 'Accept: application/x-tts-frames'). "
         "stream/both require model='spark-tts' on platform='modal'.",
     )
     language: Optional[str] = Field(
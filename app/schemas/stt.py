@@ -9,6 +9,7 @@ Usage:
         STTTranscript,
         SttbLanguage,
         STTFromGCSRequest,
+        TranscriptionBatchRequest,
     )
 
 Note:
@@ -17,7 +18,7 @@ Note:
 """
 
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -179,6 +180,74 @@ class STTOrgRequest(BaseModel):
     )
 
 
+class TranscriptionBatchRequest(BaseModel):
+    """Request body for batch transcription of GCS blobs (RunPod).
+
+    Exactly one of ``gcs_blob_names`` or ``manifest_blob_name`` must be set.
+    A manifest is a text blob under the caller's
+    ``batch-manifests/<user_id>/`` prefix in the audio bucket listing one
+    blob name per line (blank lines and lines starting with ``#`` are
+    ignored).
+
+    Attributes:
+        gcs_blob_names: Blob names to transcribe.
+        manifest_blob_name: Blob holding the list of blob names instead.
+        language: Target language for transcription.
+        adapter: Language adapter; defaults to the language.
+        whisper: Whether to use Whisper model for transcription.
+        recognise_speakers: Whether to enable speaker diarization.
+        concurrency: Items transcribed at once (capped by the server).
+        write_results: Write NDJSON results in the background to
+            ``batch-results/<user_id>/<batch_id>.ndjson`` instead of
+            streaming them in the response.
+    """
+
+    gcs_blob_names: Optional[List[str]] = Field(
+        None, min_length=1, description="GCS blob names to transcribe"
+    )
+    manifest_blob_name: Optional[str] = Field(
+        None,
+        description=(
+            "GCS blob under batch-manifests/<user_id>/ listing one blob name "
+            "per line"
+        ),
+    )
+    language: SttbLanguage = Field(..., description="Target language code")
+    adapter: Optional[SttbLanguage] = Field(
+        None, description="Language adapter; defaults to the language"
+    )
+    whisper: bool = Field(False, description="Use Whisper")
+    recognise_speakers: bool = Field(False, description="Enable speaker diarization")
+    concurrency: Optional[int] = Field(
+        None, ge=1, description="Items transcribed at once (capped by the server)"
+    )
+    write_results: bool = Field(
+        False,
+        description=(
+            "Write NDJSON results to batch-results/<user_id>/<batch_id>.ndjson "
+            "instead of streaming them"
+        ),
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "gcs_blob_names": ["calls/0001.wav", "calls/0002.wav"],
+                "language": "lug",
+                "concurrency": 8,
+            }
+        }
+    }
+
+
+class TranscriptionBatchAccepted(BaseModel):
+    """Response returned when a batch writes its results to a blob (HTTP 202)."""
+
+    batch_id: str = Field(..., description="Identifier of the batch")
+    items: int = Field(..., description="Number of blobs in the batch")
+    results_blob_name: str = Field(..., description="Blob the NDJSON is written to")
+
+
 # Constants for file validation
 MAX_AUDIO_FILE_SIZE_MB = 10  # 10MB limit
 MAX_AUDIO_DURATION_MINUTES = 10  # 10 minutes limit
@@ -0,0 +1,264 @@
+"""Shared process pool for CPU-bound audio work.
+
+Decoding and encoding with pydub holds the GIL (and ``asyncio.to_thread``
+does not release it), so a single long file stalled every other request on
+the API worker. ``AudioWorker`` runs the operations in ``app.utils.audio_ops``
+in a ``ProcessPoolExecutor`` instead, behind a small typed API::
+
+    worker = get_audio_worker()
+    info = await worker.probe(path)                      # AudioInfo
+    result = await worker.trim(src, dst, 600, "mp3")     # TrimResult
+    await worker.transcode(wav_path, mp3_path, "mp3", bitrate="96k")
+    await worker.resample(src, dst, frame_rate=16000)
+    chunks = await worker.split(path, max_ms, target_ms, chunk_max_ms, 16000)
+
+Only file paths and small results cross the process boundary.
+
+Backpressure: at most ``AUDIO_WORKER_MAX_QUEUE`` jobs may be queued or
+running per API worker; further submissions raise ``AudioWorkerBusyError``
+(HTTP 503) instead of piling up. A job that outlives
+``AUDIO_WORKER_TIMEOUT_SECONDS`` is abandoned by its caller with
+``AudioWorkerTimeoutError`` (HTTP 503; the process finishes it in the
+background and its slot is freed then).
+
+``AUDIO_WORKER_PROCESSES=0`` runs jobs in threads in this process (tests,
+tiny deployments). ``snapshot()`` reports queue depth, per-operation counts
+and latencies.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.services.base import BaseService
+from app.utils import audio_ops
+from app.utils.audio_ops import AudioInfo, SplitAudio, TrimResult
+
+# Threads used when AUDIO_WORKER_PROCESSES is 0.
+THREAD_FALLBACK_WORKERS = 2
+BUSY_RETRY_AFTER_SECONDS = 5
+
+
+class AudioWorkerBusyError(ServiceUnavailableError):
+    """Raised when the audio worker queue is full."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            message="Audio processing is busy. Please try again shortly.",
+            retry_after=BUSY_RETRY_AFTER_SECONDS,
+        )
+
+
+class AudioWorkerTimeoutError(ServiceUnavailableError):
+    """Raised when an audio job outlives AUDIO_WORKER_TIMEOUT_SECONDS."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            message="Audio processing took too long. Please try again later.",
+            retry_after=BUSY_RETRY_AFTER_SECONDS,
+        )
+
+
+class AudioWorker(BaseService):
+    """Runs audio operations in a bounded process pool."""
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self.processes = (
+            processes if processes is not None else settings.audio_worker_processes
+        )
+        self.max_queue = max_queue or settings.audio_worker_max_queue
+        self.timeout_seconds = timeout_seconds or settings.audio_worker_timeout_seconds
+        self._executor: Optional[Executor] = None
+        # Done callbacks run on pool threads.
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_in_flight = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._operations: Dict[str, Dict[str, float]] = {}
+
+    # ---- typed API ----
+
+    async def probe(self, path: str) -> AudioInfo:
+        """Duration of ``path`` (header first, decoding as a fallback)."""
+        return await self._run(audio_ops.probe, path)
+
+    async def trim(
+        self, src: str, dst: str, max_seconds: float, export_format: str
+    ) -> TrimResult:
+        """Decode ``src`` and write its first ``max_seconds`` to ``dst``."""
+        return await self._run(audio_ops.trim, src, dst, max_seconds, export_format)
+
+    async def transcode(
+        self, src: str, dst: str, export_format: str, bitrate: Optional[str] = None
+    ) -> str:
+        """Re-encode ``src`` to ``dst`` as ``export_format``."""
+        return await self._run(audio_ops.transcode, src, dst, export_format, bitrate)
+
+    async def resample(
+        self,
+        src: str,
+        dst: str,
+        frame_rate: int,
+        channels: int = 1,
+        export_format: str = "wav",
+    ) -> str:
+        """Convert ``src`` to ``frame_rate`` Hz and ``channels`` channels."""
+        return await self._run(
+            audio_ops.resample, src, dst, frame_rate, channels, export_format
+        )
+
+    async def split(
+        self,
+        src: str,
+        max_ms: int,
+        target_ms: int,
+        chunk_max_ms: int,
+        frame_rate: int,
+    ) -> SplitAudio:
+        """Cut ``src`` in pauses into WAV chunk files (caller removes them)."""
+        return await self._run(
+            audio_ops.split, src, max_ms, target_ms, chunk_max_ms, frame_rate
+        )
+
+    # ---- lifecycle and metrics ----
+
+    def close(self) -> None:
+        """Shut the pool down, dropping queued jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth and per-operation counters for this instance."""
+        with self._lock:
+            operations = {
+                name: {
+                    "completed": int(stats["completed"]),
+                    "failed": int(stats["failed"]),
+                    "avg_seconds": (
+                        round(stats["seconds"] / stats["finished"], 4)
+                        if stats["finished"]
+                        else None
+                    ),
+                    "max_seconds": round(stats["max_seconds"], 4),
+                }
+                for name, stats in self._operations.items()
+            }
+            return {
+                "mode": "process" if self.processes else "thread",
+                "workers": self.processes or THREAD_FALLBACK_WORKERS,
+                "in_flight": self._in_flight,
+                "max_queue": self.max_queue,
+                "peak_in_flight": self.peak_in_flight,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "operations": operations,
+            }
+
+    # ---- internals ----
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        future = self._submit(fn, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            self.log_warning(
+                f"Audio {fn.__name__} timed out after {self.timeout_seconds}s"
+            )
+            raise AudioWorkerTimeoutError() from None
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._in_flight >= self.max_queue:
+                self.rejected += 1
+                raise AudioWorkerBusyError()
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        started = time.perf_counter()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(
+            lambda done: self._finished(fn.__name__, started, done)
+        )
+        return future
+
+    def _finished(self, name: str, started: float, future: Future) -> None:
+        seconds = time.perf_counter() - started
+        failed = future.cancelled() or future.exception() is not None
+        with self._lock:
+            self._in_flight -= 1
+            stats = self._operations.setdefault(
+                name,
+                {
+                    "completed": 0,
+                    "failed": 0,
+                    "finished": 0,
+                    "seconds": 0.0,
+                    "max_seconds": 0.0,
+                },
+            )
+            stats["failed" if failed else "completed"] += 1
+            stats["finished"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.processes:
+                # spawn: forking a process with a running event loop and
+                # open client sockets is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=THREAD_FALLBACK_WORKERS,
+                    thread_name_prefix="audio-worker",
+                )
+        return self._executor
+
+
+_audio_worker: Optional[AudioWorker] = None
+
+
+def get_audio_worker() -> AudioWorker:
+    """Return the AudioWorker singleton."""
+    global _audio_worker
+    if _audio_worker is None:
+        _audio_worker = AudioWorker()
+    return _audio_worker
+
+
+def reset_audio_worker() -> None:
+    """Reset the singleton (test helper)."""
+    global _audio_worker
+    if _audio_worker is not None:
+        _audio_worker.close()
+    _audio_worker = None
+
+
+def close_audio_worker() -> None:
+    """Shut down the shared pool (application shutdown)."""
+    if _audio_worker is not None:
+        _audio_worker.close()
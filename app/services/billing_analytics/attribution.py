@@ -0,0 +1,163 @@
+"""Execution-cost attribution: price per-request GPU-seconds with billing rates.
+
+``endpoint_logs`` records the GPU-seconds each request caused on an upstream
+(a RunPod endpoint id or a Modal service name). RunPod billing records carry
+what each endpoint cost and how long it ran, so ``cost / runtime`` is the
+effective rate for the period, covering idle and keep-warm time the requests
+did not see. Modal billing has no runtime and is keyed by app, so a Modal app
+is priced only when EXECUTION_MODAL_APPS maps it to a recorded upstream: its
+cost over the GPU-seconds recorded for that upstream in the same period.
+Upstreams without billing data fall back to EXECUTION_COST_PER_SECOND, then
+EXECUTION_DEFAULT_COST_PER_SECOND.
+
+Pure functions, no I/O.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, defaultdict
+from typing import Iterable, Mapping, Optional
+
+from app.schemas.billing_analytics import BillingRecord
+
+
+def effective_rates(
+    records: list[BillingRecord],
+    recorded_seconds: Optional[Mapping[str, float]] = None,
+    modal_apps: Optional[Mapping[str, str]] = None,
+) -> dict[str, float]:
+    """USD per execution second for each billed upstream.
+
+    Args:
+        records: Billing records for the period.
+        recorded_seconds: GPU-seconds recorded per upstream in
+            ``endpoint_logs`` over the same period.
+        modal_apps: Modal app id or name -> recorded upstream
+            (EXECUTION_MODAL_APPS).
+    """
+    recorded_seconds = recorded_seconds or {}
+    modal_apps = modal_apps or {}
+    cost: defaultdict[str, float] = defaultdict(float)
+    runtime_ms: defaultdict[str, int] = defaultdict(int)
+    modal_cost: defaultdict[str, float] = defaultdict(float)
+    for r in records:
+        if r.runtime_ms:
+            cost[r.object_id] += r.cost
+            runtime_ms[r.object_id] += r.runtime_ms
+        elif r.provider == "modal":
+            upstream = modal_apps.get(r.object_id) or modal_apps.get(r.object_name)
+            if upstream:
+                modal_cost[upstream] += r.cost
+    rates = {
+        object_id: cost[object_id] / (runtime_ms[object_id] / 1000.0)
+        for object_id in cost
+    }
+    for upstream, total in modal_cost.items():
+        seconds = recorded_seconds.get(upstream, 0.0)
+        if seconds > 0:
+            rates[upstream] = total / seconds
+    return rates
+
+
+def resolve_rate(
+    upstream: Optional[str],
+    billing_rates: Mapping[str, float],
+    configured_rates: Mapping[str, float],
+    default_rate: float,
+) -> tuple[Optional[float], str]:
+    """Return ``(usd_per_second, source)`` for an upstream.
+
+    ``source`` is "billing", "configured", "default" or "none" (unpriced).
+    """
+    if upstream and upstream in billing_rates:
+        return billing_rates[upstream], "billing"
+    if upstream and upstream in configured_rates:
+        return configured_rates[upstream], "configured"
+    if default_rate > 0:
+        return default_rate, "default"
+    return None, "none"
+
+
+def attribute_costs(
+    usage_rows: Iterable[tuple],
+    billing_rates: Mapping[str, float],
+    configured_rates: Mapping[str, float],
+    default_rate: float = 0.0,
+) -> dict:
+    """Roll usage rows up per group key and per upstream, with estimated cost.
+
+    Args:
+        usage_rows: ``(key, upstream, requests, gpu_seconds, queue_seconds,
+            cold_starts)`` tuples, one per group key and upstream.
+        billing_rates: Effective rates from ``effective_rates``.
+        configured_rates: EXECUTION_COST_PER_SECOND.
+        default_rate: EXECUTION_DEFAULT_COST_PER_SECOND.
+
+    Returns:
+        ``{"rows": [...], "upstreams": [...], "total_gpu_seconds",
+        "total_estimated_cost"}``; rows are sorted by estimated cost.
+    """
+    rows: "OrderedDict[str, dict]" = OrderedDict()
+    upstreams: "OrderedDict[str, dict]" = OrderedDict()
+    for key, upstream, requests, gpu_seconds, queue_seconds, cold_starts in usage_rows:
+        gpu_seconds = float(gpu_seconds or 0.0)
+        rate, source = resolve_rate(
+            upstream, billing_rates, configured_rates, default_rate
+        )
+        cost = gpu_seconds * rate if rate is not None else 0.0
+
+        row = rows.setdefault(
+            key or "unknown",
+            {
+                "key": key or "unknown",
+                "requests": 0,
+                "gpu_seconds": 0.0,
+                "queue_seconds": 0.0,
+                "cold_starts": 0,
+                "estimated_cost": 0.0,
+                "unpriced_gpu_seconds": 0.0,
+            },
+        )
+        row["requests"] += int(requests or 0)
+        row["gpu_seconds"] += gpu_seconds
+        row["queue_seconds"] += float(queue_seconds or 0.0)
+        row["cold_starts"] += int(cold_starts or 0)
+        row["estimated_cost"] += cost
+        if rate is None:
+            row["unpriced_gpu_seconds"] += gpu_seconds
+
+        name = upstream or "unknown"
+        summary = upstreams.setdefault(
+            name,
+            {
+                "upstream": name,
+                "gpu_seconds": 0.0,
+                "rate_per_second": rate,
+                "rate_source": source,
+                "estimated_cost": 0.0,
+            },
+        )
+        summary["gpu_seconds"] += gpu_seconds
+        summary["estimated_cost"] += cost
+
+    for row in rows.values():
+        for field in ("gpu_seconds", "queue_seconds", "unpriced_gpu_seconds"):
+            row[field] = round(row[field], 3)
+        row["estimated_cost"] = round(row["estimated_cost"], 6)
+    for summary in upstreams.values():
+        summary["gpu_seconds"] = round(summary["gpu_seconds"], 3)
+        summary["estimated_cost"] = round(summary["estimated_cost"], 6)
+
+    ordered = sorted(
+        rows.values(),
+        key=lambda r: (r["estimated_cost"], r["gpu_seconds"]),
+        reverse=True,
+    )
+    return {
+        "rows": ordered,
+        "upstreams": sorted(
+            upstreams.values(), key=lambda u: u["gpu_seconds"], reverse=True
+        ),
+        "total_gpu_seconds": round(sum(r["gpu_seconds"] for r in ordered), 3),
+        "total_estimated_cost": round(sum(r["estimated_cost"] for r in ordered), 6),
+    }
@@ -6,7 +6,7 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Mapping, Optional
 
 from app.core.config import settings
 from app.integrations.billing.base import (
@@ -28,7 +28,7 @@ from app.schemas.billing_analytics import (
     TableResponse,
     TimeseriesResponse,
 )
-from app.services.billing_analytics import aggregation
+from app.services.billing_analytics import aggregation, attribution
 from app.services.cache import CacheBackend, get_cache_backend
 
 logger = logging.getLogger(__name__)
@@ -231,6 +231,24 @@ class BillingAnalyticsService:
         records, _ = await self._fetch_records(p)
         return sorted(records, key=lambda r: (r.provider, r.timestamp))
 
+    async def execution_rates(
+        self,
+        start: datetime,
+        end: datetime,
+        recorded_seconds: Optional[Mapping[str, float]] = None,
+    ) -> tuple[dict[str, float], list[str]]:
+        """Effective USD per execution second per billed upstream.
+
+        ``recorded_seconds`` (GPU-seconds per upstream from ``endpoint_logs``)
+        prices the Modal apps mapped by EXECUTION_MODAL_APPS.
+        """
+        p = BillingQueryParams(provider="all", start=start, end=end, resolution="day")
+        records, warnings = await self._fetch_records(p)
+        rates = attribution.effective_rates(
+            records, recorded_seconds, settings.execution_modal_apps
+        )
+        return rates, warnings
+
 
 _service_instance: Optional[BillingAnalyticsService] = None
 
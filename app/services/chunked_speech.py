@@ -0,0 +1,182 @@
+"""Sentence-chunked, parallel synthesis of long texts.
+
+A long text used to go to Spark/Orpheus as one request, so latency grew with
+its length and one upstream failure lost the whole passage.
+``ChunkedSynthesizer`` instead:
+
+    1. takes the text already split at sentence boundaries by
+       ``app.utils.sentences.chunk_text``;
+    2. renders the chunks in groups (one per request for Spark, up to the
+       Orpheus batch size through ``/tts/batch``), with at most
+       ``TTS_CHUNK_CONCURRENCY`` groups in flight, retrying a failed group
+       ``TTS_CHUNK_RETRIES`` times;
+    3. joins the clips in order with ``TTS_CHUNK_CROSSFADE_MS`` crossfades
+       (``app.utils.wav_stitch``).
+
+Groups start in text order, so ``stream`` can send the first chunk's audio as
+soon as it is rendered while later chunks are still being synthesized: time
+to first audio stays roughly constant however long the passage is.
+"""
+
+import asyncio
+import time
+import wave
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError, ServiceUnavailableError
+from app.services.base import BaseService
+from app.utils.wav_stitch import Crossfader, WavFormat, read_wav, wav_header
+
+# Renders a group of text chunks to one WAV clip per chunk, in order.
+Renderer = Callable[[List[str]], Awaitable[List[bytes]]]
+
+
+@dataclass
+class StitchedAudio:
+    """A chunked synthesis joined into one WAV file."""
+
+    wav: bytes
+    sample_rate: int
+    duration_seconds: float
+    chunks: int
+    inference_ms: float
+
+
+class ChunkedSynthesizer(BaseService):
+    """Renders text chunks concurrently and joins them in order."""
+
+    def __init__(
+        self,
+        render: Renderer,
+        group_size: int = 1,
+        concurrency: Optional[int] = None,
+        retries: Optional[int] = None,
+        crossfade_ms: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self._render = render
+        self.group_size = max(1, group_size)
+        self.concurrency = concurrency or settings.tts_chunk_concurrency
+        self.retries = retries if retries is not None else settings.tts_chunk_retries
+        self.crossfade_ms = (
+            crossfade_ms
+            if crossfade_ms is not None
+            else settings.tts_chunk_crossfade_ms
+        )
+
+    async def synthesize(self, chunks: Sequence[str]) -> StitchedAudio:
+        """Render every chunk and return the joined WAV."""
+        started = time.monotonic()
+        fmt: Optional[WavFormat] = None
+        pcm = bytearray()
+        async with aclosing(self._faded(chunks)) as pieces:
+            async for fmt, piece in pieces:
+                pcm += piece
+        assert fmt is not None  # _faded yields at least once or raises
+        return StitchedAudio(
+            wav=wav_header(fmt, len(pcm)) + bytes(pcm),
+            sample_rate=fmt.frame_rate,
+            duration_seconds=round(fmt.duration_seconds(len(pcm)), 2),
+            chunks=len(chunks),
+            inference_ms=(time.monotonic() - started) * 1000.0,
+        )
+
+    async def stream(self, chunks: Sequence[str]) -> AsyncIterator[bytes]:
+        """Yield a streamed WAV: the header, then audio as chunks finish."""
+        header_sent = False
+        async with aclosing(self._faded(chunks)) as pieces:
+            async for fmt, piece in pieces:
+                if not header_sent:
+                    header_sent = True
+                    yield wav_header(fmt)
+                if piece:
+                    yield piece
+
+    async def iter_clips(self, chunks: Sequence[str]) -> AsyncIterator[bytes]:
+        """Yield each chunk's WAV clip in text order.
+
+        All groups are scheduled up front (in order, behind the concurrency
+        limit); pending ones are cancelled if the caller stops early or a
+        group fails.
+        """
+        groups = [
+            list(chunks[i : i + self.group_size])  # noqa: E203
+            for i in range(0, len(chunks), self.group_size)
+        ]
+        self.log_info(
+            f"Synthesizing {len(chunks)} chunks in {len(groups)} groups "
+            f"(concurrency {self.concurrency})"
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.create_task(self._render_group(group, semaphore))
+            for group in groups
+        ]
+        try:
+            for task in tasks:
+                for clip in await task:
+                    yield clip
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _faded(self, chunks: Sequence[str]) -> AsyncIterator[tuple]:
+        fader: Optional[Crossfader] = None
+        async with aclosing(self.iter_clips(chunks)) as clips:
+            async for clip in clips:
+                fmt, pcm = _read_clip(clip)
+                if fader is None:
+                    fader = Crossfader(fmt, self.crossfade_ms)
+                elif fmt != fader.format:
+                    raise ExternalServiceError(
+                        service_name="TTS",
+                        message="Chunk audio formats differ",
+                        original_error=f"{fmt} != {fader.format}",
+                    )
+                yield fmt, fader.feed(pcm)
+        if fader is None:
+            raise ExternalServiceError(
+                service_name="TTS", message="No audio was synthesized"
+            )
+        yield fader.format, fader.flush()
+
+    async def _render_group(
+        self, texts: List[str], semaphore: asyncio.Semaphore
+    ) -> List[bytes]:
+        async with semaphore:
+            attempt = 0
+            while True:
+                try:
+                    clips = await self._render(texts)
+                    break
+                except (ExternalServiceError, ServiceUnavailableError) as e:
+                    if attempt >= self.retries:
+                        raise
+                    attempt += 1
+                    self.log_warning(
+                        f"Chunk group failed ({e}); retry {attempt}/{self.retries}"
+                    )
+        if len(clips) != len(texts):
+            raise ExternalServiceError(
+                service_name="TTS",
+                message=(
+                    f"expected {len(texts)} clips for the chunk group, "
+                    f"got {len(clips)}"
+                ),
+            )
+        return clips
+
+
+def _read_clip(clip: bytes) -> tuple:
+    try:
+        return read_wav(clip)
+    except (wave.Error, EOFError) as e:
+        raise ExternalServiceError(
+            service_name="TTS",
+            message="Chunk audio is not a PCM WAV file",
+            original_error=str(e),
+        )
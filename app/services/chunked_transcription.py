@@ -0,0 +1,265 @@
+"""Chunked, parallel transcription of long recordings.
+
+A single RunPod ASR job transcribes its audio sequentially, so an hour-long
+recording took an hour-scale job (and was cut to MAX_AUDIO_DURATION_MINUTES
+before that). ``ChunkedTranscriber`` instead:
+
+    1. decodes the recording once in the audio worker pool, splits it in
+       pauses with the energy-based VAD in ``app.utils.vad`` and exports
+       each chunk as 16 kHz mono WAV;
+    2. uploads each chunk and submits it as its own ASR job, with at most
+       ``STT_CHUNK_CONCURRENCY`` chunks in flight so a single recording
+       cannot take every worker;
+    3. stitches the chunk transcripts in order and shifts diarization
+       timestamps by each chunk's offset.
+
+Wall-clock time drops roughly by the concurrency factor, and recordings up to
+``STT_LONG_AUDIO_MAX_MINUTES`` are transcribed in full.
+
+The ASR worker returns diarization as word ``chunks`` with a
+``[start, end]`` ``timestamp`` pair in seconds and a ``speaker`` label, plus a
+``formatted_diarization_output`` of ``**SPEAKER_00**`` headings and ``(0.46)``
+time markers (see sample_diarization_output.json). Both are shifted by each
+chunk's offset; ``start``/``end`` (or ``start_time``/``end_time``) numbers are
+shifted too. Diarization runs per chunk, so the same label in two chunks need
+not be the same person: labels are prefixed with the chunk number
+(``C2_SPEAKER_00``) rather than merged into a false identity.
+
+Chunking is opt-in (``STT_CHUNKING_ENABLED``): one long recording becomes
+many ASR jobs, so enable it only where that RunPod capacity is budgeted.
+"""
+
+import asyncio
+import os
+import re
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+from pydub.exceptions import CouldntDecodeError
+
+from app.core.config import settings
+from app.services.audio_worker import get_audio_worker
+from app.services.base import BaseService
+from app.utils.upload_audio_file_gcp import delete_audio_file
+
+if TYPE_CHECKING:
+    from app.services.stt_service import STTService, TranscriptionResult
+
+CHUNK_FRAME_RATE = 16000
+TIMESTAMP_KEYS = frozenset({"start", "end", "start_time", "end_time"})
+# Keys holding a [start, end] pair (either end may be None).
+TIMESTAMP_PAIR_KEYS = frozenset({"timestamp"})
+SPEAKER_KEYS = frozenset({"speaker"})
+# Transcript strings that are joined, not taken from the first chunk.
+TEXT_KEYS = frozenset({"text"})
+_FORMATTED_TIME = re.compile(r"\((\d+(?:\.\d+)?)\)")
+_FORMATTED_SPEAKER = re.compile(r"^\*\*(.+?)\*\*$", re.MULTILINE)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def offset_timestamps(
+    value: Any, offset_seconds: float, speaker_prefix: str = ""
+) -> Any:
+    """Copy of a diarization structure with timestamps shifted by an offset.
+
+    ``speaker_prefix`` is prepended to every ``speaker`` label.
+    """
+    if isinstance(value, dict):
+        shifted = {}
+        for key, item in value.items():
+            if key in TIMESTAMP_KEYS and _is_number(item):
+                shifted[key] = item + offset_seconds
+            elif key in TIMESTAMP_PAIR_KEYS and isinstance(item, list):
+                shifted[key] = [
+                    t + offset_seconds if _is_number(t) else t for t in item
+                ]
+            elif key in SPEAKER_KEYS and isinstance(item, str):
+                shifted[key] = f"{speaker_prefix}{item}"
+            else:
+                shifted[key] = offset_timestamps(item, offset_seconds, speaker_prefix)
+        return shifted
+    if isinstance(value, list):
+        return [
+            offset_timestamps(item, offset_seconds, speaker_prefix) for item in value
+        ]
+    return value
+
+
+def offset_formatted(text: str, offset_seconds: float, speaker_prefix: str = "") -> str:
+    """Shift the ``(12.34)`` markers and prefix the ``**SPEAKER**`` headings."""
+    text = _FORMATTED_TIME.sub(
+        lambda m: f"({float(m.group(1)) + offset_seconds:.2f})", text
+    )
+    return _FORMATTED_SPEAKER.sub(lambda m: f"**{speaker_prefix}{m.group(1)}**", text)
+
+
+def merge_diarization(outputs: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-chunk diarization outputs (already offset) in order.
+
+    Lists under the same key are concatenated and ``text`` strings joined
+    with a space; other values are taken from the first chunk that has them.
+    """
+    merged: Dict[str, Any] = {}
+    for output in outputs:
+        for key, value in (output or {}).items():
+            if isinstance(value, list):
+                merged.setdefault(key, [])
+                if isinstance(merged[key], list):
+                    merged[key].extend(value)
+            elif key in TEXT_KEYS and isinstance(merged.get(key), str):
+                merged[key] = " ".join(part for part in (merged[key], value) if part)
+            elif key not in merged:
+                merged[key] = value
+    return merged
+
+
+def stitch_responses(
+    spans: Sequence[Tuple[int, int]], responses: Sequence[Dict[str, Any]]
+) -> Tuple[str, Dict[str, Any], str]:
+    """Join per-chunk API responses into ``(text, diarization, formatted)``."""
+    texts, diarizations, formatted = [], [], []
+    for index, ((start, _), response) in enumerate(zip(spans, responses)):
+        offset = start / 1000
+        prefix = f"C{index + 1}_" if len(spans) > 1 else ""
+        text = (response.get("audio_transcription") or "").strip()
+        if text:
+            texts.append(text)
+        diarizations.append(
+            offset_timestamps(response.get("diarization_output") or {}, offset, prefix)
+        )
+        if response.get("formatted_diarization_output"):
+            formatted.append(
+                offset_formatted(
+                    response["formatted_diarization_output"], offset, prefix
+                )
+            )
+    return " ".join(texts), merge_diarization(diarizations), "\n".join(formatted)
+
+
+class ChunkedTranscriber(BaseService):
+    """Transcribes long recordings as VAD-aligned chunks in parallel."""
+
+    def __init__(self, stt: "STTService") -> None:
+        super().__init__()
+        self._stt = stt
+
+    async def transcribe(
+        self,
+        file_path: str,
+        language: str = "lug",
+        adapter: str = "lug",
+        whisper: bool = False,
+        recognise_speakers: bool = False,
+        source: Optional[Tuple[str, str]] = None,
+    ) -> "TranscriptionResult":
+        """Transcribe ``file_path`` chunk by chunk.
+
+        Args:
+            file_path: Local copy of the recording (not deleted here).
+            language: Target language code.
+            adapter: Language adapter code.
+            whisper: Whether to use Whisper model.
+            recognise_speakers: Whether to enable speaker diarization.
+            source: ``(blob_name, blob_url)`` of the recording if it is
+                already in cloud storage; otherwise it is uploaded alongside
+                the chunks so the result can point at the full audio.
+
+        Raises:
+            AudioProcessingError: If the audio cannot be decoded or uploaded.
+            TranscriptionError: If a chunk fails or nothing was transcribed.
+        """
+        from app.services.stt_service import (
+            AudioProcessingError,
+            TranscriptionError,
+            TranscriptionResult,
+        )
+
+        limit_ms = settings.stt_long_audio_max_minutes * 60 * 1000
+        try:
+            chunks = await get_audio_worker().split(
+                file_path,
+                limit_ms,
+                int(settings.stt_chunk_target_seconds * 1000),
+                int(settings.stt_chunk_max_seconds * 1000),
+                CHUNK_FRAME_RATE,
+            )
+        except CouldntDecodeError:
+            raise AudioProcessingError(
+                "Could not decode audio file. Please ensure the file is not corrupted."
+            )
+
+        original_ms = chunks.duration_ms
+        was_trimmed = original_ms > limit_ms
+        spans = chunks.spans
+        self.log_info(
+            f"Transcribing {min(original_ms, limit_ms) / 60000:.1f} min of audio "
+            f"as {len(spans)} chunks (concurrency {settings.stt_chunk_concurrency})"
+        )
+
+        semaphore = asyncio.Semaphore(settings.stt_chunk_concurrency)
+        upload_source = (
+            None
+            if source is not None
+            else asyncio.create_task(self._stt.upload_to_storage(file_path))
+        )
+        chunk_tasks = [
+            asyncio.create_task(
+                self._transcribe_chunk(
+                    path,
+                    semaphore,
+                    language=language,
+                    adapter=adapter,
+                    whisper=whisper,
+                    recognise_speakers=recognise_speakers,
+                )
+            )
+            for path in chunks.paths
+        ]
+        try:
+            responses = await asyncio.gather(*chunk_tasks)
+            blob_name, blob_url = (
+                source if upload_source is None else await upload_source
+            )
+        except BaseException:
+            # One failed chunk fails the recording; stop the others.
+            for task in [*chunk_tasks, upload_source]:
+                if task is not None and not task.done():
+                    task.cancel()
+            raise
+        finally:
+            for path in chunks.paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        transcription, diarization, formatted = stitch_responses(spans, responses)
+        if not transcription:
+            raise TranscriptionError(
+                "No transcription was generated. The audio might be silent or unclear."
+            )
+
+        return TranscriptionResult(
+            transcription=transcription,
+            diarization_output=diarization,
+            formatted_diarization_output=formatted,
+            audio_url=blob_url,
+            blob_name=blob_name,
+            was_trimmed=was_trimmed,
+            original_duration=original_ms / 60000 if was_trimmed else None,
+        )
+
+    async def _transcribe_chunk(
+        self, path: str, semaphore: asyncio.Semaphore, **options: Any
+    ) -> Dict[str, Any]:
+        async with semaphore:
+            blob_name = None
+            try:
+                blob_name, _ = await self._stt.upload_to_storage(path)
+                return await self._stt.call_transcription_api(
+                    blob_name=blob_name, **options
+                )
+            finally:
+                if blob_name:
+                    # Chunks are intermediate; the full recording is kept.
+                    await asyncio.to_thread(delete_audio_file, blob_name)
@@ -9,6 +9,8 @@ Architecture:
     - Exponential backoff retry logic for transient failures
     - Error classification for retryable vs non-retryable errors
     - OpenAI-compatible chat completions interface
+    - Adaptive per-request timeouts from a rolling latency window per endpoint
+    - Optional hedged requests once the observed p95 latency has passed
 
 Usage:
     from app.services.inference_service import (
@@ -40,19 +42,27 @@ Note:
 
 import json
 import logging
+import math
 import os
 import random
 import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import wraps
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
+import httpx
 from dotenv import load_dotenv
-from openai import APIError, OpenAI, RateLimitError
+from openai import APIError, APITimeoutError, OpenAI, RateLimitError
 from pydantic import BaseModel, Field
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
+from app.core.config import settings
 from app.services.base import BaseService
+from app.services.keep_warm_service import record_endpoint_activity
+from app.utils.execution_usage import record_execution
 
 # Load environment variables
 load_dotenv()
@@ -444,6 +454,107 @@ def exponential_backoff_retry(
     return decorator
 
 
+# =============================================================================
+# Adaptive Timeouts and Hedging
+# =============================================================================
+
+
+class LatencyTracker:
+    """Rolling window of request latencies for one endpoint.
+
+    Used to derive per-request timeouts from observed latency instead of fixed
+    values, and to decide when a hedged duplicate request should be sent.
+    Thread-safe, since inference runs in threadpool workers.
+
+    Example:
+        tracker = LatencyTracker(window=200, min_samples=20)
+        tracker.record(1.8)
+        timeout = tracker.timeout()
+    """
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        self._samples: deque = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add one observed request latency in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    @property
+    def sample_count(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the ``pct`` percentile, or None until enough samples exist."""
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+        return ordered[rank]
+
+    def timeout(self) -> float:
+        """Per-request timeout: p99 x multiplier, clamped to configured bounds."""
+        p99 = self.percentile(99)
+        if p99 is None:
+            return settings.sunflower_default_timeout_seconds
+        return min(
+            max(
+                p99 * settings.sunflower_timeout_p99_multiplier,
+                settings.sunflower_min_timeout_seconds,
+            ),
+            settings.sunflower_default_timeout_seconds,
+        )
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging (observed p95), or None if unknown."""
+        p95 = self.percentile(95)
+        if p95 is None:
+            return None
+        return max(p95, settings.sunflower_hedge_min_delay_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current latency stats, for logging and diagnostics."""
+        return {
+            "samples": self.sample_count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "timeout": self.timeout(),
+        }
+
+
+# Upper max_tokens bounds of the per-size latency windows. A 4k-token answer
+# takes far longer than a 100-token one, so they must not share a p99.
+LATENCY_SIZE_CLASSES = (512, 2048, 8192)
+
+
+def latency_size_class(max_tokens: Optional[int]) -> Optional[str]:
+    """Latency window for a request size; None for the endpoint's default.
+
+    Requests without ``max_tokens`` keep using the endpoint's default window.
+    """
+    if max_tokens is None:
+        return None
+    for bound in LATENCY_SIZE_CLASSES:
+        if max_tokens <= bound:
+            return f"<={bound}"
+    return f">{LATENCY_SIZE_CLASSES[-1]}"
+
+
+def hedging_enabled(route: str) -> bool:
+    """Whether hedged Sunflower requests are enabled for ``route``."""
+    return route in settings.sunflower_hedge_routes
+
+
+# Shared pool for hedged attempts. Sized for a primary and a hedge per
+# concurrent request on a busy worker.
+_hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="sf-hedge")
+
+
 # =============================================================================
 # Inference Service Class
 # =============================================================================
@@ -517,6 +628,10 @@ class InferenceService(BaseService):
             "qwen": sunflower_config,
         }
 
+        self.api_base_url = settings.sunflower_api_base_url.rstrip("/")
+        self._latency_trackers: Dict[str, LatencyTracker] = {}
+        self._trackers_lock = threading.Lock()
+
         if not self.runpod_api_key:
             self.log_warning("RUNPOD_API_KEY not configured")
 
@@ -541,13 +656,135 @@ class InferenceService(BaseService):
         if not config:
             raise ValueError(f"Unsupported model type: {model_type}")
 
-        url = f"https://api.runpod.ai/v2/{config['endpoint_id']}/openai/v1"
+        url = f"{self.api_base_url}/{config['endpoint_id']}/openai/v1"
 
+        # Retries are owned by exponential_backoff_retry; the SDK's own retries
+        # would silently multiply the adaptive per-request timeout.
         return OpenAI(
             api_key=self.runpod_api_key,
             base_url=url,
+            max_retries=0,
         )
 
+    def latency_tracker(
+        self, endpoint_id: Optional[str], max_tokens: Optional[int] = None
+    ) -> LatencyTracker:
+        """Get (or create) the rolling latency tracker for an endpoint.
+
+        Each ``max_tokens`` size class gets its own window (see
+        ``latency_size_class``), so long generations are not timed out by the
+        latencies of short ones.
+        """
+        key = endpoint_id or "default"
+        size_class = latency_size_class(max_tokens)
+        if size_class is not None:
+            key = f"{key}:{size_class}"
+        with self._trackers_lock:
+            tracker = self._latency_trackers.get(key)
+            if tracker is None:
+                tracker = LatencyTracker(
+                    window=settings.sunflower_latency_window,
+                    min_samples=settings.sunflower_latency_min_samples,
+                )
+                self._latency_trackers[key] = tracker
+            return tracker
+
+    def _create_completion(
+        self, model_type: str, payload: Dict[str, Any], hedge: bool = False
+    ) -> Any:
+        """Send a non-streaming completion with an adaptive timeout.
+
+        The timeout comes from the endpoint's rolling latency window for the
+        request's ``max_tokens`` size class. When
+        ``hedge`` is set and the window has enough samples, a duplicate request
+        is sent once the observed p95 has passed; the first response wins and
+        the other request is aborted by closing its client.
+        """
+        endpoint_id = self.endpoints[model_type.lower()]["endpoint_id"]
+        tracker = self.latency_tracker(endpoint_id, payload.get("max_tokens"))
+        timeout = tracker.timeout()
+        hedge_after = tracker.hedge_delay() if hedge else None
+
+        start = time.monotonic()
+        try:
+            if hedge_after is None:
+                client = self._get_client(model_type)
+                response = client.chat.completions.create(timeout=timeout, **payload)
+            else:
+                response = self._create_hedged_completion(
+                    model_type, payload, timeout, hedge_after
+                )
+        except Exception as e:
+            if isinstance(e, (APITimeoutError, httpx.TimeoutException)):
+                # Count timeouts at their cutoff so the window adapts upward.
+                tracker.record(timeout)
+            raise
+        elapsed = time.monotonic() - start
+        tracker.record(elapsed)
+        # The OpenAI route reports no execution details; use the round trip.
+        record_execution(endpoint_id or "sunflower", elapsed)
+        record_endpoint_activity("sunflower")
+        return response
+
+    def ping(self, model_type: str = "qwen") -> None:
+        """Send a one-token completion to keep the endpoint warm.
+
+        Bypasses the latency window, hedging and endpoint-activity tracking:
+        warm-up pings are not user traffic and would skew all three.
+        """
+        config = self.endpoints.get(model_type.lower())
+        if not config:
+            raise ValueError(f"Unsupported model type: {model_type}")
+        self._get_client(model_type).chat.completions.create(
+            model=config["model_name"],
+            messages=[{"role": "user", "content": "Hi"}],
+            max_tokens=1,
+            timeout=settings.sunflower_default_timeout_seconds,
+        )
+
+    def _create_hedged_completion(
+        self,
+        model_type: str,
+        payload: Dict[str, Any],
+        timeout: float,
+        hedge_after: float,
+    ) -> Any:
+        """Race a primary request against a hedge sent after ``hedge_after``."""
+        clients = [self._get_client(model_type)]
+        pending = {
+            _hedge_executor.submit(
+                clients[0].chat.completions.create, timeout=timeout, **payload
+            )
+        }
+        try:
+            done, pending = wait(pending, timeout=hedge_after)
+            if not done:
+                self.log_info(
+                    f"No response after p95 ({hedge_after:.2f}s); "
+                    "sending hedged request"
+                )
+                clients.append(self._get_client(model_type))
+                pending.add(
+                    _hedge_executor.submit(
+                        clients[1].chat.completions.create, timeout=timeout, **payload
+                    )
+                )
+
+            last_error: Optional[BaseException] = None
+            while True:
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    last_error = future.exception()
+                if not pending:
+                    raise last_error
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        finally:
+            # Closing the clients aborts whichever request is still in flight.
+            if len(clients) > 1:
+                for client in clients:
+                    client.close()
+
     def _build_messages(
         self,
         instruction: Optional[str] = None,
@@ -678,6 +915,7 @@ class InferenceService(BaseService):
         max_tokens: Optional[int] = None,
         top_p: Optional[float] = None,
         stop: Optional[Any] = None,
+        hedge: bool = False,
     ) -> Dict[str, Any]:
         """Run inference using the language model.
 
@@ -691,6 +929,9 @@ class InferenceService(BaseService):
             max_tokens: Maximum number of tokens to generate (optional).
             top_p: Nucleus sampling probability cutoff (optional).
             stop: Stop sequence(s) to halt generation (optional).
+            hedge: Send a hedged duplicate request once the endpoint's observed
+                p95 latency has passed. Costs GPU time; enable per route via
+                SUNFLOWER_HEDGE_ROUTES.
 
         Returns:
             Dictionary containing:
@@ -726,8 +967,6 @@ class InferenceService(BaseService):
             f"Using endpoint ID: {config['endpoint_id']} and model: {config['model_name']}"
         )
 
-        # Get client and build messages
-        client = self._get_client(model_type)
         final_messages = self._build_messages(
             instruction=instruction,
             messages=messages,
@@ -755,7 +994,7 @@ class InferenceService(BaseService):
             self.log_info("Sending request to RunPod API...")
             self.log_debug(f"Request payload: {json.dumps(payload, indent=2)}")
 
-            response = client.chat.completions.create(**payload)
+            response = self._create_completion(model_type, payload, hedge=hedge)
             self.log_info("Raw response received")
 
             end_time = time.time()
@@ -920,6 +1159,7 @@ class InferenceService(BaseService):
 
         self.log_info("Opening streaming request to RunPod API...")
         stream = _create_stream()
+        record_endpoint_activity("sunflower")
 
         think_filter = ThinkTagFilter()
         usage_dict: Optional[Dict[str, Any]] = None
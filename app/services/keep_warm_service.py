@@ -0,0 +1,377 @@
+"""Keep-warm scheduler for the serverless Sunflower, ASR and Orpheus endpoints.
+
+RunPod and Modal scale workers to zero when idle, and the first request after
+that pays a multi-minute model load (surfacing as ``ModelLoadingError`` in
+``/tasks/translate`` and ``/tasks/chat/completions``). The scheduler sends a
+cheap warm-up request to each endpoint when its policy says the endpoint
+should be warm and nothing has touched it for ``idle_gap_seconds``:
+
+* during business hours (local time, ``KEEP_WARM_TIMEZONE``), and
+* for ``warm_after_traffic_seconds`` after the last real request, so a burst
+  of traffic outside business hours does not immediately go cold again.
+
+Real traffic resets the idle clock, so a busy endpoint is never pinged. Cold
+workers are detected from RunPod's ``delayTime`` (queue + cold-start time) in
+job details, or from ping wall time where no job details exist.
+
+Pings are coordinated across app instances with a Redis ``SET NX`` lock so a
+horizontally scaled deployment does not multiply idle GPU cost. When Redis is
+unavailable every instance pings on its own schedule (fail open).
+
+Policies are per endpoint and overridable through ``KEEP_WARM_POLICIES``. The
+scheduler only runs when ``KEEP_WARM_ENABLED`` is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import datetime as dt
+import logging
+import time
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import Awaitable, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.integrations.runpod import get_runpod_client, register_job_observer
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# A pinger sends one warm-up request and returns the observed cold-start delay
+# in seconds (None if unknown). It raises on failure.
+Pinger = Callable[[], Awaitable[Optional[float]]]
+
+ENDPOINTS = ("sunflower", "asr", "orpheus")
+
+# Set while a warm-up ping is in flight so the ping itself is not mistaken for
+# real traffic by the activity hooks. Context variables follow the ping into
+# ``asyncio.to_thread`` workers and awaited coroutines.
+_warming: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "keep_warm_pinging", default=False
+)
+
+
+@dataclass(frozen=True)
+class WarmPolicy:
+    """When an endpoint should be kept warm, and what counts as cold."""
+
+    enabled: bool = True
+    business_hours_start: int = 7  # local hour, inclusive
+    business_hours_end: int = 22  # local hour, exclusive
+    business_days: tuple[int, ...] = (0, 1, 2, 3, 4, 5)  # Mon-Sat
+    idle_gap_seconds: int = 240
+    warm_after_traffic_seconds: int = 900
+    cold_start_threshold_seconds: float = 10.0
+
+    @classmethod
+    def from_overrides(cls, overrides: dict) -> "WarmPolicy":
+        """Build a policy from a dict of overrides, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in overrides.items() if k in known}
+        if "business_days" in values:
+            values["business_days"] = tuple(values["business_days"])
+        return replace(cls(), **values)
+
+
+@dataclass
+class EndpointWarmState:
+    """Observed state of one endpoint, exposed on the admin endpoint."""
+
+    last_traffic_at: Optional[float] = None
+    last_ping_at: Optional[float] = None
+    last_ping_ok: Optional[bool] = None
+    last_ping_seconds: Optional[float] = None
+    last_delay_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    pings_sent: int = 0
+    ping_failures: int = 0
+    cold_starts: int = 0
+    in_flight: bool = False
+
+
+@dataclass
+class _Endpoint:
+    policy: WarmPolicy
+    pinger: Pinger
+    state: EndpointWarmState = field(default_factory=EndpointWarmState)
+
+
+class KeepWarmScheduler:
+    """Decides when each endpoint needs a warm-up ping and sends it."""
+
+    def __init__(
+        self,
+        pingers: dict[str, Pinger],
+        policies: Optional[dict[str, WarmPolicy]] = None,
+        timezone: str = "UTC",
+        tick_seconds: float = 30.0,
+        now: Callable[[], float] = time.time,
+    ) -> None:
+        policies = policies or {}
+        self._endpoints = {
+            name: _Endpoint(policy=policies.get(name, WarmPolicy()), pinger=pinger)
+            for name, pinger in pingers.items()
+        }
+        self._tz = ZoneInfo(timezone)
+        self.timezone = timezone
+        self.tick_seconds = tick_seconds
+        self._now = now
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- traffic ----
+
+    def record_activity(self, name: str, delay_seconds: Optional[float] = None) -> None:
+        """Record a real request to ``name``; resets its idle clock.
+
+        Args:
+            name: Endpoint name (``sunflower``, ``asr``, ``orpheus``).
+            delay_seconds: Cold-start delay reported for the request, if known.
+        """
+        endpoint = self._endpoints.get(name)
+        if endpoint is None or _warming.get():
+            return
+        endpoint.state.last_traffic_at = self._now()
+        if delay_seconds is not None:
+            self._record_delay(name, endpoint, delay_seconds)
+
+    # ---- scheduling ----
+
+    def in_business_hours(self, name: str) -> bool:
+        policy = self._endpoints[name].policy
+        local = dt.datetime.fromtimestamp(self._now(), tz=self._tz)
+        return (
+            local.weekday() in policy.business_days
+            and policy.business_hours_start <= local.hour < policy.business_hours_end
+        )
+
+    def is_due(self, name: str) -> bool:
+        """True if ``name`` should be warm and has been idle for the gap."""
+        endpoint = self._endpoints[name]
+        policy, state = endpoint.policy, endpoint.state
+        if not policy.enabled or state.in_flight:
+            return False
+
+        now = self._now()
+        recent_traffic = (
+            state.last_traffic_at is not None
+            and now - state.last_traffic_at < policy.warm_after_traffic_seconds
+        )
+        if not (recent_traffic or self.in_business_hours(name)):
+            return False
+
+        last_touch = max(state.last_traffic_at or 0.0, state.last_ping_at or 0.0)
+        return now - last_touch >= policy.idle_gap_seconds
+
+    async def tick(self) -> list[str]:
+        """Ping every endpoint that is due. Returns the names pinged."""
+        due = [name for name in self._endpoints if self.is_due(name)]
+        results = await asyncio.gather(*(self.ping(name) for name in due))
+        return [name for name, sent in zip(due, results) if sent]
+
+    async def ping(self, name: str, force: bool = False) -> bool:
+        """Send one warm-up ping to ``name``.
+
+        Unless ``force`` is set, the ping is skipped if another instance holds
+        the Redis lock for this endpoint's idle gap.
+
+        Returns:
+            True if a ping was sent (whether or not it succeeded).
+        """
+        endpoint = self._endpoints[name]
+        state = endpoint.state
+        if state.in_flight:
+            return False
+        if not force and not await self._acquire_lock(name, endpoint.policy):
+            # Another instance owns this gap; count it as touched locally.
+            state.last_ping_at = self._now()
+            return False
+
+        state.in_flight = True
+        state.last_ping_at = self._now()
+        token = _warming.set(True)
+        start = time.monotonic()
+        try:
+            delay = await endpoint.pinger()
+        except Exception as e:  # noqa: BLE001 — a failed ping must not kill the loop
+            state.last_ping_ok = False
+            state.ping_failures += 1
+            state.last_error = str(e)[:500]
+            logger.warning(f"Keep-warm ping to {name} failed: {e}")
+        else:
+            state.last_ping_ok = True
+            state.last_error = None
+            elapsed = time.monotonic() - start
+            self._record_delay(name, endpoint, delay if delay is not None else elapsed)
+            logger.info(f"Keep-warm ping to {name} ok in {elapsed:.2f}s")
+        finally:
+            state.last_ping_seconds = time.monotonic() - start
+            state.pings_sent += 1
+            state.in_flight = False
+            _warming.reset(token)
+        return True
+
+    def _record_delay(
+        self, name: str, endpoint: _Endpoint, delay_seconds: float
+    ) -> None:
+        endpoint.state.last_delay_seconds = delay_seconds
+        if delay_seconds >= endpoint.policy.cold_start_threshold_seconds:
+            endpoint.state.cold_starts += 1
+            logger.info(f"Cold start detected on {name}: {delay_seconds:.1f}s delay")
+
+    async def _acquire_lock(self, name: str, policy: WarmPolicy) -> bool:
+        redis = get_redis_client()
+        if redis is None:
+            return True
+        acquired = await redis.set_if_absent(
+            f"keep_warm:{name}", "1", ex=max(policy.idle_gap_seconds, 1)
+        )
+        # None means Redis errored; fail open and ping locally.
+        return acquired is not False
+
+    # ---- lifecycle ----
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background tick loop (idempotent)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Keep-warm scheduler started for {', '.join(self._endpoints)} "
+            f"(tick {self.tick_seconds}s, tz {self.timezone})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Keep-warm tick failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    # ---- introspection ----
+
+    def snapshot(self) -> dict:
+        """Current policy and state for every endpoint."""
+        endpoints = []
+        for name, endpoint in self._endpoints.items():
+            endpoints.append(
+                {
+                    "name": name,
+                    "policy": asdict(endpoint.policy),
+                    "in_business_hours": self.in_business_hours(name),
+                    "due": self.is_due(name),
+                    **asdict(endpoint.state),
+                }
+            )
+        return {
+            "enabled": settings.keep_warm_enabled,
+            "running": self.running,
+            "timezone": self.timezone,
+            "tick_seconds": self.tick_seconds,
+            "endpoints": endpoints,
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._endpoints
+
+
+# ---- default pingers ----
+
+
+async def _ping_sunflower() -> Optional[float]:
+    from app.services.inference_service import get_inference_service
+
+    # Not run_inference: pings must not feed its latency window or hedging.
+    await asyncio.to_thread(get_inference_service().ping)
+    return None  # no job details on the OpenAI route; wall time is used
+
+
+async def _ping_asr() -> Optional[float]:
+    # auto_detect_language on a single word is the cheapest job the worker runs.
+    # run_job wraps the payload in {"input": ...} itself.
+    _, job_details = await get_runpod_client().run_job(
+        {"task": "auto_detect_language", "text": "hello"}, timeout=300
+    )
+    return _delay_seconds(job_details)
+
+
+async def _ping_orpheus() -> Optional[float]:
+    from app.integrations.orpheus_modal import get_orpheus_modal_client
+
+    if not await get_orpheus_modal_client().health():
+        raise RuntimeError("Orpheus /health did not return 2xx")
+    return None
+
+
+DEFAULT_PINGERS: dict[str, Pinger] = {
+    "sunflower": _ping_sunflower,
+    "asr": _ping_asr,
+    "orpheus": _ping_orpheus,
+}
+
+
+def _delay_seconds(job_details: dict) -> Optional[float]:
+    """RunPod ``delayTime`` (ms) in seconds, or None if absent."""
+    delay_ms = (job_details or {}).get("delayTime")
+    if isinstance(delay_ms, (int, float)):
+        return delay_ms / 1000.0
+    return None
+
+
+def _observe_runpod_job(endpoint_id: str, job_details: dict) -> None:
+    """RunPod job observer: feeds ASR endpoint traffic into the scheduler."""
+    if endpoint_id and endpoint_id == get_runpod_client().endpoint_id:
+        record_endpoint_activity("asr", _delay_seconds(job_details))
+
+
+# ---- singleton ----
+
+_scheduler: Optional[KeepWarmScheduler] = None
+
+
+def get_keep_warm_scheduler() -> KeepWarmScheduler:
+    global _scheduler
+    if _scheduler is None:
+        overrides = settings.keep_warm_policies
+        _scheduler = KeepWarmScheduler(
+            pingers=DEFAULT_PINGERS,
+            policies={
+                name: WarmPolicy.from_overrides(overrides.get(name, {}))
+                for name in ENDPOINTS
+            },
+            timezone=settings.keep_warm_timezone,
+            tick_seconds=settings.keep_warm_tick_seconds,
+        )
+        register_job_observer(_observe_runpod_job)
+    return _scheduler
+
+
+def reset_keep_warm_scheduler() -> None:
+    global _scheduler
+    _scheduler = None
+
+
+def record_endpoint_activity(name: str, delay_seconds: Optional[float] = None) -> None:
+    """Record real traffic to an endpoint. No-op until the scheduler exists.
+
+    Safe to call from worker threads; it only updates timestamps.
+    """
+    if _scheduler is not None:
+        _scheduler.record_activity(name, delay_seconds)
@@ -26,14 +26,15 @@ Note:
     Business logic was extracted from app/routers/tasks.py.
 """
 
+import asyncio
 import logging
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
-import runpod
 from dotenv import load_dotenv
 
+from app.integrations.runpod import run_runpod_job
 from app.services.base import BaseService
 from app.utils.upload_audio_file_gcp import upload_audio_file
 
@@ -143,7 +144,6 @@ class LanguageService(BaseService):
         super().__init__()
         self.runpod_endpoint_id = runpod_endpoint_id or os.getenv("RUNPOD_ENDPOINT_ID")
         self.classification_threshold = classification_threshold
-        runpod.api_key = os.getenv("RUNPOD_API_KEY")
 
         if not self.runpod_endpoint_id:
             self.log_warning("RUNPOD_ENDPOINT_ID not configured")
@@ -166,10 +166,8 @@ class LanguageService(BaseService):
         """
         self.log_info(f"Starting language identification for text: {text[:50]}...")
 
-        endpoint = runpod.Endpoint(self.runpod_endpoint_id)
-
         try:
-            response = endpoint.run_sync(
+            response = await run_runpod_job(
                 {
                     "input": {
                         "task": "auto_detect_language",
@@ -177,6 +175,7 @@ class LanguageService(BaseService):
                     }
                 },
                 timeout=60,
+                endpoint_id=self.runpod_endpoint_id,
             )
 
             self.log_info(f"Language identification response: {response}")
@@ -220,12 +219,11 @@ class LanguageService(BaseService):
         """
         self.log_info(f"Starting language classification for text: {text[:50]}...")
 
-        endpoint = runpod.Endpoint(self.runpod_endpoint_id)
         # Convert text to lowercase for classification
         normalized_text = text.lower()
 
         try:
-            response = endpoint.run_sync(
+            response = await run_runpod_job(
                 {
                     "input": {
                         "task": "language_classify",
@@ -233,6 +231,7 @@ class LanguageService(BaseService):
                     }
                 },
                 timeout=60,
+                endpoint_id=self.runpod_endpoint_id,
             )
 
             self.log_info(f"Language classification response: {response}")
@@ -302,17 +301,17 @@ class LanguageService(BaseService):
         """
         self.log_info(f"Starting audio language detection for: {file_path}")
 
-        # Upload audio file to GCS
-        blob_name, blob_url = upload_audio_file(file_path=file_path)
+        # Upload audio file to GCS (blocking client, so off the event loop)
+        blob_name, blob_url = await asyncio.to_thread(
+            upload_audio_file, file_path=file_path
+        )
 
         if not blob_name:
             self.log_error("Failed to upload audio file")
             raise LanguageError("Failed to upload audio file for language detection")
 
-        endpoint = runpod.Endpoint(self.runpod_endpoint_id)
-
         try:
-            response = endpoint.run_sync(
+            response = await run_runpod_job(
                 {
                     "input": {
                         "task": "auto_detect_audio_language",
@@ -320,6 +319,7 @@ class LanguageService(BaseService):
                     }
                 },
                 timeout=600,
+                endpoint_id=self.runpod_endpoint_id,
             )
 
             self.log_info(f"Audio language detection response: {response}")
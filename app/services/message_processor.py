@@ -42,12 +42,11 @@ from enum import Enum
 from typing import Dict, Optional, Set
 
 import httpx
-import runpod
 from dotenv import load_dotenv
-from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
 from app.core.config import settings
+from app.integrations.runpod import run_runpod_job
 from app.integrations.whatsapp_store import (
     get_user_conversation_pairs,
     get_user_memory_note,
@@ -64,10 +63,17 @@ from app.integrations.whatsapp_store import (
 )
 from app.models.enums import SpeakerID
 from app.schemas.speech import SpeechRequest, TTSModel, TTSPlatform
+from app.services.audio_worker import get_audio_worker
 from app.services.inference_service import run_inference
 from app.services.speech_service import get_speech_service
+from app.services.stt_service import TranscriptionResult
+from app.services.transcription_cache import (
+    content_id_for_file,
+    get_transcription_cache,
+)
 from app.services.tts_service import get_tts_service
 from app.services.whatsapp_service import get_whatsapp_service
+from app.utils.token_budget import fit_messages_to_budget
 from app.utils.upload_audio_file_gcp import delete_audio_file, upload_audio_file
 
 load_dotenv()
@@ -96,6 +102,12 @@ WHATSAPP_MAX_RESPONSE_CHARS = int(os.getenv("WHATSAPP_MAX_RESPONSE_CHARS", "3500
 # A short token/line/emoji repeated at least this many times is treated as a
 # degenerate (looping) generation.
 WHATSAPP_REPETITION_THRESHOLD = int(os.getenv("WHATSAPP_REPETITION_THRESHOLD", "6"))
+# Sunflower errors worth one retry with a compact (system + last user) prompt.
+TRANSIENT_SUNFLOWER_ERRORS = (
+    "no response choices available",
+    "request timed out",
+    "model is still loading",
+)
 
 # Friendly fallback shown instead of corrupted/looping/empty model output.
 CORRUPTED_OUTPUT_FALLBACK = (
@@ -608,8 +620,8 @@ class OptimizedMessageProcessor:
 
             # Step 4: Validate audio file
             try:
-                audio_segment = AudioSegment.from_file(local_audio_path)
-                duration_minutes = len(audio_segment) / (1000 * 60)
+                audio_info = await get_audio_worker().probe(local_audio_path)
+                duration_minutes = audio_info.duration_seconds / 60
                 file_size_mb = os.path.getsize(local_audio_path) / (1024 * 1024)
 
                 logging.info(
@@ -631,43 +643,53 @@ class OptimizedMessageProcessor:
                 )
                 return
 
-            # Step 5: Upload to cloud storage
-            try:
-                blob_name, blob_url = upload_audio_file(file_path=local_audio_path)
-                if not blob_name:
-                    raise Exception("Upload failed")
-                logging.info(f"Audio uploaded: {blob_url}")
-            except Exception as e:
-                logging.error(f"Cloud storage upload error: {str(e)}")
-                whatsapp_service.send_message(
-                    recipient_id=from_number,
-                    message="Failed to upload audio. \n\n Please try again.",
-                    phone_number_id=phone_number_id,
-                )
-                return
+            # Forwarded voice notes have often been transcribed already.
+            cache, cache_key = await asyncio.to_thread(
+                self._voice_note_cache_key, local_audio_path, target_language
+            )
+            request_response = await self._cached_voice_note_transcription(
+                cache, cache_key
+            )
 
-            # Step 6: Transcribe
-            endpoint = runpod.Endpoint(RUNPOD_ENDPOINT_ID)
-            transcription_data = {
-                "input": {
-                    "task": "transcribe",
-                    "target_lang": target_language,
-                    "adapter": target_language,
-                    "audio_file": blob_name,
-                    "whisper": True,
-                    "recognise_speakers": False,
+            if request_response is None:
+                # Step 5: Upload to cloud storage
+                try:
+                    blob_name, blob_url = upload_audio_file(file_path=local_audio_path)
+                    if not blob_name:
+                        raise Exception("Upload failed")
+                    logging.info(f"Audio uploaded: {blob_url}")
+                except Exception as e:
+                    logging.error(f"Cloud storage upload error: {str(e)}")
+                    whatsapp_service.send_message(
+                        recipient_id=from_number,
+                        message="Failed to upload audio. \n\n Please try again.",
+                        phone_number_id=phone_number_id,
+                    )
+                    return
+
+                # Step 6: Transcribe
+                transcription_data = {
+                    "input": {
+                        "task": "transcribe",
+                        "target_lang": target_language,
+                        "adapter": target_language,
+                        "audio_file": blob_name,
+                        "whisper": True,
+                        "recognise_speakers": False,
+                    }
                 }
-            }
 
-            request_response = await self._run_asr_with_retry(
-                endpoint=endpoint,
-                transcription_data=transcription_data,
-                from_number=from_number,
-                phone_number_id=phone_number_id,
-                context_message_id=audio_message_id,
-            )
-            if not request_response:
-                return
+                request_response = await self._run_asr_with_retry(
+                    transcription_data=transcription_data,
+                    from_number=from_number,
+                    phone_number_id=phone_number_id,
+                    context_message_id=audio_message_id,
+                )
+                if not request_response:
+                    return
+                await self._cache_voice_note_transcription(
+                    cache, cache_key, request_response
+                )
 
             # Step 7: Validate transcription
             transcribed_text = request_response.get("audio_transcription", "").strip()
@@ -1268,9 +1290,11 @@ class OptimizedMessageProcessor:
         Args:
             input_text: The current user input.
             context: Previous conversation pairs.
+            memory_note: Optional summary of turns older than ``context``.
 
         Returns:
-            List of message dicts for the language model.
+            List of message dicts for the language model, trimmed to the
+            Sunflower prompt token budget.
         """
         messages = [
             {"role": "system", "content": self.system_message},
@@ -1295,7 +1319,9 @@ class OptimizedMessageProcessor:
         # Add current message
         messages.append({"role": "user", "content": input_text})
 
-        return messages
+        # Trim the oldest turns up front so long chats fit the context window
+        # on the first attempt; the memory note keeps their gist.
+        return fit_messages_to_budget(messages)
 
     def _build_compact_retry_messages(self, messages: list) -> list:
         """Build a minimal prompt for Sunflower retry when full context fails."""
@@ -1366,19 +1392,10 @@ class OptimizedMessageProcessor:
                 "content": "I'm running a bit slow right now. \n\n Please try again."
             }
         except Exception as e:
+            # Context-size failures are prevented by trimming up front; these
+            # transient ones still get a single compact-context retry.
             error_text = str(e).lower()
-            should_compact_retry = any(
-                marker in error_text
-                for marker in [
-                    "no response choices available",
-                    "context length",
-                    "prompt is too long",
-                    "too many tokens",
-                    "request timed out",
-                    "model is still loading",
-                ]
-            )
-            if should_compact_retry:
+            if any(marker in error_text for marker in TRANSIENT_SUNFLOWER_ERRORS):
                 compact_messages = self._build_compact_retry_messages(messages)
                 if compact_messages and compact_messages != messages:
                     logging.warning(
@@ -1523,9 +1540,59 @@ class OptimizedMessageProcessor:
         response = await self._call_sunflower(translate_messages)
         return self._clean_response(response)
 
+    @staticmethod
+    def _voice_note_cache_key(local_audio_path: str, target_language: str):
+        cache = get_transcription_cache()
+        if not cache.enabled:
+            return cache, None
+        try:
+            content_id = content_id_for_file(local_audio_path)
+        except OSError:
+            return cache, None
+        # Same options as the ASR job below (whisper, no diarization).
+        key = cache.key(
+            content_id,
+            platform="runpod",
+            language=target_language,
+            adapter=target_language,
+            whisper=True,
+        )
+        return cache, key
+
+    @staticmethod
+    async def _cached_voice_note_transcription(cache, key) -> Optional[Dict]:
+        """ASR response from the transcription cache, or None on a miss."""
+        if key is None:
+            return None
+        cached = await cache.get(key)
+        if cached is None:
+            return None
+        logging.info("Voice note transcription served from cache")
+        return {
+            "audio_transcription": cached.transcription,
+            "diarization_output": cached.diarization_output,
+            "formatted_diarization_output": cached.formatted_diarization_output,
+        }
+
+    @staticmethod
+    async def _cache_voice_note_transcription(cache, key, response: Dict) -> None:
+        if key is None:
+            return
+        # The uploaded blob is deleted after processing, so no audio_url.
+        await cache.set(
+            key,
+            TranscriptionResult(
+                transcription=(response.get("audio_transcription") or "").strip(),
+                diarization_output=response.get("diarization_output") or {},
+                formatted_diarization_output=response.get(
+                    "formatted_diarization_output"
+                )
+                or "",
+            ),
+        )
+
     async def _run_asr_with_retry(
         self,
-        endpoint: runpod.Endpoint,
         transcription_data: Dict,
         from_number: str,
         phone_number_id: str,
@@ -1545,10 +1612,10 @@ class OptimizedMessageProcessor:
             attempt_num = idx + 1
             is_last_attempt = attempt_num == len(attempt_timeouts)
             try:
-                return await asyncio.to_thread(
-                    lambda: endpoint.run_sync(
-                        transcription_data, timeout=timeout_seconds
-                    )
+                return await run_runpod_job(
+                    transcription_data,
+                    timeout=timeout_seconds,
+                    endpoint_id=RUNPOD_ENDPOINT_ID,
                 )
             except Exception as asr_error:
                 logging.error(
@@ -1768,8 +1835,9 @@ class OptimizedMessageProcessor:
                         delete=False, suffix=".mp3"
                     ) as mp3_file:
                         media_path = mp3_file.name
-                    audio_segment = AudioSegment.from_file(wav_path)
-                    audio_segment.export(media_path, format="mp3", bitrate="96k")
+                    await get_audio_worker().transcode(
+                        wav_path, media_path, "mp3", bitrate="96k"
+                    )
                 except Exception as conversion_error:
                     logging.warning(
                         "TTS wav->mp3 conversion failed (%s); falling back to wav upload.",
@@ -2,8 +2,10 @@
 Modal Speech-to-Text Service Module.
 
 This module provides the ModalSTTService class for interacting with the
-Modal-hosted Whisper ASR inference server. It sends raw audio bytes and
-receives transcription results.
+Modal-hosted Whisper ASR inference server. It sends raw audio (bytes, or an
+async byte iterator streamed as the request body) and receives transcription
+results. Requests share one keep-alive ``httpx.AsyncClient`` per service, so
+concurrent transcriptions neither buffer whole files nor pay a TLS handshake.
 
 Architecture:
     Router -> ModalSTTService -> Modal Whisper ASR API
@@ -16,18 +18,24 @@ Usage:
         audio: UploadFile,
         service: Annotated[ModalSTTService, Depends(get_modal_stt_service)]
     ):
-        audio_data = await audio.read()
-        transcription = await service.transcribe(audio_data)
+        transcription = await service.transcribe(iter_upload(audio))
         return {"transcription": transcription}
 """
 
-from typing import Dict, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
+import aiofiles
 import httpx
 
 from app.core.config import settings
 from app.core.exceptions import ExternalServiceError, ValidationError
+from app.schemas.stt import CHUNK_SIZE
 from app.services.base import BaseService
+from app.utils.execution_usage import record_execution
+
+AudioBody = Union[bytes, AsyncIterator[bytes]]
 
 # Mapping of language names (lowercase) to ISO 639-2/3 codes
 LANGUAGE_NAME_TO_CODE: Dict[str, str] = {
@@ -79,6 +87,21 @@ def resolve_language(language: str) -> str:
     )
 
 
+async def iter_upload(
+    reader: Any, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield an upload (anything with ``async read(size)``) in chunks."""
+    while chunk := await reader.read(chunk_size):
+        yield chunk
+
+
+async def iter_file(path: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield a local file in chunks."""
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
 class ModalSTTService(BaseService):
     """Service for interacting with the Modal Whisper ASR API.
 
@@ -106,6 +129,8 @@ class ModalSTTService(BaseService):
         super().__init__()
         self.api_url = api_url or settings.modal_stt_api_url
         self.timeout = timeout or settings.request_timeout_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
 
         self.log_debug(
             "Modal STT service initialized",
@@ -113,15 +138,17 @@ class ModalSTTService(BaseService):
         )
 
     async def transcribe(  # noqa: C901
-        self, audio_data: bytes, language: Optional[str] = None
+        self, audio_data: AudioBody, language: Optional[str] = None
     ) -> str:
         """Transcribe audio using the Modal Whisper ASR API.
 
-        Sends raw audio bytes to the endpoint and parses the response.
+        Sends raw audio to the endpoint and parses the response.
         The Modal endpoint returns: {"text": [{"text": "transcribed text..."}]}
 
         Args:
-            audio_data: Raw audio bytes to transcribe.
+            audio_data: Raw audio bytes, or an async iterator of byte chunks
+                (see ``iter_upload``/``iter_file``) streamed as the body
+                without being held in memory.
             language: Optional language code or name to guide transcription.
                 Accepts ISO 639-2/3 codes (e.g. "eng", "lug") or full names
                 (e.g. "english", "luganda"). If not provided, the model
@@ -148,7 +175,10 @@ class ModalSTTService(BaseService):
         self.log_info(
             "Transcribing audio",
             extra={
-                "audio_bytes": len(audio_data),
+                "audio_bytes": (
+                    len(audio_data) if isinstance(audio_data, bytes) else None
+                ),
+                "streamed": not isinstance(audio_data, bytes),
                 "language": resolved_language,
             },
         )
@@ -158,37 +188,40 @@ class ModalSTTService(BaseService):
             if resolved_language:
                 params["language"] = resolved_language
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.api_url,
-                    content=audio_data,
-                    headers={"Content-Type": "application/octet-stream"},
-                    params=params,
-                )
+            client = await self._get_client()
+            started = time.monotonic()
+            response = await client.post(
+                self.api_url,
+                content=audio_data,
+                headers={"Content-Type": "application/octet-stream"},
+                params=params,
+            )
+            # Modal reports no execution time; bill the round trip.
+            record_execution("modal_stt", time.monotonic() - started)
 
-                if response.status_code != 200:
-                    self.log_error(
-                        "Modal STT API returned error",
-                        extra={
-                            "status_code": response.status_code,
-                            "response_text": response.text[:500],
-                        },
-                    )
-                    raise self.external_service_error(
-                        service_name=self.EXTERNAL_SERVICE_NAME,
-                        message=f"STT API error: {response.text}",
-                        original_error=f"HTTP {response.status_code}",
-                    )
-
-                result = response.json()
-                self.log_info(f"Result received from Modal STT API: {result}")
-                transcription = self._parse_transcription(result)
-
-                self.log_info(
-                    "Transcription completed",
-                    extra={"transcription_length": len(transcription)},
+            if response.status_code != 200:
+                self.log_error(
+                    "Modal STT API returned error",
+                    extra={
+                        "status_code": response.status_code,
+                        "response_text": response.text[:500],
+                    },
+                )
+                raise self.external_service_error(
+                    service_name=self.EXTERNAL_SERVICE_NAME,
+                    message=f"STT API error: {response.text}",
+                    original_error=f"HTTP {response.status_code}",
                 )
-                return transcription
+
+            result = response.json()
+            self.log_info(f"Result received from Modal STT API: {result}")
+            transcription = self._parse_transcription(result)
+
+            self.log_info(
+                "Transcription completed",
+                extra={"transcription_length": len(transcription)},
+            )
+            return transcription
 
         except httpx.TimeoutException as e:
             self.log_error("Modal STT API timeout", exc_info=e)
@@ -249,18 +282,18 @@ class ModalSTTService(BaseService):
             True if the API responds with a non-5xx status, False otherwise.
         """
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.head(self.api_url)
-                is_healthy = response.status_code < 500
-
-                self.log_debug(
-                    "Health check completed",
-                    extra={
-                        "status_code": response.status_code,
-                        "is_healthy": is_healthy,
-                    },
-                )
-                return is_healthy
+            client = await self._get_client()
+            response = await client.head(self.api_url, timeout=10)
+            is_healthy = response.status_code < 500
+
+            self.log_debug(
+                "Health check completed",
+                extra={
+                    "status_code": response.status_code,
+                    "is_healthy": is_healthy,
+                },
+            )
+            return is_healthy
 
         except Exception as e:
             self.log_warning(
@@ -269,6 +302,29 @@ class ModalSTTService(BaseService):
             )
             return False
 
+    async def close(self) -> None:
+        """Close the shared HTTP client (it is recreated on next use)."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        async with self._client_lock:
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=settings.modal_stt_max_connections,
+                        max_keepalive_connections=(
+                            settings.modal_stt_max_keepalive_connections
+                        ),
+                        keepalive_expiry=settings.modal_stt_keepalive_expiry_seconds,
+                    ),
+                )
+        return self._client
+
 
 # -----------------------------------------------------------------------------
 # Dependency Injection
@@ -289,6 +345,12 @@ def get_modal_stt_service() -> ModalSTTService:
     return _modal_stt_service
 
 
+async def close_modal_stt_service() -> None:
+    """Close the singleton's HTTP client, if it was created."""
+    if _modal_stt_service is not None:
+        await _modal_stt_service.close()
+
+
 def reset_modal_stt_service() -> None:
     """Reset the Modal STT service singleton. Used for testing."""
     global _modal_stt_service
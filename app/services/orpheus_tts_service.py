@@ -30,7 +30,7 @@ import os
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional, Union
 
 from app.core.config import settings
 from app.core.exceptions import BadRequestError, ExternalServiceError
@@ -211,8 +211,9 @@ class BatchItemResult:
 class BatchResult:
     results: list[BatchItemResult]
     inference_ms: float
-    upload_ms: float
+    upload_ms: float  # includes signing
     total_ms: float
+    signed_url_ms: float = 0.0
 
 
 # -----------------------------------------------------------------------------
@@ -340,6 +341,44 @@ class OrpheusTTSService:
             total_ms=total_ms,
         )
 
+    # ---- chunked synthesis (see app/services/chunked_speech.py) ----
+
+    async def render_chunks(
+        self,
+        texts: list[str],
+        *,
+        speaker_id: str,
+        language: Optional[str] = None,
+        seed: Optional[int] = None,
+        temperature: float = 0.6,
+        top_p: float = 0.95,
+        repetition_penalty: float = 1.1,
+        max_tokens: int = 1200,
+    ) -> list[bytes]:
+        """Render consecutive chunks of one text in a single batch request.
+
+        Returns one WAV clip per chunk, in order. The caller validates the
+        speaker once (``speakers.validate_speaker``) and stores the joined
+        audio with ``store``.
+        """
+        params = {
+            "speaker_id": speaker_id,
+            "language": language,
+            "seed": seed,
+            "temperature": temperature,
+            "top_p": top_p,
+            "repetition_penalty": repetition_penalty,
+            "max_tokens": max_tokens,
+        }
+        audios = await self.modal.tts_batch(
+            [{"text": text, **params} for text in texts]
+        )
+        return [audio.audio_bytes for audio in audios]
+
+    async def store(self, audio_bytes: bytes) -> UploadResult:
+        """Upload a WAV under the Orpheus prefix and sign it."""
+        return await self._upload_and_sign(audio_bytes)
+
     # ---- batch synthesis ----
 
     async def synthesize_batch(
@@ -377,10 +416,7 @@ class OrpheusTTSService:
         inference_ms = (time.monotonic() - t_inf) * 1000.0
 
         t_up = time.monotonic()
-        uploads = await asyncio.gather(
-            *[self._upload_and_sign(a.audio_bytes) for a in audios],
-            return_exceptions=True,
-        )
+        uploads, signed_url_ms = await self._upload_and_sign_batch(audios)
         upload_ms = (time.monotonic() - t_up) * 1000.0
 
         results: list[BatchItemResult] = []
@@ -426,6 +462,7 @@ class OrpheusTTSService:
             inference_ms=inference_ms,
             upload_ms=upload_ms,
             total_ms=total_ms,
+            signed_url_ms=signed_url_ms,
         )
 
     # ---- internals ----
@@ -435,6 +472,28 @@ class OrpheusTTSService:
         return f"{self.object_prefix}/{date}/{uuid.uuid4().hex}.wav"
 
     async def _upload_and_sign(self, audio_bytes: bytes) -> UploadResult:
+        name, blob, upload_ms = await self._upload(audio_bytes)
+        t1 = time.monotonic()
+        try:
+            signed_url, expires_at = await asyncio.to_thread(
+                self.storage.generate_signed_url,
+                blob,
+                expiry_minutes=self.signed_url_expiry_minutes,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise self._signing_error(exc) from exc
+        signed_url_ms = (time.monotonic() - t1) * 1000.0
+
+        return UploadResult(
+            gcs_object=name,
+            audio_url=signed_url,
+            audio_url_expires_at=expires_at,
+            audio_size_bytes=len(audio_bytes),
+            upload_ms=upload_ms,
+            signed_url_ms=signed_url_ms,
+        )
+
+    async def _upload(self, audio_bytes: bytes) -> tuple[str, Any, float]:
         name = self._object_name()
         t0 = time.monotonic()
         try:
@@ -447,28 +506,58 @@ class OrpheusTTSService:
                 message="Orpheus audio upload failed",
                 original_error=str(exc),
             ) from exc
-        upload_ms = (time.monotonic() - t0) * 1000.0
+        return name, blob, (time.monotonic() - t0) * 1000.0
+
+    async def _upload_and_sign_batch(
+        self, audios: list
+    ) -> tuple[list[Union[UploadResult, Exception]], float]:
+        """Upload every item, then sign them together off the event loop.
 
+        Returns per-item results (the exception for a failed item) and the
+        wall time spent signing.
+        """
+        uploads = await asyncio.gather(
+            *[self._upload(a.audio_bytes) for a in audios],
+            return_exceptions=True,
+        )
+        uploaded = [up for up in uploads if not isinstance(up, Exception)]
         t1 = time.monotonic()
-        try:
-            signed_url, expires_at = self.storage.generate_signed_url(
-                blob, expiry_minutes=self.signed_url_expiry_minutes
+        signed = iter(
+            await self.storage.generate_signed_urls_async(
+                [blob for _, blob, _ in uploaded],
+                expiry_minutes=self.signed_url_expiry_minutes,
             )
-        except Exception as exc:  # noqa: BLE001
-            raise ExternalServiceError(
-                service_name="GCS",
-                message="Orpheus signed URL generation failed",
-                original_error=str(exc),
-            ) from exc
+        )
         signed_url_ms = (time.monotonic() - t1) * 1000.0
 
-        return UploadResult(
-            gcs_object=name,
-            audio_url=signed_url,
-            audio_url_expires_at=expires_at,
-            audio_size_bytes=len(audio_bytes),
-            upload_ms=upload_ms,
-            signed_url_ms=signed_url_ms,
+        results: list[Union[UploadResult, Exception]] = []
+        for audio, up in zip(audios, uploads):
+            if isinstance(up, Exception):
+                results.append(up)
+                continue
+            name, _, upload_ms = up
+            url = next(signed)
+            if isinstance(url, Exception):
+                results.append(self._signing_error(url))
+                continue
+            results.append(
+                UploadResult(
+                    gcs_object=name,
+                    audio_url=url.url,
+                    audio_url_expires_at=url.expires_at,
+                    audio_size_bytes=len(audio.audio_bytes),
+                    upload_ms=upload_ms,
+                    signed_url_ms=url.signing_ms,
+                )
+            )
+        return results, signed_url_ms
+
+    @staticmethod
+    def _signing_error(exc: Exception) -> ExternalServiceError:
+        return ExternalServiceError(
+            service_name="GCS",
+            message="Orpheus signed URL generation failed",
+            original_error=str(exc),
         )
 
 
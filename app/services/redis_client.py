@@ -67,11 +67,27 @@ class SafeRedis:
         key: str,
         value: Any,
         ex: Optional[int] = None,
-    ) -> None:
+    ) -> Optional[bool]:
+        """SET: True once stored, None on error."""
         try:
             await self._backend.set(key, value, ex=ex)
+            return True
         except redis.exceptions.RedisError as exc:
             logger.warning("Redis SET %s failed: %s", key, exc)
+            return None
+
+    async def set_if_absent(
+        self,
+        key: str,
+        value: Any,
+        ex: Optional[int] = None,
+    ) -> Optional[bool]:
+        """SET NX: True if the key was set, False if it existed, None on error."""
+        try:
+            return bool(await self._backend.set(key, value, ex=ex, nx=True))
+        except redis.exceptions.RedisError as exc:
+            logger.warning("Redis SET NX %s failed: %s", key, exc)
+            return None
 
     async def incr(self, key: str, amount: int = 1) -> Optional[int]:
         try:
@@ -92,6 +108,14 @@ class SafeRedis:
         except redis.exceptions.RedisError as exc:
             logger.warning("Redis DELETE %s failed: %s", key, exc)
 
+    async def publish(self, channel: str, message: str) -> Optional[int]:
+        """PUBLISH: number of subscribers that received it, None on error."""
+        try:
+            return await self._backend.publish(channel, message)
+        except redis.exceptions.RedisError as exc:
+            logger.warning("Redis PUBLISH %s failed: %s", channel, exc)
+            return None
+
 
 # ---------------------------------------------------------------------------
 # Singleton factory
@@ -5,12 +5,10 @@ mapping) out of the router so the unified SpeechService and the legacy
 /tasks/runpod/tts endpoint share one implementation.
 """
 
-import asyncio
 import logging
 import os
 from typing import Optional
 
-import runpod
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -23,11 +21,10 @@ from app.core.exceptions import (
     ExternalServiceError,
     ServiceUnavailableError,
 )
+from app.integrations.runpod import run_runpod_job
 
 logger = logging.getLogger(__name__)
 
-runpod.api_key = os.getenv("RUNPOD_API_KEY")
-
 
 @retry(
     stop=stop_after_attempt(3),
@@ -35,11 +32,8 @@ runpod.api_key = os.getenv("RUNPOD_API_KEY")
     retry=retry_if_exception_type((TimeoutError, ConnectionError)),
     reraise=True,
 )
-async def _run_sync_with_retry(endpoint, data):
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        None, lambda: endpoint.run_sync(data, timeout=600)
-    )
+async def _run_with_retry(endpoint_id, data):
+    return await run_runpod_job(data, timeout=600, endpoint_id=endpoint_id)
 
 
 class RunpodSparkTTSService:
@@ -70,9 +64,8 @@ class RunpodSparkTTSService:
                 "max_new_audio_tokens": max_new_audio_tokens,
             }
         }
-        endpoint = runpod.Endpoint(self.endpoint_id)
         try:
-            return await _run_sync_with_retry(endpoint, data)
+            return await _run_with_retry(self.endpoint_id, data)
         except TimeoutError as e:
             logger.error(f"RunPod TTS timed out: {e}")
             raise ServiceUnavailableError(message="Service unavailable due to timeout")
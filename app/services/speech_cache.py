@@ -0,0 +1,149 @@
+"""Content-addressed cache of synthesized speech.
+
+IVR and education partners request the same prompts over and over; each copy
+used to re-run GPU synthesis and upload a new WAV. ``SpeechCache`` maps a
+deterministic key of everything that shapes the audio::
+
+    tts:cache:<sha256(model | platform | voice | language | text | seed |
+                      temperature | top_p | repetition_penalty | max_tokens)>
+
+to the GCS object a previous request produced (plus its voice, language,
+sample rate and duration). ``SpeechService`` checks the object still exists
+and returns it with a freshly signed URL, so a hit costs a Redis read and a
+GCS metadata call instead of a synthesis.
+
+Entries live in Redis for ``TTS_CACHE_TTL_SECONDS`` (keep this below the
+bucket's lifecycle age); ``SafeRedis`` fails open, so an outage only means
+misses. Requests without a ``seed`` share the first rendering of their text.
+
+``snapshot()`` reports hits, misses, stale entries and the hit rate.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.schemas.speech import SpeechRequest
+from app.services.base import BaseService
+from app.services.redis_client import SafeRedis, get_redis_client
+
+CACHE_KEY_PREFIX = "tts:cache:"
+CACHED_FIELDS = (
+    "gcs_object",
+    "voice",
+    "language",
+    "sample_rate",
+    "duration_seconds",
+)
+KEY_FIELDS = (
+    "voice",
+    "language",
+    "seed",
+    "temperature",
+    "top_p",
+    "repetition_penalty",
+    "max_tokens",
+    "max_new_audio_tokens",
+)
+
+
+class SpeechCache(BaseService):
+    """Redis-backed map from synthesis parameters to stored audio objects."""
+
+    def __init__(
+        self,
+        redis: Optional[SafeRedis] = None,
+        ttl_seconds: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        super().__init__()
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or settings.tts_cache_ttl_seconds
+        self.enabled = enabled if enabled is not None else settings.tts_cache_enabled
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.stores = 0
+
+    @staticmethod
+    def key(req: SpeechRequest) -> str:
+        """Cache key for one synthesis request."""
+        parts = {
+            "model": req.model.value,
+            "platform": req.platform.value,
+            "text": req.text,
+            **{name: getattr(req, name) for name in KEY_FIELDS},
+        }
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return CACHE_KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+        redis = self._redis_client()
+        raw = await redis.get(key) if redis is not None else None
+        entry = _decode(raw) if raw else None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    async def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Remember the object a synthesis produced."""
+        if not self.enabled or not entry.get("gcs_object"):
+            return
+        self.stores += 1
+        redis = self._redis_client()
+        if redis is not None:
+            raw = json.dumps({name: entry.get(name) for name in CACHED_FIELDS})
+            await redis.set(key, raw, ex=self.ttl_seconds)
+
+    def mark_stale(self) -> None:
+        """Count a hit whose object had been deleted (treated as a miss)."""
+        self.hits -= 1
+        self.misses += 1
+        self.stale += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Hit/miss counters for this instance."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "lookups": lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def _redis_client(self) -> Optional[SafeRedis]:
+        return self._redis if self._redis is not None else get_redis_client()
+
+
+def _decode(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(raw)
+        return {name: entry[name] for name in CACHED_FIELDS}
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+_speech_cache: Optional[SpeechCache] = None
+
+
+def get_speech_cache() -> SpeechCache:
+    """Return the SpeechCache singleton."""
+    global _speech_cache
+    if _speech_cache is None:
+        _speech_cache = SpeechCache()
+    return _speech_cache
+
+
+def reset_speech_cache() -> None:
+    """Reset the singleton (test helper)."""
+    global _speech_cache
+    _speech_cache = None
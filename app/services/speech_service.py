@@ -4,13 +4,25 @@ Validates a SpeechRequest, routes by (model, platform) to the existing TTS
 services, and normalizes each provider's result into a SpeechResult. No
 synthesis logic lives here — it composes TTSService (Modal spark),
 RunpodSparkTTSService (RunPod spark), and OrpheusTTSService.
+
+Modal results (orpheus and spark) are cached by content (see
+``app.services.speech_cache``): a repeated request reuses the stored object
+with a freshly signed URL. RunPod spark audio is uploaded by the worker to
+its own bucket, so it is not cached here.
+
+Long Modal texts are split at sentence boundaries and synthesized as
+parallel chunks (see ``app.services.chunked_speech``); ``stream_chunked``
+streams a long spark text chunk by chunk.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
+from app.core.config import settings
 from app.core.exceptions import BadRequestError, ExternalServiceError
 from app.models.enums import SpeakerID, TTSResponseMode, get_all_speakers
 from app.schemas.orpheus_tts import (
@@ -19,6 +31,7 @@ from app.schemas.orpheus_tts import (
 )
 from app.schemas.speech import SpeechBatchRequest, SpeechRequest
 from app.schemas.tts import SpeakerInfo, SpeakersListResponse
+from app.services.chunked_speech import ChunkedSynthesizer
 from app.services.orpheus_tts_service import (
     BatchResult,
     OrpheusTTSService,
@@ -28,7 +41,9 @@ from app.services.runpod_tts_service import (
     RunpodSparkTTSService,
     get_runpod_spark_tts_service,
 )
+from app.services.speech_cache import SpeechCache, get_speech_cache
 from app.services.tts_service import TTSService, get_tts_service
+from app.utils.sentences import chunk_text
 from app.utils.storage import GCPStorageService
 from app.utils.storage import get_storage_service as get_legacy_storage_service
 
@@ -66,11 +81,13 @@ class SpeechService:
         orpheus_service: Optional[OrpheusTTSService] = None,
         runpod_spark_service: Optional[RunpodSparkTTSService] = None,
         storage_service: Optional[GCPStorageService] = None,
+        speech_cache: Optional[SpeechCache] = None,
     ) -> None:
         self._spark_modal = tts_service or get_tts_service()
         self._orpheus = orpheus_service or get_orpheus_tts_service()
         self._runpod_spark = runpod_spark_service or get_runpod_spark_tts_service()
         self._storage = storage_service or get_legacy_storage_service()
+        self._cache = speech_cache
 
     @staticmethod
     def resolve_spark_speaker(voice: Optional[str]) -> SpeakerID:
@@ -192,11 +209,89 @@ class SpeechService:
     async def synthesize(self, req: SpeechRequest) -> SpeechResult:
         """Dispatch a url-mode synthesis request and normalize the result.
 
-        Callers must have already run ``validate_request``.
+        Identical Modal requests are served from the speech cache. Callers
+        must have already run ``validate_request``.
         """
+        if req.platform.value != "modal":
+            return await self._synthesize(req)
+
+        cache = self._cache or get_speech_cache()
+        key = cache.key(req)
+        entry = await cache.get(key)
+        if entry is not None:
+            cached = await self._from_cache(req, entry)
+            if cached is not None:
+                return cached
+            cache.mark_stale()
+
+        result = await self._synthesize(req)
+        await cache.set(key, vars(result))
+        return result
+
+    async def _from_cache(
+        self, req: SpeechRequest, entry: Dict[str, Any]
+    ) -> Optional[SpeechResult]:
+        """Re-sign a cached object; None if it no longer exists."""
+        started = time.monotonic()
+        if req.model.value == "orpheus-3b-tts":
+            storage = self._orpheus.storage
+            expiry_minutes = self._orpheus.signed_url_expiry_minutes
+        else:
+            storage, expiry_minutes = self._storage, None
+        gcs_object = entry["gcs_object"]
+        if not await asyncio.to_thread(storage.file_exists, gcs_object):
+            return None
+        signed_url, expires_at = await asyncio.to_thread(
+            storage.get_signed_url_for_file, gcs_object, expiry_minutes
+        )
+        return SpeechResult(
+            audio_url=signed_url,
+            audio_url_expires_at=expires_at,
+            model=req.model.value,
+            platform=req.platform.value,
+            voice=entry["voice"],
+            language=entry["language"],
+            sample_rate=entry["sample_rate"],
+            duration_seconds=entry["duration_seconds"],
+            gcs_object=gcs_object,
+            timings_ms={
+                "cache_hit": True,
+                "total_ms": (time.monotonic() - started) * 1000.0,
+            },
+        )
+
+    @staticmethod
+    def text_chunks(req: SpeechRequest) -> Optional[List[str]]:
+        """Sentence chunks of a long Modal text; None when it is sent whole."""
+        if (
+            not settings.tts_chunking_enabled
+            or req.platform.value != "modal"
+            or len(req.text) <= settings.tts_chunking_min_chars
+        ):
+            return None
+        chunks = chunk_text(req.text, req.language, settings.tts_chunk_max_chars)
+        return chunks if len(chunks) > 1 else None
+
+    def stream_chunked(self, req: SpeechRequest) -> Optional[AsyncIterator[bytes]]:
+        """Progressive WAV stream of a long spark-tts text (None if short).
+
+        The first chunk's audio is sent as soon as it is synthesized while
+        the rest are rendered in parallel.
+        """
+        chunks = self.text_chunks(req)
+        if chunks is None:
+            return None
+        speaker = self.resolve_spark_speaker(req.voice)
+        return self._spark_chunker(speaker).stream(chunks)
+
+    async def _synthesize(self, req: SpeechRequest) -> SpeechResult:
         model = req.model.value
         platform = req.platform.value
 
+        chunks = self.text_chunks(req)
+        if chunks is not None:
+            return await self._synthesize_chunked(req, chunks)
+
         if model == "orpheus-3b-tts":
             speaker_id, resolved_language = await self._resolve_orpheus_voice(
                 req.voice, req.language
@@ -204,18 +299,10 @@ class SpeechService:
             kwargs: Dict[str, Any] = {
                 "text": req.text,
                 "speaker_id": speaker_id,
+                **self._orpheus_tuning(req),
             }
             if resolved_language is not None:
                 kwargs["language"] = resolved_language
-            for name, val in (
-                ("seed", req.seed),
-                ("temperature", req.temperature),
-                ("top_p", req.top_p),
-                ("repetition_penalty", req.repetition_penalty),
-                ("max_tokens", req.max_tokens),
-            ):
-                if val is not None:
-                    kwargs[name] = val
             r = await self._orpheus.synthesize(**kwargs)
             return SpeechResult(
                 audio_url=r.audio_url,
@@ -241,8 +328,9 @@ class SpeechService:
                 text=req.text, speaker_id=speaker
             )
             file_name = self._storage.generate_file_name(req.text, speaker)
-            blob = await self._storage.upload_audio_async(audio, file_name)
-            signed_url, expires_at = self._storage.generate_signed_url(blob)
+            signed_url, expires_at, timings_ms = await self._store_spark(
+                audio, file_name
+            )
             return SpeechResult(
                 audio_url=signed_url,
                 audio_url_expires_at=expires_at,
@@ -253,6 +341,7 @@ class SpeechService:
                     self._spark_modal.estimate_duration(req.text), 2
                 ),
                 gcs_object=file_name,
+                timings_ms=timings_ms,
             )
 
         temperature = (
@@ -290,6 +379,110 @@ class SpeechService:
             gcs_object=out.get("blob"),
         )
 
+    async def _synthesize_chunked(
+        self, req: SpeechRequest, chunks: List[str]
+    ) -> SpeechResult:
+        """Synthesize ``chunks`` in parallel and store the joined audio."""
+        started = time.monotonic()
+        if req.model.value == "orpheus-3b-tts":
+            speaker_id, language = await self._resolve_orpheus_voice(
+                req.voice, req.language
+            )
+            # Validate once here rather than failing every chunk upstream.
+            await self._orpheus.speakers.validate_speaker(speaker_id, language=language)
+            tuning = self._orpheus_tuning(req)
+
+            async def render(texts: List[str]) -> List[bytes]:
+                return await self._orpheus.render_chunks(
+                    texts, speaker_id=speaker_id, language=language, **tuning
+                )
+
+            # Spread the chunks over TTS_CHUNK_CONCURRENCY batch requests.
+            group_size = min(
+                self._orpheus.max_batch_size,
+                -(-len(chunks) // settings.tts_chunk_concurrency),
+            )
+            audio = await ChunkedSynthesizer(render, group_size=group_size).synthesize(
+                chunks
+            )
+            upload = await self._orpheus.store(audio.wav)
+            voice = speaker_id
+            language = await self._orpheus.speakers.language_for(speaker_id)
+            signed_url, expires_at = upload.audio_url, upload.audio_url_expires_at
+            gcs_object = upload.gcs_object
+            timings_ms: Dict[str, Any] = {
+                "upload_ms": upload.upload_ms,
+                "signed_url_ms": upload.signed_url_ms,
+            }
+        else:
+            speaker = self.resolve_spark_speaker(req.voice)
+            audio = await self._spark_chunker(speaker).synthesize(chunks)
+            gcs_object = self._storage.generate_file_name(req.text, speaker)
+            signed_url, expires_at, timings_ms = await self._store_spark(
+                audio.wav, gcs_object
+            )
+            voice, language = speaker.name.lower(), None
+
+        return SpeechResult(
+            audio_url=signed_url,
+            audio_url_expires_at=expires_at,
+            model=req.model.value,
+            platform=req.platform.value,
+            voice=voice,
+            language=language,
+            sample_rate=audio.sample_rate,
+            duration_seconds=audio.duration_seconds,
+            gcs_object=gcs_object,
+            timings_ms={
+                "inference_ms": audio.inference_ms,
+                **timings_ms,
+                "total_ms": (time.monotonic() - started) * 1000.0,
+                "chunks": audio.chunks,
+            },
+        )
+
+    def _spark_chunker(self, speaker: SpeakerID) -> ChunkedSynthesizer:
+        async def render(texts: List[str]) -> List[bytes]:
+            return [
+                await self._spark_modal.generate_audio(
+                    text=texts[0], speaker_id=speaker
+                )
+            ]
+
+        return ChunkedSynthesizer(render)
+
+    async def _store_spark(
+        self, audio: bytes, file_name: str
+    ) -> Tuple[str, datetime, Dict[str, Any]]:
+        """Upload spark audio and sign it; returns (url, expires_at, timings)."""
+        t0 = time.monotonic()
+        blob = await self._storage.upload_audio_async(audio, file_name)
+        t1 = time.monotonic()
+        signed_url, expires_at = await asyncio.to_thread(
+            self._storage.generate_signed_url, blob
+        )
+        t2 = time.monotonic()
+        return (
+            signed_url,
+            expires_at,
+            {"upload_ms": (t1 - t0) * 1000.0, "signed_url_ms": (t2 - t1) * 1000.0},
+        )
+
+    @staticmethod
+    def _orpheus_tuning(req: SpeechRequest) -> Dict[str, Any]:
+        """Orpheus sampling parameters the request sets explicitly."""
+        return {
+            name: val
+            for name, val in (
+                ("seed", req.seed),
+                ("temperature", req.temperature),
+                ("top_p", req.top_p),
+                ("repetition_penalty", req.repetition_penalty),
+                ("max_tokens", req.max_tokens),
+            )
+            if val is not None
+        }
+
     async def synthesize_batch(self, req: SpeechBatchRequest) -> BatchResult:
         """Validate + dispatch a batch (orpheus-3b-tts only).
 
@@ -21,16 +21,15 @@ import hashlib
 import logging
 import os
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Optional, Tuple
 
 from dotenv import load_dotenv
-from google.auth import default
-from google.auth.transport.requests import Request
 from google.cloud import storage
 from google.cloud.storage import Blob, Bucket
 
 from app.services.base import BaseService
+from app.utils.url_signer import get_url_signer
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -150,44 +149,16 @@ class StorageService(BaseService):
             blob_name = f"{prefix}/{file_id}/{file_name}"
             blob = self.bucket.blob(blob_name)
 
-            # Calculate expiry time
-            expires_at = datetime.now(timezone.utc) + timedelta(minutes=expiry_minutes)
-
-            # Generate signed URL for PUT method
-            # Use IAM-based signing for Cloud Run (no private key required)
-            signing_kwargs = {
-                "version": "v4",
-                "expiration": timedelta(minutes=expiry_minutes),
-                "method": "PUT",
-                "content_type": content_type,
-            }
-
-            # Add service account email and access token for IAM-based signing
-            # When running in Cloud Run, we need to explicitly provide an access token
-            # to force the library to use the IAM signBlob API instead of trying to sign locally
-            if self._service_account_email:
-                try:
-                    # Get default credentials and refresh to get access token
-                    credentials, _ = default()
-                    if not credentials.valid:
-                        credentials.refresh(Request())
-
-                    signing_kwargs[
-                        "service_account_email"
-                    ] = self._service_account_email
-                    signing_kwargs["access_token"] = credentials.token
-
-                    self.log_info(
-                        f"Using IAM-based signing with service account: {self._service_account_email}"
-                    )
-                except Exception as e:
-                    self.log_warning(f"Failed to get access token for IAM signing: {e}")
-                    # Fall back to service account email only
-                    signing_kwargs[
-                        "service_account_email"
-                    ] = self._service_account_email
-
-            signed_url = blob.generate_signed_url(**signing_kwargs)
+            # Upload URLs are unique per file, so they are never cached;
+            # the signer still reuses its IAM credentials.
+            signed = get_url_signer().sign(
+                blob,
+                expiry_minutes,
+                service_account_email=self._service_account_email,
+                method="PUT",
+                content_type=content_type,
+            )
+            signed_url, expires_at = signed.url, signed.expires_at
 
             self.log_info(f"Upload URL generated for file_id: {file_id}")
             return signed_url, file_id, expires_at
@@ -216,42 +187,12 @@ class StorageService(BaseService):
         """
         try:
             blob = self.bucket.blob(blob_name)
-            expires_at = datetime.now(timezone.utc) + timedelta(minutes=expiry_minutes)
-
-            # Generate signed URL for GET method
-            # Use IAM-based signing for Cloud Run (no private key required)
-            signing_kwargs = {
-                "version": "v4",
-                "expiration": timedelta(minutes=expiry_minutes),
-                "method": "GET",
-            }
-
-            # Add service account email and access token for IAM-based signing
-            # When running in Cloud Run, we need to explicitly provide an access token
-            # to force the library to use the IAM signBlob API instead of trying to sign locally
-            if self._service_account_email:
-                try:
-                    # Get default credentials and refresh to get access token
-                    credentials, _ = default()
-                    if not credentials.valid:
-                        credentials.refresh(Request())
-
-                    signing_kwargs[
-                        "service_account_email"
-                    ] = self._service_account_email
-                    signing_kwargs["access_token"] = credentials.token
-
-                    self.log_info(
-                        f"Using IAM-based signing with service account: {self._service_account_email}"
-                    )
-                except Exception as e:
-                    self.log_warning(f"Failed to get access token for IAM signing: {e}")
-                    # Fall back to service account email only
-                    signing_kwargs[
-                        "service_account_email"
-                    ] = self._service_account_email
-
-            signed_url = blob.generate_signed_url(**signing_kwargs)
+            signed = get_url_signer().sign(
+                blob,
+                expiry_minutes,
+                service_account_email=self._service_account_email,
+            )
+            signed_url, expires_at = signed.url, signed.expires_at
 
             return signed_url, expires_at
 
@@ -30,23 +30,39 @@ Note:
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import tempfile
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+import uuid
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-import runpod
+import aiofiles
 from dotenv import load_dotenv
-from google.cloud import storage
-from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
-from app.integrations.runpod import run_job_and_get_output
+from app.core.config import settings
+from app.integrations.runpod import run_job_and_get_output, run_runpod_job
 from app.schemas.stt import ALLOWED_AUDIO_TYPES, MAX_AUDIO_DURATION_MINUTES
+from app.services.audio_worker import get_audio_worker
 from app.services.base import BaseService
+from app.services.chunked_transcription import ChunkedTranscriber
 from app.utils.audio import get_audio_extension
-from app.utils.upload_audio_file_gcp import upload_audio_file
+from app.utils.audio_probe import (
+    PROBE_HEAD_BYTES,
+    probe_duration,
+    probe_duration_from_bytes,
+    trim_stream_copy,
+)
+from app.utils.upload_audio_file_gcp import (
+    STREAM_READ_SIZE,
+    _get_storage_client,
+    delete_audio_file,
+    probe_audio_blob,
+    stream_audio_upload,
+    upload_audio_file,
+)
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
@@ -65,6 +81,8 @@ class TranscriptionResult:
         was_trimmed: Whether the audio was trimmed.
         original_duration: Original duration if trimmed.
         processing_time: Time taken for transcription.
+        content_id: Identity of the audio content (see
+            ``app.services.transcription_cache``), when known.
     """
 
     transcription: Optional[str]
@@ -75,6 +93,7 @@ class TranscriptionResult:
     was_trimmed: bool = False
     original_duration: Optional[float] = None
     processing_time: Optional[float] = None
+    content_id: Optional[str] = None
 
 
 class AudioValidationError(Exception):
@@ -130,7 +149,6 @@ class STTService(BaseService):
         self.audio_bucket_name = audio_bucket_name or os.getenv(
             "AUDIO_CONTENT_BUCKET_NAME"
         )
-        runpod.api_key = os.getenv("RUNPOD_API_KEY")
 
         if not self.runpod_endpoint_id:
             self.log_warning("RUNPOD_ENDPOINT_ID not configured")
@@ -156,13 +174,16 @@ class STTService(BaseService):
                 f"Unsupported file type. Supported formats: {supported_formats}"
             )
 
-    def process_audio_duration(
+    async def process_audio_duration(
         self, file_path: str, file_extension: str
     ) -> Tuple[str, bool, Optional[float]]:
-        """Process audio file and trim if necessary.
+        """Check the audio duration and trim the file if it is too long.
 
-        Loads the audio file, checks its duration, and trims it to the
-        maximum allowed duration if it exceeds the limit.
+        The duration is read from the container header (see
+        ``app.utils.audio_probe``), so files under the limit are never
+        decoded. Long files are cut with an ffmpeg stream copy; the file is
+        only decoded (in the audio worker pool) when its duration cannot be
+        probed or ffmpeg cannot trim it.
 
         Args:
             file_path: Path to the audio file.
@@ -181,33 +202,39 @@ class STTService(BaseService):
             os.path.dirname(file_path),
             f"trimmed_{os.path.basename(file_path)}",
         )
-
-        try:
-            audio_segment = AudioSegment.from_file(file_path)
-            duration_minutes = len(audio_segment) / (1000 * 60)
-
-            if duration_minutes > MAX_AUDIO_DURATION_MINUTES:
-                # Trim to max duration
-                trimmed_audio = audio_segment[
-                    : (MAX_AUDIO_DURATION_MINUTES * 60 * 1000)
-                ]
-                export_format = (
-                    file_extension[1:]
-                    if file_extension.startswith(".")
-                    else file_extension
-                )
-                trimmed_audio.export(trimmed_file_path, format=export_format)
+        max_seconds = MAX_AUDIO_DURATION_MINUTES * 60
+
+        duration_seconds = await asyncio.to_thread(probe_duration, file_path)
+        if duration_seconds is not None:
+            if duration_seconds <= max_seconds:
+                return file_path, False, None
+            if await asyncio.to_thread(
+                trim_stream_copy, file_path, trimmed_file_path, max_seconds
+            ):
                 os.remove(file_path)
-
+                duration_minutes = duration_seconds / 60
                 self.log_info(
                     f"Audio trimmed from {duration_minutes:.1f} to "
-                    f"{MAX_AUDIO_DURATION_MINUTES} minutes"
+                    f"{MAX_AUDIO_DURATION_MINUTES} minutes (stream copy)"
                 )
-
                 return trimmed_file_path, True, duration_minutes
 
-            return file_path, False, None
+        return await self._decode_and_trim(file_path, file_extension, trimmed_file_path)
 
+    async def _decode_and_trim(
+        self, file_path: str, file_extension: str, trimmed_file_path: str
+    ) -> Tuple[str, bool, Optional[float]]:
+        """Fallback: decode the whole file to measure and re-encode a trim."""
+        export_format = (
+            file_extension[1:] if file_extension.startswith(".") else file_extension
+        )
+        try:
+            result = await get_audio_worker().trim(
+                file_path,
+                trimmed_file_path,
+                MAX_AUDIO_DURATION_MINUTES * 60,
+                export_format,
+            )
         except CouldntDecodeError:
             # Clean up files on error
             if os.path.exists(file_path):
@@ -218,9 +245,43 @@ class STTService(BaseService):
                 "Could not decode audio file. Please ensure the file is not corrupted."
             )
 
+        if not result.trimmed:
+            return file_path, False, None
+
+        os.remove(file_path)
+        duration_minutes = result.duration_seconds / 60
+        self.log_info(
+            f"Audio trimmed from {duration_minutes:.1f} to "
+            f"{MAX_AUDIO_DURATION_MINUTES} minutes"
+        )
+        return trimmed_file_path, True, duration_minutes
+
+    @staticmethod
+    def single_job_limit_seconds() -> float:
+        """Longest audio sent to RunPod as one job.
+
+        Longer audio is chunked when STT_CHUNKING_ENABLED, else trimmed.
+        """
+        limit = MAX_AUDIO_DURATION_MINUTES * 60
+        if settings.stt_chunking_enabled:
+            return min(settings.stt_chunking_min_seconds, limit)
+        return limit
+
+    async def _should_chunk(self, file_path: str) -> bool:
+        if not settings.stt_chunking_enabled:
+            return False
+        duration_seconds = await asyncio.to_thread(probe_duration, file_path)
+        return (
+            duration_seconds is not None
+            and duration_seconds > self.single_job_limit_seconds()
+        )
+
     async def upload_to_storage(self, file_path: str) -> Tuple[str, str]:
         """Upload audio file to cloud storage.
 
+        The upload runs in a worker thread, so concurrent uploads (e.g. the
+        chunks of a long recording) overlap and never block the event loop.
+
         Args:
             file_path: Path to the audio file to upload.
 
@@ -231,7 +292,9 @@ class STTService(BaseService):
             AudioProcessingError: If upload fails.
         """
         try:
-            blob_name, blob_url = upload_audio_file(file_path=file_path)
+            blob_name, blob_url = await asyncio.to_thread(
+                upload_audio_file, file_path=file_path
+            )
             if not blob_name or not blob_url:
                 raise AudioProcessingError(
                     "Failed to upload audio file to cloud storage"
@@ -328,7 +391,6 @@ class STTService(BaseService):
         Raises:
             TranscriptionError: If transcription fails.
         """
-        endpoint = runpod.Endpoint(self.runpod_endpoint_id)
         data = {
             "input": {
                 "task": "transcribe",
@@ -341,10 +403,8 @@ class STTService(BaseService):
         }
 
         try:
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: endpoint.run_sync(data, timeout=600)
+            response = await run_runpod_job(
+                data, timeout=600, endpoint_id=self.runpod_endpoint_id
             )
             self.log_info("Transcription response received (sync)")
             return response
@@ -374,8 +434,10 @@ class STTService(BaseService):
     ) -> TranscriptionResult:
         """Transcribe audio from a GCS blob.
 
-        Downloads the audio from GCS, processes it (trim if needed),
-        and calls the transcription API.
+        The duration is read from the blob's header with ranged reads, so
+        audio that fits in one job is never downloaded: the worker reads it
+        from GCS directly. Only long recordings, or ones whose header cannot
+        be parsed, are downloaded to be chunked or trimmed.
 
         Args:
             gcs_blob_name: Name of the blob in GCS.
@@ -393,20 +455,39 @@ class STTService(BaseService):
         """
         self.log_info(f"Starting transcription from GCS: {gcs_blob_name}")
 
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(self.audio_bucket_name)
-        blob = bucket.blob(gcs_blob_name)
-
-        if not blob.exists():
+        probe = await asyncio.to_thread(
+            probe_audio_blob, gcs_blob_name, self.audio_bucket_name
+        )
+        if probe is None:
             raise AudioProcessingError(f"GCS blob {gcs_blob_name} does not exist.")
 
-        # Download to temp file
+        options = dict(
+            language=language,
+            adapter=adapter,
+            whisper=whisper,
+            recognise_speakers=recognise_speakers,
+        )
+        if probe.duration_seconds is not None and probe.duration_seconds <= (
+            self.single_job_limit_seconds()
+        ):
+            return await self._transcribe_gcs_blob(
+                gcs_blob_name, was_trimmed=False, original_duration=None, **options
+            )
+        return await self._transcribe_downloaded_gcs_blob(gcs_blob_name, **options)
+
+    async def _transcribe_downloaded_gcs_blob(
+        self, gcs_blob_name: str, **options: Any
+    ) -> TranscriptionResult:
+        """Download a long (or unprobeable) blob to chunk or trim it.
+
+        A trimmed recording is uploaded as a new blob and that blob is
+        transcribed (and returned as the audio location).
+        """
         file_extension = get_audio_extension(gcs_blob_name) or ".mp3"
         with tempfile.NamedTemporaryFile(
             delete=False, suffix=file_extension
         ) as temp_file:
             file_path = temp_file.name
-            blob.download_to_filename(file_path)
 
         trimmed_file_path = os.path.join(
             os.path.dirname(file_path),
@@ -414,36 +495,31 @@ class STTService(BaseService):
         )
 
         try:
-            # Process audio duration
-            file_path, was_trimmed, original_duration = self.process_audio_duration(
-                file_path, file_extension
-            )
-
-            # Call transcription API
-            response = await self.call_transcription_api_sync(
-                blob_name=gcs_blob_name,
-                language=language,
-                adapter=adapter,
-                whisper=whisper,
-                recognise_speakers=recognise_speakers,
-            )
-
-            transcription = response.get("audio_transcription")
-            if not transcription:
-                raise TranscriptionError(
-                    "No transcription was generated. The audio might be silent or unclear."
+            await asyncio.to_thread(self._download_blob, gcs_blob_name, file_path)
+            if await self._should_chunk(file_path):
+                return await ChunkedTranscriber(self).transcribe(
+                    file_path,
+                    source=(
+                        gcs_blob_name,
+                        f"gs://{self.audio_bucket_name}/{gcs_blob_name}",
+                    ),
+                    **options,
                 )
 
-            return TranscriptionResult(
-                transcription=transcription,
-                diarization_output=response.get("diarization_output", {}),
-                formatted_diarization_output=response.get(
-                    "formatted_diarization_output", ""
-                ),
-                audio_url=f"gs://{self.audio_bucket_name}/{gcs_blob_name}",
-                blob_name=gcs_blob_name,
+            # Process audio duration
+            (
+                processed_path,
+                was_trimmed,
+                original_duration,
+            ) = await self.process_audio_duration(file_path, file_extension)
+            if was_trimmed:
+                # The worker reads from GCS, so it needs the trimmed copy there.
+                gcs_blob_name, _ = await self.upload_to_storage(processed_path)
+            return await self._transcribe_gcs_blob(
+                gcs_blob_name,
                 was_trimmed=was_trimmed,
                 original_duration=original_duration,
+                **options,
             )
 
         finally:
@@ -453,6 +529,35 @@ class STTService(BaseService):
             if os.path.exists(trimmed_file_path):
                 os.remove(trimmed_file_path)
 
+    async def _transcribe_gcs_blob(
+        self,
+        gcs_blob_name: str,
+        was_trimmed: bool,
+        original_duration: Optional[float],
+        **options: Any,
+    ) -> TranscriptionResult:
+        response = await self.call_transcription_api_sync(
+            blob_name=gcs_blob_name, **options
+        )
+
+        transcription = response.get("audio_transcription")
+        if not transcription:
+            raise TranscriptionError(
+                "No transcription was generated. The audio might be silent or unclear."
+            )
+
+        return TranscriptionResult(
+            transcription=transcription,
+            diarization_output=response.get("diarization_output", {}),
+            formatted_diarization_output=response.get(
+                "formatted_diarization_output", ""
+            ),
+            audio_url=f"gs://{self.audio_bucket_name}/{gcs_blob_name}",
+            blob_name=gcs_blob_name,
+            was_trimmed=was_trimmed,
+            original_duration=original_duration,
+        )
+
     async def transcribe_uploaded_file(
         self,
         file_path: str,
@@ -490,10 +595,21 @@ class STTService(BaseService):
         )
 
         try:
+            if await self._should_chunk(file_path):
+                return await ChunkedTranscriber(self).transcribe(
+                    file_path,
+                    language=language,
+                    adapter=adapter,
+                    whisper=whisper,
+                    recognise_speakers=recognise_speakers,
+                )
+
             # Process audio duration
-            file_path, was_trimmed, original_duration = self.process_audio_duration(
-                file_path, file_extension
-            )
+            (
+                file_path,
+                was_trimmed,
+                original_duration,
+            ) = await self.process_audio_duration(file_path, file_extension)
 
             # Upload to cloud storage
             blob_name, blob_url = await self.upload_to_storage(file_path)
@@ -532,6 +648,205 @@ class STTService(BaseService):
             if os.path.exists(trimmed_file_path):
                 os.remove(trimmed_file_path)
 
+    async def transcribe_upload_stream(
+        self,
+        stream: Any,
+        file_extension: str,
+        content_type: Optional[str] = None,
+        language: str = "lug",
+        adapter: str = "lug",
+        whisper: bool = False,
+        recognise_speakers: bool = False,
+        cache_lookup: Optional[
+            Callable[[str], Awaitable[Optional[TranscriptionResult]]]
+        ] = None,
+    ) -> TranscriptionResult:
+        """Transcribe an upload by piping it straight into cloud storage.
+
+        Unlike ``transcribe_uploaded_file`` the audio never touches local
+        disk: it is streamed into a resumable upload and its duration is read
+        from the first (and last) bytes seen on the way. The first
+        ``PROBE_HEAD_BYTES`` are probed before anything is uploaded; audio
+        they show to be too long is copied to local disk instead and handled
+        by ``transcribe_uploaded_file``. Audio whose duration only the end
+        of the stream reveals (Ogg) or that cannot be read from its header
+        is checked after the upload and downloaded again if needed.
+
+        Args:
+            stream: Object with an ``async read(size)`` method, e.g. an
+                ``UploadFile``.
+            file_extension: The file extension.
+            content_type: The upload's content type.
+            language: Target language code.
+            adapter: Language adapter code.
+            whisper: Whether to use Whisper model.
+            recognise_speakers: Whether to enable speaker diarization.
+            cache_lookup: Called with the upload's content id once it is
+                known; a result it returns is used instead of transcribing.
+
+        Returns:
+            TranscriptionResult containing the transcription and metadata,
+            with ``content_id`` set to the upload's SHA-256.
+
+        Raises:
+            AudioProcessingError: If the upload or audio processing fails.
+            TranscriptionError: If transcription fails.
+        """
+        self.log_info("Starting transcription of streamed upload")
+        options = {
+            "language": language,
+            "adapter": adapter,
+            "whisper": whisper,
+            "recognise_speakers": recognise_speakers,
+        }
+        head = await _read_head(stream)
+        if self._head_exceeds_limit(head, getattr(stream, "size", None)):
+            # Known to need trimming or chunking: keep it off cloud storage.
+            return await self._transcribe_spooled_upload(
+                head, stream, file_extension, cache_lookup, **options
+            )
+
+        blob_name = f"{uuid.uuid4().hex}{file_extension}"
+        try:
+            upload = await stream_audio_upload(
+                stream, blob_name, content_type, prefix=head
+            )
+        except Exception as e:
+            self.log_error(f"Cloud storage upload error: {str(e)}")
+            raise AudioProcessingError("Failed to upload audio file to cloud storage")
+
+        content_id = f"sha256:{upload.sha256}"
+        if cache_lookup is not None:
+            cached = await cache_lookup(content_id)
+            if cached is not None:
+                return replace(
+                    cached,
+                    audio_url=upload.blob_uri,
+                    blob_name=blob_name,
+                    content_id=content_id,
+                )
+
+        duration_seconds = probe_duration_from_bytes(
+            upload.head, upload.tail, upload.size
+        )
+        if duration_seconds is None or duration_seconds > (
+            self.single_job_limit_seconds()
+        ):
+            result = await self._transcribe_uploaded_blob_locally(
+                blob_name, file_extension, **options
+            )
+            return replace(result, content_id=content_id)
+
+        response = await self.call_transcription_api(blob_name=blob_name, **options)
+
+        transcription = response.get("audio_transcription")
+        if not transcription:
+            raise TranscriptionError(
+                "No transcription was generated. The audio might be silent or unclear."
+            )
+
+        return TranscriptionResult(
+            transcription=transcription,
+            diarization_output=response.get("diarization_output", {}),
+            formatted_diarization_output=response.get(
+                "formatted_diarization_output", ""
+            ),
+            audio_url=upload.blob_uri,
+            blob_name=blob_name,
+            content_id=content_id,
+        )
+
+    async def _transcribe_uploaded_blob_locally(
+        self, blob_name: str, file_extension: str, **options: Any
+    ) -> TranscriptionResult:
+        """Fallback for streamed uploads that need trimming or decoding."""
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=file_extension
+        ) as temp_file:
+            file_path = temp_file.name
+        try:
+            await asyncio.to_thread(self._download_blob, blob_name, file_path)
+        except Exception as e:
+            os.remove(file_path)
+            self.log_error(f"Cloud storage download error: {str(e)}")
+            raise AudioProcessingError("Failed to process the uploaded audio file")
+        finally:
+            # The local path re-uploads the (possibly trimmed) file.
+            await asyncio.to_thread(delete_audio_file, blob_name)
+
+        return await self.transcribe_uploaded_file(
+            file_path=file_path, file_extension=file_extension, **options
+        )
+
+    def _download_blob(self, blob_name: str, file_path: str) -> None:
+        bucket = _get_storage_client().bucket(self.audio_bucket_name)
+        bucket.blob(blob_name).download_to_filename(file_path)
+
+    def _head_exceeds_limit(self, head: bytes, size: Any) -> bool:
+        """Whether the first bytes of an upload already show it is too long.
+
+        ``size`` is the declared length of the upload (``UploadFile.size``);
+        without it only a stream that fits in ``head`` can be judged.
+        """
+        if len(head) < PROBE_HEAD_BYTES:
+            duration = probe_duration_from_bytes(head, head, len(head))
+        elif isinstance(size, int) and size > 0:
+            duration = probe_duration_from_bytes(head, b"", size)
+        else:
+            return False
+        return duration is not None and duration > self.single_job_limit_seconds()
+
+    async def _transcribe_spooled_upload(
+        self,
+        head: bytes,
+        stream: Any,
+        file_extension: str,
+        cache_lookup: Optional[
+            Callable[[str], Awaitable[Optional[TranscriptionResult]]]
+        ],
+        **options: Any,
+    ) -> TranscriptionResult:
+        """Copy a too-long upload to local disk and trim or chunk it there.
+
+        Only what ``transcribe_uploaded_file`` keeps is sent to cloud storage.
+        """
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=file_extension
+        ) as temp_file:
+            file_path = temp_file.name
+        digest = hashlib.sha256(head)
+        try:
+            async with aiofiles.open(file_path, "wb") as out_file:
+                await out_file.write(head)
+                while chunk := await stream.read(STREAM_READ_SIZE):
+                    digest.update(chunk)
+                    await out_file.write(chunk)
+        except Exception as e:
+            os.remove(file_path)
+            self.log_error(f"Failed to spool upload: {str(e)}")
+            raise AudioProcessingError("Failed to process the uploaded audio file")
+
+        content_id = f"sha256:{digest.hexdigest()}"
+        if cache_lookup is not None:
+            cached = await cache_lookup(content_id)
+            if cached is not None:
+                # The result is persisted with its audio, so store this copy.
+                try:
+                    blob_name, blob_url = await self.upload_to_storage(file_path)
+                finally:
+                    os.remove(file_path)
+                return replace(
+                    cached,
+                    audio_url=blob_url,
+                    blob_name=blob_name,
+                    content_id=content_id,
+                )
+
+        result = await self.transcribe_uploaded_file(
+            file_path=file_path, file_extension=file_extension, **options
+        )
+        return replace(result, content_id=content_id)
+
     async def transcribe_org_audio(
         self,
         file_path: str,
@@ -583,6 +898,17 @@ class STTService(BaseService):
                 os.remove(file_path)
 
 
+async def _read_head(stream: Any) -> bytes:
+    """Read up to ``PROBE_HEAD_BYTES`` from the start of ``stream``."""
+    head = bytearray()
+    while len(head) < PROBE_HEAD_BYTES:
+        chunk = await stream.read(PROBE_HEAD_BYTES - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return bytes(head)
+
+
 # Singleton instance
 _stt_service_instance: Optional[STTService] = None
 
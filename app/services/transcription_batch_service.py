@@ -0,0 +1,306 @@
+"""Batch transcription of GCS blobs.
+
+``POST /tasks/audio/transcriptions/batch`` accepts a list of blob names (or a
+manifest blob listing them) and hands them to ``TranscriptionBatchService``,
+which transcribes them through ``TranscriptionService`` (so repeated clips
+are served from the transcription cache) with a bounded number in flight:
+
+    - ``concurrency`` workers per batch (capped by STT_BATCH_MAX_CONCURRENCY)
+      pull the next blob as soon as they finish one, so a batch of thousands
+      never has more than ``concurrency`` tasks or RunPod jobs at once;
+    - each item still waits for a ``runpod_asr`` upstream slot, so a batch
+      shares the upstream fairly with interactive traffic instead of being
+      shed with 503s.
+
+Results are emitted as NDJSON in completion order, one object per item
+(``index`` is its position in the request) followed by a ``summary`` line:
+streamed in the response, or written in the background to
+``batch-results/<user_id>/<batch_id>.ndjson``, a name the server picks so a
+caller cannot overwrite other objects in the shared audio bucket. Manifests
+are read only from the caller's own ``batch-manifests/<user_id>/`` prefix.
+Quota is charged once per batch by the router. Item failures are reported in
+their line and do not stop the batch.
+"""
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import APIException, BadRequestError
+from app.schemas.stt import STTTranscript, TranscriptionBatchRequest
+from app.services.base import BaseService
+from app.services.stt_service import (
+    AudioProcessingError,
+    AudioValidationError,
+    TranscriptionError,
+)
+from app.services.transcription_service import (
+    TranscriptionService,
+    get_transcription_service,
+)
+from app.services.upstream_limiter import wait_for_upstream_slot
+from app.utils.upload_audio_file_gcp import (
+    open_audio_bucket_writer,
+    read_audio_bucket_text,
+)
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+# Per-user prefixes in the audio bucket (followed by "<user_id>/").
+BATCH_MANIFEST_PREFIX = "batch-manifests"
+BATCH_RESULTS_PREFIX = "batch-results"
+# Give up on an item that could not get an upstream slot for this long.
+MAX_SLOT_WAIT_SECONDS = 30 * 60
+
+
+@dataclass
+class BatchOptions:
+    """Transcription options shared by every item of a batch."""
+
+    language: str
+    adapter: str
+    whisper: bool = False
+    recognise_speakers: bool = False
+    concurrency: int = 1
+
+
+def to_ndjson(item: Dict[str, Any]) -> str:
+    """One NDJSON line for a result or summary object."""
+    return json.dumps(item, default=str) + "\n"
+
+
+def manifest_prefix(user) -> str:
+    """Prefix a user's batch manifests must live under."""
+    return f"{BATCH_MANIFEST_PREFIX}/{user.id}/"
+
+
+def results_blob_name(user, batch_id: str) -> str:
+    """Blob a background batch writes its NDJSON results to."""
+    return f"{BATCH_RESULTS_PREFIX}/{user.id}/{batch_id}.ndjson"
+
+
+class TranscriptionBatchService(BaseService):
+    """Transcribes batches of GCS blobs with bounded concurrency."""
+
+    def __init__(self, transcription_service: Optional[TranscriptionService] = None):
+        super().__init__()
+        self._transcription = transcription_service or get_transcription_service()
+        self._tasks: Set[asyncio.Task] = set()
+
+    # ---- request handling ----
+
+    async def resolve_blob_names(
+        self, body: TranscriptionBatchRequest, user
+    ) -> List[str]:
+        """Blob names of a batch request, loading the manifest if given.
+
+        Raises:
+            BadRequestError: If neither or both inputs are given, the manifest
+                is outside the user's prefix, missing or empty, or the batch
+                is too large (HTTP 400).
+        """
+        if bool(body.gcs_blob_names) == bool(body.manifest_blob_name):
+            raise BadRequestError(
+                message="Provide either 'gcs_blob_names' or 'manifest_blob_name'."
+            )
+        if body.gcs_blob_names:
+            names = [name.strip() for name in body.gcs_blob_names if name.strip()]
+        else:
+            prefix = manifest_prefix(user)
+            if not body.manifest_blob_name.startswith(prefix):
+                raise BadRequestError(
+                    message=f"'manifest_blob_name' must start with '{prefix}'."
+                )
+            text = await asyncio.to_thread(
+                read_audio_bucket_text, body.manifest_blob_name
+            )
+            if text is None:
+                raise BadRequestError(
+                    message=f"Manifest '{body.manifest_blob_name}' does not exist."
+                )
+            names = [
+                line.strip()
+                for line in text.splitlines()
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+        if not names:
+            raise BadRequestError(message="The batch contains no blob names.")
+        if len(names) > settings.stt_batch_max_items:
+            raise BadRequestError(
+                message=f"A batch may contain at most "
+                f"{settings.stt_batch_max_items} blobs; got {len(names)}."
+            )
+        return names
+
+    @staticmethod
+    def options(body: TranscriptionBatchRequest) -> BatchOptions:
+        """Resolve the batch's options, capping the requested concurrency."""
+        concurrency = body.concurrency or settings.stt_batch_default_concurrency
+        return BatchOptions(
+            language=body.language.value,
+            adapter=(body.adapter or body.language).value,
+            whisper=body.whisper,
+            recognise_speakers=body.recognise_speakers,
+            concurrency=min(concurrency, settings.stt_batch_max_concurrency),
+        )
+
+    # ---- execution ----
+
+    async def run(
+        self, user, blob_names: List[str], options: BatchOptions
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one result per blob as it completes, then a summary.
+
+        Closing the iterator early (e.g. the client disconnected) cancels
+        the items still in flight.
+        """
+        results: asyncio.Queue = asyncio.Queue()
+        pending = iter(enumerate(blob_names))
+
+        async def worker() -> None:
+            for index, blob_name in pending:
+                await results.put(
+                    await self._transcribe_item(user, index, blob_name, options)
+                )
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(options.concurrency, len(blob_names)))
+        ]
+        succeeded = 0
+        try:
+            for _ in blob_names:
+                item = await results.get()
+                succeeded += item["status"] == "ok"
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+        self.log_info(
+            f"Batch of {len(blob_names)} finished: {succeeded} succeeded, "
+            f"{len(blob_names) - succeeded} failed"
+        )
+        yield {
+            "summary": {
+                "total": len(blob_names),
+                "succeeded": succeeded,
+                "failed": len(blob_names) - succeeded,
+            }
+        }
+
+    def start(
+        self, user, blob_names: List[str], options: BatchOptions
+    ) -> Tuple[str, str]:
+        """Run a batch in the background, writing NDJSON to a blob.
+
+        Returns:
+            ``(batch_id, results_blob_name)``.
+        """
+        batch_id = uuid.uuid4().hex
+        blob_name = results_blob_name(user, batch_id)
+        task = asyncio.create_task(
+            self._write_results(user, blob_names, options, blob_name)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self.log_info(
+            f"Accepted batch {batch_id} of {len(blob_names)} blobs -> {blob_name}"
+        )
+        return batch_id, blob_name
+
+    @property
+    def active(self) -> int:
+        """Background batches currently running on this instance."""
+        return len(self._tasks)
+
+    async def _write_results(
+        self,
+        user,
+        blob_names: List[str],
+        options: BatchOptions,
+        results_blob_name: str,
+    ) -> None:
+        try:
+            writer = await asyncio.to_thread(
+                open_audio_bucket_writer, results_blob_name, NDJSON_CONTENT_TYPE
+            )
+            async for item in self.run(user, blob_names, options):
+                await asyncio.to_thread(writer.write, to_ndjson(item))
+            await asyncio.to_thread(writer.close)
+        except Exception as e:  # noqa: BLE001 — nobody awaits this task
+            self.log_error(f"Writing batch results to {results_blob_name} failed: {e}")
+
+    async def _transcribe_item(
+        self, user, index: int, blob_name: str, options: BatchOptions
+    ) -> Dict[str, Any]:
+        item: Dict[str, Any] = {"index": index, "gcs_blob_name": blob_name}
+        try:
+            lease = await wait_for_upstream_slot(
+                "runpod_asr", user, MAX_SLOT_WAIT_SECONDS
+            )
+            try:
+                result = await self._transcription.transcribe(
+                    platform="runpod",
+                    language=options.language,
+                    adapter=options.adapter,
+                    whisper=options.whisper,
+                    recognise_speakers=options.recognise_speakers,
+                    gcs_blob_name=blob_name,
+                )
+            finally:
+                if lease is not None:
+                    lease.release()
+        except Exception as e:  # noqa: BLE001 — reported per item
+            self.log_warning(f"Batch item {blob_name} failed: {e}")
+            return {**item, "status": "error", **self._describe_error(e)}
+
+        transcript = STTTranscript(
+            audio_transcription=result.transcription,
+            diarization_output=result.diarization_output,
+            formatted_diarization_output=result.formatted_diarization_output,
+            audio_url=result.audio_url,
+            language=options.language,
+            was_audio_trimmed=result.was_trimmed,
+            original_duration_minutes=(
+                result.original_duration if result.was_trimmed else None
+            ),
+        )
+        return {
+            **item,
+            "status": "ok",
+            **transcript.model_dump(exclude={"audio_transcription_id"}),
+        }
+
+    @staticmethod
+    def _describe_error(error: Exception) -> Dict[str, str]:
+        if isinstance(error, AudioValidationError):
+            return {"error_code": "invalid_audio", "error_detail": str(error)}
+        if isinstance(error, AudioProcessingError):
+            return {"error_code": "audio_processing_failed", "error_detail": str(error)}
+        if isinstance(error, TranscriptionError):
+            return {"error_code": "transcription_failed", "error_detail": str(error)}
+        if isinstance(error, APIException):
+            return {"error_code": "upstream_error", "error_detail": error.message}
+        return {
+            "error_code": "internal_error",
+            "error_detail": "An unexpected error occurred during transcription",
+        }
+
+
+_transcription_batch_service: Optional[TranscriptionBatchService] = None
+
+
+def get_transcription_batch_service() -> TranscriptionBatchService:
+    """Return the TranscriptionBatchService singleton."""
+    global _transcription_batch_service
+    if _transcription_batch_service is None:
+        _transcription_batch_service = TranscriptionBatchService()
+    return _transcription_batch_service
+
+
+def reset_transcription_batch_service() -> None:
+    """Reset the singleton (test helper)."""
+    global _transcription_batch_service
+    _transcription_batch_service = None
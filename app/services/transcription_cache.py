@@ -0,0 +1,210 @@
+"""Content-addressed transcription cache.
+
+Partners re-submit the same recordings and WhatsApp users forward the same
+voice notes; without a cache each copy re-runs GPU ASR. Results are keyed by
+the audio's content and every option that changes the output::
+
+    stt:cache:<sha256(content_id | platform | language | adapter | whisper |
+                      recognise_speakers)>
+
+``content_id`` identifies the audio without re-reading it where possible:
+
+    - ``sha256:<hex>`` of the bytes for uploads and Modal requests;
+    - ``md5:<base64>`` (or ``crc32c:<base64>:<size>`` for composite objects)
+      from GCS object metadata for ``gcs_blob_name`` inputs, so the blob is
+      never downloaded just to look it up.
+
+Two tiers hold the transcript, diarization output and trim information:
+
+    - a per-process LRU bounded by ``TRANSCRIPTION_CACHE_LOCAL_MAX_BYTES``;
+    - Redis, shared by all instances, for ``TRANSCRIPTION_CACHE_TTL_SECONDS``.
+
+Redis hits are copied into the local tier. Redis outages degrade to the local
+tier (``SafeRedis`` fails open). The storage location of the audio is not
+cached (it belongs to whoever first uploaded the content): callers set
+``audio_url`` and ``blob_name`` of a hit to their own request's blob,
+uploading the request's audio first where the result is persisted.
+
+``snapshot()`` reports hits per tier, misses and the hit rate.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.services.base import BaseService
+from app.services.redis_client import SafeRedis, get_redis_client
+from app.services.stt_service import TranscriptionResult
+
+CACHE_KEY_PREFIX = "stt:cache:"
+HASH_READ_SIZE = 1024 * 1024
+CACHED_FIELDS = (
+    "transcription",
+    "diarization_output",
+    "formatted_diarization_output",
+    "was_trimmed",
+    "original_duration",
+)
+
+
+def content_id_for_bytes(data: bytes) -> str:
+    """Content id of in-memory audio."""
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def content_id_for_file(path: str) -> str:
+    """Content id of an audio file (blocking; reads the file once).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_READ_SIZE):
+            digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+class TranscriptionCache(BaseService):
+    """Two-tier (local LRU + Redis) cache of transcription results."""
+
+    def __init__(
+        self,
+        redis: Optional[SafeRedis] = None,
+        ttl_seconds: Optional[int] = None,
+        local_max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        super().__init__()
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or settings.transcription_cache_ttl_seconds
+        self.local_max_bytes = (
+            local_max_bytes
+            if local_max_bytes is not None
+            else settings.transcription_cache_local_max_bytes
+        )
+        self.enabled = (
+            enabled if enabled is not None else settings.transcription_cache_enabled
+        )
+        # key -> serialized entry; most recently used last.
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._local_bytes = 0
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @staticmethod
+    def key(
+        content_id: str,
+        *,
+        platform: str,
+        language: str,
+        adapter: str,
+        whisper: bool = False,
+        recognise_speakers: bool = False,
+    ) -> str:
+        """Cache key for one audio content and set of transcription options."""
+        parts = [
+            content_id,
+            platform,
+            language,
+            adapter,
+            str(bool(whisper)),
+            str(bool(recognise_speakers)),
+        ]
+        digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+        return CACHE_KEY_PREFIX + digest
+
+    async def get(self, key: str) -> Optional[TranscriptionResult]:
+        """Return the cached result for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+        raw = self._local.get(key)
+        if raw is not None:
+            self._local.move_to_end(key)
+            self.local_hits += 1
+            return _decode(raw)
+
+        redis = self._redis_client()
+        raw = await redis.get(key) if redis is not None else None
+        result = _decode(raw) if raw else None
+        if result is None:
+            self.misses += 1
+            return None
+        self.shared_hits += 1
+        self._remember(key, raw)
+        return result
+
+    async def set(self, key: str, result: TranscriptionResult) -> None:
+        """Store a successful result; empty transcriptions are not cached."""
+        if not self.enabled or not result.transcription:
+            return
+        entry = {name: getattr(result, name) for name in CACHED_FIELDS}
+        raw = json.dumps(entry)
+        self._remember(key, raw)
+        self.stores += 1
+        redis = self._redis_client()
+        if redis is not None:
+            await redis.set(key, raw, ex=self.ttl_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Hit/miss counters for this instance."""
+        lookups = self.local_hits + self.shared_hits + self.misses
+        hits = self.local_hits + self.shared_hits
+        return {
+            "enabled": self.enabled,
+            "lookups": lookups,
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "local_entries": len(self._local),
+            "local_bytes": self._local_bytes,
+        }
+
+    # ---- internals ----
+
+    def _redis_client(self) -> Optional[SafeRedis]:
+        return self._redis if self._redis is not None else get_redis_client()
+
+    def _remember(self, key: str, raw: str) -> None:
+        size = len(raw)
+        if size > self.local_max_bytes:
+            return
+        previous = self._local.pop(key, None)
+        if previous is not None:
+            self._local_bytes -= len(previous)
+        self._local[key] = raw
+        self._local_bytes += size
+        while self._local_bytes > self.local_max_bytes:
+            _, evicted = self._local.popitem(last=False)
+            self._local_bytes -= len(evicted)
+
+
+def _decode(raw: str) -> Optional[TranscriptionResult]:
+    try:
+        entry = json.loads(raw)
+        return TranscriptionResult(**{name: entry[name] for name in CACHED_FIELDS})
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+_transcription_cache: Optional[TranscriptionCache] = None
+
+
+def get_transcription_cache() -> TranscriptionCache:
+    """Return the TranscriptionCache singleton."""
+    global _transcription_cache
+    if _transcription_cache is None:
+        _transcription_cache = TranscriptionCache()
+    return _transcription_cache
+
+
+def reset_transcription_cache() -> None:
+    """Reset the singleton (test helper)."""
+    global _transcription_cache
+    _transcription_cache = None
@@ -0,0 +1,390 @@
+"""Asynchronous transcription jobs.
+
+``POST /tasks/jobs/transcriptions`` hands the request to
+``TranscriptionJobService``. The service records a queued job, runs the
+existing ``TranscriptionService`` in a background task and stores the
+outcome. The client gets the job id at once and either polls
+``GET /tasks/jobs/{id}`` or passes a ``callback_url`` that is POSTed the
+final job document. Long RunPod transcriptions and diarizations therefore no
+longer hold an HTTP connection (and a proxy timeout) open for minutes.
+
+Job documents live in Redis under ``jobs:transcription:{id}`` for
+``TRANSCRIPTION_JOB_TTL_SECONDS``, so any instance can answer a status poll.
+When Redis is not configured or a write fails, the submitting instance keeps
+the document in memory instead (at most
+``TRANSCRIPTION_JOB_MEMORY_MAX_ENTRIES``), which keeps single-instance
+deployments and Redis outages working. Successful RunPod transcripts are
+saved to ``audio_transcriptions``, as on the synchronous endpoint.
+
+Jobs still running at shutdown are cancelled and recorded as failed, so
+clients polling them do not wait on a job nobody is running.
+
+Background jobs wait for an upstream slot instead of being shed with a 503:
+the client has already been told the job was accepted.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Set
+
+import httpx
+
+from app.core.config import settings
+from app.core.exceptions import APIException, NotFoundError
+from app.crud.audio_transcription import create_audio_transcription
+from app.database.db import async_session_maker
+from app.schemas.jobs import JobStatus, TranscriptionJob
+from app.schemas.stt import STTTranscript
+from app.services.base import BaseService
+from app.services.redis_client import SafeRedis, get_redis_client
+from app.services.stt_service import (
+    AudioProcessingError,
+    AudioValidationError,
+    TranscriptionError,
+)
+from app.services.transcription_service import (
+    TranscriptionService,
+    get_transcription_service,
+)
+from app.services.upstream_limiter import wait_for_upstream_slot
+from app.utils.callback_url import (
+    UnsafeCallbackURL,
+    pin_callback_url,
+    resolve_callback_url,
+)
+
+JOB_KEY_PREFIX = "jobs:transcription:"
+# Give up on a job that could not get an upstream slot for this long.
+MAX_SLOT_WAIT_SECONDS = 30 * 60
+CALLBACK_ATTEMPTS = 3
+CALLBACK_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass
+class TranscriptionJobRequest:
+    """Validated inputs of a transcription job.
+
+    ``file_path`` is a temporary copy of the upload owned by the job; it is
+    deleted once the job finishes.
+    """
+
+    platform: str
+    language: str
+    adapter: str
+    org: bool = False
+    whisper: bool = False
+    recognise_speakers: bool = False
+    file_path: Optional[str] = None
+    file_extension: Optional[str] = None
+    content_type: Optional[str] = None
+    gcs_blob_name: Optional[str] = None
+    callback_url: Optional[str] = None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TranscriptionJobService(BaseService):
+    """Runs transcriptions in the background and tracks their status."""
+
+    def __init__(
+        self,
+        transcription_service: Optional[TranscriptionService] = None,
+        redis: Optional[SafeRedis] = None,
+        session_factory: Callable[[], Any] = async_session_maker,
+        ttl_seconds: Optional[int] = None,
+        memory_max_entries: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self._transcription = transcription_service or get_transcription_service()
+        self._redis = redis
+        self._session_factory = session_factory
+        self.ttl_seconds = ttl_seconds or settings.transcription_job_ttl_seconds
+        self.memory_max_entries = (
+            memory_max_entries or settings.transcription_job_memory_max_entries
+        )
+        # Fallback while Redis is unavailable.
+        # job_id -> (stored_at, document); insertion order is expiry order.
+        self._memory: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+
+    # ---- public API ----
+
+    async def submit(self, user, request: TranscriptionJobRequest) -> TranscriptionJob:
+        """Record a queued job and start it in the background."""
+        now = _now()
+        job = TranscriptionJob(
+            job_id=uuid.uuid4().hex,
+            status=JobStatus.queued,
+            platform=request.platform,
+            language=request.language,
+            created_at=now,
+            updated_at=now,
+            callback_url=request.callback_url,
+        )
+        await self._save(job, user)
+        task = asyncio.create_task(self._run(job, user, request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self.log_info(f"Accepted transcription job {job.job_id} ({request.platform})")
+        return job
+
+    async def get(self, job_id: str, user) -> TranscriptionJob:
+        """Return a job owned by ``user``.
+
+        Raises:
+            NotFoundError: If the job does not exist, has expired, or belongs
+                to another user.
+        """
+        document = await self._load(job_id)
+        if document is None or document.get("user_id") != user.id:
+            raise NotFoundError(resource="Job", resource_id=job_id)
+        return TranscriptionJob.model_validate(document["job"])
+
+    @property
+    def active(self) -> int:
+        """Jobs currently queued or running on this instance."""
+        return len(self._tasks)
+
+    async def shutdown(self) -> None:
+        """Cancel running jobs; each records itself as failed before exiting."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.log_warning(f"Cancelled {len(tasks)} transcription job(s)")
+
+    # ---- execution ----
+
+    async def _run(
+        self, job: TranscriptionJob, user, request: TranscriptionJobRequest
+    ) -> None:
+        try:
+            job = await self._execute(job, user, request)
+        except asyncio.CancelledError:
+            await self._save(
+                job.model_copy(
+                    update={
+                        "status": JobStatus.failed,
+                        "error": "The server shut down before the job finished",
+                        "updated_at": _now(),
+                    }
+                ),
+                user,
+            )
+            raise
+        except Exception as e:  # noqa: BLE001 — every failure is recorded
+            self.log_error(f"Transcription job {job.job_id} failed: {e}")
+            job = job.model_copy(
+                update={
+                    "status": JobStatus.failed,
+                    "error": self._describe_error(e),
+                    "updated_at": _now(),
+                }
+            )
+        finally:
+            if request.file_path and os.path.exists(request.file_path):
+                os.unlink(request.file_path)
+
+        await self._save(job, user)
+        if job.callback_url:
+            job = await self._notify(job)
+            await self._save(job, user)
+
+    async def _execute(
+        self, job: TranscriptionJob, user, request: TranscriptionJobRequest
+    ) -> TranscriptionJob:
+        upstream = "modal_stt" if request.platform == "modal" else "runpod_asr"
+        lease = await wait_for_upstream_slot(upstream, user, MAX_SLOT_WAIT_SECONDS)
+        try:
+            job = job.model_copy(
+                update={"status": JobStatus.running, "updated_at": _now()}
+            )
+            await self._save(job, user)
+            result = await self._transcribe(request)
+        finally:
+            if lease is not None:
+                lease.release()
+
+        audio_transcription_id = None
+        if request.platform == "runpod" and not request.org and result.transcription:
+            audio_transcription_id = await self._persist(user, request, result)
+
+        transcript = STTTranscript(
+            audio_transcription=result.transcription,
+            diarization_output=result.diarization_output,
+            formatted_diarization_output=result.formatted_diarization_output,
+            audio_transcription_id=audio_transcription_id,
+            audio_url=result.audio_url,
+            language=request.language,
+            was_audio_trimmed=result.was_trimmed,
+            original_duration_minutes=(
+                result.original_duration if result.was_trimmed else None
+            ),
+        )
+        self.log_info(f"Transcription job {job.job_id} succeeded")
+        return job.model_copy(
+            update={
+                "status": JobStatus.succeeded,
+                "result": transcript,
+                "updated_at": _now(),
+            }
+        )
+
+    async def _transcribe(self, request: TranscriptionJobRequest):
+        if request.platform == "modal":
+            return await self._transcription.transcribe(
+                platform="modal",
+                language=request.language,
+                adapter=request.adapter,
+                file_path=request.file_path,
+            )
+        return await self._transcription.transcribe(
+            platform="runpod",
+            language=request.language,
+            adapter=request.adapter,
+            org=request.org,
+            whisper=request.whisper,
+            recognise_speakers=request.recognise_speakers,
+            file_path=None if request.gcs_blob_name else request.file_path,
+            file_extension=request.file_extension,
+            content_type=request.content_type,
+            gcs_blob_name=request.gcs_blob_name,
+        )
+
+    async def _persist(self, user, request: TranscriptionJobRequest, result):
+        try:
+            async with self._session_factory() as db:
+                db_obj = await create_audio_transcription(
+                    db,
+                    user,
+                    result.audio_url,
+                    result.blob_name,
+                    result.transcription,
+                    request.language,
+                )
+                return db_obj.id
+        except Exception as e:  # noqa: BLE001 — the transcript is still returned
+            self.log_error(f"Database error: {str(e)}")
+            return None
+
+    @staticmethod
+    def _describe_error(error: Exception) -> str:
+        if isinstance(error, APIException):
+            return error.message
+        if isinstance(
+            error, (AudioValidationError, AudioProcessingError, TranscriptionError)
+        ):
+            return str(error)
+        return "An unexpected error occurred during transcription"
+
+    async def _notify(self, job: TranscriptionJob) -> TranscriptionJob:
+        """POST the final job document to the client's callback URL.
+
+        The URL is re-checked before every attempt (its DNS may have changed
+        since submission), the POST goes to the address that passed the check
+        and redirects are not followed, so the callback cannot be pointed at
+        internal addresses.
+        """
+        body = job.model_dump(mode="json")
+        status_code = None
+        async with httpx.AsyncClient(
+            timeout=CALLBACK_TIMEOUT_SECONDS, follow_redirects=False
+        ) as client:
+            for attempt in range(CALLBACK_ATTEMPTS):
+                try:
+                    addresses = await resolve_callback_url(job.callback_url)
+                except UnsafeCallbackURL as e:
+                    self.log_warning(f"Callback for job {job.job_id} refused: {e}")
+                    break
+                # Connect to the address just checked, not a fresh lookup.
+                url, headers, extensions = pin_callback_url(
+                    job.callback_url, addresses[0]
+                )
+                try:
+                    response = await client.post(
+                        url, json=body, headers=headers, extensions=extensions
+                    )
+                    status_code = response.status_code
+                    if response.is_success:
+                        break
+                except httpx.HTTPError as e:
+                    self.log_warning(
+                        f"Callback for job {job.job_id} failed "
+                        f"(attempt {attempt + 1}): {e}"
+                    )
+                if attempt + 1 < CALLBACK_ATTEMPTS:
+                    await asyncio.sleep(2**attempt)
+        return job.model_copy(update={"callback_status": status_code})
+
+    # ---- storage ----
+
+    def _redis_client(self) -> Optional[SafeRedis]:
+        return self._redis if self._redis is not None else get_redis_client()
+
+    async def _save(self, job: TranscriptionJob, user) -> None:
+        document = {"user_id": user.id, "job": job.model_dump(mode="json")}
+        redis = self._redis_client()
+        if redis is not None and await redis.set(
+            JOB_KEY_PREFIX + job.job_id, json.dumps(document), ex=self.ttl_seconds
+        ):
+            self._memory.pop(job.job_id, None)
+            return
+        self._remember(job.job_id, document)
+
+    async def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # A remembered document is newer than Redis: its last write failed.
+        entry = self._memory.get(job_id)
+        if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+            return entry[1]
+        redis = self._redis_client()
+        if redis is not None:
+            raw = await redis.get(JOB_KEY_PREFIX + job_id)
+            if raw:
+                return json.loads(raw)
+        return None
+
+    def _remember(self, job_id: str, document: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        # Updating an existing key keeps its position (and creation time).
+        created = self._memory[job_id][0] if job_id in self._memory else now
+        self._memory[job_id] = (created, document)
+        while self._memory:
+            oldest_id, (stored_at, _) = next(iter(self._memory.items()))
+            if (
+                now - stored_at <= self.ttl_seconds
+                and len(self._memory) <= self.memory_max_entries
+            ):
+                break
+            del self._memory[oldest_id]
+
+
+_transcription_job_service: Optional[TranscriptionJobService] = None
+
+
+def get_transcription_job_service() -> TranscriptionJobService:
+    """Return the TranscriptionJobService singleton."""
+    global _transcription_job_service
+    if _transcription_job_service is None:
+        _transcription_job_service = TranscriptionJobService()
+    return _transcription_job_service
+
+
+async def close_transcription_job_service() -> None:
+    """Cancel the singleton's running jobs, if it was created."""
+    if _transcription_job_service is not None:
+        await _transcription_job_service.shutdown()
+
+
+def reset_transcription_job_service() -> None:
+    """Reset the singleton (test helper)."""
+    global _transcription_job_service
+    _transcription_job_service = None
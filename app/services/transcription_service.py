@@ -4,13 +4,45 @@ Routes a transcription request to the correct underlying service based on the
 selected platform and the organization flag, after validating that the
 requested combination of inputs is supported. No transcription business logic
 lives here — it composes the existing STTService and ModalSTTService.
+
+Results are looked up in (and stored to) the content-addressed
+``TranscriptionCache`` first, so re-submitted audio does not re-run ASR.
+
+With ``STT_NORMALIZE_AUDIO`` enabled, uploaded audio is re-encoded to 16 kHz
+mono (see ``app.utils.audio_normalize``) after the cache lookup and before it
+is sent upstream; streamed uploads are then spooled to disk first.
 """
 
-from typing import Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+
+import aiofiles
 
+from app.core.config import settings
 from app.core.exceptions import BadRequestError
-from app.services.modal_stt_service import ModalSTTService, get_modal_stt_service
+from app.schemas.stt import CHUNK_SIZE
+from app.services.modal_stt_service import (
+    ModalSTTService,
+    get_modal_stt_service,
+    iter_file,
+    iter_upload,
+)
 from app.services.stt_service import STTService, TranscriptionResult, get_stt_service
+from app.services.transcription_cache import (
+    TranscriptionCache,
+    content_id_for_bytes,
+    content_id_for_file,
+    get_transcription_cache,
+)
+from app.utils.audio_normalize import normalize_bytes, normalize_file
+from app.utils.upload_audio_file_gcp import get_audio_blob_fingerprint
+
+logger = logging.getLogger(__name__)
 
 
 class TranscriptionService:
@@ -20,9 +52,15 @@ class TranscriptionService:
         self,
         stt_service: Optional[STTService] = None,
         modal_stt_service: Optional[ModalSTTService] = None,
+        cache: Optional[TranscriptionCache] = None,
+        normalize: Optional[bool] = None,
     ) -> None:
         self._stt = stt_service or get_stt_service()
         self._modal = modal_stt_service or get_modal_stt_service()
+        self._cache = cache or get_transcription_cache()
+        self._normalize = (
+            settings.stt_normalize_audio if normalize is None else normalize
+        )
 
     def validate_and_normalize(
         self,
@@ -97,13 +135,143 @@ class TranscriptionService:
         content_type: Optional[str] = None,
         audio_bytes: Optional[bytes] = None,
         gcs_blob_name: Optional[str] = None,
+        audio_stream: Optional[Any] = None,
     ) -> TranscriptionResult:
         """Dispatch to the appropriate backend and return a TranscriptionResult.
 
-        Callers must have already run ``validate_and_normalize``.
+        Callers must have already run ``validate_and_normalize``. A standard
+        (non-org) RunPod upload may be passed as ``audio_stream`` (an object
+        with ``async read(size)``) instead of ``file_path``; it is then piped
+        straight into cloud storage. Modal accepts a seekable ``audio_stream``
+        (an ``UploadFile``) or ``file_path`` as well as ``audio_bytes``; the
+        first two are streamed as the request body.
         """
+        if platform != "modal" and not gcs_blob_name:
+            # Validate type first, preserving the legacy endpoints' behavior.
+            self._stt.validate_audio_file(content_type, file_extension)
+
+        options = self._cache_options(
+            platform, language, adapter, org, whisper, recognise_speakers
+        )
+
+        # Temporary files created here (STTService methods remove their
+        # own inputs; removing again is harmless).
+        temp_paths = []
+        if audio_stream is not None and (platform == "modal" or not org):
+            if platform != "modal" and not self._normalize:
+                return await self._transcribe_stream(
+                    audio_stream,
+                    file_extension,
+                    content_type,
+                    options,
+                    language=language,
+                    adapter=adapter,
+                    whisper=whisper,
+                    recognise_speakers=recognise_speakers,
+                )
+            if self._normalize:
+                # Normalization needs the whole file.
+                file_path = await _spool(audio_stream, file_extension)
+                temp_paths.append(file_path)
+                audio_stream = None
+
+        try:
+            content_id = await self._content_id(
+                audio_bytes, gcs_blob_name, file_path, audio_stream
+            )
+            key = self._cache.key(content_id, **options) if content_id else None
+            cached = await self._cached(
+                key,
+                content_id,
+                gcs_blob_name,
+                upload_path=file_path if platform == "runpod" else None,
+            )
+            if cached is not None:
+                return cached
+
+            if self._normalize:
+                source_path = file_path
+                audio_bytes, file_path, file_extension = await self._normalized(
+                    audio_bytes, file_path, file_extension
+                )
+                if file_path != source_path:
+                    temp_paths.append(file_path)
+
+            result = await self._dispatch(
+                platform=platform,
+                language=language,
+                adapter=adapter,
+                org=org,
+                whisper=whisper,
+                recognise_speakers=recognise_speakers,
+                file_path=file_path,
+                file_extension=file_extension,
+                audio_bytes=audio_bytes,
+                gcs_blob_name=gcs_blob_name,
+                audio_stream=audio_stream,
+            )
+        finally:
+            for path in temp_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+        if key is not None:
+            await self._cache.set(key, result)
+        return result
+
+    async def _cached(
+        self,
+        key: Optional[str],
+        content_id: Optional[str],
+        gcs_blob_name: Optional[str],
+        upload_path: Optional[str] = None,
+    ) -> Optional[TranscriptionResult]:
+        """Look ``key`` up, pointing a hit at this request's own audio.
+
+        The cache holds no audio location: a hit is linked to the request's
+        GCS blob, or to ``upload_path`` uploaded now (RunPod results are
+        persisted, which needs a stored copy of the audio). Other hits
+        (Modal) carry no audio link.
+        """
+        if key is None:
+            return None
+        cached = await self._cache.get(key)
+        if cached is None:
+            return None
+        if gcs_blob_name:
+            blob_name = gcs_blob_name
+            audio_url = f"gs://{self._stt.audio_bucket_name}/{gcs_blob_name}"
+        elif upload_path:
+            blob_name, audio_url = await self._stt.upload_to_storage(upload_path)
+        else:
+            blob_name = audio_url = None
+        return replace(
+            cached, audio_url=audio_url, blob_name=blob_name, content_id=content_id
+        )
+
+    async def _dispatch(
+        self,
+        *,
+        platform: str,
+        language: str,
+        adapter: str,
+        org: bool,
+        whisper: bool,
+        recognise_speakers: bool,
+        file_path: Optional[str],
+        file_extension: Optional[str],
+        audio_bytes: Optional[bytes],
+        gcs_blob_name: Optional[str],
+        audio_stream: Optional[Any] = None,
+    ) -> TranscriptionResult:
         if platform == "modal":
-            text = await self._modal.transcribe(audio_bytes, language=language)
+            # Files and uploads are streamed as the request body.
+            if audio_bytes is not None:
+                body: Any = audio_bytes
+            elif file_path:
+                body = iter_file(file_path)
+            else:
+                body = iter_upload(audio_stream)
+            text = await self._modal.transcribe(body, language=language)
             return TranscriptionResult(
                 transcription=text,
                 diarization_output={},
@@ -120,10 +288,7 @@ class TranscriptionService:
                 recognise_speakers=recognise_speakers,
             )
 
-        # RunPod from an uploaded file (org or standard). Validate type first,
-        # preserving the legacy endpoints' behavior.
-        self._stt.validate_audio_file(content_type, file_extension)
-
+        # RunPod from an uploaded file (org or standard).
         if org:
             return await self._stt.transcribe_org_audio(
                 file_path=file_path,
@@ -139,6 +304,146 @@ class TranscriptionService:
             recognise_speakers=recognise_speakers,
         )
 
+    async def _transcribe_stream(
+        self,
+        audio_stream: Any,
+        file_extension: Optional[str],
+        content_type: Optional[str],
+        options: Dict[str, Any],
+        **transcribe_options: Any,
+    ) -> TranscriptionResult:
+        # The content hash is only known once the stream has been uploaded,
+        # so the lookup runs inside STTService between upload and ASR.
+        hit = False
+
+        async def lookup(content_id: str) -> Optional[TranscriptionResult]:
+            nonlocal hit
+            cached = await self._cache.get(self._cache.key(content_id, **options))
+            hit = cached is not None
+            return cached
+
+        result = await self._stt.transcribe_upload_stream(
+            audio_stream,
+            file_extension,
+            content_type=content_type,
+            cache_lookup=lookup if self._cache.enabled else None,
+            **transcribe_options,
+        )
+        if not hit and result.content_id:
+            await self._cache.set(self._cache.key(result.content_id, **options), result)
+        return result
+
+    async def _normalized(
+        self,
+        audio_bytes: Optional[bytes],
+        file_path: Optional[str],
+        file_extension: Optional[str],
+    ) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+        """Swap the input for a 16 kHz mono copy when that is smaller.
+
+        A new ``file_path`` is removed by the STTService method it is passed
+        to, like any upload; the original stays with the caller.
+        """
+        if audio_bytes:
+            normalized = await normalize_bytes(audio_bytes, file_extension or "")
+            if normalized is None:
+                return audio_bytes, file_path, file_extension
+            audio_bytes, report = normalized
+        elif file_path:
+            report = await normalize_file(file_path)
+            if report is None:
+                return audio_bytes, file_path, file_extension
+            file_path, file_extension = report.path, report.extension
+        else:
+            return audio_bytes, file_path, file_extension
+
+        logger.info(
+            f"Normalized ASR input to 16 kHz mono {report.codec}: "
+            f"{report.original_bytes} -> {report.normalized_bytes} bytes "
+            f"({report.reduction:.0%} smaller) in {report.seconds:.2f}s",
+            extra={
+                "original_bytes": report.original_bytes,
+                "normalized_bytes": report.normalized_bytes,
+                "saved_bytes": report.saved_bytes,
+                "codec": report.codec,
+            },
+        )
+        return audio_bytes, file_path, file_extension
+
+    @staticmethod
+    def _cache_options(
+        platform: str,
+        language: str,
+        adapter: str,
+        org: bool,
+        whisper: bool,
+        recognise_speakers: bool,
+    ) -> Dict[str, Any]:
+        """The request options that change a transcript, for cache keys."""
+        if platform == "modal":
+            # Modal only takes the language.
+            return {"platform": "modal", "language": language, "adapter": ""}
+        if org:
+            return {
+                "platform": "runpod-org",
+                "language": "",
+                "adapter": "",
+                "recognise_speakers": recognise_speakers,
+            }
+        return {
+            "platform": "runpod",
+            "language": language,
+            "adapter": adapter,
+            "whisper": whisper,
+            "recognise_speakers": recognise_speakers,
+        }
+
+    async def _content_id(
+        self,
+        audio_bytes: Optional[bytes],
+        gcs_blob_name: Optional[str],
+        file_path: Optional[str],
+        audio_stream: Optional[Any] = None,
+    ) -> Optional[str]:
+        """Identify the input audio; None disables caching for the request."""
+        if not self._cache.enabled:
+            return None
+        if audio_bytes:
+            return await asyncio.to_thread(content_id_for_bytes, audio_bytes)
+        if audio_stream is not None:
+            return await _stream_content_id(audio_stream)
+        if gcs_blob_name:
+            return await asyncio.to_thread(get_audio_blob_fingerprint, gcs_blob_name)
+        if file_path:
+            try:
+                return await asyncio.to_thread(content_id_for_file, file_path)
+            except OSError:
+                return None
+        return None
+
+
+async def _stream_content_id(stream: Any) -> str:
+    """Hash a seekable upload chunk by chunk, then rewind it for sending."""
+    digest = hashlib.sha256()
+    while chunk := await stream.read(CHUNK_SIZE):
+        await asyncio.to_thread(digest.update, chunk)
+    await stream.seek(0)
+    return f"sha256:{digest.hexdigest()}"
+
+
+async def _spool(stream: Any, suffix: Optional[str]) -> str:
+    """Copy an upload stream to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix or "") as temp_file:
+        path = temp_file.name
+    try:
+        async with aiofiles.open(path, "wb") as out_file:
+            while content := await stream.read(CHUNK_SIZE):
+                await out_file.write(content)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
 
 _transcription_service_instance: Optional[TranscriptionService] = None
 
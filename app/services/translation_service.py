@@ -276,6 +276,7 @@ class TranslationService(BaseService):
         from app.services.inference_service import (
             InferenceService,
             get_inference_service,
+            hedging_enabled,
         )
 
         cleaned_text = text.strip()
@@ -306,6 +307,7 @@ class TranslationService(BaseService):
                 temperature=SUNFLOWER_TRANSLATION_TEMPERATURE,
                 max_tokens=SUNFLOWER_TRANSLATION_MAX_TOKENS,
                 top_p=SUNFLOWER_TRANSLATION_TOP_P,
+                hedge=hedging_enabled("translate"),
             )
         )
 
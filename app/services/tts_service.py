@@ -36,6 +36,7 @@ Example:
     Generated 44100 bytes of audio
 """
 
+import asyncio
 from typing import AsyncGenerator, Optional
 
 import httpx
@@ -102,6 +103,8 @@ class TTSService(BaseService):
         super().__init__()
         self.api_url = api_url or settings.tts_api_url
         self.timeout = timeout or settings.request_timeout_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
 
         self.log_debug(
             "TTS service initialized",
@@ -171,31 +174,31 @@ class TTSService(BaseService):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.api_url,
-                    params={"text": text, "speaker_id": str(sid)},
-                )
-
-                if response.status_code != 200:
-                    self.log_error(
-                        "TTS API returned error",
-                        extra={
-                            "status_code": response.status_code,
-                            "response_text": response.text[:500],
-                        },
-                    )
-                    raise self.external_service_error(
-                        service_name=self.EXTERNAL_SERVICE_NAME,
-                        message=f"TTS API error: {response.text}",
-                        original_error=f"HTTP {response.status_code}",
-                    )
+            client = await self._get_client()
+            response = await client.post(
+                self.api_url,
+                params={"text": text, "speaker_id": str(sid)},
+            )
 
-                self.log_info(
-                    "Audio generated successfully",
-                    extra={"audio_bytes": len(response.content)},
+            if response.status_code != 200:
+                self.log_error(
+                    "TTS API returned error",
+                    extra={
+                        "status_code": response.status_code,
+                        "response_text": response.text[:500],
+                    },
+                )
+                raise self.external_service_error(
+                    service_name=self.EXTERNAL_SERVICE_NAME,
+                    message=f"TTS API error: {response.text}",
+                    original_error=f"HTTP {response.status_code}",
                 )
-                return response.content
+
+            self.log_info(
+                "Audio generated successfully",
+                extra={"audio_bytes": len(response.content)},
+            )
+            return response.content
 
         except httpx.TimeoutException as e:
             self.log_error("TTS API timeout", exc_info=e)
@@ -267,37 +270,37 @@ class TTSService(BaseService):
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                async with client.stream(
-                    "POST",
-                    self.api_url,
-                    params={"text": text, "speaker_id": str(sid)},
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        self.log_error(
-                            "TTS API streaming error",
-                            extra={
-                                "status_code": response.status_code,
-                                "error_text": error_text.decode()[:500],
-                            },
-                        )
-                        raise self.external_service_error(
-                            service_name=self.EXTERNAL_SERVICE_NAME,
-                            message=f"TTS API error: {error_text.decode()}",
-                            original_error=f"HTTP {response.status_code}",
-                        )
-
-                    total_bytes = 0
-                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                        total_bytes += len(chunk)
-                        yield chunk
-
-                    self.log_info(
-                        "Audio stream completed",
-                        extra={"total_bytes": total_bytes},
+            client = await self._get_client()
+            async with client.stream(
+                "POST",
+                self.api_url,
+                params={"text": text, "speaker_id": str(sid)},
+            ) as response:
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    self.log_error(
+                        "TTS API streaming error",
+                        extra={
+                            "status_code": response.status_code,
+                            "error_text": error_text.decode()[:500],
+                        },
+                    )
+                    raise self.external_service_error(
+                        service_name=self.EXTERNAL_SERVICE_NAME,
+                        message=f"TTS API error: {error_text.decode()}",
+                        original_error=f"HTTP {response.status_code}",
                     )
 
+                total_bytes = 0
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    total_bytes += len(chunk)
+                    yield chunk
+
+                self.log_info(
+                    "Audio stream completed",
+                    extra={"total_bytes": total_bytes},
+                )
+
         except httpx.TimeoutException as e:
             self.log_error("TTS API stream timeout", exc_info=e)
             raise self.external_service_error(
@@ -340,18 +343,18 @@ class TTSService(BaseService):
             ...     print("TTS service is unavailable")
         """
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.head(self.api_url)
-                is_healthy = response.status_code < 500
-
-                self.log_debug(
-                    "Health check completed",
-                    extra={
-                        "status_code": response.status_code,
-                        "is_healthy": is_healthy,
-                    },
-                )
-                return is_healthy
+            client = await self._get_client()
+            response = await client.head(self.api_url, timeout=10)
+            is_healthy = response.status_code < 500
+
+            self.log_debug(
+                "Health check completed",
+                extra={
+                    "status_code": response.status_code,
+                    "is_healthy": is_healthy,
+                },
+            )
+            return is_healthy
 
         except Exception as e:
             self.log_warning(
@@ -360,6 +363,36 @@ class TTSService(BaseService):
             )
             return False
 
+    async def close(self) -> None:
+        """Close the shared HTTP client (it is recreated on next use)."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive client, creating it on first use.
+
+        Reusing one client keeps TLS sessions (and, with ``TTS_HTTP2``, a
+        multiplexed HTTP/2 connection) open between requests instead of
+        paying a handshake before every synthesis.
+        """
+        if self._client is not None:
+            return self._client
+        async with self._client_lock:
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    http2=settings.tts_http2,
+                    limits=httpx.Limits(
+                        max_connections=settings.tts_max_connections,
+                        max_keepalive_connections=(
+                            settings.tts_max_keepalive_connections
+                        ),
+                        keepalive_expiry=settings.tts_keepalive_expiry_seconds,
+                    ),
+                )
+        return self._client
+
     @staticmethod
     def estimate_duration(text: str, words_per_minute: int = 150) -> float:
         """Estimate audio duration based on text length.
@@ -421,6 +454,12 @@ def get_tts_service() -> TTSService:
     return _tts_service
 
 
+async def close_tts_service() -> None:
+    """Close the singleton's HTTP client, if it was created."""
+    if _tts_service is not None:
+        await _tts_service.close()
+
+
 def reset_tts_service() -> None:
     """Reset the TTS service singleton.
 
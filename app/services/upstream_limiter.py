@@ -0,0 +1,276 @@
+"""Per-upstream admission control with tier-aware priority queueing.
+
+Each upstream (Sunflower, RunPod ASR, Modal STT, Orpheus) gets a cap on how
+many requests this worker has in flight to it at once. Requests beyond the cap
+wait in a priority queue ordered by account tier, so under a spike admin and
+premium callers are admitted ahead of free-tier traffic instead of everyone
+piling onto the upstream and tripping its 429s.
+
+Load is shed early: when the estimated queue wait (from the observed hold
+time of a slot) already exceeds the configured deadline, the request fails
+immediately with a 503 and ``Retry-After`` rather than queueing until it
+times out. A request that does queue but is not admitted within the deadline
+gets the same 503.
+
+Limits are per process; with N workers the upstream sees at most N times the
+configured in-flight cap.
+
+Usage:
+    from app.services.upstream_limiter import upstream_slot
+
+    async with upstream_slot("sunflower", current_user):
+        result = await run_in_threadpool(service.run_inference, ...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterator, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.utils.rate_limit import TIER_QUOTAS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+UPSTREAMS = ("sunflower", "runpod_asr", "modal_stt", "orpheus")
+
+# Smoothing factor for the slot hold-time average used to estimate waits.
+HOLD_TIME_ALPHA = 0.2
+
+
+def _per_minute(tier: str) -> int:
+    limit = str(TIER_QUOTAS[tier]["per_minute"])
+    return int(limit.split("/", 1)[0])
+
+
+# Higher per-minute quota means higher admission priority (lower number).
+TIER_PRIORITY: dict[str, int] = {
+    tier: rank
+    for rank, tier in enumerate(sorted(TIER_QUOTAS, key=_per_minute, reverse=True))
+}
+
+
+def tier_priority(account_type: Optional[str]) -> int:
+    """Admission priority for an account type; unknown tiers rank as free."""
+    tier = (account_type or "free").lower()
+    return TIER_PRIORITY.get(tier, TIER_PRIORITY["free"])
+
+
+class Lease:
+    """A held upstream slot. ``release`` is idempotent and thread-safe."""
+
+    def __init__(self, limiter: "UpstreamLimiter") -> None:
+        self._limiter = limiter
+        self._loop = asyncio.get_running_loop()
+        self._acquired_at = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        held = time.monotonic() - self._acquired_at
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._limiter._release(held)
+        else:
+            # Streaming responses finish in a worker thread.
+            self._loop.call_soon_threadsafe(self._limiter._release, held)
+
+
+class UpstreamLimiter:
+    """In-flight cap plus a tier-priority wait queue for one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        queue_deadline_seconds: float,
+        initial_hold_seconds: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.max_in_flight = max(max_in_flight, 1)
+        self.queue_deadline_seconds = queue_deadline_seconds
+        self.avg_hold_seconds = initial_hold_seconds
+        self.in_flight = 0
+        self.shed = 0
+        # Heap of (priority, sequence, future); sequence keeps FIFO per tier.
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, f in self._waiters if not f.done())
+
+    def estimated_wait(self, priority: int) -> float:
+        """Seconds a new request at ``priority`` would likely wait for a slot."""
+        if self.in_flight < self.max_in_flight and not self.queued:
+            return 0.0
+        ahead = sum(1 for p, _, f in self._waiters if p <= priority and not f.done())
+        rounds = ahead // self.max_in_flight + 1
+        return rounds * self.avg_hold_seconds
+
+    async def acquire(self, account_type: Optional[str]) -> Lease:
+        """Wait for a slot or raise ``ServiceUnavailableError``.
+
+        Raises:
+            ServiceUnavailableError: If the estimated or actual queue wait
+                exceeds the deadline. ``Retry-After`` carries the estimate.
+        """
+        priority = tier_priority(account_type)
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self.in_flight += 1
+            return Lease(self)
+
+        estimate = self.estimated_wait(priority)
+        if estimate > self.queue_deadline_seconds:
+            raise self._shed(estimate)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(future), timeout=self.queue_deadline_seconds
+            )
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the deadline expired; keep the slot.
+                return Lease(self)
+            future.cancel()
+            raise self._shed(self.estimated_wait(priority))
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over but the caller went away.
+                self._release(None)
+            else:
+                future.cancel()
+            raise
+        return Lease(self)
+
+    def _release(self, held_seconds: Optional[float]) -> None:
+        if held_seconds is not None:
+            self.avg_hold_seconds += HOLD_TIME_ALPHA * (
+                held_seconds - self.avg_hold_seconds
+            )
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot straight to the next waiter; in_flight is unchanged.
+                future.set_result(None)
+                return
+        self.in_flight = max(self.in_flight - 1, 0)
+
+    def _shed(self, estimate: float) -> ServiceUnavailableError:
+        self.shed += 1
+        retry_after = max(math.ceil(estimate), 1)
+        logger.warning(
+            f"Shedding {self.name} request: {self.in_flight} in flight, "
+            f"{self.queued} queued, estimated wait {estimate:.1f}s"
+        )
+        return ServiceUnavailableError(
+            message=(
+                f"The {self.name} service is at capacity. "
+                f"Please retry in {retry_after} seconds."
+            ),
+            retry_after=retry_after,
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "name": self.name,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "avg_hold_seconds": round(self.avg_hold_seconds, 3),
+            "shed": self.shed,
+        }
+
+
+_limiters: dict[str, UpstreamLimiter] = {}
+
+
+def get_upstream_limiter(name: str) -> UpstreamLimiter:
+    """Return the process-wide limiter for ``name``, creating it on first use."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = UpstreamLimiter(
+            name,
+            max_in_flight=settings.upstream_max_in_flight.get(
+                name, settings.upstream_default_max_in_flight
+            ),
+            queue_deadline_seconds=settings.upstream_queue_deadline_seconds,
+        )
+        _limiters[name] = limiter
+    return limiter
+
+
+def reset_upstream_limiters() -> None:
+    _limiters.clear()
+
+
+async def acquire_upstream_slot(name: str, user) -> Optional[Lease]:
+    """Acquire a slot on ``name`` for ``user``; None when admission is disabled.
+
+    For responses that outlive the handler (streaming), the caller owns the
+    lease and must release it when the body is done.
+    """
+    if not settings.upstream_admission_enabled:
+        return None
+    return await get_upstream_limiter(name).acquire(getattr(user, "account_type", None))
+
+
+async def wait_for_upstream_slot(
+    name: str, user, max_wait_seconds: float
+) -> Optional[Lease]:
+    """Acquire a slot, waiting out sheds for up to ``max_wait_seconds``.
+
+    For background work (jobs, batches) whose client has already been
+    answered, so a 503 would only lose the work.
+
+    Raises:
+        ServiceUnavailableError: If no slot was admitted within the wait.
+    """
+    deadline = time.monotonic() + max_wait_seconds
+    while True:
+        try:
+            return await acquire_upstream_slot(name, user)
+        except ServiceUnavailableError as e:
+            if time.monotonic() >= deadline:
+                raise
+            retry_after = int((e.headers or {}).get("Retry-After", 1))
+            await asyncio.sleep(retry_after)
+
+
+@asynccontextmanager
+async def upstream_slot(name: str, user) -> AsyncIterator[None]:
+    """Hold a slot on upstream ``name`` for the duration of the block."""
+    lease = await acquire_upstream_slot(name, user)
+    try:
+        yield
+    finally:
+        if lease is not None:
+            lease.release()
+
+
+def release_after(iterator: Iterator[T], lease: Optional[Lease]) -> Iterator[T]:
+    """Yield from ``iterator`` and release ``lease`` once it is exhausted or closed.
+
+    Used to hold an upstream slot for the whole body of a streaming response.
+    """
+    try:
+        yield from iterator
+    finally:
+        if lease is not None:
+            lease.release()
@@ -608,3 +608,68 @@ def stub_quota_service(request, monkeypatch):
 
     monkeypatch.setattr(QuotaService, "check_and_consume", always_allow)
     yield
+
+
+# ---------------------------------------------------------------------------
+# Transcription Cache Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def disable_transcription_cache(monkeypatch):
+    """Install a disabled TranscriptionCache singleton by default.
+
+    Tests reuse the same fake audio bytes with different mocked transcripts;
+    a shared cache would leak results between them. Cache tests build their
+    own ``TranscriptionCache`` instances.
+    """
+    from app.services import transcription_cache
+
+    monkeypatch.setattr(
+        transcription_cache,
+        "_transcription_cache",
+        transcription_cache.TranscriptionCache(enabled=False),
+    )
+    yield
+
+
+@pytest.fixture(autouse=True)
+def disable_speech_cache(monkeypatch):
+    """Install a disabled SpeechCache singleton by default."""
+    from app.services import speech_cache
+
+    monkeypatch.setattr(
+        speech_cache, "_speech_cache", speech_cache.SpeechCache(enabled=False)
+    )
+    yield
+
+
+# ---------------------------------------------------------------------------
+# Audio Worker Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def inline_audio_worker(monkeypatch):
+    """Run audio worker jobs in threads so tests can patch pydub."""
+    from app.services import audio_worker
+
+    worker = audio_worker.AudioWorker(processes=0)
+    monkeypatch.setattr(audio_worker, "_audio_worker", worker)
+    yield worker
+    worker.close()
+
+
+# ---------------------------------------------------------------------------
+# URL Signer Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def fresh_url_signer(monkeypatch):
+    """Give each test an empty signed-URL cache."""
+    from app.utils import url_signer
+
+    signer = url_signer.UrlSigner()
+    monkeypatch.setattr(url_signer, "_url_signer", signer)
+    yield signer
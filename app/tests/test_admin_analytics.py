@@ -345,3 +345,139 @@ class TestAdminExportEndpoint:
             "/api/admin/analytics/export?view=invalid&time_range=7d"
         )
         assert response.status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# Execution-cost attribution
+# ---------------------------------------------------------------------------
+
+
+async def _seed_execution_logs(db_session):
+    now = datetime.now()
+    logs = [
+        EndpointLog(
+            username="alice",
+            endpoint="/tasks/stt",
+            time_taken=12.0,
+            organization="Org A",
+            gpu_seconds=10.0,
+            queue_seconds=15.0,
+            cold_start=True,
+            upstream="asr-endpoint",
+            date=now - timedelta(hours=1),
+        ),
+        EndpointLog(
+            username="alice",
+            endpoint="/tasks/modal/stt",
+            time_taken=4.0,
+            organization="Org A",
+            gpu_seconds=4.0,
+            queue_seconds=0.0,
+            cold_start=False,
+            upstream="modal_stt",
+            date=now - timedelta(hours=2),
+        ),
+        EndpointLog(
+            username="bob",
+            endpoint="/tasks/stt",
+            time_taken=3.0,
+            organization="Org B",
+            gpu_seconds=2.0,
+            queue_seconds=0.5,
+            cold_start=False,
+            upstream="asr-endpoint",
+            date=now - timedelta(hours=3),
+        ),
+        # No upstream usage recorded: ignored.
+        EndpointLog(
+            username="bob",
+            endpoint="/tasks/languages",
+            time_taken=0.1,
+            organization="Org B",
+            date=now - timedelta(hours=3),
+        ),
+    ]
+    for log in logs:
+        db_session.add(log)
+    await db_session.commit()
+
+
+@pytest.fixture
+def fake_billing(monkeypatch):
+    from unittest.mock import AsyncMock, MagicMock
+
+    from app.api import app
+    from app.core.config import settings
+    from app.deps import get_billing_analytics_service
+
+    svc = MagicMock()
+    svc.execution_rates = AsyncMock(return_value=({"asr-endpoint": 0.001}, []))
+    monkeypatch.setattr(settings, "execution_cost_per_second_raw", "modal_stt=0.0005")
+    app.dependency_overrides[get_billing_analytics_service] = lambda: svc
+    yield svc
+    app.dependency_overrides.pop(get_billing_analytics_service, None)
+
+
+class TestAdminExecutionCostsEndpoint:
+    async def test_costs_per_user(
+        self, admin_client, test_db, db_session, fake_billing
+    ):
+        await _seed_execution_logs(db_session)
+        response = await admin_client.get(
+            "/api/admin/analytics/execution-costs?time_range=7d&group_by=user"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        rows = {row["key"]: row for row in data["rows"]}
+        assert rows["alice"]["requests"] == 2
+        assert rows["alice"]["gpu_seconds"] == 14.0
+        assert rows["alice"]["cold_starts"] == 1
+        assert rows["alice"]["estimated_cost"] == pytest.approx(0.012)
+        assert rows["bob"]["estimated_cost"] == pytest.approx(0.002)
+        sources = {u["upstream"]: u["rate_source"] for u in data["upstreams"]}
+        assert sources == {"asr-endpoint": "billing", "modal_stt": "configured"}
+        assert data["total_estimated_cost"] == pytest.approx(0.014)
+        recorded = fake_billing.execution_rates.call_args.args[2]
+        assert recorded == {"asr-endpoint": 12.0, "modal_stt": 4.0}
+
+    async def test_costs_per_organization(
+        self, admin_client, test_db, db_session, fake_billing
+    ):
+        await _seed_execution_logs(db_session)
+        response = await admin_client.get(
+            "/api/admin/analytics/execution-costs?group_by=organization"
+        )
+        assert response.status_code == 200
+        keys = [row["key"] for row in response.json()["rows"]]
+        assert keys == ["Org A", "Org B"]
+
+    async def test_invalid_group_by(self, admin_client, test_db, fake_billing):
+        response = await admin_client.get(
+            "/api/admin/analytics/execution-costs?group_by=gpu"
+        )
+        assert response.status_code == 400
+
+    async def test_requires_admin(self, authenticated_client, test_db):
+        response = await authenticated_client.get(
+            "/api/admin/analytics/execution-costs"
+        )
+        assert response.status_code == 403
+
+
+class TestAdminRunPodPollingEndpoint:
+    async def test_requires_admin(self, authenticated_client, test_db):
+        response = await authenticated_client.get("/api/admin/analytics/runpod-polling")
+        assert response.status_code == 403
+
+    async def test_reports_poller_snapshots(self, admin_client, test_db, monkeypatch):
+        import app.routers.admin_analytics as admin_analytics
+
+        snapshot = {"endpoint_id": "ep", "in_flight": 2, "completed": 5}
+        monkeypatch.setattr(
+            admin_analytics, "get_status_poller_snapshots", lambda: [snapshot]
+        )
+
+        response = await admin_client.get("/api/admin/analytics/runpod-polling")
+
+        assert response.status_code == 200
+        assert response.json() == {"endpoints": [snapshot]}
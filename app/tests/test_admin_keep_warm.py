@@ -0,0 +1,49 @@
+import pytest
+
+import app.services.keep_warm_service as keep_warm_module
+from app.services.keep_warm_service import KeepWarmScheduler
+
+BASE = "/api/admin/keep-warm"
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    async def pinger():
+        return 12.0
+
+    monkeypatch.setattr(keep_warm_module, "get_redis_client", lambda: None)
+    scheduler = KeepWarmScheduler(pingers={"asr": pinger})
+    monkeypatch.setattr(keep_warm_module, "_scheduler", scheduler)
+    return scheduler
+
+
+class TestAuth:
+    async def test_status_requires_admin(self, authenticated_client, test_db):
+        resp = await authenticated_client.get(BASE)
+        assert resp.status_code == 403
+
+    async def test_status_unauthenticated(self, async_client, test_db):
+        resp = await async_client.get(BASE)
+        assert resp.status_code == 401
+
+
+class TestEndpoints:
+    async def test_status_ok(self, admin_client, test_db, scheduler):
+        resp = await admin_client.get(BASE)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["running"] is False
+        assert [e["name"] for e in body["endpoints"]] == ["asr"]
+        assert body["endpoints"][0]["policy"]["idle_gap_seconds"] == 240
+
+    async def test_manual_ping(self, admin_client, test_db, scheduler):
+        resp = await admin_client.post(f"{BASE}/asr/ping")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["pings_sent"] == 1
+        assert body["last_delay_seconds"] == 12.0
+        assert body["cold_starts"] == 1
+
+    async def test_unknown_endpoint(self, admin_client, test_db, scheduler):
+        resp = await admin_client.post(f"{BASE}/nope/ping")
+        assert resp.status_code == 404
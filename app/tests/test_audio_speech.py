@@ -1,5 +1,6 @@
 """Integration tests for POST /tasks/audio/speech."""
 
+import json
 from datetime import datetime
 from typing import Dict
 from unittest.mock import AsyncMock, MagicMock
@@ -10,6 +11,12 @@ from httpx import AsyncClient
 from app.api import app
 from app.deps import get_speech_service
 from app.services.speech_service import SpeechResult
+from app.utils.audio_frames import (
+    FRAME_AUDIO,
+    FRAME_CONTROL,
+    FRAMES_MEDIA_TYPE,
+    iter_frames,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -111,6 +118,34 @@ async def test_speech_stream_mode_returns_wav(
     assert resp.content == b"RIFFDATA"
 
 
+async def test_speech_stream_mode_streams_long_text_in_chunks(
+    authenticated_client: AsyncClient, fake_speech, test_user: Dict
+):
+    """Long spark-tts texts stream the chunked WAV from the speech service."""
+
+    async def chunked():
+        yield b"RIFF"
+        yield b"CHUNK1"
+        yield b"CHUNK2"
+
+    fake_speech.stream_chunked = MagicMock(return_value=chunked())
+    resp = await authenticated_client.post(
+        "/tasks/audio/speech",
+        json={
+            "text": "A long passage. " * 40,
+            "model": "spark-tts",
+            "platform": "modal",
+            "response_mode": "stream",
+        },
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("audio/wav")
+    assert resp.headers["x-speaker-name"]
+    assert resp.content == b"RIFFCHUNK1CHUNK2"
+    fake_speech.stream_chunked.assert_called_once()
+
+
 async def test_openapi_marks_legacy_tts_deprecated(async_client: AsyncClient):
     resp = await async_client.get("/openapi.json")
     assert resp.status_code == 200
@@ -212,12 +247,8 @@ async def test_speech_quota_exceeded_returns_429(
     assert resp.status_code == 429
 
 
-async def test_speech_both_mode_returns_sse(
-    authenticated_client: AsyncClient, test_user: Dict, monkeypatch
-):
-    """spark-tts + modal + response_mode=both returns an SSE (event-stream)."""
-    from app.deps import get_legacy_storage_service
-    from app.services.tts_service import get_tts_service
+def _both_mode_doubles():
+    """TTS and storage doubles for response_mode=both."""
 
     async def fake_stream(text, speaker_id, chunk_size=8192):
         yield b"RIFF"
@@ -225,17 +256,28 @@ async def test_speech_both_mode_returns_sse(
 
     fake_tts = MagicMock()
     fake_tts.generate_audio_stream = fake_stream
+    upload = MagicMock()
+    upload.bytes_written = 8
+    upload.write = AsyncMock()
+    upload.finish = AsyncMock(return_value="blob")
+    upload.abort = AsyncMock()
     storage = MagicMock()
     storage.generate_file_name = MagicMock(return_value="f.wav")
-    storage.upload_audio_async = AsyncMock(return_value="blob")
+    storage.open_streaming_upload = MagicMock(return_value=upload)
     storage.generate_signed_url = MagicMock(
         return_value=("https://s/f.wav", datetime(2026, 12, 1))
     )
+    return fake_tts, storage, upload
+
+
+async def _post_both_mode(client: AsyncClient, fake_tts, storage, headers=None):
+    from app.deps import get_legacy_storage_service
+    from app.services.tts_service import get_tts_service
 
     app.dependency_overrides[get_tts_service] = lambda: fake_tts
     app.dependency_overrides[get_legacy_storage_service] = lambda: storage
     try:
-        resp = await authenticated_client.post(
+        return await client.post(
             "/tasks/audio/speech",
             json={
                 "text": "hi",
@@ -243,13 +285,71 @@ async def test_speech_both_mode_returns_sse(
                 "platform": "modal",
                 "response_mode": "both",
             },
+            headers=headers,
         )
     finally:
         app.dependency_overrides.pop(get_tts_service, None)
         app.dependency_overrides.pop(get_legacy_storage_service, None)
 
+
+async def test_speech_both_mode_returns_sse(
+    authenticated_client: AsyncClient, test_user: Dict, monkeypatch
+):
+    """spark-tts + modal + response_mode=both returns an SSE (event-stream)."""
+    fake_tts, storage, upload = _both_mode_doubles()
+
+    resp = await _post_both_mode(authenticated_client, fake_tts, storage)
+
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/event-stream")
+    # Chunks are uploaded as they stream, not after.
+    assert [c.args[0] for c in upload.write.await_args_list] == [b"RIFF", b"DATA"]
+    upload.finish.assert_awaited_once()
+    assert '"audio_url":"https://s/f.wav"' in resp.text
+
+
+async def test_speech_both_mode_binary_frames(
+    authenticated_client: AsyncClient, test_user: Dict
+):
+    """Accept: application/x-tts-frames sends raw audio, then a control frame."""
+    fake_tts, storage, upload = _both_mode_doubles()
+
+    resp = await _post_both_mode(
+        authenticated_client,
+        fake_tts,
+        storage,
+        headers={"Accept": FRAMES_MEDIA_TYPE},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith(FRAMES_MEDIA_TYPE)
+    frames = list(iter_frames(resp.content))
+    assert frames[:2] == [(FRAME_AUDIO, b"RIFF"), (FRAME_AUDIO, b"DATA")]
+    kind, payload = frames[2]
+    assert kind == FRAME_CONTROL and len(frames) == 3
+    final = json.loads(payload)
+    assert final["event"] == "complete"
+    assert final["audio_url"] == "https://s/f.wav"
+    assert final["total_bytes"] == 8
+
+
+async def test_speech_both_mode_upload_failure_is_error_frame(
+    authenticated_client: AsyncClient, test_user: Dict
+):
+    fake_tts, storage, upload = _both_mode_doubles()
+    upload.finish = AsyncMock(side_effect=RuntimeError("gcs down"))
+
+    resp = await _post_both_mode(
+        authenticated_client,
+        fake_tts,
+        storage,
+        headers={"Accept": FRAMES_MEDIA_TYPE},
+    )
+
+    kind, payload = list(iter_frames(resp.content))[-1]
+    assert kind == FRAME_CONTROL
+    assert json.loads(payload) == {"event": "error", "error": "gcs down"}
+    upload.abort.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Integration tests for the unified POST /tasks/audio/transcriptions endpoint."""
 
 import io
+import json
 from typing import Dict
 from unittest.mock import AsyncMock, MagicMock
 
@@ -252,3 +253,75 @@ async def test_quota_exceeded_returns_429(
         files=audio_part(),
     )
     assert resp.status_code == 429
+
+
+# --- batch endpoint ---
+
+
+async def test_batch_streams_ndjson(
+    authenticated_client: AsyncClient, fake_facade, test_user: Dict
+):
+    from app.services.transcription_batch_service import (
+        TranscriptionBatchService,
+        get_transcription_batch_service,
+    )
+
+    batches = TranscriptionBatchService(transcription_service=fake_facade)
+    app.dependency_overrides[get_transcription_batch_service] = lambda: batches
+    try:
+        resp = await authenticated_client.post(
+            "/tasks/audio/transcriptions/batch",
+            json={"gcs_blob_names": ["a.wav", "b.wav"], "language": "lug"},
+        )
+    finally:
+        app.dependency_overrides.pop(get_transcription_batch_service, None)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1]
+    assert all(line["status"] == "ok" for line in lines[:-1])
+    assert lines[-1]["summary"]["succeeded"] == 2
+    assert fake_facade.transcribe.await_count == 2
+
+
+async def test_batch_with_results_blob_returns_202(
+    authenticated_client: AsyncClient, fake_facade, test_user: Dict, monkeypatch
+):
+    from app.services.transcription_batch_service import get_transcription_batch_service
+
+    batches = MagicMock()
+    batches.resolve_blob_names = AsyncMock(return_value=["a.wav"])
+    batches.start = MagicMock(
+        return_value=("batch-1", "batch-results/1/batch-1.ndjson")
+    )
+    app.dependency_overrides[get_transcription_batch_service] = lambda: batches
+    try:
+        resp = await authenticated_client.post(
+            "/tasks/audio/transcriptions/batch",
+            json={
+                "gcs_blob_names": ["a.wav"],
+                "language": "lug",
+                "write_results": True,
+                "results_blob_name": "other-users/audio.wav",
+            },
+        )
+    finally:
+        app.dependency_overrides.pop(get_transcription_batch_service, None)
+
+    assert resp.status_code == 202
+    assert resp.json() == {
+        "batch_id": "batch-1",
+        "items": 1,
+        "results_blob_name": "batch-results/1/batch-1.ndjson",
+    }
+    assert len(batches.start.call_args.args) == 3
+
+
+async def test_batch_requires_an_input(
+    authenticated_client: AsyncClient, fake_facade, test_user: Dict
+):
+    resp = await authenticated_client.post(
+        "/tasks/audio/transcriptions/batch", json={"language": "lug"}
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,76 @@
+"""Tests for execution-cost attribution (pure functions)."""
+
+from datetime import datetime
+
+from app.schemas.billing_analytics import BillingRecord
+from app.services.billing_analytics.attribution import (
+    attribute_costs,
+    effective_rates,
+    resolve_rate,
+)
+
+
+def _record(object_id: str, cost: float, runtime_ms, provider: str = "runpod"):
+    return BillingRecord(
+        provider=provider,
+        object_id=object_id,
+        object_name=object_id,
+        timestamp=datetime(2026, 1, 1),
+        cost=cost,
+        runtime_ms=runtime_ms,
+    )
+
+
+def test_effective_rates_divide_cost_by_runtime():
+    rates = effective_rates(
+        [
+            _record("asr", 1.0, 1_000_000),
+            _record("asr", 1.0, 1_000_000),
+            _record("volumes", 5.0, None),
+        ]
+    )
+    assert rates == {"asr": 0.001}
+
+
+def test_effective_rates_price_mapped_modal_apps_over_recorded_seconds():
+    records = [
+        _record("ap-stt", 2.0, None, provider="modal"),
+        _record("ap-stt", 1.0, None, provider="modal"),
+        _record("ap-unmapped", 9.0, None, provider="modal"),
+        _record("ap-idle", 4.0, None, provider="modal"),
+    ]
+
+    rates = effective_rates(
+        records,
+        recorded_seconds={"modal_stt": 1000.0},
+        modal_apps={"ap-stt": "modal_stt", "ap-idle": "modal_tts"},
+    )
+
+    assert rates == {"modal_stt": 0.003}
+
+
+def test_resolve_rate_prefers_billing_then_config_then_default():
+    assert resolve_rate("a", {"a": 0.1}, {"a": 0.2}, 0.3) == (0.1, "billing")
+    assert resolve_rate("a", {}, {"a": 0.2}, 0.3) == (0.2, "configured")
+    assert resolve_rate("a", {}, {}, 0.3) == (0.3, "default")
+    assert resolve_rate("a", {}, {}, 0.0) == (None, "none")
+
+
+def test_attribute_costs_groups_by_key_across_upstreams():
+    rows = [
+        ("alice", "asr", 2, 10.0, 20.0, 1),
+        ("alice", "modal_stt", 1, 4.0, 0.0, 0),
+        ("bob", "unknown-endpoint", 3, 6.0, 1.0, 0),
+    ]
+
+    result = attribute_costs(rows, {"asr": 0.001}, {"modal_stt": 0.0005})
+
+    alice, bob = result["rows"]
+    assert alice["key"] == "alice"
+    assert alice["requests"] == 3
+    assert alice["gpu_seconds"] == 14.0
+    assert alice["estimated_cost"] == 0.012
+    assert bob["unpriced_gpu_seconds"] == 6.0
+    assert bob["estimated_cost"] == 0.0
+    assert result["total_gpu_seconds"] == 20.0
+    assert result["upstreams"][0]["upstream"] == "asr"
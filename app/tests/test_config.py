@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from app.core.config import Settings
 
 
@@ -42,3 +45,14 @@ def test_ga_properties_env_alias_works(monkeypatch):
     s = Settings()
     assert s.ga_properties == {"506611499": "Sunflower"}
     assert s.ga_enabled is True
+
+
+def test_stt_chunk_max_must_not_be_below_target():
+    with pytest.raises(ValidationError, match="STT_CHUNK_MAX_SECONDS"):
+        Settings(stt_chunk_target_seconds=200, stt_chunk_max_seconds=180)
+    assert Settings(stt_chunk_target_seconds=180, stt_chunk_max_seconds=180)
+
+
+def test_execution_modal_apps_map_app_to_upstream():
+    s = Settings(execution_modal_apps_raw="modal_stt=ap-123, malformed,orpheus=")
+    assert s.execution_modal_apps == {"ap-123": "modal_stt"}
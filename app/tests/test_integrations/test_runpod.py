@@ -5,17 +5,122 @@ This module contains unit tests for the RunPodClient class and related
 functions defined in app/integrations/runpod.py.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
 
+import app.integrations.runpod as runpod_module
+import app.integrations.runpod_poller as runpod_poller
+from app.core.config import settings
 from app.integrations.runpod import (
     RunPodClient,
+    close_runpod_clients,
     get_runpod_client,
+    get_status_poller_snapshots,
     normalize_runpod_response,
+    register_job_observer,
     reset_runpod_client,
     run_job_and_get_output,
+    run_runpod_job,
+    unregister_job_observer,
 )
+from app.integrations.runpod_webhooks import get_completion_hub, reset_completion_hub
+
+
+class FakeRunPod:
+    """Minimal RunPod serverless REST API: run, status and cancel."""
+
+    def __init__(self) -> None:
+        self.statuses = ["COMPLETED"]
+        self.submitted = []
+        self.cancelled = []
+        self.status_calls = 0
+        self.auth = None
+        # Seconds after /run to POST the completed job to its webhook
+        # (None: never call webhooks).
+        self.webhook_delay = None
+        self.webhook_responses = []
+        self._webhook_tasks = []
+        self.app = web.Application()
+        self.app.router.add_post("/{endpoint}/run", self.run)
+        self.app.router.add_get("/{endpoint}/status/{job_id}", self.status)
+        self.app.router.add_post("/{endpoint}/cancel/{job_id}", self.cancel)
+
+    async def run(self, request: web.Request) -> web.Response:
+        self.auth = request.headers.get("Authorization")
+        body = await request.json()
+        self.submitted.append(body)
+        if body.get("webhook") and self.webhook_delay is not None:
+            task = asyncio.ensure_future(self._call_webhook(body["webhook"]))
+            self._webhook_tasks.append(task)
+        return web.json_response({"id": "job-123", "status": "IN_QUEUE"})
+
+    async def _call_webhook(self, url: str) -> None:
+        await asyncio.sleep(self.webhook_delay)
+        async with ClientSession() as session:
+            async with session.post(url, json=self.completed("job-123")) as resp:
+                self.webhook_responses.append(resp.status)
+
+    @staticmethod
+    def completed(job_id: str) -> dict:
+        return {
+            "id": job_id,
+            "status": "COMPLETED",
+            "output": {"result": "success"},
+            "delayTime": 1200,
+            "executionTime": 300,
+            "workerId": "worker-1",
+        }
+
+    async def status(self, request: web.Request) -> web.Response:
+        if self.cancelled:
+            status = "CANCELLED"
+        else:
+            index = min(self.status_calls, len(self.statuses) - 1)
+            status = self.statuses[index]
+        self.status_calls += 1
+        if status == "COMPLETED":
+            return web.json_response(self.completed(request.match_info["job_id"]))
+        return web.json_response({"id": request.match_info["job_id"], "status": status})
+
+    async def cancel(self, request: web.Request) -> web.Response:
+        self.cancelled.append(request.match_info["job_id"])
+        return web.json_response({"status": "CANCELLED"})
+
+
+@pytest.fixture
+async def fake_runpod(monkeypatch):
+    fake = FakeRunPod()
+    server = TestServer(fake.app)
+    await server.start_server()
+    monkeypatch.setattr(
+        runpod_module.runpod, "endpoint_url_base", str(server.make_url("")).rstrip("/")
+    )
+    monkeypatch.setattr(runpod_poller, "INITIAL_INTERVAL", 0.01)
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+async def webhook_receiver():
+    """Stand-in for POST /tasks/webhooks/runpod feeding a fresh hub."""
+    reset_completion_hub()
+    hub = get_completion_hub()
+
+    async def receive(request: web.Request) -> web.Response:
+        delivered = await hub.deliver(await request.json())
+        return web.json_response({"delivered": delivered})
+
+    app = web.Application()
+    app.router.add_post("/hook", receive)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/hook")), hub
+    await server.close()
+    reset_completion_hub()
 
 
 class TestRunPodClientInitialization:
@@ -72,43 +177,251 @@ class TestRunPodClientRunJob:
                 await client.run_job({"input": "test"})
 
     @pytest.mark.asyncio
-    async def test_run_job_success(self) -> None:
-        """Test successful job execution."""
+    async def test_run_job_success(self, fake_runpod) -> None:
+        """Job is polled to completion and the final status is the details."""
+        fake_runpod.statuses = ["IN_QUEUE", "IN_PROGRESS", "COMPLETED"]
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        output, details = await client.run_job({"task": "translate"})
+        await client.close()
+
+        assert output == {"result": "success"}
+        assert details["status"] == "COMPLETED"
+        assert details["delayTime"] == 1200
+        # Body is wrapped like the SDK's AsyncioEndpoint.run.
+        assert fake_runpod.submitted == [{"input": {"task": "translate"}}]
+        assert fake_runpod.auth == "Bearer test-key"
+        # Completed details are not re-fetched after the final status.
+        assert fake_runpod.status_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_polled_by_the_endpoint_poller(self, fake_runpod) -> None:
+        fake_runpod.statuses = ["IN_QUEUE", "COMPLETED"]
+        reset_runpod_client()
+
+        await run_runpod_job({"task": "translate"}, endpoint_id="test-endpoint")
+        [snapshot] = [
+            s
+            for s in get_status_poller_snapshots()
+            if s["endpoint_id"] == "test-endpoint"
+        ]
+        await close_runpod_clients()
+        reset_runpod_client()
+
+        assert snapshot["completed"] == 1
+        assert snapshot["status_requests"] == 2
+        assert snapshot["in_flight"] == 0
+        assert snapshot["latency_avg_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_jobs(self, fake_runpod) -> None:
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        await client.run_job({"task": "a"})
+        session = client._session
+        await client.run_job({"task": "b"})
+
+        assert client._session is session
+        await client.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_run_job_notifies_observers(self, fake_runpod) -> None:
+        seen = []
+
+        def observer(endpoint_id, details):
+            seen.append((endpoint_id, details["delayTime"]))
+
+        register_job_observer(observer)
+        try:
+            client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+            await client.run_job({"task": "a"})
+            await client.close()
+        finally:
+            unregister_job_observer(observer)
+        assert seen == [("test-endpoint", 1200)]
+
+    @pytest.mark.asyncio
+    async def test_timeout_polls_then_cancels(self, fake_runpod, monkeypatch) -> None:
+        monkeypatch.setattr(runpod_module, "TIMEOUT_POLL_ATTEMPTS", 2)
+        monkeypatch.setattr(runpod_module, "TIMEOUT_POLL_INTERVAL", 0)
+        fake_runpod.statuses = ["IN_PROGRESS"] * 100
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        output, details = await client.run_job({"task": "slow"}, timeout=0.05)
+        await client.close()
+
+        assert fake_runpod.cancelled == ["job-123"]
+        assert output == {"status": "CANCELLED"}
+        assert details["status"] == "CANCELLED"
+
+
+class TestRunUntilComplete:
+    """Tests for the async run_sync replacement."""
+
+    @pytest.mark.asyncio
+    async def test_unwraps_sdk_style_payload(self, fake_runpod) -> None:
+        fake_runpod.statuses = ["IN_PROGRESS", "COMPLETED"]
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        output = await client.run_until_complete(
+            {"input": {"task": "summarise", "text": "hi"}}, timeout=5
+        )
+        await client.close()
+
+        assert output == {"result": "success"}
+        assert fake_runpod.submitted == [{"input": {"task": "summarise", "text": "hi"}}]
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_and_raises(self, fake_runpod) -> None:
+        fake_runpod.statuses = ["IN_PROGRESS"] * 100
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        with pytest.raises(TimeoutError):
+            await client.run_until_complete({"task": "slow"}, timeout=0.05)
+        await client.close()
+
+        assert fake_runpod.cancelled == ["job-123"]
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_cancels_job(self, fake_runpod) -> None:
+        fake_runpod.statuses = ["IN_PROGRESS"] * 1000
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        task = asyncio.create_task(client.run_until_complete({"task": "slow"}))
+        while fake_runpod.status_calls == 0:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        while not fake_runpod.cancelled:
+            await asyncio.sleep(0.01)
+        await client.close()
+
+        assert fake_runpod.cancelled == ["job-123"]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_api_raises_connection_error(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            runpod_module.runpod, "endpoint_url_base", "http://127.0.0.1:9"
+        )
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        with pytest.raises(ConnectionError):
+            await client.run_until_complete({"task": "x"}, timeout=5)
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_run_runpod_job_uses_per_endpoint_clients(self, fake_runpod) -> None:
+        reset_runpod_client()
+
+        output = await run_runpod_job({"task": "x"}, timeout=5, endpoint_id="other")
+
+        assert output == {"result": "success"}
+        assert get_runpod_client("other") is get_runpod_client("other")
+        assert get_runpod_client("other").endpoint_id == "other"
+        await close_runpod_clients()
+        reset_runpod_client()
+
+
+class TestWebhookCompletion:
+    """Jobs submitted with a webhook are resolved by the callback."""
+
+    @pytest.mark.asyncio
+    async def test_webhook_resolves_job_without_polling(
+        self, fake_runpod, webhook_receiver
+    ) -> None:
+        url, hub = webhook_receiver
+        fake_runpod.statuses = ["IN_PROGRESS"] * 1000
+        fake_runpod.webhook_delay = 0.05
+        client = RunPodClient(
+            endpoint_id="test-endpoint",
+            api_key="test-key",
+            webhook_url=url,
+            webhook_grace_seconds=5,
+        )
+
+        output, details = await client.run_job({"task": "translate"}, timeout=5)
+        await client.close()
+
+        assert output == {"result": "success"}
+        assert details["delayTime"] == 1200
+        assert fake_runpod.submitted[0]["webhook"] == url
+        assert fake_runpod.status_calls == 0
+        assert hub.delivered == 1
+        assert hub.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_after_grace(
+        self, fake_runpod, webhook_receiver
+    ) -> None:
+        url, hub = webhook_receiver
+        fake_runpod.statuses = ["IN_PROGRESS", "COMPLETED"]
         client = RunPodClient(
             endpoint_id="test-endpoint",
             api_key="test-key",
+            webhook_url=url,
+            webhook_grace_seconds=0.05,
         )
 
-        mock_job = AsyncMock()
-        mock_job.endpoint_id = "test-endpoint"
-        mock_job.job_id = "job-123"
-        mock_job.status = AsyncMock(return_value="COMPLETED")
-        mock_job.output = AsyncMock(return_value={"result": "success"})
-
-        mock_endpoint = AsyncMock()
-        mock_endpoint.run = AsyncMock(return_value=mock_job)
-
-        with patch(
-            "app.integrations.runpod.http_client.AsyncClientSession"
-        ) as mock_session:
-            mock_session_instance = AsyncMock()
-            mock_session.return_value.__aenter__ = AsyncMock(
-                return_value=mock_session_instance
-            )
-            mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
-
-            with patch(
-                "app.integrations.runpod.AsyncioEndpoint", return_value=mock_endpoint
-            ):
-                with patch.object(
-                    client,
-                    "_get_job_details_sync",
-                    return_value={"status": "COMPLETED"},
-                ):
-                    output, details = await client.run_job({"input": "test"})
-
-                    assert output == {"result": "success"}
-                    assert details["status"] == "COMPLETED"
+        output = await client.run_until_complete({"task": "x"}, timeout=5)
+        await client.close()
+
+        assert output == {"result": "success"}
+        assert fake_runpod.status_calls >= 1
+        assert hub.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_late_webhook_beats_polling(
+        self, fake_runpod, webhook_receiver
+    ) -> None:
+        url, hub = webhook_receiver
+        fake_runpod.statuses = ["IN_PROGRESS"] * 1000
+        fake_runpod.webhook_delay = 0.2
+        client = RunPodClient(
+            endpoint_id="test-endpoint",
+            api_key="test-key",
+            webhook_url=url,
+            webhook_grace_seconds=0.05,
+        )
+
+        output = await client.run_until_complete({"task": "x"}, timeout=5)
+        await client.close()
+
+        assert output == {"result": "success"}
+        assert fake_runpod.status_calls >= 1
+        assert hub.delivered == 1
+
+    @pytest.mark.asyncio
+    async def test_no_webhook_when_unconfigured(self, fake_runpod) -> None:
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        await client.run_job({"task": "translate"})
+        await client.close()
+
+        assert "webhook" not in fake_runpod.submitted[0]
+
+    def test_configured_webhook_url_carries_token(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            settings, "runpod_webhook_url", "https://api.test/tasks/webhooks/runpod"
+        )
+        monkeypatch.setattr(settings, "runpod_webhook_secret", "s3cret/+")
+
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        assert client.webhook_url == (
+            "https://api.test/tasks/webhooks/runpod/s3cret%2F%2B"
+        )
+
+    def test_no_webhook_without_secret(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            settings, "runpod_webhook_url", "https://api.test/tasks/webhooks/runpod"
+        )
+        monkeypatch.setattr(settings, "runpod_webhook_secret", "")
+
+        client = RunPodClient(endpoint_id="test-endpoint", api_key="test-key")
+
+        assert client.webhook_url == ""
 
 
 class TestNormalizeRunpodResponse:
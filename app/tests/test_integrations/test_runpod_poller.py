@@ -0,0 +1,169 @@
+"""
+Tests for the multiplexed RunPod status poller.
+
+Uses an in-memory status fetcher; each job completes after a fixed number
+of status checks.
+"""
+
+import asyncio
+from typing import Dict
+
+import pytest
+
+from app.integrations.runpod_poller import StatusPoller
+
+
+class FakeStatuses:
+    def __init__(self, checks_until_done: int = 3, delay: float = 0.0) -> None:
+        self.checks_until_done = checks_until_done
+        self.delay = delay
+        self.calls: Dict[str, int] = {}
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def fetch(self, job_id: str) -> dict:
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.concurrent -= 1
+        self.calls[job_id] = self.calls.get(job_id, 0) + 1
+        if self.calls[job_id] >= self.checks_until_done:
+            return {"id": job_id, "status": "COMPLETED", "output": job_id}
+        return {"id": job_id, "status": "IN_PROGRESS"}
+
+
+def _poller(fake: FakeStatuses, **kwargs) -> StatusPoller:
+    options = {"initial_interval": 0.01, "max_interval": 0.02}
+    options.update(kwargs)
+    return StatusPoller("endpoint", fetch=fake.fetch, **options)
+
+
+QUEUED = {"status": "IN_QUEUE"}
+
+
+@pytest.mark.asyncio
+async def test_many_jobs_share_one_loop() -> None:
+    fake = FakeStatuses()
+    poller = _poller(fake)
+
+    results = await asyncio.gather(
+        *(poller.wait(f"job-{i}", QUEUED) for i in range(20))
+    )
+
+    assert [r["output"] for r in results] == [f"job-{i}" for i in range(20)]
+    assert all(calls == 3 for calls in fake.calls.values())
+    snapshot = poller.snapshot()
+    assert snapshot["in_flight"] == 0
+    assert snapshot["completed"] == 20
+    assert snapshot["status_requests"] == 60
+    assert snapshot["latency_p95_seconds"] > 0
+    assert not poller.running
+
+
+@pytest.mark.asyncio
+async def test_status_requests_are_bounded() -> None:
+    fake = FakeStatuses(checks_until_done=2, delay=0.01)
+    poller = _poller(fake, max_concurrent_requests=3)
+
+    await asyncio.gather(*(poller.wait(f"job-{i}", QUEUED) for i in range(12)))
+
+    assert fake.max_concurrent == 3
+
+
+@pytest.mark.asyncio
+async def test_waiters_on_the_same_job_share_checks() -> None:
+    fake = FakeStatuses()
+    poller = _poller(fake)
+
+    first, second = await asyncio.gather(
+        poller.wait("job-1", QUEUED), poller.wait("job-1", QUEUED)
+    )
+
+    assert first is second
+    assert fake.calls == {"job-1": 3}
+
+
+@pytest.mark.asyncio
+async def test_long_jobs_back_off_further() -> None:
+    fake = FakeStatuses(checks_until_done=1000)
+    poller = _poller(fake, long_job_after=0.05, long_job_interval=0.2)
+    waiter = asyncio.ensure_future(poller.wait("job-1", QUEUED))
+
+    await asyncio.sleep(0.04)
+    assert poller._jobs["job-1"].interval <= 0.02
+    await asyncio.sleep(0.5)
+    assert poller._jobs["job-1"].interval > 0.02
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert poller.in_flight == 0
+    await poller.stop()
+
+
+@pytest.mark.asyncio
+async def test_final_details_are_returned_without_polling() -> None:
+    fake = FakeStatuses()
+    poller = _poller(fake)
+
+    details = await poller.wait("job-1", {"status": "COMPLETED", "output": 1})
+
+    assert details["output"] == 1
+    assert fake.calls == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_are_retried() -> None:
+    attempts = []
+
+    async def flaky(job_id: str) -> dict:
+        attempts.append(job_id)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return {"status": "COMPLETED"}
+
+    poller = StatusPoller("endpoint", fetch=flaky, initial_interval=0.01)
+
+    assert (await poller.wait("job-1", QUEUED))["status"] == "COMPLETED"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_status_request_does_not_stall_other_jobs() -> None:
+    async def fetch(job_id: str) -> dict:
+        if job_id == "slow":
+            await asyncio.sleep(10)
+        return {"status": "COMPLETED", "output": job_id}
+
+    poller = StatusPoller("endpoint", fetch=fetch, initial_interval=0.01)
+    slow = asyncio.ensure_future(poller.wait("slow", QUEUED))
+    await asyncio.sleep(0.02)
+
+    fast = await asyncio.wait_for(poller.wait("fast", QUEUED), 1.0)
+
+    assert fast["output"] == "fast"
+    assert not slow.done()
+    slow.cancel()
+    await poller.stop()
+
+
+@pytest.mark.asyncio
+async def test_status_requests_have_a_deadline() -> None:
+    attempts = []
+
+    async def hangs_once(job_id: str) -> dict:
+        attempts.append(job_id)
+        if len(attempts) == 1:
+            await asyncio.sleep(10)
+        return {"status": "COMPLETED"}
+
+    poller = StatusPoller(
+        "endpoint", fetch=hangs_once, initial_interval=0.01, request_timeout=0.05
+    )
+
+    details = await asyncio.wait_for(poller.wait("job-1", QUEUED), 1.0)
+
+    assert details["status"] == "COMPLETED"
+    assert len(attempts) == 2
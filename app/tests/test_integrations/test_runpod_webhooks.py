@@ -0,0 +1,102 @@
+"""
+Tests for the RunPod completion webhook hub.
+
+Covers local resolution, callbacks that arrive before the waiter registers,
+and relaying callbacks between instances over Redis pub/sub (fakeredis).
+"""
+
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+
+from app.integrations.runpod_webhooks import CHANNEL, JobCompletionHub
+from app.services.redis_client import SafeRedis
+
+
+def _completed(job_id: str) -> dict:
+    return {"id": job_id, "status": "COMPLETED", "output": {"text": "ok"}}
+
+
+class TestLocalResolution:
+    @pytest.mark.asyncio
+    async def test_resolve_wakes_waiter(self) -> None:
+        hub = JobCompletionHub()
+        future = hub.expect("job-1")
+
+        assert await hub.deliver(_completed("job-1")) is True
+        assert (await future)["output"] == {"text": "ok"}
+        assert hub.delivered == 1
+
+    @pytest.mark.asyncio
+    async def test_early_callback_is_handed_to_late_waiter(self) -> None:
+        hub = JobCompletionHub()
+
+        assert hub.resolve(_completed("job-1")) is False
+        future = hub.expect("job-1")
+
+        assert future.done()
+        assert future.result()["status"] == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_discard_cancels_pending_waiter(self) -> None:
+        hub = JobCompletionHub()
+        future = hub.expect("job-1")
+
+        hub.discard("job-1")
+
+        assert future.cancelled()
+        assert hub.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_unmatched_callback_without_redis_is_not_delivered(self) -> None:
+        hub = JobCompletionHub()
+
+        assert await hub.deliver(_completed("job-1")) is False
+
+    @pytest.mark.asyncio
+    async def test_callback_without_id_is_ignored(self) -> None:
+        hub = JobCompletionHub()
+
+        assert hub.resolve({"status": "COMPLETED"}) is False
+
+
+class TestCrossInstanceRelay:
+    @pytest.mark.asyncio
+    async def test_callback_on_other_instance_resolves_waiter(self) -> None:
+        server = fakeredis.FakeServer()
+        publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        receiving = JobCompletionHub(SafeRedis(publisher))
+        waiting = JobCompletionHub()
+        waiting.start(
+            SafeRedis(
+                fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+            )
+        )
+        future = waiting.expect("job-1")
+        try:
+            # Wait for the listener to subscribe before the callback lands.
+            for _ in range(100):
+                if dict(await publisher.pubsub_numsub(CHANNEL)).get(CHANNEL):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await receiving.deliver(_completed("job-1")) is True
+            details = await asyncio.wait_for(future, 1)
+        finally:
+            await waiting.stop()
+
+        assert details["output"] == {"text": "ok"}
+        assert receiving.relayed == 1
+        assert waiting.delivered == 1
+        assert not waiting.running
+
+    @pytest.mark.asyncio
+    async def test_own_relayed_messages_are_ignored(self) -> None:
+        hub = JobCompletionHub()
+        message = '{"origin": "%s", "details": {"id": "job-1"}}' % hub.instance_id
+
+        hub._on_message(message)
+        hub._on_message("not json")
+
+        assert not hub.expect("job-1").done()
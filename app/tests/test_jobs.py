@@ -0,0 +1,124 @@
+"""Integration tests for the asynchronous /tasks/jobs endpoints."""
+
+import asyncio
+import io
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Dict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import AsyncClient
+
+import app.services.transcription_job_service as job_module
+from app.api import app
+from app.deps import get_transcription_job_service, get_transcription_service
+from app.services.stt_service import TranscriptionResult
+from app.services.transcription_job_service import TranscriptionJobService
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield MagicMock()
+
+
+@pytest.fixture
+def fake_facade():
+    facade = MagicMock()
+    facade.validate_and_normalize = MagicMock(return_value=(False, True))
+    facade.transcribe = AsyncMock(
+        return_value=TranscriptionResult(
+            transcription="hello world",
+            diarization_output={},
+            formatted_diarization_output="",
+            audio_url="gs://bucket/a.wav",
+            blob_name="a.wav",
+        )
+    )
+    app.dependency_overrides[get_transcription_service] = lambda: facade
+    yield facade
+    app.dependency_overrides.pop(get_transcription_service, None)
+
+
+@pytest.fixture
+def jobs(fake_facade, monkeypatch):
+    monkeypatch.setattr(
+        job_module,
+        "create_audio_transcription",
+        AsyncMock(return_value=SimpleNamespace(id=7)),
+    )
+    service = TranscriptionJobService(
+        transcription_service=fake_facade, session_factory=_fake_session
+    )
+    app.dependency_overrides[get_transcription_job_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_transcription_job_service, None)
+
+
+def audio_part():
+    return {"audio": ("sample.wav", io.BytesIO(b"RIFFfake"), "audio/wav")}
+
+
+async def test_submit_returns_202_and_job_completes(
+    authenticated_client: AsyncClient, jobs, fake_facade, test_user: Dict
+):
+    resp = await authenticated_client.post(
+        "/tasks/jobs/transcriptions",
+        data={"language": "lug", "recognise_speakers": "true"},
+        files=audio_part(),
+    )
+    assert resp.status_code == 202
+    accepted = resp.json()
+    assert accepted["status"] == "queued"
+    assert accepted["status_url"] == f"/tasks/jobs/{accepted['job_id']}"
+
+    await asyncio.gather(*list(jobs._tasks))
+
+    resp = await authenticated_client.get(accepted["status_url"])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "succeeded"
+    assert body["result"]["audio_transcription"] == "hello world"
+    assert body["result"]["audio_transcription_id"] == 7
+    _, kwargs = fake_facade.transcribe.call_args
+    assert kwargs["platform"] == "runpod"
+    assert kwargs["recognise_speakers"] is True
+
+
+async def test_invalid_callback_url_is_rejected(
+    authenticated_client: AsyncClient, jobs, test_user: Dict
+):
+    resp = await authenticated_client.post(
+        "/tasks/jobs/transcriptions",
+        data={"language": "lug", "callback_url": "ftp://example.com/done"},
+        files=audio_part(),
+    )
+    assert resp.status_code == 400
+    assert jobs.active == 0
+
+
+async def test_internal_callback_url_is_rejected(
+    authenticated_client: AsyncClient, jobs, test_user: Dict
+):
+    resp = await authenticated_client.post(
+        "/tasks/jobs/transcriptions",
+        data={
+            "language": "lug",
+            "callback_url": "http://169.254.169.254/computeMetadata/v1/",
+        },
+        files=audio_part(),
+    )
+    assert resp.status_code == 400
+    assert jobs.active == 0
+
+
+async def test_unknown_job_returns_404(
+    authenticated_client: AsyncClient, jobs, test_user: Dict
+):
+    resp = await authenticated_client.get("/tasks/jobs/does-not-exist")
+    assert resp.status_code == 404
+
+
+async def test_jobs_require_authentication(async_client: AsyncClient, jobs):
+    resp = await async_client.get("/tasks/jobs/anything")
+    assert resp.status_code == 401
@@ -0,0 +1,114 @@
+"""Lint-style guard against blocking RunPod SDK calls in the app.
+
+``runpod.Endpoint`` is the synchronous SDK client: ``run_sync`` (and every
+other method) blocks the calling thread until the job finishes, which inside
+an async route freezes the whole worker. All RunPod jobs must go through
+``app.integrations.runpod.run_runpod_job`` instead.
+
+The check walks the AST of every module under ``app/`` (tests and alembic
+excluded) and fails on:
+
+* any construction of ``runpod.Endpoint`` / ``Endpoint`` imported from runpod;
+* any ``.run_sync(...)`` call that is not directly awaited. SQLAlchemy's
+  ``AsyncConnection.run_sync`` is a coroutine and is always awaited, the
+  RunPod one never is.
+"""
+
+import ast
+from pathlib import Path
+from typing import List
+
+APP_DIR = Path(__file__).resolve().parents[1]
+EXCLUDED_DIRS = {"tests", "alembic"}
+
+
+def _runpod_endpoint_names(tree: ast.AST) -> set:
+    """Local names bound to ``runpod.Endpoint`` via ``from runpod import``."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and (node.module or "").startswith(
+            "runpod"
+        ):
+            for alias in node.names:
+                if alias.name == "Endpoint":
+                    names.add(alias.asname or alias.name)
+    return names
+
+
+def find_blocking_runpod_calls(source: str, filename: str = "<src>") -> List[str]:
+    """Return ``file:line`` descriptions of blocking RunPod calls in ``source``."""
+    tree = ast.parse(source, filename=filename)
+    endpoint_names = _runpod_endpoint_names(tree)
+    awaited = {
+        id(node.value)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Await) and isinstance(node.value, ast.Call)
+    }
+    problems = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr == "Endpoint"
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "runpod"
+        ) or (isinstance(func, ast.Name) and func.id in endpoint_names):
+            problems.append(f"{filename}:{node.lineno} constructs runpod.Endpoint")
+        elif (
+            isinstance(func, ast.Attribute)
+            and func.attr == "run_sync"
+            and id(node) not in awaited
+        ):
+            problems.append(f"{filename}:{node.lineno} calls blocking run_sync")
+    return problems
+
+
+def _app_modules():
+    for path in sorted(APP_DIR.rglob("*.py")):
+        relative = path.relative_to(APP_DIR)
+        if EXCLUDED_DIRS & set(relative.parts[:-1]):
+            continue
+        yield path
+
+
+def test_no_blocking_runpod_calls_in_app():
+    problems = []
+    for path in _app_modules():
+        problems.extend(
+            find_blocking_runpod_calls(
+                path.read_text(encoding="utf-8"),
+                str(path.relative_to(APP_DIR.parent)),
+            )
+        )
+    assert not problems, (
+        "Blocking RunPod SDK calls found; use "
+        "app.integrations.runpod.run_runpod_job instead:\n" + "\n".join(problems)
+    )
+
+
+def test_checker_flags_sync_runpod_usage():
+    source = (
+        "import runpod\n"
+        "from runpod import Endpoint as RP\n"
+        "async def route(data):\n"
+        "    endpoint = runpod.Endpoint('x')\n"
+        "    other = RP('y')\n"
+        "    return endpoint.run_sync(data, timeout=600)\n"
+    )
+    problems = find_blocking_runpod_calls(source)
+    assert [p.split(" ", 1)[0] for p in problems] == [
+        "<src>:4",
+        "<src>:5",
+        "<src>:6",
+    ]
+
+
+def test_checker_allows_awaited_sqlalchemy_run_sync():
+    source = (
+        "async def init_db(engine, Base):\n"
+        "    async with engine.begin() as conn:\n"
+        "        await conn.run_sync(Base.metadata.create_all)\n"
+    )
+    assert find_blocking_runpod_calls(source) == []
@@ -5,6 +5,7 @@ Covers schema validation, the non-streaming and streaming (SSE) paths,
 error mapping, and deprecation of the legacy Sunflower endpoints.
 """
 
+import asyncio
 import json as jsonlib
 from typing import Any, Dict
 from unittest.mock import MagicMock
@@ -226,6 +227,40 @@ class TestChatCompletionsEndpoint:
         assert len(sent) == 4
         assert [m["role"] for m in sent[1:]] == ["user", "assistant", "user"]
 
+    async def test_long_history_trimmed_to_token_budget(
+        self,
+        async_client: AsyncClient,
+        test_user: Dict,
+        override_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        import app.utils.token_budget as token_budget
+
+        monkeypatch.setattr(token_budget, "get_tokenizer", lambda: None)
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 1024
+        )
+        monkeypatch.setattr(token_budget.settings, "sunflower_min_prompt_tokens", 256)
+        override_service.run_inference.return_value = SAMPLE_RESULT
+        history = []
+        for i in range(20):
+            history.append({"role": "user", "content": f"Question {i} " + "x" * 200})
+            history.append({"role": "assistant", "content": f"Answer {i} " + "y" * 200})
+        history.append({"role": "user", "content": "And to Acholi?"})
+
+        response = await async_client.post(
+            "/tasks/chat/completions",
+            json={"messages": history, "max_tokens": 256},
+            headers={"Authorization": f"Bearer {test_user['token']}"},
+        )
+
+        assert response.status_code == 200
+        sent = override_service.run_inference.call_args.kwargs["messages"]
+        assert len(sent) < len(history) + 1
+        assert sent[0]["role"] == "system"
+        assert sent[-1] == {"role": "user", "content": "And to Acholi?"}
+        assert token_budget.count_message_tokens(sent) <= 1024 - 256
+
     async def test_requires_auth(self, async_client: AsyncClient) -> None:
         response = await async_client.post(
             "/tasks/chat/completions",
@@ -370,6 +405,82 @@ async def _read_sse_events(response) -> list:
     return events
 
 
+class TestChatCompletionsAdmission:
+    """Per-upstream admission control on /tasks/chat/completions."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_limiters(self):
+        from app.services.upstream_limiter import reset_upstream_limiters
+
+        reset_upstream_limiters()
+        yield
+        reset_upstream_limiters()
+
+    async def test_saturated_upstream_sheds_with_retry_after(
+        self,
+        async_client: AsyncClient,
+        test_user: Dict,
+        override_service: MagicMock,
+        monkeypatch,
+    ) -> None:
+        from app.services import upstream_limiter
+
+        monkeypatch.setattr(
+            upstream_limiter.settings, "upstream_max_in_flight_raw", "sunflower=1"
+        )
+        limiter = upstream_limiter.get_upstream_limiter("sunflower")
+        limiter.avg_hold_seconds = 60.0
+        await limiter.acquire("admin")
+
+        response = await async_client.post(
+            "/tasks/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hello"}]},
+            headers={"Authorization": f"Bearer {test_user['token']}"},
+        )
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "60"
+        override_service.run_inference.assert_not_called()
+
+    async def test_slot_released_after_completion(
+        self,
+        async_client: AsyncClient,
+        test_user: Dict,
+        override_service: MagicMock,
+    ) -> None:
+        from app.services.upstream_limiter import get_upstream_limiter
+
+        override_service.run_inference.return_value = SAMPLE_RESULT
+        response = await async_client.post(
+            "/tasks/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hello"}]},
+            headers={"Authorization": f"Bearer {test_user['token']}"},
+        )
+        assert response.status_code == 200
+        assert get_upstream_limiter("sunflower").in_flight == 0
+
+    async def test_slot_released_after_stream(
+        self,
+        async_client: AsyncClient,
+        test_user: Dict,
+        override_service: MagicMock,
+    ) -> None:
+        from app.services.upstream_limiter import get_upstream_limiter
+
+        override_service.run_inference_stream.return_value = iter(
+            [{"type": "delta", "content": "Oli otya?"}]
+        )
+        async with async_client.stream(
+            "POST",
+            "/tasks/chat/completions",
+            json={"messages": [{"role": "user", "content": "Hi"}], "stream": True},
+            headers={"Authorization": f"Bearer {test_user['token']}"},
+        ) as response:
+            events = await _read_sse_events(response)
+        assert events[-1] == "[DONE]"
+        await asyncio.sleep(0)
+        assert get_upstream_limiter("sunflower").in_flight == 0
+
+
 class TestChatCompletionsStreaming:
     """Tests for POST /tasks/chat/completions with stream=true."""
 
@@ -531,6 +642,84 @@ class TestChatCompletionsStreaming:
         assert error_events[0]["error"]["type"] == "server_error"
 
 
+class TestEventStreamFraming:
+    """Unit tests for SSE framing and delta coalescing in _event_stream."""
+
+    def _frames(self, items, **kwargs) -> list:
+        from app.routers.chat import _event_stream
+
+        gen = iter(items)
+        return list(
+            _event_stream(
+                "chatcmpl-x",
+                1718000000,
+                "Sunbird/Sunflower-14B",
+                next(gen),
+                gen,
+                [],
+                **kwargs,
+            )
+        )
+
+    def _contents(self, frames) -> list:
+        payloads = [f.decode().removeprefix("data: ").strip() for f in frames]
+        chunks = [jsonlib.loads(p) for p in payloads if p != "[DONE]"]
+        return [
+            c["choices"][0]["delta"]["content"]
+            for c in chunks
+            if c.get("choices") and c["choices"][0]["delta"].get("content")
+        ]
+
+    def test_content_frame_matches_pydantic_serialization(self) -> None:
+        from app.routers.chat import _SSEFramer
+        from app.schemas.chat import ChatCompletionChunkDelta
+
+        framer = _SSEFramer("chatcmpl-x", 1718000000, "Sunbird/Sunflower-14B")
+        text = 'Oli otya? "Ssebo"\nWebale — nnyo'
+        assert framer.content(text) == framer.chunk(
+            ChatCompletionChunkDelta(content=text)
+        )
+
+    def test_one_frame_per_delta_without_window(self) -> None:
+        items = [{"type": "delta", "content": t} for t in ("a", "b", "c")]
+        frames = self._frames(items, coalesce_ms=0)
+        assert self._contents(frames) == ["a", "b", "c"]
+        assert frames[-1] == b"data: [DONE]\n\n"
+
+    def test_deltas_coalesced_within_window(self) -> None:
+        items = [{"type": "delta", "content": t} for t in ("a", "b", "c")]
+        frames = self._frames(items, coalesce_ms=60_000, coalesce_chars=256)
+        assert self._contents(frames) == ["abc"]
+
+    def test_size_limit_flushes_window(self) -> None:
+        items = [{"type": "delta", "content": t} for t in ("ab", "cd", "e")]
+        frames = self._frames(items, coalesce_ms=60_000, coalesce_chars=4)
+        assert self._contents(frames) == ["abcd", "e"]
+
+    def test_buffered_text_flushed_before_error(self) -> None:
+        from app.routers.chat import _event_stream
+
+        def failing():
+            yield {"type": "delta", "content": "b"}
+            raise RuntimeError("upstream died")
+
+        gen = failing()
+        frames = list(
+            _event_stream(
+                "chatcmpl-x",
+                1,
+                "Sunbird/Sunflower-14B",
+                {"type": "delta", "content": "a"},
+                gen,
+                [],
+                coalesce_ms=60_000,
+            )
+        )
+        assert self._contents(frames) == ["ab"]
+        assert b"server_error" in frames[-2]
+        assert frames[-1] == b"data: [DONE]\n\n"
+
+
 class TestLegacyEndpointDeprecation:
     """The legacy Sunflower endpoints must still work but be deprecated."""
 
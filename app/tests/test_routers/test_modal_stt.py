@@ -40,6 +40,17 @@ def mock_modal_stt_service() -> MagicMock:
     return service
 
 
+def streaming_transcribe(text: str):
+    """A ``transcribe`` mock that drains the streamed body it is given."""
+    bodies = []
+
+    async def transcribe(body, language=None):
+        bodies.append((b"".join([chunk async for chunk in body]), language))
+        return text
+
+    return AsyncMock(side_effect=transcribe), bodies
+
+
 # ---------------------------------------------------------------------------
 # Modal STT Endpoint Tests
 # ---------------------------------------------------------------------------
@@ -56,8 +67,8 @@ class TestModalSTTEndpoint:
         mock_modal_stt_service: MagicMock,
     ) -> None:
         """Test successful audio transcription via Modal."""
-        mock_modal_stt_service.transcribe = AsyncMock(
-            return_value="Hello world this is a test."
+        mock_modal_stt_service.transcribe, bodies = streaming_transcribe(
+            "Hello world this is a test."
         )
 
         app.dependency_overrides[get_modal_stt_service] = lambda: mock_modal_stt_service
@@ -76,9 +87,7 @@ class TestModalSTTEndpoint:
             json_response = response.json()
             assert json_response["audio_transcription"] == "Hello world this is a test."
 
-            mock_modal_stt_service.transcribe.assert_called_once_with(
-                audio_content, language=None
-            )
+            assert bodies == [(audio_content, None)]
 
         finally:
             app.dependency_overrides.pop(get_modal_stt_service, None)
@@ -252,7 +261,7 @@ class TestModalSTTLanguageParam:
         mock_modal_stt_service: MagicMock,
     ) -> None:
         """Test that a language code is forwarded to the service."""
-        mock_modal_stt_service.transcribe = AsyncMock(return_value="Oli otya")
+        mock_modal_stt_service.transcribe, bodies = streaming_transcribe("Oli otya")
 
         app.dependency_overrides[get_modal_stt_service] = lambda: mock_modal_stt_service
 
@@ -271,9 +280,7 @@ class TestModalSTTLanguageParam:
             assert response.status_code == 200
             assert response.json()["audio_transcription"] == "Oli otya"
 
-            mock_modal_stt_service.transcribe.assert_called_once_with(
-                audio_content, language="lug"
-            )
+            assert bodies == [(audio_content, "lug")]
 
         finally:
             app.dependency_overrides.pop(get_modal_stt_service, None)
@@ -286,7 +293,7 @@ class TestModalSTTLanguageParam:
         mock_modal_stt_service: MagicMock,
     ) -> None:
         """Test that a full language name is forwarded to the service."""
-        mock_modal_stt_service.transcribe = AsyncMock(return_value="Hello world")
+        mock_modal_stt_service.transcribe, bodies = streaming_transcribe("Hello world")
 
         app.dependency_overrides[get_modal_stt_service] = lambda: mock_modal_stt_service
 
@@ -305,9 +312,7 @@ class TestModalSTTLanguageParam:
             assert response.status_code == 200
             assert response.json()["audio_transcription"] == "Hello world"
 
-            mock_modal_stt_service.transcribe.assert_called_once_with(
-                audio_content, language="English"
-            )
+            assert bodies == [(audio_content, "English")]
 
         finally:
             app.dependency_overrides.pop(get_modal_stt_service, None)
@@ -320,7 +325,9 @@ class TestModalSTTLanguageParam:
         mock_modal_stt_service: MagicMock,
     ) -> None:
         """Test that omitting language defaults to None (auto-detect)."""
-        mock_modal_stt_service.transcribe = AsyncMock(return_value="Auto detected")
+        mock_modal_stt_service.transcribe, bodies = streaming_transcribe(
+            "Auto detected"
+        )
 
         app.dependency_overrides[get_modal_stt_service] = lambda: mock_modal_stt_service
 
@@ -334,9 +341,7 @@ class TestModalSTTLanguageParam:
             )
 
             assert response.status_code == 200
-            mock_modal_stt_service.transcribe.assert_called_once_with(
-                b"audio", language=None
-            )
+            assert bodies == [(b"audio", None)]
 
         finally:
             app.dependency_overrides.pop(get_modal_stt_service, None)
@@ -38,7 +38,7 @@ def mock_stt_service() -> MagicMock:
     """
     service = MagicMock(spec=STTService)
     service.validate_audio_file = MagicMock()
-    service.transcribe_uploaded_file = AsyncMock()
+    service.transcribe_upload_stream = AsyncMock()
     service.transcribe_from_gcs = AsyncMock()
     service.transcribe_org_audio = AsyncMock()
     return service
@@ -74,7 +74,7 @@ class TestSTTEndpoint:
         sample_transcription_result: TranscriptionResult,
     ) -> None:
         """Test successful audio transcription."""
-        mock_stt_service.transcribe_uploaded_file = AsyncMock(
+        mock_stt_service.transcribe_upload_stream = AsyncMock(
             return_value=sample_transcription_result
         )
 
@@ -103,7 +103,7 @@ class TestSTTEndpoint:
 
             # Verify service was called
             mock_stt_service.validate_audio_file.assert_called_once()
-            mock_stt_service.transcribe_uploaded_file.assert_called_once()
+            mock_stt_service.transcribe_upload_stream.assert_called_once()
 
         finally:
             # Clean up dependency override
@@ -150,7 +150,7 @@ class TestSTTEndpoint:
         mock_stt_service: MagicMock,
     ) -> None:
         """Test that audio processing error returns 400 Bad Request."""
-        mock_stt_service.transcribe_uploaded_file = AsyncMock(
+        mock_stt_service.transcribe_upload_stream = AsyncMock(
             side_effect=AudioProcessingError("Could not decode audio file")
         )
 
@@ -182,7 +182,7 @@ class TestSTTEndpoint:
         mock_stt_service: MagicMock,
     ) -> None:
         """Test that transcription error returns 502 Service Unavailable."""
-        mock_stt_service.transcribe_uploaded_file = AsyncMock(
+        mock_stt_service.transcribe_upload_stream = AsyncMock(
             side_effect=TranscriptionError("Transcription service timed out")
         )
 
@@ -241,7 +241,7 @@ class TestSTTEndpoint:
             was_trimmed=True,
             original_duration=15.5,
         )
-        mock_stt_service.transcribe_uploaded_file = AsyncMock(
+        mock_stt_service.transcribe_upload_stream = AsyncMock(
             return_value=trimmed_result
         )
 
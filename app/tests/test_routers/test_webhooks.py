@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from httpx import AsyncClient
 
+from app.integrations.runpod_webhooks import get_completion_hub, reset_completion_hub
 from app.routers import webhooks as webhooks_module
 from app.services.message_processor import ProcessingResult, ResponseType
 
@@ -740,3 +741,71 @@ class TestWebhookSignatureVerification:
         assert response.status_code == 200
         assert response.json()["status"] == "success"
         mock_processor.process_message.assert_awaited_once()
+
+
+class TestRunPodCompletionWebhook:
+    """Tests for POST /tasks/webhooks/runpod."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_hub(self):
+        reset_completion_hub()
+        yield get_completion_hub()
+        reset_completion_hub()
+
+    @pytest.mark.asyncio
+    async def test_callback_resolves_waiting_job(
+        self, async_client: AsyncClient, fresh_hub, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(webhooks_module.settings, "runpod_webhook_secret", "tok")
+        future = fresh_hub.expect("job-1")
+
+        response = await async_client.post(
+            "/tasks/webhooks/runpod/tok",
+            json={"id": "job-1", "status": "COMPLETED", "output": {"text": "hi"}},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "delivered": True}
+        assert future.result()["output"] == {"text": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_wrong_token_is_rejected(
+        self, async_client: AsyncClient, fresh_hub, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(webhooks_module.settings, "runpod_webhook_secret", "tok")
+        future = fresh_hub.expect("job-1")
+
+        response = await async_client.post(
+            "/tasks/webhooks/runpod/nope",
+            json={"id": "job-1", "status": "COMPLETED"},
+        )
+
+        assert response.status_code == 403
+        assert not future.done()
+
+    @pytest.mark.asyncio
+    async def test_body_without_job_id_is_rejected(
+        self, async_client: AsyncClient, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(webhooks_module.settings, "runpod_webhook_secret", "tok")
+
+        response = await async_client.post(
+            "/tasks/webhooks/runpod/tok", json={"status": "COMPLETED"}
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_refused_without_configured_secret(
+        self, async_client: AsyncClient, fresh_hub, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(webhooks_module.settings, "runpod_webhook_secret", "")
+        future = fresh_hub.expect("job-1")
+
+        response = await async_client.post(
+            "/tasks/webhooks/runpod/anything",
+            json={"id": "job-1", "status": "COMPLETED", "output": {"text": "x"}},
+        )
+
+        assert response.status_code == 403
+        assert not future.done()
@@ -14,7 +14,7 @@ def healthy_safe_redis():
 
 
 async def test_set_and_get_roundtrip(healthy_safe_redis):
-    await healthy_safe_redis.set("foo", "bar", ex=30)
+    assert await healthy_safe_redis.set("foo", "bar", ex=30) is True
     assert await healthy_safe_redis.get("foo") == "bar"
 
 
@@ -92,3 +92,31 @@ def test_init_uses_async_client_not_sync():
     backend = module.aioredis.from_url("redis://localhost:6379/0")
     assert isinstance(backend, redis.asyncio.client.Redis)
     assert not isinstance(backend, redis.client.Redis)
+
+
+async def test_set_if_absent_only_sets_once(healthy_safe_redis):
+    assert await healthy_safe_redis.set_if_absent("lock", "1", ex=30) is True
+    assert await healthy_safe_redis.set_if_absent("lock", "2", ex=30) is False
+    assert await healthy_safe_redis.get("lock") == "1"
+
+
+async def test_set_if_absent_returns_none_on_error():
+    class BrokenBackend:
+        async def set(self, *args, **kwargs):
+            raise redis.exceptions.ConnectionError("upstream down")
+
+    safe = SafeRedis(BrokenBackend())
+    assert await safe.set_if_absent("lock", "1") is None
+
+
+async def test_publish_returns_subscriber_count(healthy_safe_redis):
+    assert await healthy_safe_redis.publish("channel", "hello") == 0
+
+
+async def test_publish_returns_none_on_error():
+    class BrokenBackend:
+        async def publish(self, *args, **kwargs):
+            raise redis.exceptions.ConnectionError("upstream down")
+
+    safe = SafeRedis(BrokenBackend())
+    assert await safe.publish("channel", "hello") is None
@@ -0,0 +1,137 @@
+"""Tests for the shared audio worker pool."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+from pydub import AudioSegment
+from pydub.exceptions import CouldntDecodeError
+from pydub.generators import Sine
+
+from app.services.audio_worker import (
+    AudioWorker,
+    AudioWorkerBusyError,
+    AudioWorkerTimeoutError,
+)
+
+
+@pytest.fixture
+def wav_path():
+    """Four seconds of 44.1 kHz stereo tone and silence."""
+    tone = Sine(440).to_audio_segment(duration=1500, volume=-10)
+    audio = (tone + AudioSegment.silent(duration=1000) + tone).set_channels(2)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        path = f.name
+    audio.set_frame_rate(44100).export(path, format="wav")
+    yield path
+    os.remove(path)
+
+
+@pytest.fixture
+def out_path():
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        path = f.name
+    yield path
+    if os.path.exists(path):
+        os.remove(path)
+
+
+async def test_probe_trim_and_resample(wav_path, out_path) -> None:
+    worker = AudioWorker(processes=0)
+    try:
+        info = await worker.probe(wav_path)
+        assert info.duration_seconds == pytest.approx(4.0, abs=0.01)
+
+        result = await worker.trim(wav_path, out_path, 2, "wav")
+        assert result.trimmed is True
+        assert result.duration_seconds == pytest.approx(4.0, abs=0.01)
+        assert len(AudioSegment.from_file(out_path)) == 2000
+
+        await worker.resample(wav_path, out_path, frame_rate=16000)
+        resampled = AudioSegment.from_file(out_path)
+        assert (resampled.frame_rate, resampled.channels) == (16000, 1)
+    finally:
+        worker.close()
+
+
+async def test_split_exports_chunks(wav_path) -> None:
+    worker = AudioWorker(processes=0)
+    try:
+        chunks = await worker.split(wav_path, 60_000, 1500, 3000, 16000)
+        try:
+            assert chunks.duration_ms == 4000
+            assert chunks.spans[0][0] == 0 and chunks.spans[-1][1] == 4000
+            assert len(chunks.paths) == len(chunks.spans) >= 2
+            assert all(os.path.exists(path) for path in chunks.paths)
+        finally:
+            for path in chunks.paths:
+                os.remove(path)
+    finally:
+        worker.close()
+
+
+async def test_decode_errors_propagate_and_are_counted(wav_path, out_path) -> None:
+    worker = AudioWorker(processes=0)
+    try:
+        with patch(
+            "app.utils.audio_ops.AudioSegment.from_file",
+            side_effect=CouldntDecodeError("Decoding failed"),
+        ):
+            with pytest.raises(CouldntDecodeError):
+                await worker.trim(wav_path, out_path, 1, "wav")
+    finally:
+        worker.close()
+
+    stats = worker.snapshot()["operations"]["trim"]
+    assert (stats["completed"], stats["failed"]) == (0, 1)
+
+
+async def test_full_queue_rejects_new_jobs(wav_path) -> None:
+    worker = AudioWorker(processes=0, max_queue=1)
+    release = threading.Event()
+    try:
+        blocked = asyncio.create_task(worker._run(release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AudioWorkerBusyError):
+            await worker.probe(wav_path)
+
+        release.set()
+        await blocked
+        assert (await worker.probe(wav_path)).duration_seconds > 0
+    finally:
+        release.set()
+        worker.close()
+
+    snapshot = worker.snapshot()
+    assert snapshot["rejected"] == 1
+    assert snapshot["peak_in_flight"] == 1
+    assert snapshot["in_flight"] == 0
+
+
+async def test_timeout_raises_typed_error() -> None:
+    worker = AudioWorker(processes=0, timeout_seconds=0.05)
+    release = threading.Event()
+    try:
+        with pytest.raises(AudioWorkerTimeoutError) as exc_info:
+            await worker._run(release.wait)
+    finally:
+        release.set()
+        worker.close()
+
+    assert exc_info.value.status_code == 503
+    assert worker.snapshot()["timeouts"] == 1
+
+
+async def test_runs_in_a_separate_process(wav_path) -> None:
+    worker = AudioWorker(processes=1)
+    try:
+        info = await worker.probe(wav_path)
+    finally:
+        worker.close()
+
+    assert info.duration_seconds == pytest.approx(4.0, abs=0.01)
+    assert worker.snapshot()["mode"] == "process"
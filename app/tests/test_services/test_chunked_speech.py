@@ -0,0 +1,126 @@
+"""Tests for chunked, parallel speech synthesis."""
+
+import asyncio
+import io
+import struct
+import wave
+
+import pytest
+
+from app.core.exceptions import ExternalServiceError
+from app.services.chunked_speech import ChunkedSynthesizer
+from app.utils.wav_stitch import read_wav
+
+
+def tone(value: int, frames: int = 240) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(24000)
+        wav.writeframes(struct.pack(f"<{frames}h", *[value] * frames))
+    return buffer.getvalue()
+
+
+def fake_renderer(delays=None):
+    """Renders chunk "N" as a clip of value N after ``delays[N]`` seconds."""
+    calls = []
+    state = {"active": 0, "peak": 0}
+
+    async def render(texts):
+        calls.append(list(texts))
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(max((delays or {}).get(t, 0) for t in texts))
+        finally:
+            state["active"] -= 1
+        return [tone(int(t)) for t in texts]
+
+    return render, calls, state
+
+
+async def test_clips_come_back_in_text_order_with_bounded_fan_out() -> None:
+    render, calls, state = fake_renderer({"1": 0.05, "2": 0.01, "3": 0.03})
+    synth = ChunkedSynthesizer(render, concurrency=2, crossfade_ms=0)
+
+    audio = await synth.synthesize(["1", "2", "3", "4"])
+
+    assert calls[0] == ["1"] and len(calls) == 4
+    assert state["peak"] == 2
+    fmt, pcm = read_wav(audio.wav)
+    values = struct.unpack(f"<{len(pcm) // 2}h", pcm)
+    assert [values[i * 240] for i in range(4)] == [1, 2, 3, 4]
+    assert audio.sample_rate == 24000
+    assert audio.duration_seconds == pytest.approx(0.04)
+    assert audio.chunks == 4
+
+
+async def test_groups_are_rendered_together() -> None:
+    render, calls, _ = fake_renderer()
+    synth = ChunkedSynthesizer(render, group_size=2, crossfade_ms=10)
+
+    audio = await synth.synthesize(["1", "2", "3"])
+
+    assert calls == [["1", "2"], ["3"]]
+    # Three 10 ms clips overlapped by two 10 ms seams.
+    assert audio.duration_seconds == pytest.approx(0.01)
+
+
+async def test_failed_group_is_retried_then_fails_the_text() -> None:
+    attempts = []
+
+    async def flaky(texts):
+        attempts.append(texts)
+        if len(attempts) == 1:
+            raise ExternalServiceError(service_name="TTS", message="boom")
+        return [tone(1) for _ in texts]
+
+    audio = await ChunkedSynthesizer(flaky, retries=1).synthesize(["a"])
+    assert len(attempts) == 2 and audio.chunks == 1
+
+    async def broken(texts):
+        raise ExternalServiceError(service_name="TTS", message="down")
+
+    with pytest.raises(ExternalServiceError):
+        await ChunkedSynthesizer(broken, retries=1).synthesize(["a", "b"])
+
+
+async def test_stream_sends_first_chunk_before_the_rest_finish() -> None:
+    release = asyncio.Event()
+
+    async def render(texts):
+        if texts != ["1"]:
+            await release.wait()
+        return [tone(int(t)) for t in texts]
+
+    stream = ChunkedSynthesizer(render, crossfade_ms=0).stream(["1", "2"])
+    header = await stream.__anext__()
+    first = await stream.__anext__()
+
+    assert header[:4] == b"RIFF" and len(header) == 44
+    assert struct.unpack("<240h", first) == (1,) * 240
+
+    release.set()
+    rest = b"".join([piece async for piece in stream])
+    assert struct.unpack("<240h", rest) == (2,) * 240
+
+
+async def test_stopping_the_stream_cancels_pending_chunks() -> None:
+    cancelled = asyncio.Event()
+
+    async def render(texts):
+        if texts == ["1"]:
+            return [tone(1)]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return [tone(2)]
+
+    stream = ChunkedSynthesizer(render).stream(["1", "2"])
+    await stream.__anext__()
+    await stream.aclose()
+
+    assert cancelled.is_set()
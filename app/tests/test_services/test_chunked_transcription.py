@@ -0,0 +1,235 @@
+"""Tests for chunked long-audio transcription."""
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from app.services.chunked_transcription import (
+    ChunkedTranscriber,
+    merge_diarization,
+    offset_timestamps,
+    stitch_responses,
+)
+from app.services.stt_service import STTService, TranscriptionError
+
+SAMPLE_RESPONSE = json.loads(
+    (Path(__file__).parents[3] / "sample_diarization_output.json").read_text()
+)
+
+
+def _sample_response(words: int = 3) -> dict:
+    """The ASR worker's response shape, cut to its first ``words`` words."""
+    chunks = SAMPLE_RESPONSE["diarization_output"]["chunks"][:words]
+    text = " ".join(c["text"] for c in chunks)
+    return {
+        "audio_transcription": text,
+        "diarization_output": {"chunks": chunks, "text": text},
+        "formatted_diarization_output": (
+            f"**{chunks[0]['speaker']}**\n({chunks[0]['timestamp'][0]}) {text} "
+            f"({chunks[-1]['timestamp'][1]})"
+        ),
+    }
+
+
+class TestStitching:
+    def test_offset_timestamps_shifts_nested_times(self) -> None:
+        value = {
+            "segments": [{"start": 1.0, "end": 2.5, "speaker": "A", "words": []}],
+            "start_time": 0,
+            "flag": True,
+        }
+
+        shifted = offset_timestamps(value, 60)
+
+        assert shifted["segments"][0]["start"] == 61.0
+        assert shifted["segments"][0]["end"] == 62.5
+        assert shifted["segments"][0]["speaker"] == "A"
+        assert shifted["start_time"] == 60
+        assert shifted["flag"] is True
+        assert value["segments"][0]["start"] == 1.0
+
+    def test_stitch_shifts_and_relabels_sample_shaped_output(self) -> None:
+        response = _sample_response()
+        first = response["diarization_output"]["chunks"][0]
+
+        text, diarization, formatted = stitch_responses(
+            [(0, 120_000), (120_000, 240_000)], [response, response]
+        )
+
+        chunks = diarization["chunks"]
+        assert len(chunks) == 6
+        assert chunks[0]["timestamp"] == first["timestamp"]
+        assert chunks[0]["speaker"] == f"C1_{first['speaker']}"
+        assert chunks[3]["timestamp"] == [t + 120 for t in first["timestamp"]]
+        assert chunks[3]["speaker"] == f"C2_{first['speaker']}"
+        assert diarization["text"] == " ".join(
+            [response["diarization_output"]["text"]] * 2
+        )
+        assert text == diarization["text"]
+        assert "(120.46)" in formatted
+        assert f"**C2_{first['speaker']}**" in formatted
+        assert f"**C1_{first['speaker']}**" in formatted.split("\n")[0]
+
+    def test_single_chunk_keeps_speaker_labels(self) -> None:
+        response = _sample_response()
+
+        _, diarization, formatted = stitch_responses([(0, 60_000)], [response])
+
+        assert diarization["chunks"] == response["diarization_output"]["chunks"]
+        assert formatted == response["formatted_diarization_output"]
+
+    def test_offset_keeps_open_ended_timestamps(self) -> None:
+        shifted = offset_timestamps({"chunks": [{"timestamp": [3.5, None]}]}, 10)
+
+        assert shifted["chunks"][0]["timestamp"] == [13.5, None]
+
+    def test_merge_diarization_concatenates_lists(self) -> None:
+        merged = merge_diarization(
+            [
+                {"segments": [{"start": 0}], "model": "x"},
+                {},
+                {"segments": [{"start": 60}], "model": "y"},
+            ]
+        )
+
+        assert merged == {"segments": [{"start": 0}, {"start": 60}], "model": "x"}
+
+
+@pytest.fixture
+def long_wav():
+    """Three 2s tone bursts separated by 0.8s pauses, as a WAV file."""
+    tone = Sine(440).to_audio_segment(duration=2000, volume=-10)
+    pause = AudioSegment.silent(duration=800)
+    audio = tone + pause + tone + pause + tone
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        path = f.name
+    audio.set_frame_rate(16000).export(path, format="wav")
+    yield path
+    os.remove(path)
+
+
+@pytest.fixture
+def small_chunks():
+    with patch("app.services.chunked_transcription.settings") as mock_settings:
+        mock_settings.stt_long_audio_max_minutes = 180
+        mock_settings.stt_chunk_target_seconds = 2
+        mock_settings.stt_chunk_max_seconds = 3
+        mock_settings.stt_chunk_concurrency = 2
+        yield mock_settings
+
+
+class TestChunkedTranscriber:
+    def setup_method(self) -> None:
+        self.service = STTService(
+            runpod_endpoint_id="test-endpoint", audio_bucket_name="test-bucket"
+        )
+
+    async def test_transcribes_chunks_in_parallel_and_stitches(
+        self, long_wav, small_chunks
+    ) -> None:
+        in_flight = 0
+        peak = 0
+        uploads = iter(range(100))
+
+        async def upload(path):
+            assert os.path.exists(path)
+            n = next(uploads)
+            return f"blob-{n}.wav", f"https://example.com/blob-{n}.wav"
+
+        async def call_api(blob_name, **options):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = _sample_response(words=1)
+            response["audio_transcription"] = f"text {blob_name}"
+            return response
+
+        with patch.object(
+            self.service, "upload_to_storage", side_effect=upload
+        ), patch.object(
+            self.service, "call_transcription_api", side_effect=call_api
+        ), patch(
+            "app.services.chunked_transcription.delete_audio_file"
+        ) as delete:
+            result = await ChunkedTranscriber(self.service).transcribe(
+                long_wav, source=("full.wav", "gs://test-bucket/full.wav")
+            )
+
+        assert peak == 2
+        texts = result.transcription.split(" text ")
+        assert len(texts) == 3
+        assert result.blob_name == "full.wav"
+        assert result.audio_url == "gs://test-bucket/full.wav"
+        words = result.diarization_output["chunks"]
+        starts = [w["timestamp"][0] for w in words]
+        assert starts[0] == 0.46
+        assert starts[1] > 2.46 and starts[2] > starts[1] + 2
+        assert [w["speaker"] for w in words] == [f"C{n}_SPEAKER_01" for n in (1, 2, 3)]
+        assert result.formatted_diarization_output.count("**C") == 3
+        assert delete.call_count == 3
+        assert result.was_trimmed is False
+
+    async def test_uploads_original_when_not_in_storage(
+        self, long_wav, small_chunks
+    ) -> None:
+        upload = AsyncMock(return_value=("blob.wav", "https://example.com/blob.wav"))
+        api = AsyncMock(return_value={"audio_transcription": "hi"})
+
+        with patch.object(self.service, "upload_to_storage", upload), patch.object(
+            self.service, "call_transcription_api", api
+        ), patch("app.services.chunked_transcription.delete_audio_file"):
+            result = await ChunkedTranscriber(self.service).transcribe(long_wav)
+
+        assert long_wav in [c.args[0] for c in upload.call_args_list]
+        assert result.transcription == "hi hi hi"
+
+    async def test_all_empty_chunks_raise(self, long_wav, small_chunks) -> None:
+        with patch.object(
+            self.service,
+            "upload_to_storage",
+            AsyncMock(return_value=("b.wav", "u")),
+        ), patch.object(
+            self.service,
+            "call_transcription_api",
+            AsyncMock(return_value={"audio_transcription": ""}),
+        ), patch(
+            "app.services.chunked_transcription.delete_audio_file"
+        ):
+            with pytest.raises(TranscriptionError):
+                await ChunkedTranscriber(self.service).transcribe(long_wav)
+
+
+class TestSTTServiceRouting:
+    async def test_long_upload_is_chunked(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            "app.services.stt_service.settings.stt_chunking_enabled", True
+        )
+        service = STTService(
+            runpod_endpoint_id="test-endpoint", audio_bucket_name="test-bucket"
+        )
+        chunked = MagicMock()
+        chunked.transcribe = AsyncMock(return_value="chunked-result")
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            path = f.name
+
+        with patch(
+            "app.services.stt_service.probe_duration", return_value=3600.0
+        ), patch(
+            "app.services.stt_service.ChunkedTranscriber", return_value=chunked
+        ), patch.object(
+            service, "call_transcription_api", new_callable=AsyncMock
+        ) as api:
+            result = await service.transcribe_uploaded_file(path, ".mp3")
+
+        assert result == "chunked-result"
+        api.assert_not_called()
+        assert not os.path.exists(path)
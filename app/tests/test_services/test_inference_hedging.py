@@ -0,0 +1,281 @@
+"""
+Tests for adaptive timeouts and hedged requests in InferenceService.
+
+Requests go through the real OpenAI client to a local fake OpenAI-compatible
+server, so timeouts, hedging and loser cancellation are exercised end to end.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from openai import APITimeoutError
+
+import app.services.inference_service as inference_module
+from app.services.inference_service import (
+    InferenceService,
+    LatencyTracker,
+    hedging_enabled,
+    latency_size_class,
+)
+from app.utils.execution_usage import start_execution_tracking, stop_execution_tracking
+
+
+class FakeSunflowerServer:
+    """Minimal OpenAI-compatible chat completions server with scripted delays."""
+
+    def __init__(self, delays: List[float]) -> None:
+        self.delays = list(delays)
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:  # silence test output
+                pass
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("content-length", 0))
+                self.rfile.read(length)
+                with server._lock:
+                    index = server.requests
+                    server.requests += 1
+                delay = server.delays[index] if index < len(server.delays) else 0.0
+                time.sleep(delay)
+                body = json.dumps(
+                    {
+                        "id": f"chatcmpl-{index}",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": "Sunbird/Sunflower-14B",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": f"reply {index}",
+                                },
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": 1,
+                            "completion_tokens": 1,
+                            "total_tokens": 2,
+                        },
+                    }
+                ).encode()
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client gave up (timeout or hedge loser)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}/v2"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FakeSunflowerServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def fast_settings(monkeypatch):
+    """Tight bounds so adaptive behaviour is observable in milliseconds."""
+    settings = inference_module.settings
+    monkeypatch.setattr(settings, "sunflower_latency_min_samples", 5)
+    monkeypatch.setattr(settings, "sunflower_min_timeout_seconds", 0.3)
+    monkeypatch.setattr(settings, "sunflower_timeout_p99_multiplier", 3.0)
+    monkeypatch.setattr(settings, "sunflower_hedge_min_delay_seconds", 0.1)
+    return settings
+
+
+def _service(base_url: str) -> InferenceService:
+    service = InferenceService(runpod_api_key="test-key", qwen_endpoint_id="sf")
+    service.api_base_url = base_url
+    return service
+
+
+def _prime(service: InferenceService, seconds: float, count: int = 10) -> None:
+    tracker = service.latency_tracker("sf")
+    for _ in range(count):
+        tracker.record(seconds)
+
+
+PAYLOAD = {
+    "model": "Sunbird/Sunflower-14B",
+    "messages": [{"role": "user", "content": "Hello"}],
+    "temperature": 0.3,
+    "stream": False,
+}
+
+
+class TestLatencyTracker:
+    """Unit tests for the rolling latency window."""
+
+    def test_no_percentiles_until_min_samples(self, fast_settings):
+        tracker = LatencyTracker(window=10, min_samples=5)
+        for _ in range(4):
+            tracker.record(1.0)
+        assert tracker.percentile(95) is None
+        assert tracker.hedge_delay() is None
+        assert tracker.timeout() == fast_settings.sunflower_default_timeout_seconds
+
+    def test_percentiles_over_window(self, fast_settings):
+        tracker = LatencyTracker(window=100, min_samples=5)
+        for value in range(1, 101):
+            tracker.record(value / 100)
+        assert tracker.percentile(50) == 0.5
+        assert tracker.percentile(95) == 0.95
+        assert tracker.percentile(99) == 0.99
+
+    def test_window_drops_old_samples(self, fast_settings):
+        tracker = LatencyTracker(window=5, min_samples=5)
+        for value in (9.0, 9.0, 9.0, 9.0, 9.0, 1.0, 1.0, 1.0, 1.0, 1.0):
+            tracker.record(value)
+        assert tracker.percentile(99) == 1.0
+
+    def test_timeout_clamped(self, fast_settings):
+        tracker = LatencyTracker(window=10, min_samples=5)
+        for _ in range(5):
+            tracker.record(0.01)
+        assert tracker.timeout() == 0.3  # min bound
+        for _ in range(10):
+            tracker.record(10_000.0)
+        assert tracker.timeout() == fast_settings.sunflower_default_timeout_seconds
+
+    def test_size_classes(self):
+        assert latency_size_class(None) is None
+        assert latency_size_class(100) == "<=512"
+        assert latency_size_class(512) == "<=512"
+        assert latency_size_class(4096) == "<=8192"
+        assert latency_size_class(32_000) == ">8192"
+
+    def test_hedging_enabled_per_route(self, monkeypatch):
+        monkeypatch.setattr(
+            inference_module.settings,
+            "sunflower_hedge_routes_raw",
+            "chat_completions, translate",
+        )
+        assert hedging_enabled("chat_completions") is True
+        assert hedging_enabled("translate") is True
+        assert hedging_enabled("whatsapp") is False
+
+
+class TestAdaptiveTimeouts:
+    """Adaptive per-request timeouts against the fake server."""
+
+    def test_latency_recorded_on_success(self, fast_settings):
+        with FakeSunflowerServer([0.0]) as server:
+            service = _service(server.base_url)
+            response = service._create_completion("qwen", dict(PAYLOAD))
+        assert response.choices[0].message.content == "reply 0"
+        assert service.latency_tracker("sf").sample_count == 1
+
+    def test_completion_time_is_recorded_against_the_endpoint(self, fast_settings):
+        usage = start_execution_tracking()
+        try:
+            with FakeSunflowerServer([0.05]) as server:
+                service = _service(server.base_url)
+                service._create_completion("qwen", dict(PAYLOAD))
+        finally:
+            stop_execution_tracking()
+        assert usage.jobs == 1
+        assert usage.by_upstream["sf"] >= 0.05
+
+    def test_slow_request_times_out_at_adaptive_limit(self, fast_settings):
+        with FakeSunflowerServer([2.0]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.05)
+            start = time.monotonic()
+            with pytest.raises(APITimeoutError):
+                service._create_completion("qwen", dict(PAYLOAD))
+            elapsed = time.monotonic() - start
+        assert elapsed < 1.5
+        # The timeout is recorded at its cutoff so the window adapts upward.
+        assert service.latency_tracker("sf").sample_count == 11
+
+    def test_long_generation_is_not_timed_out_by_short_latencies(self, fast_settings):
+        with FakeSunflowerServer([0.6]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.05)  # short requests: timeout would be 0.3s
+            response = service._create_completion(
+                "qwen", dict(PAYLOAD, max_tokens=4096)
+            )
+        assert response.choices[0].message.content == "reply 0"
+        assert service.latency_tracker("sf", 4096).sample_count == 1
+        assert service.latency_tracker("sf").sample_count == 10
+
+    def test_error_mentioning_timeout_is_not_recorded(self, fast_settings):
+        service = _service("http://127.0.0.1:9/v2")
+        _prime(service, 0.05)
+        client = MagicMock()
+        client.chat.completions.create.side_effect = ValueError(
+            "400: 'timeout' is not a valid parameter"
+        )
+        with patch.object(service, "_get_client", return_value=client):
+            with pytest.raises(ValueError):
+                service._create_completion("qwen", dict(PAYLOAD))
+        assert service.latency_tracker("sf").sample_count == 10
+
+    def test_ping_bypasses_latency_window_and_hedging(self, fast_settings):
+        with FakeSunflowerServer([0.3, 0.0]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.05)
+            service.ping()
+            assert server.requests == 1
+        assert service.latency_tracker("sf").sample_count == 10
+
+
+class TestHedgedRequests:
+    """Hedging: first response wins, loser is abandoned."""
+
+    def test_hedge_wins_when_primary_is_slow(self, fast_settings):
+        with FakeSunflowerServer([2.0, 0.0]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.05)
+            fast_settings.sunflower_min_timeout_seconds = 5.0
+            start = time.monotonic()
+            response = service._create_completion("qwen", dict(PAYLOAD), hedge=True)
+            elapsed = time.monotonic() - start
+            assert server.requests == 2
+        assert response.choices[0].message.content == "reply 1"
+        assert elapsed < 1.5
+
+    def test_no_hedge_when_primary_is_fast(self, fast_settings):
+        with FakeSunflowerServer([0.0, 0.0]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.5)
+            response = service._create_completion("qwen", dict(PAYLOAD), hedge=True)
+            assert server.requests == 1
+        assert response.choices[0].message.content == "reply 0"
+
+    def test_no_hedge_without_latency_history(self, fast_settings):
+        with FakeSunflowerServer([0.3, 0.0]) as server:
+            service = _service(server.base_url)
+            response = service._create_completion("qwen", dict(PAYLOAD), hedge=True)
+            assert server.requests == 1
+        assert response.choices[0].message.content == "reply 0"
+
+    def test_run_inference_passes_hedge_flag(self, fast_settings):
+        with FakeSunflowerServer([2.0, 0.0]) as server:
+            service = _service(server.base_url)
+            _prime(service, 0.05)
+            fast_settings.sunflower_min_timeout_seconds = 5.0
+            result = service.run_inference(
+                messages=[{"role": "user", "content": "Hello"}], hedge=True
+            )
+        assert result["content"] == "reply 1"
@@ -211,6 +211,15 @@ class TestRunInferenceStream:
         assert kwargs["temperature"] == 0.5
         assert kwargs["max_tokens"] == 64
 
+    def test_opening_a_stream_records_endpoint_activity(self) -> None:
+        service = self._service_with_chunks([_make_chunk(content="x")])
+        with patch("app.services.inference_service.record_endpoint_activity") as record:
+            gen = service.run_inference_stream(
+                messages=[{"role": "user", "content": "Hi"}]
+            )
+            next(gen)
+        record.assert_called_once_with("sunflower")
+
     def test_unsupported_model_type_raises_value_error(self) -> None:
         service = InferenceService(
             runpod_api_key="test-key", qwen_endpoint_id="test-endpoint"
@@ -0,0 +1,188 @@
+"""
+Tests for the keep-warm scheduler.
+
+A fake clock and fake pingers stand in for RunPod and Modal so policy
+decisions can be checked without network calls.
+"""
+
+import datetime as dt
+from zoneinfo import ZoneInfo
+
+import fakeredis.aioredis
+import pytest
+
+import app.services.keep_warm_service as keep_warm_module
+from app.services.keep_warm_service import (
+    KeepWarmScheduler,
+    WarmPolicy,
+    _delay_seconds,
+    _observe_runpod_job,
+)
+from app.services.redis_client import SafeRedis
+
+KAMPALA = ZoneInfo("Africa/Kampala")
+
+
+class FakeClock:
+    def __init__(self, local: dt.datetime) -> None:
+        self.value = local.replace(tzinfo=KAMPALA).timestamp()
+
+    def __call__(self) -> float:
+        return self.value
+
+    def advance(self, seconds: float) -> None:
+        self.value += seconds
+
+
+class FakePinger:
+    def __init__(self, delay=None, error=None) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        # Activity recorded while pinging must not count as real traffic.
+        keep_warm_module.record_endpoint_activity("asr")
+        if self.error:
+            raise self.error
+        return self.delay
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    monkeypatch.setattr(keep_warm_module, "get_redis_client", lambda: None)
+
+
+def _scheduler(clock, pinger, policy=None):
+    return KeepWarmScheduler(
+        pingers={"asr": pinger},
+        policies={"asr": policy or WarmPolicy()},
+        timezone="Africa/Kampala",
+        now=clock,
+    )
+
+
+# Tuesday 10:00 and 02:00 local time.
+BUSINESS = dt.datetime(2026, 10, 13, 10, 0)
+NIGHT = dt.datetime(2026, 10, 13, 2, 0)
+
+
+class TestWarmPolicy:
+    def test_overrides_ignore_unknown_keys(self):
+        policy = WarmPolicy.from_overrides(
+            {"idle_gap_seconds": 60, "business_days": [0, 1], "bogus": 1}
+        )
+        assert policy.idle_gap_seconds == 60
+        assert policy.business_days == (0, 1)
+        assert policy.business_hours_start == WarmPolicy().business_hours_start
+
+    def test_delay_seconds_from_job_details(self):
+        assert _delay_seconds({"delayTime": 12500}) == 12.5
+        assert _delay_seconds({}) is None
+
+
+class TestScheduling:
+    async def test_pings_in_business_hours(self):
+        clock, pinger = FakeClock(BUSINESS), FakePinger(delay=0.2)
+        scheduler = _scheduler(clock, pinger)
+
+        assert await scheduler.tick() == ["asr"]
+        assert pinger.calls == 1
+        # Within the idle gap nothing is due.
+        clock.advance(60)
+        assert await scheduler.tick() == []
+        clock.advance(WarmPolicy().idle_gap_seconds)
+        assert await scheduler.tick() == ["asr"]
+
+    async def test_no_pings_at_night_without_traffic(self):
+        scheduler = _scheduler(FakeClock(NIGHT), FakePinger())
+        assert scheduler.in_business_hours("asr") is False
+        assert await scheduler.tick() == []
+
+    async def test_traffic_keeps_endpoint_warm_after_hours(self):
+        clock, pinger = FakeClock(NIGHT), FakePinger()
+        scheduler = _scheduler(clock, pinger)
+        scheduler.record_activity("asr")
+
+        clock.advance(WarmPolicy().idle_gap_seconds)
+        assert await scheduler.tick() == ["asr"]
+        clock.advance(WarmPolicy().warm_after_traffic_seconds)
+        assert await scheduler.tick() == []
+
+    async def test_real_traffic_resets_idle_clock(self):
+        clock, pinger = FakeClock(BUSINESS), FakePinger()
+        scheduler = _scheduler(clock, pinger)
+        scheduler.record_activity("asr")
+        clock.advance(WarmPolicy().idle_gap_seconds - 1)
+        assert scheduler.is_due("asr") is False
+
+    async def test_disabled_policy_never_pings(self):
+        scheduler = _scheduler(
+            FakeClock(BUSINESS), FakePinger(), WarmPolicy(enabled=False)
+        )
+        assert await scheduler.tick() == []
+
+
+class TestPing:
+    async def test_cold_start_detected_from_delay(self):
+        clock, pinger = FakeClock(BUSINESS), FakePinger(delay=45.0)
+        scheduler = _scheduler(clock, pinger)
+        await scheduler.ping("asr")
+
+        state = scheduler.snapshot()["endpoints"][0]
+        assert state["cold_starts"] == 1
+        assert state["last_delay_seconds"] == 45.0
+        assert state["last_ping_ok"] is True
+
+    async def test_ping_does_not_count_as_traffic(self, monkeypatch):
+        clock, pinger = FakeClock(BUSINESS), FakePinger()
+        scheduler = _scheduler(clock, pinger)
+        monkeypatch.setattr(keep_warm_module, "_scheduler", scheduler)
+        await scheduler.ping("asr")
+        assert scheduler.snapshot()["endpoints"][0]["last_traffic_at"] is None
+
+    async def test_failure_recorded(self):
+        clock = FakeClock(BUSINESS)
+        scheduler = _scheduler(clock, FakePinger(error=RuntimeError("loading")))
+        assert await scheduler.ping("asr") is True
+
+        state = scheduler.snapshot()["endpoints"][0]
+        assert state["ping_failures"] == 1
+        assert state["last_error"] == "loading"
+        assert state["in_flight"] is False
+
+    async def test_redis_lock_coordinates_instances(self, monkeypatch):
+        redis = SafeRedis(fakeredis.aioredis.FakeRedis(decode_responses=True))
+        monkeypatch.setattr(keep_warm_module, "get_redis_client", lambda: redis)
+        clock = FakeClock(BUSINESS)
+        first, second = FakePinger(), FakePinger()
+
+        assert await _scheduler(clock, first).tick() == ["asr"]
+        assert await _scheduler(clock, second).tick() == []
+        assert (first.calls, second.calls) == (1, 0)
+
+    async def test_runpod_observer_records_asr_traffic(self, monkeypatch):
+        clock = FakeClock(BUSINESS)
+        scheduler = _scheduler(clock, FakePinger())
+        monkeypatch.setattr(keep_warm_module, "_scheduler", scheduler)
+        endpoint_id = keep_warm_module.get_runpod_client().endpoint_id or "ep"
+        monkeypatch.setattr(
+            keep_warm_module.get_runpod_client(), "endpoint_id", endpoint_id
+        )
+
+        _observe_runpod_job(endpoint_id, {"delayTime": 30000})
+        _observe_runpod_job("other-endpoint", {"delayTime": 30000})
+
+        state = scheduler.snapshot()["endpoints"][0]
+        assert state["last_traffic_at"] == clock()
+        assert state["cold_starts"] == 1
+
+
+class TestLifecycle:
+    async def test_start_and_stop(self):
+        scheduler = _scheduler(FakeClock(NIGHT), FakePinger())
+        scheduler.start()
+        assert scheduler.running is True
+        await scheduler.stop()
+        assert scheduler.running is False
@@ -7,7 +7,7 @@ classification, audio language detection, and error handling.
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -168,29 +168,21 @@ class TestLanguageIdentificationAPI:
     @pytest.mark.asyncio
     async def test_successful_language_identification(self) -> None:
         """Test successful language identification API call."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value={"language": "lug"})
+        mock_run = AsyncMock(return_value={"language": "lug"})
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             result = await self.service.identify_language(text="Oli otya?")
 
             assert result.language == "lug"
             assert result.raw_response == {"language": "lug"}
-            mock_endpoint.run_sync.assert_called_once()
+            mock_run.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_language_identification_timeout_raises_error(self) -> None:
         """Test that timeout raises LanguageTimeoutError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
-            side_effect=TimeoutError("Request timed out")
-        )
+        mock_run = AsyncMock(side_effect=TimeoutError("Request timed out"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with pytest.raises(LanguageTimeoutError) as exc_info:
                 await self.service.identify_language(text="Hello")
 
@@ -201,12 +193,9 @@ class TestLanguageIdentificationAPI:
         self,
     ) -> None:
         """Test that generic error raises LanguageError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(side_effect=Exception("Unknown error"))
+        mock_run = AsyncMock(side_effect=Exception("Unknown error"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with pytest.raises(LanguageError) as exc_info:
                 await self.service.identify_language(text="Hello")
 
@@ -217,12 +206,9 @@ class TestLanguageIdentificationAPI:
         self,
     ) -> None:
         """Test that None response returns 'unknown' language."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value=None)
+        mock_run = AsyncMock(return_value=None)
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             result = await self.service.identify_language(text="Test")
 
             assert result.language == "unknown"
@@ -241,14 +227,11 @@ class TestLanguageClassificationAPI:
     @pytest.mark.asyncio
     async def test_successful_language_classification(self) -> None:
         """Test successful language classification API call."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
+        mock_run = AsyncMock(
             return_value={"predictions": {"lug": 0.95, "eng": 0.03, "ach": 0.02}}
         )
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             result = await self.service.classify_language(text="Oli otya?")
 
             assert result.language == "lug"
@@ -258,14 +241,11 @@ class TestLanguageClassificationAPI:
     @pytest.mark.asyncio
     async def test_language_classification_below_threshold(self) -> None:
         """Test classification returns 'language not detected' when below threshold."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
+        mock_run = AsyncMock(
             return_value={"predictions": {"lug": 0.5, "eng": 0.3, "ach": 0.2}}
         )
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             result = await self.service.classify_language(text="Test text")
 
             assert result.language == "language not detected"
@@ -274,28 +254,20 @@ class TestLanguageClassificationAPI:
     @pytest.mark.asyncio
     async def test_language_classification_normalizes_text_to_lowercase(self) -> None:
         """Test that text is normalized to lowercase before classification."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value={"predictions": {"eng": 0.95}})
+        mock_run = AsyncMock(return_value={"predictions": {"eng": 0.95}})
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             await self.service.classify_language(text="HELLO WORLD")
 
-            call_args = mock_endpoint.run_sync.call_args[0][0]
+            call_args = mock_run.call_args[0][0]
             assert call_args["input"]["text"] == "hello world"
 
     @pytest.mark.asyncio
     async def test_language_classification_timeout_raises_error(self) -> None:
         """Test that timeout raises LanguageTimeoutError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
-            side_effect=TimeoutError("Request timed out")
-        )
+        mock_run = AsyncMock(side_effect=TimeoutError("Request timed out"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with pytest.raises(LanguageTimeoutError) as exc_info:
                 await self.service.classify_language(text="Hello")
 
@@ -304,12 +276,9 @@ class TestLanguageClassificationAPI:
     @pytest.mark.asyncio
     async def test_language_classification_invalid_response_raises_error(self) -> None:
         """Test that invalid response raises LanguageDetectionError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value={"invalid": "response"})
+        mock_run = AsyncMock(return_value={"invalid": "response"})
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with pytest.raises(LanguageDetectionError) as exc_info:
                 await self.service.classify_language(text="Hello")
 
@@ -320,12 +289,9 @@ class TestLanguageClassificationAPI:
         self,
     ) -> None:
         """Test that generic error raises LanguageError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(side_effect=Exception("Unknown error"))
+        mock_run = AsyncMock(side_effect=Exception("Unknown error"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with pytest.raises(LanguageError) as exc_info:
                 await self.service.classify_language(text="Hello")
 
@@ -344,12 +310,9 @@ class TestAudioLanguageDetectionAPI:
     @pytest.mark.asyncio
     async def test_successful_audio_language_detection(self) -> None:
         """Test successful audio language detection API call."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value={"detected_language": "lug"})
+        mock_run = AsyncMock(return_value={"detected_language": "lug"})
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch(
                 "app.services.language_service.upload_audio_file",
                 return_value=(
@@ -380,14 +343,9 @@ class TestAudioLanguageDetectionAPI:
     @pytest.mark.asyncio
     async def test_audio_language_detection_timeout_raises_error(self) -> None:
         """Test that timeout raises LanguageTimeoutError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
-            side_effect=TimeoutError("Request timed out")
-        )
+        mock_run = AsyncMock(side_effect=TimeoutError("Request timed out"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch(
                 "app.services.language_service.upload_audio_file",
                 return_value=(
@@ -403,14 +361,9 @@ class TestAudioLanguageDetectionAPI:
     @pytest.mark.asyncio
     async def test_audio_language_detection_connection_error_raises_error(self) -> None:
         """Test that connection error raises LanguageConnectionError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(
-            side_effect=ConnectionError("Connection refused")
-        )
+        mock_run = AsyncMock(side_effect=ConnectionError("Connection refused"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch(
                 "app.services.language_service.upload_audio_file",
                 return_value=(
@@ -428,12 +381,9 @@ class TestAudioLanguageDetectionAPI:
         self,
     ) -> None:
         """Test that generic error raises LanguageError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(side_effect=Exception("Unknown error"))
+        mock_run = AsyncMock(side_effect=Exception("Unknown error"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch(
                 "app.services.language_service.upload_audio_file",
                 return_value=(
@@ -496,12 +446,9 @@ class TestLanguageServiceLogging:
     @pytest.mark.asyncio
     async def test_language_identification_logs_info(self) -> None:
         """Test that language identification logs info messages."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value={"language": "lug"})
+        mock_run = AsyncMock(return_value={"language": "lug"})
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch.object(self.service, "log_info") as mock_log:
                 await self.service.identify_language(text="Hello")
 
@@ -511,12 +458,9 @@ class TestLanguageServiceLogging:
     @pytest.mark.asyncio
     async def test_language_identification_logs_error_on_failure(self) -> None:
         """Test that language identification logs errors on API failure."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(side_effect=Exception("API Error"))
+        mock_run = AsyncMock(side_effect=Exception("API Error"))
 
-        with patch(
-            "app.services.language_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.language_service.run_runpod_job", mock_run):
             with patch.object(self.service, "log_error") as mock_log:
                 with pytest.raises(LanguageError):
                     await self.service.identify_language(text="Hello")
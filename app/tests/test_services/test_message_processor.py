@@ -10,6 +10,7 @@ from app.services.message_processor import (
     ResponseType,
     clear_processed_messages,
 )
+from app.utils import audio_ops
 
 
 @pytest.fixture
@@ -76,6 +77,73 @@ class TestOptimizedMessageProcessor:
         mock_handle_text.assert_awaited_once()
         assert mock_handle_text.await_args.args[-2:] == (False, True)
 
+    def test_optimized_prompt_trimmed_to_token_budget(self, monkeypatch) -> None:
+        import app.utils.token_budget as token_budget
+
+        monkeypatch.setattr(token_budget, "get_tokenizer", lambda: None)
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 1024
+        )
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_completion_reserve_tokens", 512
+        )
+        monkeypatch.setattr(token_budget.settings, "sunflower_min_prompt_tokens", 256)
+        processor = OptimizedMessageProcessor()
+        context = [
+            {"user_message": "u" * 600, "bot_response": "b" * 600} for _ in range(5)
+        ]
+
+        messages = processor._build_optimized_prompt(
+            input_text="Latest?", context=context, memory_note="Earlier: greetings."
+        )
+
+        assert token_budget.count_message_tokens(messages) <= 512
+        assert messages[0]["content"] == processor.system_message
+        assert "Earlier: greetings." in messages[1]["content"]
+        assert messages[-1] == {"role": "user", "content": "Latest?"}
+
+    @pytest.mark.asyncio
+    async def test_sunflower_transient_error_retries_with_compact_prompt(
+        self,
+    ) -> None:
+        processor = OptimizedMessageProcessor()
+        messages = [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "old"},
+            {"role": "assistant", "content": "reply"},
+            {"role": "user", "content": "latest"},
+        ]
+        calls = []
+
+        def fake_inference(messages, model_type):
+            calls.append(messages)
+            if len(calls) == 1:
+                raise RuntimeError("Model is still loading")
+            return {"content": "ok"}
+
+        with patch("app.services.message_processor.run_inference", new=fake_inference):
+            response = await processor._call_sunflower(messages)
+
+        assert response == {"content": "ok"}
+        assert calls[1] == [messages[0], messages[-1]]
+
+    @pytest.mark.asyncio
+    async def test_sunflower_other_errors_are_not_retried(self) -> None:
+        processor = OptimizedMessageProcessor()
+        fake_inference = MagicMock(side_effect=RuntimeError("bad request"))
+
+        with patch("app.services.message_processor.run_inference", new=fake_inference):
+            response = await processor._call_sunflower(
+                [
+                    {"role": "system", "content": "sys"},
+                    {"role": "user", "content": "hi"},
+                    {"role": "user", "content": "again"},
+                ]
+            )
+
+        assert "technical difficulties" in response["content"]
+        assert fake_inference.call_count == 1
+
     @pytest.mark.asyncio
     async def test_set_default_preference_does_not_overwrite_mode_or_tts(self) -> None:
         processor = OptimizedMessageProcessor()
@@ -392,7 +460,7 @@ class TestOrpheusAudioDelivery:
         )
         segment = MagicMock()
         monkeypatch.setattr(
-            mp.AudioSegment, "from_file", MagicMock(return_value=segment)
+            audio_ops.AudioSegment, "from_file", MagicMock(return_value=segment)
         )
         ws = MagicMock()
         ws.upload_media.return_value = {"id": "MEDIA-123"}
@@ -653,7 +721,7 @@ class TestReplyContext:
             proc, "_generate_orpheus_wav_bytes", AsyncMock(return_value=b"WAV")
         )
         monkeypatch.setattr(
-            mp.AudioSegment, "from_file", MagicMock(return_value=MagicMock())
+            audio_ops.AudioSegment, "from_file", MagicMock(return_value=MagicMock())
         )
         ws = MagicMock()
         ws.upload_media.return_value = {"id": "MID"}
@@ -673,11 +741,11 @@ class TestReplyContext:
         ws = MagicMock()
         monkeypatch.setattr(mp, "whatsapp_service", ws)
 
-        endpoint = MagicMock()
-        endpoint.run_sync.side_effect = RuntimeError("asr down")
+        monkeypatch.setattr(
+            mp, "run_runpod_job", AsyncMock(side_effect=RuntimeError("asr down"))
+        )
 
         out = await proc._run_asr_with_retry(
-            endpoint=endpoint,
             transcription_data={"input": {}},
             from_number="256700000001",
             phone_number_id="PNID",
@@ -979,3 +1047,35 @@ class TestInboundDedupReverted:
         # The store dedup helpers are not imported into the processor module.
         assert not hasattr(mp, "claim_inbound_message")
         assert not hasattr(mp, "finalize_inbound_message")
+
+
+class TestVoiceNoteTranscriptionCache:
+    """Forwarded voice notes reuse cached transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_voice_note_round_trip(self, monkeypatch, tmp_path) -> None:
+        from app.services import transcription_cache
+
+        monkeypatch.setattr(transcription_cache, "get_redis_client", lambda: None)
+        monkeypatch.setattr(
+            transcription_cache,
+            "_transcription_cache",
+            transcription_cache.TranscriptionCache(enabled=True),
+        )
+        proc = OptimizedMessageProcessor()
+        note = tmp_path / "note.ogg"
+        note.write_bytes(b"voice note")
+        forwarded = tmp_path / "forwarded.ogg"
+        forwarded.write_bytes(b"voice note")
+
+        cache, key = proc._voice_note_cache_key(str(note), "lug")
+        assert await proc._cached_voice_note_transcription(cache, key) is None
+        await proc._cache_voice_note_transcription(
+            cache, key, {"audio_transcription": " Oli otya "}
+        )
+
+        cache, key = proc._voice_note_cache_key(str(forwarded), "lug")
+        response = await proc._cached_voice_note_transcription(cache, key)
+        assert response["audio_transcription"] == "Oli otya"
+        _, other_language = proc._voice_note_cache_key(str(forwarded), "ach")
+        assert other_language != key
@@ -17,6 +17,8 @@ from app.services.modal_stt_service import (
     VALID_LANGUAGE_CODES,
     ModalSTTService,
     get_modal_stt_service,
+    iter_file,
+    iter_upload,
     reset_modal_stt_service,
     resolve_language,
 )
@@ -219,6 +221,74 @@ class TestModalSTTServiceTranscribe:
             assert result == ""
 
 
+class TestModalSTTServiceStreaming:
+    """Tests for streamed request bodies and the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_reaches_modal(self) -> None:
+        """An async iterator is sent as a chunked request body."""
+        received = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            received.append(
+                (request.headers.get("Transfer-Encoding"), await request.aread())
+            )
+            return httpx.Response(200, json=[{"text": "streamed"}])
+
+        service = ModalSTTService(api_url="https://test.com/stt", timeout=10)
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def body():
+            yield b"chunk-1 "
+            yield b"chunk-2"
+
+        result = await service.transcribe(body())
+
+        assert result == "streamed"
+        assert received == [("chunked", b"chunk-1 chunk-2")]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_between_calls(self) -> None:
+        """One keep-alive client with configured limits serves every call."""
+        service = ModalSTTService(api_url="https://test.com/stt", timeout=10)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [{"text": "ok"}]
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            await service.transcribe(b"one")
+            await service.transcribe(b"two")
+            await service.close()
+
+        mock_client_class.assert_called_once()
+        limits = mock_client_class.call_args.kwargs["limits"]
+        assert isinstance(limits, httpx.Limits)
+        assert mock_client.post.await_count == 2
+        mock_client.aclose.assert_awaited_once()
+        assert service._client is None
+
+    @pytest.mark.asyncio
+    async def test_iter_upload_and_iter_file(self, tmp_path) -> None:
+        """Uploads and files are yielded in bounded chunks."""
+        upload = MagicMock()
+        upload.read = AsyncMock(side_effect=[b"ab", b"c", b""])
+        assert [chunk async for chunk in iter_upload(upload, chunk_size=2)] == [
+            b"ab",
+            b"c",
+        ]
+        upload.read.assert_awaited_with(2)
+
+        path = tmp_path / "audio.wav"
+        path.write_bytes(b"abcde")
+        chunks = [chunk async for chunk in iter_file(str(path), chunk_size=2)]
+        assert chunks == [b"ab", b"cd", b"e"]
+
+
 class TestModalSTTServiceHealthCheck:
     """Tests for health_check method."""
 
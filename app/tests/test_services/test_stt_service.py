@@ -6,8 +6,11 @@ app/services/stt_service.py. Tests cover audio validation, audio processing,
 cloud storage interactions, and transcription API calls.
 """
 
+import asyncio
+import io
 import os
 import tempfile
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,6 +26,7 @@ from app.services.stt_service import (
     get_stt_service,
     reset_stt_service,
 )
+from app.utils.upload_audio_file_gcp import BlobProbe, StreamedUpload
 
 
 class TestSTTServiceInitialization:
@@ -171,14 +175,14 @@ class TestAudioDurationProcessing:
             audio_bucket_name="test",
         )
 
-    def test_audio_under_limit_not_trimmed(self) -> None:
+    async def test_audio_under_limit_not_trimmed(self) -> None:
         """Test that audio under limit is not trimmed."""
         # Create mock audio segment (5 minutes = 300000 ms)
         mock_audio = MagicMock()
         mock_audio.__len__ = MagicMock(return_value=300000)
 
         with patch(
-            "app.services.stt_service.AudioSegment.from_file", return_value=mock_audio
+            "app.utils.audio_ops.AudioSegment.from_file", return_value=mock_audio
         ):
             with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
                 temp_path = f.name
@@ -188,7 +192,7 @@ class TestAudioDurationProcessing:
                     result_path,
                     was_trimmed,
                     original_duration,
-                ) = self.service.process_audio_duration(temp_path, ".mp3")
+                ) = await self.service.process_audio_duration(temp_path, ".mp3")
 
                 assert result_path == temp_path
                 assert was_trimmed is False
@@ -197,7 +201,7 @@ class TestAudioDurationProcessing:
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
 
-    def test_audio_over_limit_is_trimmed(self) -> None:
+    async def test_audio_over_limit_is_trimmed(self) -> None:
         """Test that audio over limit is trimmed."""
         # Create mock audio segment (15 minutes = 900000 ms)
         mock_audio = MagicMock()
@@ -206,7 +210,7 @@ class TestAudioDurationProcessing:
         mock_audio.__getitem__ = MagicMock(return_value=mock_trimmed)
 
         with patch(
-            "app.services.stt_service.AudioSegment.from_file", return_value=mock_audio
+            "app.utils.audio_ops.AudioSegment.from_file", return_value=mock_audio
         ):
             with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
                 temp_path = f.name
@@ -222,7 +226,7 @@ class TestAudioDurationProcessing:
                     result_path,
                     was_trimmed,
                     original_duration,
-                ) = self.service.process_audio_duration(temp_path, ".mp3")
+                ) = await self.service.process_audio_duration(temp_path, ".mp3")
 
                 assert was_trimmed is True
                 assert original_duration == pytest.approx(15.0, rel=0.1)
@@ -233,20 +237,75 @@ class TestAudioDurationProcessing:
                 if os.path.exists(trimmed_path):
                     os.remove(trimmed_path)
 
-    def test_corrupted_audio_raises_error(self) -> None:
+    async def test_corrupted_audio_raises_error(self) -> None:
         """Test that corrupted audio raises AudioProcessingError."""
         with patch(
-            "app.services.stt_service.AudioSegment.from_file",
+            "app.utils.audio_ops.AudioSegment.from_file",
             side_effect=CouldntDecodeError("Decoding failed"),
         ):
             with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
                 temp_path = f.name
 
             with pytest.raises(AudioProcessingError) as exc_info:
-                self.service.process_audio_duration(temp_path, ".mp3")
+                await self.service.process_audio_duration(temp_path, ".mp3")
 
             assert "Could not decode audio file" in str(exc_info.value)
 
+    async def test_probed_audio_under_limit_is_not_decoded(self) -> None:
+        """A duration read from the header skips decoding entirely."""
+        with patch(
+            "app.services.stt_service.probe_duration", return_value=120.0
+        ), patch("app.utils.audio_ops.AudioSegment.from_file") as from_file:
+            result = await self.service.process_audio_duration("/tmp/a.mp3", ".mp3")
+
+        assert result == ("/tmp/a.mp3", False, None)
+        from_file.assert_not_called()
+
+    async def test_probed_audio_over_limit_is_stream_copied(self) -> None:
+        """Long audio is trimmed with ffmpeg stream copy when available."""
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            temp_path = f.name
+        trimmed_path = os.path.join(
+            os.path.dirname(temp_path), f"trimmed_{os.path.basename(temp_path)}"
+        )
+
+        with patch(
+            "app.services.stt_service.probe_duration", return_value=900.0
+        ), patch(
+            "app.services.stt_service.trim_stream_copy", return_value=True
+        ) as trim, patch(
+            "app.utils.audio_ops.AudioSegment.from_file"
+        ) as from_file:
+            result = await self.service.process_audio_duration(temp_path, ".mp3")
+
+        assert result == (trimmed_path, True, pytest.approx(15.0))
+        trim.assert_called_once_with(temp_path, trimmed_path, 600)
+        from_file.assert_not_called()
+        assert not os.path.exists(temp_path)
+
+    async def test_falls_back_to_decode_when_stream_copy_fails(self) -> None:
+        """Without ffmpeg the audio is decoded and re-encoded as before."""
+        mock_audio = MagicMock()
+        mock_audio.__len__ = MagicMock(return_value=900000)
+        mock_trimmed = MagicMock()
+        mock_audio.__getitem__ = MagicMock(return_value=mock_trimmed)
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            temp_path = f.name
+
+        with patch(
+            "app.services.stt_service.probe_duration", return_value=900.0
+        ), patch(
+            "app.services.stt_service.trim_stream_copy", return_value=False
+        ), patch(
+            "app.utils.audio_ops.AudioSegment.from_file", return_value=mock_audio
+        ):
+            _, was_trimmed, _ = await self.service.process_audio_duration(
+                temp_path, ".mp3"
+            )
+
+        assert was_trimmed is True
+        mock_trimmed.export.assert_called_once()
+
 
 class TestCloudStorageUpload:
     """Tests for cloud storage upload functionality."""
@@ -272,6 +331,23 @@ class TestCloudStorageUpload:
             assert blob_name == "blob-name.mp3"
             assert blob_url == "https://storage.example.com/blob-name.mp3"
 
+    @pytest.mark.asyncio
+    async def test_uploads_overlap_off_the_event_loop(self) -> None:
+        """Blocking uploads run in worker threads, so they run concurrently."""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def upload(file_path: str):
+            both_started.wait()
+            return file_path, f"gs://test-bucket/{file_path}"
+
+        with patch("app.services.stt_service.upload_audio_file", side_effect=upload):
+            results = await asyncio.gather(
+                self.service.upload_to_storage("a.wav"),
+                self.service.upload_to_storage("b.wav"),
+            )
+
+        assert [name for name, _ in results] == ["a.wav", "b.wav"]
+
     @pytest.mark.asyncio
     async def test_upload_returns_none_raises_error(self) -> None:
         """Test that upload failure raises AudioProcessingError."""
@@ -433,12 +509,9 @@ class TestTranscriptionSyncAPI:
             "formatted_diarization_output": "",
         }
 
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(return_value=mock_response)
+        mock_run = AsyncMock(return_value=mock_response)
 
-        with patch(
-            "app.services.stt_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.stt_service.run_runpod_job", mock_run):
             result = await self.service.call_transcription_api_sync(
                 blob_name="audio.mp3",
                 language="lug",
@@ -450,12 +523,9 @@ class TestTranscriptionSyncAPI:
     @pytest.mark.asyncio
     async def test_sync_transcription_timeout(self) -> None:
         """Test sync transcription timeout raises TranscriptionError."""
-        mock_endpoint = MagicMock()
-        mock_endpoint.run_sync = MagicMock(side_effect=TimeoutError("Timeout"))
+        mock_run = AsyncMock(side_effect=TimeoutError("Timeout"))
 
-        with patch(
-            "app.services.stt_service.runpod.Endpoint", return_value=mock_endpoint
-        ):
+        with patch("app.services.stt_service.run_runpod_job", mock_run):
             with pytest.raises(TranscriptionError) as exc_info:
                 await self.service.call_transcription_api_sync(
                     blob_name="audio.mp3",
@@ -478,59 +548,119 @@ class TestTranscribeFromGCS:
 
     @pytest.mark.asyncio
     async def test_successful_gcs_transcription(self) -> None:
-        """Test successful transcription from GCS."""
-        mock_blob = MagicMock()
-        mock_blob.exists.return_value = True
-        mock_blob.download_to_filename = MagicMock()
-
-        mock_bucket = MagicMock()
-        mock_bucket.blob.return_value = mock_blob
-
-        mock_client = MagicMock()
-        mock_client.bucket.return_value = mock_bucket
-
-        mock_audio = MagicMock()
-        mock_audio.__len__ = MagicMock(return_value=300000)  # 5 minutes
-
+        """Short audio is transcribed from GCS without downloading it."""
         mock_response = {
             "audio_transcription": "Hello world",
             "diarization_output": {},
             "formatted_diarization_output": "",
         }
 
-        with patch("app.services.stt_service.storage.Client", return_value=mock_client):
-            with patch(
-                "app.services.stt_service.AudioSegment.from_file",
-                return_value=mock_audio,
-            ):
+        with patch(
+            "app.services.stt_service.probe_audio_blob",
+            return_value=BlobProbe(size=1_000_000, duration_seconds=300.0),
+        ) as mock_probe:
+            with patch("app.services.stt_service._get_storage_client") as mock_client:
                 with patch.object(
                     self.service,
                     "call_transcription_api_sync",
                     new_callable=AsyncMock,
                     return_value=mock_response,
-                ):
+                ) as mock_api:
                     result = await self.service.transcribe_from_gcs(
                         gcs_blob_name="audio.mp3",
                         language="lug",
                     )
 
-                    assert result.transcription == "Hello world"
-                    assert result.blob_name == "audio.mp3"
-                    assert result.was_trimmed is False
+        assert result.transcription == "Hello world"
+        assert result.blob_name == "audio.mp3"
+        assert result.was_trimmed is False
+        mock_probe.assert_called_once_with("audio.mp3", "test-bucket")
+        mock_client.assert_not_called()
+        assert mock_api.call_args.kwargs["blob_name"] == "audio.mp3"
 
     @pytest.mark.asyncio
-    async def test_gcs_blob_not_found(self) -> None:
-        """Test that missing GCS blob raises AudioProcessingError."""
+    async def test_unprobeable_blob_is_downloaded(self) -> None:
+        """Audio whose header cannot be parsed is downloaded and checked."""
         mock_blob = MagicMock()
-        mock_blob.exists.return_value = False
-
         mock_bucket = MagicMock()
         mock_bucket.blob.return_value = mock_blob
-
         mock_client = MagicMock()
         mock_client.bucket.return_value = mock_bucket
 
-        with patch("app.services.stt_service.storage.Client", return_value=mock_client):
+        mock_audio = MagicMock()
+        mock_audio.__len__ = MagicMock(return_value=300000)  # 5 minutes
+
+        mock_response = {
+            "audio_transcription": "Hello world",
+            "diarization_output": {},
+            "formatted_diarization_output": "",
+        }
+
+        with patch(
+            "app.services.stt_service.probe_audio_blob",
+            return_value=BlobProbe(size=1_000_000, duration_seconds=None),
+        ):
+            with patch(
+                "app.services.stt_service._get_storage_client", return_value=mock_client
+            ):
+                with patch(
+                    "app.utils.audio_ops.AudioSegment.from_file",
+                    return_value=mock_audio,
+                ):
+                    with patch.object(
+                        self.service,
+                        "call_transcription_api_sync",
+                        new_callable=AsyncMock,
+                        return_value=mock_response,
+                    ):
+                        result = await self.service.transcribe_from_gcs(
+                            gcs_blob_name="audio.mp3",
+                        )
+
+        assert result.transcription == "Hello world"
+        assert result.was_trimmed is False
+        mock_blob.download_to_filename.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_trimmed_copy_is_uploaded_and_transcribed(self) -> None:
+        """With chunking off, the worker gets the trimmed audio, not the original."""
+        mock_response = {
+            "audio_transcription": "Hello world",
+            "diarization_output": {},
+            "formatted_diarization_output": "",
+        }
+
+        with patch(
+            "app.services.stt_service.probe_audio_blob",
+            return_value=BlobProbe(size=50_000_000, duration_seconds=3600.0),
+        ), patch.object(self.service, "_download_blob"), patch.object(
+            self.service,
+            "process_audio_duration",
+            new_callable=AsyncMock,
+            return_value=("/tmp/trimmed_audio.mp3", True, 60.0),
+        ), patch.object(
+            self.service,
+            "upload_to_storage",
+            new_callable=AsyncMock,
+            return_value=("trimmed.mp3", "gs://test-bucket/trimmed.mp3"),
+        ) as mock_upload, patch.object(
+            self.service,
+            "call_transcription_api_sync",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        ) as mock_api:
+            result = await self.service.transcribe_from_gcs(gcs_blob_name="audio.mp3")
+
+        mock_upload.assert_awaited_once_with("/tmp/trimmed_audio.mp3")
+        assert mock_api.call_args.kwargs["blob_name"] == "trimmed.mp3"
+        assert result.blob_name == "trimmed.mp3"
+        assert result.was_trimmed is True
+        assert result.original_duration == 60.0
+
+    @pytest.mark.asyncio
+    async def test_gcs_blob_not_found(self) -> None:
+        """Test that missing GCS blob raises AudioProcessingError."""
+        with patch("app.services.stt_service.probe_audio_blob", return_value=None):
             with pytest.raises(AudioProcessingError) as exc_info:
                 await self.service.transcribe_from_gcs(gcs_blob_name="missing.mp3")
 
@@ -539,42 +669,28 @@ class TestTranscribeFromGCS:
     @pytest.mark.asyncio
     async def test_gcs_transcription_no_result(self) -> None:
         """Test that empty transcription raises TranscriptionError."""
-        mock_blob = MagicMock()
-        mock_blob.exists.return_value = True
-        mock_blob.download_to_filename = MagicMock()
-
-        mock_bucket = MagicMock()
-        mock_bucket.blob.return_value = mock_blob
-
-        mock_client = MagicMock()
-        mock_client.bucket.return_value = mock_bucket
-
-        mock_audio = MagicMock()
-        mock_audio.__len__ = MagicMock(return_value=300000)
-
         mock_response = {
             "audio_transcription": None,
             "diarization_output": {},
             "formatted_diarization_output": "",
         }
 
-        with patch("app.services.stt_service.storage.Client", return_value=mock_client):
-            with patch(
-                "app.services.stt_service.AudioSegment.from_file",
-                return_value=mock_audio,
+        with patch(
+            "app.services.stt_service.probe_audio_blob",
+            return_value=BlobProbe(size=1_000_000, duration_seconds=300.0),
+        ):
+            with patch.object(
+                self.service,
+                "call_transcription_api_sync",
+                new_callable=AsyncMock,
+                return_value=mock_response,
             ):
-                with patch.object(
-                    self.service,
-                    "call_transcription_api_sync",
-                    new_callable=AsyncMock,
-                    return_value=mock_response,
-                ):
-                    with pytest.raises(TranscriptionError) as exc_info:
-                        await self.service.transcribe_from_gcs(
-                            gcs_blob_name="audio.mp3",
-                        )
+                with pytest.raises(TranscriptionError) as exc_info:
+                    await self.service.transcribe_from_gcs(
+                        gcs_blob_name="audio.mp3",
+                    )
 
-                    assert "No transcription was generated" in str(exc_info.value)
+                assert "No transcription was generated" in str(exc_info.value)
 
 
 class TestTranscribeUploadedFile:
@@ -605,7 +721,7 @@ class TestTranscribeUploadedFile:
 
         try:
             with patch(
-                "app.services.stt_service.AudioSegment.from_file",
+                "app.utils.audio_ops.AudioSegment.from_file",
                 return_value=mock_audio,
             ):
                 with patch.object(
@@ -634,6 +750,199 @@ class TestTranscribeUploadedFile:
                 os.remove(temp_path)
 
 
+class _AsyncStream:
+    """Minimal ``UploadFile`` stand-in."""
+
+    def __init__(self, data: bytes, size=None) -> None:
+        self._buffer = io.BytesIO(data)
+        self.size = size
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+class TestTranscribeUploadStream:
+    """Tests for transcribe_upload_stream method."""
+
+    def setup_method(self) -> None:
+        """Create service instance for tests."""
+        self.service = STTService(
+            runpod_endpoint_id="test-endpoint",
+            audio_bucket_name="test-bucket",
+        )
+
+    @staticmethod
+    def _streamed(blob_name: str) -> StreamedUpload:
+        return StreamedUpload(
+            blob_name=blob_name,
+            blob_uri=f"gs://test-bucket/{blob_name}",
+            size=100,
+            head=b"head",
+            tail=b"tail",
+            sha256="abc",
+        )
+
+    @pytest.mark.asyncio
+    async def test_short_audio_is_transcribed_from_streamed_blob(self) -> None:
+        """Audio under the limit goes straight from the stream to RunPod."""
+        upload = AsyncMock(
+            side_effect=lambda stream, name, ct, **kwargs: self._streamed(name)
+        )
+        with patch("app.services.stt_service.stream_audio_upload", upload), patch(
+            "app.services.stt_service.probe_duration_from_bytes", return_value=60.0
+        ), patch.object(
+            self.service,
+            "call_transcription_api",
+            new_callable=AsyncMock,
+            return_value={"audio_transcription": "Hello world"},
+        ) as call_api, patch.object(
+            self.service, "transcribe_uploaded_file", new_callable=AsyncMock
+        ) as local:
+            result = await self.service.transcribe_upload_stream(
+                _AsyncStream(b"audio"), ".mp3", content_type="audio/mpeg"
+            )
+
+        blob_name = upload.call_args.args[1]
+        assert blob_name.endswith(".mp3")
+        assert upload.call_args.kwargs["prefix"] == b"audio"
+        assert call_api.call_args.kwargs["blob_name"] == blob_name
+        assert result.transcription == "Hello world"
+        assert result.audio_url == f"gs://test-bucket/{blob_name}"
+        assert result.was_trimmed is False
+        local.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_or_unknown_audio_falls_back_to_local_file(self) -> None:
+        """Audio that needs trimming is downloaded and processed locally."""
+        fallback = TranscriptionResult(
+            transcription="trimmed",
+            diarization_output={},
+            formatted_diarization_output="",
+            was_trimmed=True,
+        )
+        blob = MagicMock()
+        client = MagicMock()
+        client.bucket.return_value.blob.return_value = blob
+        upload = AsyncMock(
+            side_effect=lambda stream, name, ct, **kwargs: self._streamed(name)
+        )
+        with patch("app.services.stt_service.stream_audio_upload", upload), patch(
+            "app.services.stt_service.probe_duration_from_bytes", return_value=None
+        ), patch(
+            "app.services.stt_service._get_storage_client", return_value=client
+        ), patch(
+            "app.services.stt_service.delete_audio_file"
+        ) as delete, patch.object(
+            self.service,
+            "transcribe_uploaded_file",
+            new_callable=AsyncMock,
+            return_value=fallback,
+        ) as local:
+            result = await self.service.transcribe_upload_stream(
+                _AsyncStream(b"audio"), ".wav"
+            )
+
+        assert result.transcription == "trimmed"
+        assert result.content_id == "sha256:abc"
+        blob.download_to_filename.assert_called_once()
+        delete.assert_called_once_with(upload.call_args.args[1])
+        assert local.call_args.kwargs["file_extension"] == ".wav"
+        os.remove(local.call_args.kwargs["file_path"])
+
+    @pytest.mark.asyncio
+    async def test_long_header_is_spooled_locally_without_uploading(self) -> None:
+        """A header showing audio over the limit skips the cloud upload."""
+        data = b"h" * 300_000
+        fallback = TranscriptionResult(
+            transcription="trimmed",
+            diarization_output={},
+            formatted_diarization_output="",
+            was_trimmed=True,
+        )
+        spooled = {}
+
+        async def local(file_path: str, file_extension: str, **kwargs):
+            with open(file_path, "rb") as f:
+                spooled["data"] = f.read()
+            os.remove(file_path)
+            return fallback
+
+        upload = AsyncMock()
+        with patch("app.services.stt_service.stream_audio_upload", upload), patch(
+            "app.services.stt_service.probe_duration_from_bytes",
+            return_value=4 * 3600.0,
+        ) as probe, patch.object(
+            self.service, "transcribe_uploaded_file", side_effect=local
+        ):
+            result = await self.service.transcribe_upload_stream(
+                _AsyncStream(data, size=len(data)), ".wav"
+            )
+
+        upload.assert_not_called()
+        assert probe.call_args.args[2] == len(data)
+        assert spooled["data"] == data
+        assert result.transcription == "trimmed"
+        assert result.content_id.startswith("sha256:")
+
+    @pytest.mark.asyncio
+    async def test_spooled_cache_hit_is_stored_under_its_own_blob(self) -> None:
+        """A hit still uploads this request's audio, which is persisted."""
+        data = b"h" * 300_000
+        cached = TranscriptionResult(
+            transcription="cached",
+            diarization_output={},
+            formatted_diarization_output="",
+        )
+        with patch(
+            "app.services.stt_service.probe_duration_from_bytes",
+            return_value=4 * 3600.0,
+        ), patch.object(
+            self.service,
+            "upload_to_storage",
+            new_callable=AsyncMock,
+            return_value=("own.wav", "gs://test-bucket/own.wav"),
+        ) as upload, patch.object(
+            self.service, "transcribe_uploaded_file", new_callable=AsyncMock
+        ) as local:
+            result = await self.service.transcribe_upload_stream(
+                _AsyncStream(data, size=len(data)),
+                ".wav",
+                cache_lookup=AsyncMock(return_value=cached),
+            )
+
+        local.assert_not_called()
+        assert not os.path.exists(upload.call_args.args[0])
+        assert result.transcription == "cached"
+        assert result.audio_url == "gs://test-bucket/own.wav"
+        assert result.blob_name == "own.wav"
+
+    @pytest.mark.asyncio
+    async def test_long_header_without_declared_size_is_uploaded(self) -> None:
+        """Without a size, a partial head cannot be judged before uploading."""
+        upload = AsyncMock(side_effect=RuntimeError("network"))
+        with patch("app.services.stt_service.stream_audio_upload", upload), patch(
+            "app.services.stt_service.probe_duration_from_bytes",
+            return_value=4 * 3600.0,
+        ):
+            with pytest.raises(AudioProcessingError):
+                await self.service.transcribe_upload_stream(
+                    _AsyncStream(b"h" * 300_000), ".wav"
+                )
+
+        upload.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_raises_processing_error(self) -> None:
+        with patch(
+            "app.services.stt_service.stream_audio_upload",
+            AsyncMock(side_effect=RuntimeError("network")),
+        ):
+            with pytest.raises(AudioProcessingError):
+                await self.service.transcribe_upload_stream(
+                    _AsyncStream(b"audio"), ".mp3"
+                )
+
+
 class TestTranscribeOrgAudio:
     """Tests for transcribe_org_audio method."""
 
@@ -736,41 +1045,27 @@ class TestSTTServiceLogging:
     @pytest.mark.asyncio
     async def test_transcription_logs_info(self) -> None:
         """Test that transcription logs info messages."""
-        mock_blob = MagicMock()
-        mock_blob.exists.return_value = True
-        mock_blob.download_to_filename = MagicMock()
-
-        mock_bucket = MagicMock()
-        mock_bucket.blob.return_value = mock_blob
-
-        mock_client = MagicMock()
-        mock_client.bucket.return_value = mock_bucket
-
-        mock_audio = MagicMock()
-        mock_audio.__len__ = MagicMock(return_value=300000)
-
         mock_response = {
             "audio_transcription": "Hello",
             "diarization_output": {},
             "formatted_diarization_output": "",
         }
 
-        with patch("app.services.stt_service.storage.Client", return_value=mock_client):
-            with patch(
-                "app.services.stt_service.AudioSegment.from_file",
-                return_value=mock_audio,
+        with patch(
+            "app.services.stt_service.probe_audio_blob",
+            return_value=BlobProbe(size=1_000_000, duration_seconds=300.0),
+        ):
+            with patch.object(
+                self.service,
+                "call_transcription_api_sync",
+                new_callable=AsyncMock,
+                return_value=mock_response,
             ):
-                with patch.object(
-                    self.service,
-                    "call_transcription_api_sync",
-                    new_callable=AsyncMock,
-                    return_value=mock_response,
-                ):
-                    with patch.object(self.service, "log_info") as mock_log:
-                        await self.service.transcribe_from_gcs("audio.mp3")
+                with patch.object(self.service, "log_info") as mock_log:
+                    await self.service.transcribe_from_gcs("audio.mp3")
 
-                        # Should log at least once
-                        assert mock_log.call_count >= 1
+                    # Should log at least once
+                    assert mock_log.call_count >= 1
 
     @pytest.mark.asyncio
     async def test_transcription_logs_error_on_failure(self) -> None:
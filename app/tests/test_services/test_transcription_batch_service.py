@@ -0,0 +1,201 @@
+"""Tests for the batch transcription service."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.services.transcription_batch_service as batch_module
+from app.core.exceptions import BadRequestError
+from app.schemas.stt import TranscriptionBatchRequest
+from app.services.stt_service import TranscriptionError, TranscriptionResult
+from app.services.transcription_batch_service import (
+    BatchOptions,
+    TranscriptionBatchService,
+)
+
+USER = SimpleNamespace(id=1, email="a@b.c", username="alice", account_type="free")
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        transcription=text,
+        diarization_output={},
+        formatted_diarization_output="",
+        audio_url=f"gs://bucket/{text}",
+        blob_name=text,
+    )
+
+
+@pytest.fixture
+def facade():
+    facade = MagicMock()
+    facade.transcribe = AsyncMock(
+        side_effect=lambda **kwargs: _result(kwargs["gcs_blob_name"])
+    )
+    return facade
+
+
+async def _collect(service, names, concurrency=2):
+    options = BatchOptions(language="lug", adapter="lug", concurrency=concurrency)
+    return [item async for item in service.run(USER, names, options)]
+
+
+async def test_run_yields_every_item_then_summary(facade):
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    items = await _collect(service, ["a.wav", "b.wav", "c.wav"])
+
+    assert items[-1] == {"summary": {"total": 3, "succeeded": 3, "failed": 0}}
+    by_index = {item["index"]: item for item in items[:-1]}
+    assert by_index[1]["gcs_blob_name"] == "b.wav"
+    assert by_index[1]["status"] == "ok"
+    assert by_index[1]["audio_transcription"] == "b.wav"
+    _, kwargs = facade.transcribe.call_args
+    assert kwargs["platform"] == "runpod"
+
+
+async def test_concurrency_is_bounded(facade):
+    in_flight = peak = 0
+
+    async def transcribe(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _result(kwargs["gcs_blob_name"])
+
+    facade.transcribe = AsyncMock(side_effect=transcribe)
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    items = await _collect(service, [f"{i}.wav" for i in range(10)], concurrency=3)
+
+    assert peak == 3
+    assert len(items) == 11
+
+
+async def test_item_failure_is_reported_and_batch_continues(facade):
+    async def transcribe(**kwargs):
+        if kwargs["gcs_blob_name"] == "bad.wav":
+            raise TranscriptionError("No transcription was generated.")
+        return _result(kwargs["gcs_blob_name"])
+
+    facade.transcribe = AsyncMock(side_effect=transcribe)
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    items = await _collect(service, ["a.wav", "bad.wav"])
+
+    failed = next(item for item in items if item.get("status") == "error")
+    assert failed["gcs_blob_name"] == "bad.wav"
+    assert failed["error_code"] == "transcription_failed"
+    assert items[-1]["summary"]["failed"] == 1
+
+
+async def test_closing_early_cancels_in_flight_items(facade):
+    started = asyncio.Event()
+
+    async def transcribe(**kwargs):
+        if kwargs["gcs_blob_name"] != "fast.wav":
+            started.set()
+            await asyncio.sleep(60)
+        return _result(kwargs["gcs_blob_name"])
+
+    facade.transcribe = AsyncMock(side_effect=transcribe)
+    service = TranscriptionBatchService(transcription_service=facade)
+    options = BatchOptions(language="lug", adapter="lug", concurrency=2)
+
+    stream = service.run(USER, ["fast.wav", "slow.wav"], options)
+    first = await stream.__anext__()
+    await started.wait()
+    await stream.aclose()
+
+    assert first["gcs_blob_name"] == "fast.wav"
+    await asyncio.sleep(0)
+    assert facade.transcribe.await_count == 2
+
+
+async def test_resolve_blob_names_from_manifest(monkeypatch, facade):
+    monkeypatch.setattr(
+        batch_module,
+        "read_audio_bucket_text",
+        MagicMock(return_value="# calls\na.wav\n\n  b.wav  \n"),
+    )
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    names = await service.resolve_blob_names(
+        TranscriptionBatchRequest(
+            manifest_blob_name="batch-manifests/1/m.txt", language="lug"
+        ),
+        USER,
+    )
+
+    assert names == ["a.wav", "b.wav"]
+    batch_module.read_audio_bucket_text.assert_called_once_with(
+        "batch-manifests/1/m.txt"
+    )
+
+
+async def test_manifest_outside_callers_prefix_is_rejected(monkeypatch, facade):
+    reader = MagicMock(return_value="a.wav\n")
+    monkeypatch.setattr(batch_module, "read_audio_bucket_text", reader)
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    for name in ("m.txt", "batch-manifests/2/m.txt", "batch-manifests/10/m.txt"):
+        with pytest.raises(BadRequestError):
+            await service.resolve_blob_names(
+                TranscriptionBatchRequest(manifest_blob_name=name, language="lug"),
+                USER,
+            )
+
+    reader.assert_not_called()
+
+
+async def test_resolve_blob_names_rejects_bad_requests(monkeypatch, facade):
+    service = TranscriptionBatchService(transcription_service=facade)
+    monkeypatch.setattr(batch_module.settings, "stt_batch_max_items", 2)
+    monkeypatch.setattr(
+        batch_module, "read_audio_bucket_text", MagicMock(return_value=None)
+    )
+
+    for body in (
+        TranscriptionBatchRequest(language="lug"),
+        TranscriptionBatchRequest(
+            gcs_blob_names=["a"], manifest_blob_name="m.txt", language="lug"
+        ),
+        TranscriptionBatchRequest(gcs_blob_names=["a", "b", "c"], language="lug"),
+        TranscriptionBatchRequest(
+            manifest_blob_name="batch-manifests/1/missing.txt", language="lug"
+        ),
+    ):
+        with pytest.raises(BadRequestError):
+            await service.resolve_blob_names(body, USER)
+
+
+def test_options_cap_concurrency(monkeypatch):
+    monkeypatch.setattr(batch_module.settings, "stt_batch_max_concurrency", 4)
+    options = TranscriptionBatchService.options(
+        TranscriptionBatchRequest(gcs_blob_names=["a"], language="lug", concurrency=50)
+    )
+    assert options.concurrency == 4
+    assert options.adapter == "lug"
+
+
+async def test_start_writes_ndjson_to_results_blob(monkeypatch, facade):
+    writer = MagicMock()
+    opener = MagicMock(return_value=writer)
+    monkeypatch.setattr(batch_module, "open_audio_bucket_writer", opener)
+    service = TranscriptionBatchService(transcription_service=facade)
+
+    batch_id, blob_name = service.start(
+        USER, ["a.wav"], BatchOptions(language="lug", adapter="lug")
+    )
+    await asyncio.gather(*list(service._tasks))
+
+    assert blob_name == f"batch-results/1/{batch_id}.ndjson"
+    opener.assert_called_once_with(blob_name, "application/x-ndjson")
+    lines = [call.args[0] for call in writer.write.call_args_list]
+    assert len(lines) == 2 and all(line.endswith("\n") for line in lines)
+    assert '"summary"' in lines[-1]
+    writer.close.assert_called_once()
@@ -0,0 +1,110 @@
+"""Tests for the two-tier transcription cache."""
+
+import pytest
+
+from app.services.stt_service import TranscriptionResult
+from app.services.transcription_cache import (
+    CACHE_KEY_PREFIX,
+    TranscriptionCache,
+    content_id_for_bytes,
+    content_id_for_file,
+)
+
+
+def _result(text: str = "hello", **kwargs) -> TranscriptionResult:
+    return TranscriptionResult(
+        transcription=text,
+        diarization_output={"speakers": [text]},
+        formatted_diarization_output=f"S1: {text}",
+        **kwargs,
+    )
+
+
+def _key(content_id: str = "sha256:a", **options) -> str:
+    options = {"platform": "runpod", "language": "lug", "adapter": "lug", **options}
+    return TranscriptionCache.key(content_id, **options)
+
+
+def test_key_depends_on_content_and_every_option():
+    base = _key()
+    assert base.startswith(CACHE_KEY_PREFIX)
+    assert _key() == base
+    assert _key("sha256:b") != base
+    assert _key(language="ach") != base
+    assert _key(adapter="ach") != base
+    assert _key(whisper=True) != base
+    assert _key(recognise_speakers=True) != base
+    assert _key(platform="modal") != base
+
+
+def test_content_ids_match_for_bytes_and_files(tmp_path):
+    path = tmp_path / "a.wav"
+    path.write_bytes(b"voice note" * 1000)
+
+    assert content_id_for_file(str(path)) == content_id_for_bytes(b"voice note" * 1000)
+
+
+async def test_local_round_trip_without_redis(monkeypatch):
+    monkeypatch.setattr(
+        "app.services.transcription_cache.get_redis_client", lambda: None
+    )
+    cache = TranscriptionCache(enabled=True)
+
+    assert await cache.get(_key()) is None
+    await cache.set(_key(), _result(was_trimmed=True, original_duration=12.5))
+    hit = await cache.get(_key())
+
+    assert hit.transcription == "hello"
+    assert hit.diarization_output == {"speakers": ["hello"]}
+    assert hit.was_trimmed is True
+    assert hit.original_duration == 12.5
+    assert cache.snapshot()["hit_rate"] == 0.5
+
+
+async def test_shared_tier_serves_other_instances(fake_redis):
+    writer = TranscriptionCache(redis=fake_redis, enabled=True)
+    reader = TranscriptionCache(redis=fake_redis, enabled=True)
+
+    await writer.set(_key(), _result(audio_url="gs://b/a.wav", blob_name="a.wav"))
+    hit = await reader.get(_key())
+    again = await reader.get(_key())
+
+    assert hit.transcription == "hello" and again.transcription == "hello"
+    # Audio locations belong to the first uploader and are not shared.
+    assert hit.audio_url is None and hit.blob_name is None
+    assert await fake_redis._backend.ttl(_key()) == pytest.approx(
+        writer.ttl_seconds, abs=5
+    )
+    snapshot = reader.snapshot()
+    assert snapshot["shared_hits"] == 1
+    assert snapshot["local_hits"] == 1
+
+
+async def test_local_tier_is_size_bounded(monkeypatch):
+    monkeypatch.setattr(
+        "app.services.transcription_cache.get_redis_client", lambda: None
+    )
+    probe = TranscriptionCache(enabled=True)
+    await probe.set(_key(), _result("x" * 50))
+    entry_bytes = probe.snapshot()["local_bytes"]
+    cache = TranscriptionCache(enabled=True, local_max_bytes=3 * entry_bytes)
+
+    for i in range(3):
+        await cache.set(_key(f"sha256:{i}"), _result("x" * 50))
+    await cache.get(_key("sha256:0"))  # most recently used now
+    await cache.set(_key("sha256:3"), _result("x" * 50))
+
+    assert cache.snapshot()["local_entries"] == 3
+    assert await cache.get(_key("sha256:0")) is not None
+    assert await cache.get(_key("sha256:1")) is None
+
+
+async def test_empty_transcripts_and_disabled_cache_are_not_stored(fake_redis):
+    cache = TranscriptionCache(redis=fake_redis, enabled=True)
+    await cache.set(_key(), _result(""))
+    assert await cache.get(_key()) is None
+
+    disabled = TranscriptionCache(redis=fake_redis, enabled=False)
+    await disabled.set(_key(), _result())
+    assert await disabled.get(_key()) is None
+    assert await fake_redis.get(_key()) is None
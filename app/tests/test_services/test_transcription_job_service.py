@@ -0,0 +1,376 @@
+"""Tests for the asynchronous transcription job service."""
+
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis.aioredis
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import app.services.transcription_job_service as job_module
+from app.core.exceptions import NotFoundError
+from app.schemas.jobs import JobStatus
+from app.services.redis_client import SafeRedis
+from app.services.stt_service import TranscriptionError, TranscriptionResult
+from app.services.transcription_job_service import (
+    TranscriptionJobRequest,
+    TranscriptionJobService,
+)
+
+USER = SimpleNamespace(id=1, email="a@b.c", username="alice", account_type="free")
+OTHER_USER = SimpleNamespace(id=2, email="x@y.z", username="bob", account_type="free")
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield MagicMock()
+
+
+@pytest.fixture
+def facade():
+    facade = MagicMock()
+    facade.transcribe = AsyncMock(
+        return_value=TranscriptionResult(
+            transcription="oli otya",
+            diarization_output={"segments": []},
+            formatted_diarization_output="",
+            audio_url="https://storage/a.wav",
+            blob_name="a.wav",
+        )
+    )
+    return facade
+
+
+@pytest.fixture
+def redis():
+    return SafeRedis(fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+
+@pytest.fixture
+def persisted(monkeypatch):
+    create = AsyncMock(return_value=SimpleNamespace(id=42))
+    monkeypatch.setattr(job_module, "create_audio_transcription", create)
+    return create
+
+
+def _service(facade, redis=None):
+    return TranscriptionJobService(
+        transcription_service=facade, redis=redis, session_factory=_fake_session
+    )
+
+
+async def _finish(service: TranscriptionJobService) -> None:
+    await asyncio.gather(*list(service._tasks))
+
+
+def _upload() -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
+        f.write(b"RIFFfake")
+        return f.name
+
+
+async def test_job_runs_in_background_and_stores_result(facade, redis, persisted):
+    service = _service(facade, redis)
+    path = _upload()
+    request = TranscriptionJobRequest(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        recognise_speakers=True,
+        file_path=path,
+        file_extension=".wav",
+        content_type="audio/wav",
+    )
+
+    job = await service.submit(USER, request)
+    assert job.status == JobStatus.queued
+    await _finish(service)
+
+    done = await service.get(job.job_id, USER)
+    assert done.status == JobStatus.succeeded
+    assert done.result.audio_transcription == "oli otya"
+    assert done.result.audio_transcription_id == 42
+    assert not os.path.exists(path)
+    _, kwargs = facade.transcribe.call_args
+    assert kwargs["file_path"] == path
+    assert kwargs["recognise_speakers"] is True
+
+
+async def test_job_state_is_visible_from_another_instance(facade, redis, persisted):
+    submitting = _service(facade, redis)
+    job = await submitting.submit(
+        USER,
+        TranscriptionJobRequest(
+            platform="runpod", language="lug", adapter="lug", gcs_blob_name="a.wav"
+        ),
+    )
+    await _finish(submitting)
+
+    polled = await _service(facade, redis).get(job.job_id, USER)
+
+    assert polled.status == JobStatus.succeeded
+
+
+async def test_failure_is_recorded(facade, persisted):
+    facade.transcribe.side_effect = TranscriptionError("Transcription timed out")
+    service = _service(facade)
+
+    job = await service.submit(
+        USER,
+        TranscriptionJobRequest(
+            platform="runpod", language="lug", adapter="lug", gcs_blob_name="a.wav"
+        ),
+    )
+    await _finish(service)
+
+    failed = await service.get(job.job_id, USER)
+    assert failed.status == JobStatus.failed
+    assert failed.error == "Transcription timed out"
+    assert failed.result is None
+
+
+def _blob_request(**kwargs) -> TranscriptionJobRequest:
+    return TranscriptionJobRequest(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        gcs_blob_name="a.wav",
+        **kwargs,
+    )
+
+
+async def test_jobs_are_not_kept_in_memory_while_redis_works(facade, redis, persisted):
+    service = _service(facade, redis)
+    await service.submit(USER, _blob_request())
+    await _finish(service)
+
+    assert len(service._memory) == 0
+
+
+async def test_memory_fallback_is_bounded(facade, persisted):
+    service = TranscriptionJobService(
+        transcription_service=facade,
+        session_factory=_fake_session,
+        memory_max_entries=2,
+    )
+    jobs = [await service.submit(USER, _blob_request()) for _ in range(3)]
+    await _finish(service)
+
+    assert len(service._memory) == 2
+    with pytest.raises(NotFoundError):
+        await service.get(jobs[0].job_id, USER)
+    assert (await service.get(jobs[2].job_id, USER)).status == JobStatus.succeeded
+
+
+async def test_failed_redis_write_falls_back_to_memory(facade, redis, persisted):
+    service = _service(facade, redis)
+    job = await service.submit(USER, _blob_request())
+    redis.set = AsyncMock(return_value=None)  # Redis goes away mid-job
+    await _finish(service)
+
+    assert job.job_id in service._memory
+    assert (await service.get(job.job_id, USER)).status == JobStatus.succeeded
+
+
+async def test_shutdown_marks_running_jobs_failed(facade, redis, persisted):
+    started = asyncio.Event()
+
+    async def hang(**kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    facade.transcribe.side_effect = hang
+    service = _service(facade, redis)
+    job = await service.submit(USER, _blob_request())
+    await started.wait()
+
+    await service.shutdown()
+
+    assert service.active == 0
+    failed = await service.get(job.job_id, USER)
+    assert failed.status == JobStatus.failed
+    assert "shut down" in failed.error
+
+
+async def test_jobs_are_private_to_their_owner(facade, persisted):
+    service = _service(facade)
+    job = await service.submit(
+        USER,
+        TranscriptionJobRequest(
+            platform="runpod", language="lug", adapter="lug", gcs_blob_name="a.wav"
+        ),
+    )
+    await _finish(service)
+
+    with pytest.raises(NotFoundError):
+        await service.get(job.job_id, OTHER_USER)
+    with pytest.raises(NotFoundError):
+        await service.get("missing", USER)
+
+
+async def test_modal_job_streams_upload_file(facade):
+    service = _service(facade)
+    path = _upload()
+
+    await service.submit(
+        USER,
+        TranscriptionJobRequest(
+            platform="modal", language="lug", adapter="lug", file_path=path
+        ),
+    )
+    await _finish(service)
+
+    _, kwargs = facade.transcribe.call_args
+    assert kwargs["platform"] == "modal"
+    assert kwargs["file_path"] == path
+
+
+async def test_callback_receives_final_document(facade, persisted, monkeypatch):
+    # The test server listens on loopback.
+    monkeypatch.setattr(
+        job_module.settings, "transcription_job_callback_allow_private", True
+    )
+    received = []
+
+    async def callback(request: web.Request) -> web.Response:
+        received.append(await request.json())
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/done", callback)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        service = _service(facade)
+        job = await service.submit(
+            USER,
+            TranscriptionJobRequest(
+                platform="runpod",
+                language="lug",
+                adapter="lug",
+                gcs_blob_name="a.wav",
+                callback_url=str(server.make_url("/done")),
+            ),
+        )
+        await _finish(service)
+    finally:
+        await server.close()
+
+    assert received[0]["job_id"] == job.job_id
+    assert received[0]["status"] == "succeeded"
+    assert received[0]["result"]["audio_transcription"] == "oli otya"
+    assert (await service.get(job.job_id, USER)).callback_status == 200
+
+
+async def test_callback_to_private_address_is_not_sent(facade, persisted):
+    received = []
+
+    async def callback(request: web.Request) -> web.Response:
+        received.append(await request.json())
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/done", callback)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        service = _service(facade)
+        job = await service.submit(
+            USER,
+            TranscriptionJobRequest(
+                platform="runpod",
+                language="lug",
+                adapter="lug",
+                gcs_blob_name="a.wav",
+                callback_url=str(server.make_url("/done")),
+            ),
+        )
+        await _finish(service)
+    finally:
+        await server.close()
+
+    assert received == []
+    finished = await service.get(job.job_id, USER)
+    assert finished.status == "succeeded"
+    assert finished.callback_status is None
+
+
+async def test_callback_goes_to_the_validated_address(facade, persisted, monkeypatch):
+    received = []
+
+    async def callback(request: web.Request) -> web.Response:
+        received.append(request.headers["Host"])
+        return web.json_response({"ok": True})
+
+    async def resolved(url):
+        return ["127.0.0.1"]
+
+    # The hostname does not resolve, so only the pinned address can be reached.
+    monkeypatch.setattr(job_module, "resolve_callback_url", resolved)
+    app = web.Application()
+    app.router.add_post("/done", callback)
+    server = TestServer(app)
+    await server.start_server()
+    host = f"hooks.invalid:{server.port}"
+    try:
+        service = _service(facade)
+        job = await service.submit(
+            USER, _blob_request(callback_url=f"http://{host}/done")
+        )
+        await _finish(service)
+    finally:
+        await server.close()
+
+    assert received == [host]
+    assert (await service.get(job.job_id, USER)).callback_status == 200
+
+
+async def test_repeated_upload_is_persisted_with_its_own_blob(redis, persisted):
+    from app.services.transcription_cache import TranscriptionCache
+    from app.services.transcription_service import TranscriptionService
+
+    stt = MagicMock()
+    stt.audio_bucket_name = "bucket"
+    stt.validate_audio_file = MagicMock(return_value=None)
+    stt.transcribe_uploaded_file = AsyncMock(
+        return_value=TranscriptionResult(
+            transcription="oli otya",
+            diarization_output={},
+            formatted_diarization_output="",
+            audio_url="gs://bucket/first.wav",
+            blob_name="first.wav",
+        )
+    )
+    stt.upload_to_storage = AsyncMock(
+        return_value=("second.wav", "gs://bucket/second.wav")
+    )
+    facade = TranscriptionService(
+        stt_service=stt,
+        modal_stt_service=MagicMock(),
+        cache=TranscriptionCache(enabled=True),
+        normalize=False,
+    )
+    service = _service(facade, redis)
+
+    for _ in range(2):
+        await service.submit(
+            USER,
+            TranscriptionJobRequest(
+                platform="runpod",
+                language="lug",
+                adapter="lug",
+                file_path=_upload(),
+                file_extension=".wav",
+                content_type="audio/wav",
+            ),
+        )
+        await _finish(service)
+
+    stt.transcribe_uploaded_file.assert_awaited_once()
+    urls = [call.args[2] for call in persisted.await_args_list]
+    assert urls == ["gs://bucket/first.wav", "gs://bucket/second.wav"]
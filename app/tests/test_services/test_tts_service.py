@@ -256,6 +256,53 @@ class TestTTSServiceGenerateAudioStream:
             assert exc_info.value.service_name == "TTS API"
 
 
+class TestTTSServiceSharedClient:
+    """Tests for the shared keep-alive HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_between_calls(self) -> None:
+        """One HTTP/2 keep-alive client serves generation and streaming."""
+        service = TTSService(api_url="https://test.com/tts", timeout=10)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"audio"
+
+        async def mock_aiter_bytes(chunk_size=None):
+            yield b"chunk"
+
+        mock_stream_response = MagicMock()
+        mock_stream_response.status_code = 200
+        mock_stream_response.aiter_bytes = mock_aiter_bytes
+        mock_stream_context = AsyncMock()
+        mock_stream_context.__aenter__ = AsyncMock(return_value=mock_stream_response)
+        mock_stream_context.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client.stream = MagicMock(return_value=mock_stream_context)
+            mock_client_class.return_value = mock_client
+
+            await service.generate_audio(text="one", speaker_id=1)
+            await service.generate_audio(text="two", speaker_id=1)
+            chunks = [
+                chunk
+                async for chunk in service.generate_audio_stream(
+                    text="three", speaker_id=1
+                )
+            ]
+            await service.close()
+
+        mock_client_class.assert_called_once()
+        kwargs = mock_client_class.call_args.kwargs
+        assert isinstance(kwargs["limits"], httpx.Limits)
+        assert kwargs["http2"] is True
+        assert chunks == [b"chunk"]
+        assert mock_client.post.await_count == 2
+        mock_client.aclose.assert_awaited_once()
+        assert service._client is None
+
+
 class TestTTSServiceHealthCheck:
     """Tests for health_check method."""
 
@@ -0,0 +1,141 @@
+"""
+Tests for per-upstream admission control.
+
+Covers tier priority derived from TIER_QUOTAS, in-flight caps, priority
+hand-off, fast shedding with Retry-After, and lease release from threads.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.upstream_limiter as limiter_module
+from app.core.exceptions import ServiceUnavailableError
+from app.services.upstream_limiter import (
+    UpstreamLimiter,
+    acquire_upstream_slot,
+    get_upstream_limiter,
+    release_after,
+    reset_upstream_limiters,
+    tier_priority,
+    upstream_slot,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    reset_upstream_limiters()
+    yield
+    reset_upstream_limiters()
+
+
+class TestTierPriority:
+    def test_order_follows_tier_quotas(self):
+        assert tier_priority("admin") < tier_priority("premium") < tier_priority("free")
+
+    def test_account_type_is_case_insensitive(self):
+        assert tier_priority("Premium") == tier_priority("premium")
+
+    def test_unknown_tier_ranks_as_free(self):
+        assert tier_priority(None) == tier_priority("free")
+        assert tier_priority("anonymous") == tier_priority("free")
+
+
+class TestUpstreamLimiter:
+    async def test_admits_up_to_cap(self):
+        limiter = UpstreamLimiter("test", max_in_flight=2, queue_deadline_seconds=5)
+        first = await limiter.acquire("free")
+        await limiter.acquire("free")
+        assert limiter.in_flight == 2
+
+        first.release()
+        first.release()  # idempotent
+        assert limiter.in_flight == 1
+
+    async def test_higher_tier_admitted_first(self):
+        limiter = UpstreamLimiter("test", max_in_flight=1, queue_deadline_seconds=5)
+        held = await limiter.acquire("free")
+        order = []
+
+        async def wait(tier):
+            lease = await limiter.acquire(tier)
+            order.append(tier)
+            lease.release()
+
+        tasks = [asyncio.create_task(wait(t)) for t in ("free", "premium", "admin")]
+        await asyncio.sleep(0)
+        assert limiter.queued == 3
+
+        held.release()
+        await asyncio.gather(*tasks)
+        assert order == ["admin", "premium", "free"]
+        assert limiter.in_flight == 0
+
+    async def test_sheds_when_estimated_wait_exceeds_deadline(self):
+        limiter = UpstreamLimiter(
+            "test", max_in_flight=1, queue_deadline_seconds=2, initial_hold_seconds=5
+        )
+        await limiter.acquire("admin")
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await limiter.acquire("free")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "5"
+        assert limiter.shed == 1
+        assert limiter.queued == 0
+
+    async def test_queued_request_shed_at_deadline(self):
+        limiter = UpstreamLimiter(
+            "test", max_in_flight=1, queue_deadline_seconds=0.05, initial_hold_seconds=0
+        )
+        held = await limiter.acquire("free")
+
+        with pytest.raises(ServiceUnavailableError):
+            await limiter.acquire("free")
+
+        # The abandoned waiter does not swallow the slot.
+        held.release()
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = UpstreamLimiter("test", max_in_flight=1, queue_deadline_seconds=5)
+        held = await limiter.acquire("free")
+        waiter = asyncio.create_task(limiter.acquire("free"))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        held.release()
+        assert limiter.in_flight == 0
+
+    async def test_release_from_worker_thread(self):
+        limiter = UpstreamLimiter("test", max_in_flight=1, queue_deadline_seconds=5)
+        lease = await limiter.acquire("free")
+
+        def consume():
+            return list(release_after(iter([1, 2]), lease))
+
+        assert await asyncio.to_thread(consume) == [1, 2]
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 0
+
+
+class TestUpstreamSlot:
+    async def test_slot_uses_configured_limit(self, monkeypatch):
+        monkeypatch.setattr(
+            limiter_module.settings, "upstream_max_in_flight_raw", "orpheus=3"
+        )
+        user = SimpleNamespace(account_type="Premium")
+        async with upstream_slot("orpheus", user):
+            limiter = get_upstream_limiter("orpheus")
+            assert limiter.max_in_flight == 3
+            assert limiter.in_flight == 1
+        assert limiter.in_flight == 0
+
+    async def test_disabled_admission_is_a_no_op(self, monkeypatch):
+        monkeypatch.setattr(
+            limiter_module.settings, "upstream_admission_enabled", False
+        )
+        assert await acquire_upstream_slot("sunflower", None) is None
@@ -1,11 +1,15 @@
 """Unit tests for the TTS unified speech facade and helpers."""
 
+import io
+import struct
+import wave
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.core.config import settings
 from app.core.exceptions import (
     BadRequestError,
     ExternalServiceError,
@@ -18,7 +22,8 @@ from app.schemas.orpheus_tts import (
 )
 from app.schemas.speech import SpeechRequest, SpeechResponse, TTSModel, TTSPlatform
 from app.schemas.tts import SpeakersListResponse
-from app.services.orpheus_tts_service import SynthesizeResult
+from app.services.orpheus_tts_service import SynthesizeResult, UploadResult
+from app.services.speech_cache import SpeechCache
 from app.services.speech_service import SpeechService
 from app.utils.deprecation import (
     STT_SUNSET_DATE,
@@ -73,18 +78,17 @@ async def test_runpod_spark_service_builds_payload_and_returns_output(monkeypatc
 
     captured = {}
 
-    def fake_run_sync(data, timeout):
+    async def fake_run_runpod_job(data, timeout, endpoint_id=None):
         captured["data"] = data
         captured["timeout"] = timeout
+        captured["endpoint_id"] = endpoint_id
         return {
             "audio_url": "https://x/y.mp3",
             "blob": "tts/y.mp3",
             "sample_rate": 16000,
         }
 
-    fake_endpoint = MagicMock()
-    fake_endpoint.run_sync = fake_run_sync
-    monkeypatch.setattr(mod.runpod, "Endpoint", lambda _id: fake_endpoint)
+    monkeypatch.setattr(mod, "run_runpod_job", fake_run_runpod_job)
 
     svc = mod.RunpodSparkTTSService(endpoint_id="ep123")
     out = await svc.synthesize(
@@ -99,17 +103,16 @@ async def test_runpod_spark_service_builds_payload_and_returns_output(monkeypatc
         "max_new_audio_tokens": 2000,
     }
     assert captured["timeout"] == 600
+    assert captured["endpoint_id"] == "ep123"
 
 
 async def test_runpod_spark_service_maps_timeout(monkeypatch):
     from app.services import runpod_tts_service as mod
 
-    def boom(data, timeout):
+    async def boom(data, timeout, endpoint_id=None):
         raise TimeoutError("slow")
 
-    fake_endpoint = MagicMock()
-    fake_endpoint.run_sync = boom
-    monkeypatch.setattr(mod.runpod, "Endpoint", lambda _id: fake_endpoint)
+    monkeypatch.setattr(mod, "run_runpod_job", boom)
 
     svc = mod.RunpodSparkTTSService(endpoint_id="ep123")
     with pytest.raises(ServiceUnavailableError):
@@ -121,12 +124,10 @@ async def test_runpod_spark_service_maps_timeout(monkeypatch):
 async def test_runpod_spark_service_maps_connection_error(monkeypatch):
     from app.services import runpod_tts_service as mod
 
-    def boom(data, timeout):
+    async def boom(data, timeout, endpoint_id=None):
         raise ConnectionError("lost")
 
-    fake_endpoint = MagicMock()
-    fake_endpoint.run_sync = boom
-    monkeypatch.setattr(mod.runpod, "Endpoint", lambda _id: fake_endpoint)
+    monkeypatch.setattr(mod, "run_runpod_job", boom)
 
     svc = mod.RunpodSparkTTSService(endpoint_id="ep123")
     with pytest.raises(ExternalServiceError):
@@ -138,12 +139,10 @@ async def test_runpod_spark_service_maps_connection_error(monkeypatch):
 async def test_runpod_spark_service_maps_value_error(monkeypatch):
     from app.services import runpod_tts_service as mod
 
-    def boom(data, timeout):
+    async def boom(data, timeout, endpoint_id=None):
         raise ValueError("bad input")
 
-    fake_endpoint = MagicMock()
-    fake_endpoint.run_sync = boom
-    monkeypatch.setattr(mod.runpod, "Endpoint", lambda _id: fake_endpoint)
+    monkeypatch.setattr(mod, "run_runpod_job", boom)
 
     svc = mod.RunpodSparkTTSService(endpoint_id="ep123")
     with pytest.raises(BadRequestError):
@@ -300,6 +299,184 @@ async def test_synthesize_spark_modal_uploads_and_signs():
     assert result.voice == "luganda_female"
 
 
+def wav_clip(value: int, frames: int = 2400) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(24000)
+        wav.writeframes(struct.pack(f"<{frames}h", *[value] * frames))
+    return buffer.getvalue()
+
+
+LONG_TEXT = " ".join(f"This is sentence number {i} of the passage." for i in range(20))
+
+
+@pytest.fixture
+def tts_chunking(monkeypatch):
+    monkeypatch.setattr(settings, "tts_chunking_enabled", True)
+
+
+def test_long_text_is_sent_whole_unless_chunking_is_enabled():
+    facade, _, _, _, _ = make_speech_facade()
+    req = SpeechRequest(text=LONG_TEXT, model="spark-tts", platform="modal")
+
+    assert facade.text_chunks(req) is None
+    assert facade.stream_chunked(req) is None
+
+
+async def test_long_orpheus_text_is_synthesized_in_chunks(tts_chunking):
+    facade, _, orpheus, _, _ = make_speech_facade()
+    orpheus.max_batch_size = 16
+    orpheus.speakers.validate_speaker = AsyncMock()
+    orpheus.speakers.language_for = AsyncMock(return_value="eng")
+    orpheus.render_chunks = AsyncMock(
+        side_effect=lambda texts, **kw: [wav_clip(1) for _ in texts]
+    )
+    orpheus.store = AsyncMock(
+        return_value=UploadResult(
+            gcs_object="orpheus_tts/long.wav",
+            audio_url="https://o/long.wav",
+            audio_url_expires_at=datetime(2026, 12, 1),
+            audio_size_bytes=1,
+            upload_ms=2.0,
+            signed_url_ms=1.0,
+        )
+    )
+    req = SpeechRequest(
+        text=LONG_TEXT, model="orpheus-3b-tts", voice="salt_eng_0001", seed=7
+    )
+
+    result = await facade.synthesize(req)
+
+    orpheus.synthesize.assert_not_awaited()
+    orpheus.speakers.validate_speaker.assert_awaited_once()
+    chunks = [t for call in orpheus.render_chunks.await_args_list for t in call.args[0]]
+    assert " ".join(chunks) == LONG_TEXT
+    assert orpheus.render_chunks.await_count == 4  # TTS_CHUNK_CONCURRENCY groups
+    assert orpheus.render_chunks.await_args.kwargs["seed"] == 7
+    assert result.audio_url == "https://o/long.wav"
+    assert result.language == "eng"
+    assert result.sample_rate == 24000
+    assert result.timings_ms["chunks"] == len(chunks)
+    assert result.duration_seconds > 0
+
+
+async def test_long_spark_text_is_chunked_and_short_text_is_not(tts_chunking):
+    facade, spark, _, _, storage = make_speech_facade()
+    spark.generate_audio = AsyncMock(return_value=wav_clip(1))
+    req = SpeechRequest(text=LONG_TEXT, model="spark-tts", platform="modal")
+
+    result = await facade.synthesize(req)
+
+    assert spark.generate_audio.await_count == len(facade.text_chunks(req))
+    storage.upload_audio_async.assert_awaited_once()
+    assert result.audio_url == "https://s/x.wav"
+    assert result.timings_ms["chunks"] > 1
+    assert facade.text_chunks(SpeechRequest(text="hi", model="spark-tts")) is None
+    assert (
+        facade.text_chunks(
+            SpeechRequest(text=LONG_TEXT, model="spark-tts", platform="runpod")
+        )
+        is None
+    )
+
+
+async def test_stream_chunked_yields_a_wav_stream(tts_chunking):
+    facade, spark, _, _, _ = make_speech_facade()
+    spark.generate_audio = AsyncMock(return_value=wav_clip(1))
+    req = SpeechRequest(
+        text=LONG_TEXT, model="spark-tts", platform="modal", response_mode="stream"
+    )
+
+    body = b"".join([piece async for piece in facade.stream_chunked(req)])
+
+    assert body[:4] == b"RIFF"
+    assert facade.stream_chunked(SpeechRequest(text="hi", model="spark-tts")) is None
+
+
+def cached_facade(fake_redis):
+    facade, spark, orpheus, runpod_spark, storage = make_speech_facade()
+    facade._cache = SpeechCache(redis=fake_redis, enabled=True)
+    storage.file_exists = MagicMock(return_value=True)
+    storage.get_signed_url_for_file = MagicMock(
+        return_value=("https://s/fresh.wav", datetime(2026, 12, 2))
+    )
+    orpheus.storage.file_exists = MagicMock(return_value=True)
+    orpheus.storage.get_signed_url_for_file = MagicMock(
+        return_value=("https://o/fresh.wav", datetime(2026, 12, 2))
+    )
+    orpheus.signed_url_expiry_minutes = 30
+    return facade, spark, orpheus, runpod_spark, storage
+
+
+async def test_repeated_spark_modal_request_reuses_stored_audio(fake_redis):
+    facade, spark, _, _, storage = cached_facade(fake_redis)
+    req = SpeechRequest(text="hi", model="spark-tts", platform="modal")
+
+    first = await facade.synthesize(req)
+    second = await facade.synthesize(req)
+
+    spark.generate_audio.assert_awaited_once()
+    storage.file_exists.assert_called_once_with("tts_audio/x.wav")
+    assert first.audio_url == "https://s/x.wav"
+    assert second.audio_url == "https://s/fresh.wav"
+    assert second.gcs_object == "tts_audio/x.wav"
+    assert second.voice == "luganda_female"
+    assert second.duration_seconds == 3.0
+    assert second.timings_ms["cache_hit"] is True
+
+
+async def test_orpheus_hit_is_signed_by_orpheus_storage(fake_redis):
+    facade, _, orpheus, _, _ = cached_facade(fake_redis)
+    req = SpeechRequest(text="hi", model="orpheus-3b-tts", platform="modal", seed=7)
+
+    await facade.synthesize(req)
+    result = await facade.synthesize(req)
+
+    orpheus.synthesize.assert_awaited_once()
+    orpheus.storage.get_signed_url_for_file.assert_called_once_with(
+        "orpheus_tts/a.wav", 30
+    )
+    assert result.audio_url == "https://o/fresh.wav"
+    assert (result.language, result.sample_rate) == ("lug", 24000)
+
+
+async def test_different_parameters_are_not_shared(fake_redis):
+    facade, _, orpheus, _, _ = cached_facade(fake_redis)
+
+    for seed in (1, 2):
+        await facade.synthesize(
+            SpeechRequest(text="hi", model="orpheus-3b-tts", seed=seed)
+        )
+
+    assert orpheus.synthesize.await_count == 2
+
+
+async def test_deleted_object_is_synthesized_again(fake_redis):
+    facade, spark, _, _, storage = cached_facade(fake_redis)
+    req = SpeechRequest(text="hi", model="spark-tts", platform="modal")
+    await facade.synthesize(req)
+    storage.file_exists.return_value = False
+
+    result = await facade.synthesize(req)
+
+    assert spark.generate_audio.await_count == 2
+    assert result.audio_url == "https://s/x.wav"
+    assert facade._cache.snapshot()["stale"] == 1
+
+
+async def test_runpod_spark_is_not_cached(fake_redis):
+    facade, _, _, runpod_spark, _ = cached_facade(fake_redis)
+    req = SpeechRequest(text="hi", model="spark-tts", platform="runpod")
+
+    await facade.synthesize(req)
+    await facade.synthesize(req)
+
+    assert runpod_spark.synthesize.await_count == 2
+    assert facade._cache.snapshot()["lookups"] == 0
+
+
 async def test_synthesize_spark_runpod_maps_output():
     facade, _, _, runpod_spark, _ = make_speech_facade()
     req = SpeechRequest(text="hi", model="spark-tts", platform="runpod", voice="248")
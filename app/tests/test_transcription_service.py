@@ -1,13 +1,18 @@
 """Unit tests for the TranscriptionService facade and its schema."""
 
+import io
+import os
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from fastapi import UploadFile
 
 from app.core.exceptions import BadRequestError
 from app.schemas.stt import TranscriptionPlatform
 from app.services.stt_service import TranscriptionResult
+from app.services.transcription_cache import TranscriptionCache, content_id_for_bytes
 from app.services.transcription_service import TranscriptionService
+from app.utils.audio_normalize import NormalizedAudio
 from app.utils.deprecation import (
     STT_SUNSET_DATE,
     SUCCESSOR_TRANSCRIPTIONS,
@@ -232,6 +237,39 @@ async def test_transcribe_dispatches_uploaded():
     assert result.transcription == "upload text"
 
 
+async def test_transcribe_dispatches_uploaded_stream():
+    facade, stt, _ = make_facade()
+    stt.transcribe_upload_stream = AsyncMock(
+        return_value=TranscriptionResult(
+            transcription="stream text",
+            diarization_output={},
+            formatted_diarization_output="",
+        )
+    )
+    stream = MagicMock()
+    result = await facade.transcribe(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        file_extension=".wav",
+        content_type="audio/wav",
+        audio_stream=stream,
+    )
+    stt.validate_audio_file.assert_called_once_with("audio/wav", ".wav")
+    stt.transcribe_upload_stream.assert_awaited_once_with(
+        stream,
+        ".wav",
+        content_type="audio/wav",
+        cache_lookup=None,
+        language="lug",
+        adapter="lug",
+        whisper=False,
+        recognise_speakers=False,
+    )
+    stt.transcribe_uploaded_file.assert_not_called()
+    assert result.transcription == "stream text"
+
+
 async def test_transcribe_dispatches_org():
     facade, stt, _ = make_facade()
     result = await facade.transcribe(
@@ -251,6 +289,227 @@ async def test_transcribe_dispatches_org():
     assert result.transcription == "org text"
 
 
+# --- transcription cache ---
+
+
+def make_cached_facade():
+    facade, stt, modal = make_facade()
+    stt.audio_bucket_name = "bucket"
+    cache = TranscriptionCache(enabled=True)
+    facade._cache = cache
+    return facade, stt, modal, cache
+
+
+async def test_modal_repeat_is_served_from_cache():
+    facade, _, modal, cache = make_cached_facade()
+    for _ in range(2):
+        result = await facade.transcribe(
+            platform="modal", language="lug", adapter="lug", audio_bytes=b"voice"
+        )
+        assert result.transcription == "modal text"
+
+    modal.transcribe.assert_awaited_once()
+    assert cache.snapshot()["local_hits"] == 1
+    assert result.content_id == content_id_for_bytes(b"voice")
+
+
+async def test_modal_stream_is_hashed_then_streamed():
+    facade, _, modal, cache = make_cached_facade()
+    bodies = []
+
+    async def transcribe(body, language):
+        bodies.append(b"".join([chunk async for chunk in body]))
+        return "modal text"
+
+    modal.transcribe = AsyncMock(side_effect=transcribe)
+    for _ in range(2):
+        upload = UploadFile(io.BytesIO(b"voice"), filename="a.wav")
+        result = await facade.transcribe(
+            platform="modal", language="lug", adapter="lug", audio_stream=upload
+        )
+
+    assert bodies == [b"voice"]
+    assert result.content_id == content_id_for_bytes(b"voice")
+    assert cache.snapshot()["local_hits"] == 1
+
+
+async def test_cache_key_includes_request_options():
+    facade, _, modal, _ = make_cached_facade()
+    await facade.transcribe(
+        platform="modal", language="lug", adapter="lug", audio_bytes=b"voice"
+    )
+    await facade.transcribe(
+        platform="modal", language="ach", adapter="ach", audio_bytes=b"voice"
+    )
+    assert modal.transcribe.await_count == 2
+
+
+async def test_gcs_repeat_uses_blob_fingerprint(monkeypatch):
+    facade, stt, _, _ = make_cached_facade()
+    fingerprint = MagicMock(return_value="md5:abc==")
+    monkeypatch.setattr(
+        "app.services.transcription_service.get_audio_blob_fingerprint", fingerprint
+    )
+    for blob in ("a.wav", "copy-of-a.wav"):
+        result = await facade.transcribe(
+            platform="runpod", language="lug", adapter="lug", gcs_blob_name=blob
+        )
+
+    stt.transcribe_from_gcs.assert_awaited_once()
+    fingerprint.assert_called_with("copy-of-a.wav")
+    assert result.transcription == "gcs text"
+    assert result.blob_name == "copy-of-a.wav"
+    assert result.audio_url == "gs://bucket/copy-of-a.wav"
+
+
+async def test_upload_repeat_is_linked_to_its_own_upload(tmp_path):
+    facade, stt, _, _ = make_cached_facade()
+    stt.upload_to_storage = AsyncMock(return_value=("copy.wav", "gs://bucket/copy.wav"))
+    path = tmp_path / "voice.wav"
+    for _ in range(2):
+        path.write_bytes(b"voice")
+        result = await facade.transcribe(
+            platform="runpod",
+            language="lug",
+            adapter="lug",
+            file_path=str(path),
+            file_extension=".wav",
+        )
+
+    stt.transcribe_uploaded_file.assert_awaited_once()
+    stt.upload_to_storage.assert_awaited_once_with(str(path))
+    assert result.transcription == "upload text"
+    assert result.blob_name == "copy.wav"
+    assert result.audio_url == "gs://bucket/copy.wav"
+
+
+async def test_modal_repeat_has_no_audio_link():
+    facade, stt, _, _ = make_cached_facade()
+    stt.upload_to_storage = AsyncMock()
+    for _ in range(2):
+        result = await facade.transcribe(
+            platform="modal", language="lug", adapter="lug", audio_bytes=b"voice"
+        )
+
+    stt.upload_to_storage.assert_not_called()
+    assert result.audio_url is None and result.blob_name is None
+
+
+async def test_stream_lookup_hit_skips_store():
+    facade, stt, _, cache = make_cached_facade()
+    cached = TranscriptionResult(
+        transcription="cached text",
+        diarization_output={},
+        formatted_diarization_output="",
+    )
+    key = cache.key("sha256:abc", platform="runpod", language="lug", adapter="lug")
+    await cache.set(key, cached)
+
+    async def fake_stream(stream, extension, cache_lookup, **kwargs):
+        hit = await cache_lookup("sha256:abc")
+        return TranscriptionResult(
+            transcription=hit.transcription,
+            diarization_output={},
+            formatted_diarization_output="",
+            content_id="sha256:abc",
+        )
+
+    stt.transcribe_upload_stream = AsyncMock(side_effect=fake_stream)
+    result = await facade.transcribe(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        file_extension=".wav",
+        content_type="audio/wav",
+        audio_stream=MagicMock(),
+    )
+
+    assert result.transcription == "cached text"
+    assert cache.snapshot()["stores"] == 1
+
+
+# --- input normalization ---
+
+
+def _report(path="/tmp/n.ogg", original=1000, normalized=100):
+    return NormalizedAudio(
+        path=path,
+        codec="opus",
+        original_bytes=original,
+        normalized_bytes=normalized,
+        seconds=0.1,
+    )
+
+
+async def test_modal_bytes_are_normalized(monkeypatch):
+    facade, _, modal = make_facade()
+    facade._normalize = True
+    normalize = AsyncMock(return_value=(b"small", _report()))
+    monkeypatch.setattr("app.services.transcription_service.normalize_bytes", normalize)
+
+    await facade.transcribe(
+        platform="modal", language="lug", adapter="lug", audio_bytes=b"big wav"
+    )
+
+    normalize.assert_awaited_once_with(b"big wav", "")
+    modal.transcribe.assert_awaited_once_with(b"small", language="lug")
+
+
+async def test_stream_is_spooled_and_normalized(monkeypatch):
+    facade, stt, _ = make_facade()
+    facade._normalize = True
+    stt.transcribe_upload_stream = AsyncMock()
+    spooled = []
+
+    async def normalize(path):
+        with open(path, "rb") as f:
+            assert f.read() == b"audio bytes"
+        spooled.append(path)
+        return _report()
+
+    monkeypatch.setattr("app.services.transcription_service.normalize_file", normalize)
+    stream = MagicMock()
+    stream.read = AsyncMock(side_effect=[b"audio ", b"bytes", b""])
+
+    await facade.transcribe(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        file_extension=".wav",
+        content_type="audio/wav",
+        audio_stream=stream,
+    )
+
+    stt.transcribe_upload_stream.assert_not_called()
+    kwargs = stt.transcribe_uploaded_file.await_args.kwargs
+    assert kwargs["file_path"] == "/tmp/n.ogg"
+    assert kwargs["file_extension"] == ".ogg"
+    assert not os.path.exists(spooled[0])
+
+
+async def test_failed_normalization_keeps_original(monkeypatch):
+    facade, stt, _ = make_facade()
+    facade._normalize = True
+    monkeypatch.setattr(
+        "app.services.transcription_service.normalize_file",
+        AsyncMock(return_value=None),
+    )
+
+    await facade.transcribe(
+        platform="runpod",
+        language="lug",
+        adapter="lug",
+        org=True,
+        file_path="/tmp/o.wav",
+        file_extension=".wav",
+        content_type="audio/wav",
+    )
+
+    stt.transcribe_org_audio.assert_awaited_once_with(
+        file_path="/tmp/o.wav", recognise_speakers=False
+    )
+
+
 def test_transcription_service_dep_is_exported():
     import app.deps as deps
 
@@ -0,0 +1,86 @@
+"""Tests for ffmpeg-based ASR input normalization."""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.audio_normalize import ffmpeg_args, normalize_bytes, normalize_file
+
+
+def _fake_ffmpeg(tmp_path, output_size):
+    """An executable standing in for ffmpeg: writes ``output_size`` bytes."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        "#!/bin/sh\n"
+        "for last; do :; done\n"
+        f'head -c {output_size} /dev/zero > "$last"\n'
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "upload.wav"
+    path.write_bytes(b"\0" * 1000)
+    return str(path)
+
+
+def test_ffmpeg_args_resample_to_16k_mono():
+    args = ffmpeg_args("in.wav", "out.ogg", "opus", "24k")
+    assert args[args.index("-ar") + 1] == "16000"
+    assert args[args.index("-ac") + 1] == "1"
+    assert args[args.index("-c:a") + 1] == "libopus"
+    assert args[args.index("-b:a") + 1] == "24k"
+    assert args[-1] == "out.ogg"
+
+    assert "flac" in ffmpeg_args("in.wav", "out.flac", "flac", "24k")
+    with pytest.raises(ValueError):
+        ffmpeg_args("in.wav", "out.mp3", "mp3", "24k")
+
+
+async def test_normalize_file_reports_reduction(tmp_path, source):
+    with patch(
+        "app.utils.audio_normalize.shutil.which",
+        return_value=_fake_ffmpeg(tmp_path, 100),
+    ):
+        result = await normalize_file(source, codec="opus")
+
+    try:
+        assert result.extension == ".ogg"
+        assert result.original_bytes == 1000
+        assert result.normalized_bytes == 100
+        assert result.saved_bytes == 900
+        assert result.reduction == pytest.approx(0.9)
+    finally:
+        os.remove(result.path)
+
+
+async def test_larger_output_is_discarded(tmp_path, source):
+    with patch(
+        "app.utils.audio_normalize.shutil.which",
+        return_value=_fake_ffmpeg(tmp_path, 5000),
+    ), patch("app.utils.audio_normalize._remove") as remove:
+        assert await normalize_file(source, codec="flac") is None
+    discarded = remove.call_args.args[0]
+    assert discarded.endswith(".flac")
+    os.remove(discarded)
+
+
+async def test_missing_ffmpeg_skips_normalization(source):
+    with patch("app.utils.audio_normalize.shutil.which", return_value=None):
+        assert await normalize_file(source) is None
+
+
+async def test_normalize_bytes_round_trip(tmp_path):
+    with patch(
+        "app.utils.audio_normalize.shutil.which",
+        return_value=_fake_ffmpeg(tmp_path, 10),
+    ):
+        data, report = await normalize_bytes(b"x" * 100, ".wav", codec="opus")
+
+    assert data == b"\0" * 10
+    assert report.saved_bytes == 90
+    assert not os.path.exists(report.path)
@@ -0,0 +1,158 @@
+"""
+Tests for Audio Probe Module.
+
+This module contains tests for the header-only duration probe defined in
+app/utils/audio_probe.py. Each test writes a minimal container file and
+checks the duration read from its header.
+"""
+
+import struct
+import wave
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.audio_probe import (
+    PROBE_TAIL_BYTES,
+    probe_duration,
+    probe_duration_from_bytes,
+    trim_stream_copy,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames.
+MP3_HEADER = b"\xff\xfb\x90\x00"
+MP3_FRAME_LENGTH = 417
+
+
+@pytest.fixture(autouse=True)
+def no_ffprobe():
+    """Make sure results come from the header parsers."""
+    with patch("app.utils.audio_probe.shutil.which", return_value=None):
+        yield
+
+
+def _write(tmp_path, name, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def _ogg_page(granule: int, packet: bytes) -> bytes:
+    return (
+        b"OggS\x00\x02"
+        + struct.pack("<q", granule)
+        + b"\x00" * 12
+        + bytes([1, len(packet)])
+        + packet
+    )
+
+
+class TestProbeDuration:
+    """Tests for probe_duration."""
+
+    def test_wav(self, tmp_path):
+        path = str(tmp_path / "a.wav")
+        with wave.open(path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(b"\x00\x00" * 16000 * 3)
+
+        assert probe_duration(path) == pytest.approx(3.0)
+
+    def test_flac(self, tmp_path):
+        packed = 44100 << 44 | 1 << 41 | 15 << 36 | 44100 * 7
+        streaminfo = b"\x00" * 10 + packed.to_bytes(8, "big") + b"\x00" * 16
+        path = _write(tmp_path, "a.flac", b"fLaC\x80\x00\x00\x22" + streaminfo)
+
+        assert probe_duration(path) == pytest.approx(7.0)
+
+    def test_ogg_opus(self, tmp_path):
+        head = b"OpusHead\x01\x01" + struct.pack("<H", 312) + b"\x00" * 7
+        data = _ogg_page(0, head) + _ogg_page(48000 * 5 + 312, b"\x00" * 10)
+        path = _write(tmp_path, "a.ogg", data)
+
+        assert probe_duration(path) == pytest.approx(5.0)
+
+    def test_m4a(self, tmp_path):
+        ftyp = struct.pack(">I4s", 16, b"ftyp") + b"M4A \x00\x00\x00\x00"
+        mvhd_body = b"\x00" * 12 + struct.pack(">II", 1000, 42500) + b"\x00" * 80
+        mvhd = struct.pack(">I4s", 8 + len(mvhd_body), b"mvhd") + mvhd_body
+        moov = struct.pack(">I4s", 8 + len(mvhd), b"moov") + mvhd
+        path = _write(tmp_path, "a.m4a", ftyp + moov)
+
+        assert probe_duration(path) == pytest.approx(42.5)
+
+    def test_mp3_cbr(self, tmp_path):
+        frame = MP3_HEADER + b"\x00" * (MP3_FRAME_LENGTH - 4)
+        path = _write(tmp_path, "a.mp3", frame * 100)
+
+        assert probe_duration(path) == pytest.approx(100 * 417 * 8 / 128000)
+
+    def test_mp3_xing_with_id3_tag(self, tmp_path):
+        id3 = b"ID3\x03\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10
+        xing = b"Xing" + struct.pack(">II", 1, 1000)
+        first = MP3_HEADER + b"\x00" * 32 + xing
+        first += b"\x00" * (MP3_FRAME_LENGTH - len(first))
+        frame = MP3_HEADER + b"\x00" * (MP3_FRAME_LENGTH - 4)
+        path = _write(tmp_path, "a.mp3", id3 + first + frame * 3)
+
+        assert probe_duration(path) == pytest.approx(1000 * 1152 / 44100)
+
+    def test_mp3_vbr_without_xing_is_unknown(self, tmp_path):
+        # A 320 kbps first frame followed by 128 kbps frames: measuring from
+        # the first bitrate would report a fraction of the real length.
+        loud = b"\xff\xfb\xe0\x00" + b"\x00" * (1044 - 4)
+        frame = MP3_HEADER + b"\x00" * (MP3_FRAME_LENGTH - 4)
+        path = _write(tmp_path, "a.mp3", loud + frame * 100)
+
+        assert probe_duration(path) is None
+
+    def test_mp3_single_unconfirmed_frame_is_unknown(self, tmp_path):
+        path = _write(tmp_path, "a.mp3", MP3_HEADER + b"\x00" * 100)
+
+        assert probe_duration(path) is None
+
+    def test_unknown_format_returns_none(self, tmp_path):
+        path = _write(tmp_path, "a.mp3", b"fake audio data")
+
+        assert probe_duration(path) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert probe_duration(str(tmp_path / "missing.wav")) is None
+
+
+def test_trim_stream_copy_without_ffmpeg(tmp_path):
+    """Callers fall back to decoding when ffmpeg is not installed."""
+    src = _write(tmp_path, "a.mp3", b"data")
+
+    assert trim_stream_copy(src, str(tmp_path / "b.mp3"), 600) is False
+
+
+class TestProbeDurationFromBytes:
+    """Tests for probe_duration_from_bytes."""
+
+    def test_wav_head_only(self, tmp_path):
+        path = tmp_path / "a.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(b"\x00\x00" * 8000 * 60)
+        data = path.read_bytes()
+
+        assert probe_duration_from_bytes(
+            data[:4096], data[-4096:], len(data)
+        ) == pytest.approx(60.0)
+
+    def test_ogg_uses_tail(self):
+        head_packet = b"\x01vorbis\x00\x00\x00\x00\x01" + struct.pack("<I", 16000)
+        head = _ogg_page(0, head_packet + b"\x00" * 20)
+        last_page = _ogg_page(16000 * 90, b"\x00" * 10)
+        tail = b"\x00" * (PROBE_TAIL_BYTES - len(last_page)) + last_page
+        size = 10 * 1024 * 1024
+
+        assert probe_duration_from_bytes(head, tail, size) == pytest.approx(90.0)
+
+    def test_header_outside_head_returns_none(self):
+        assert probe_duration_from_bytes(b"\x00" * 1024, b"", 10_000_000) is None
@@ -0,0 +1,75 @@
+"""Tests for client callback URL validation (SSRF guard)."""
+
+import asyncio
+
+import pytest
+
+from app.utils import callback_url as callback_module
+from app.utils.callback_url import (
+    UnsafeCallbackURL,
+    pin_callback_url,
+    resolve_callback_url,
+)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/done",
+        "http://localhost:8080/done",
+        "http://10.1.2.3/done",
+        "http://192.168.0.5/done",
+        "http://169.254.169.254/computeMetadata/v1/",
+        "http://[::1]/done",
+        "http://[::ffff:127.0.0.1]/done",
+        "http://0.0.0.0/done",
+        "http://100.64.0.1/done",
+    ],
+)
+async def test_non_public_addresses_are_refused(url):
+    with pytest.raises(UnsafeCallbackURL):
+        await resolve_callback_url(url)
+
+
+@pytest.mark.parametrize("url", ["ftp://8.8.8.8/done", "http:///done", "not a url"])
+async def test_malformed_urls_are_refused(url):
+    with pytest.raises(UnsafeCallbackURL):
+        await resolve_callback_url(url)
+
+
+async def test_public_address_is_accepted():
+    assert await resolve_callback_url("https://8.8.8.8/hook") == ["8.8.8.8"]
+
+
+async def test_refused_if_any_resolved_address_is_private(monkeypatch):
+    async def fake_getaddrinfo(host, port, **kwargs):
+        return [(2, 1, 6, "", ("8.8.8.8", port)), (2, 1, 6, "", ("10.0.0.1", port))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    with pytest.raises(UnsafeCallbackURL):
+        await resolve_callback_url("https://client.example/hook")
+
+
+async def test_private_addresses_allowed_for_local_development(monkeypatch):
+    monkeypatch.setattr(
+        callback_module.settings, "transcription_job_callback_allow_private", True
+    )
+    assert await resolve_callback_url("http://127.0.0.1:9000/done") == ["127.0.0.1"]
+
+
+def test_pin_keeps_host_header_and_tls_name():
+    url, headers, extensions = pin_callback_url(
+        "https://user:pw@client.example:8443/hook?x=1", "8.8.8.8"
+    )
+    assert url == "https://user:pw@8.8.8.8:8443/hook?x=1"
+    assert headers == {"Host": "client.example:8443"}
+    assert extensions == {"sni_hostname": "client.example"}
+
+
+def test_pin_brackets_ipv6_addresses():
+    url, headers, extensions = pin_callback_url(
+        "http://client.example/hook", "2001:4860::8888"
+    )
+    assert url == "http://[2001:4860::8888]/hook"
+    assert headers == {"Host": "client.example"}
+    assert extensions == {}
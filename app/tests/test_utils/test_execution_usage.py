@@ -0,0 +1,65 @@
+"""Tests for per-request upstream execution usage tracking."""
+
+import asyncio
+
+from app.utils.execution_usage import (
+    current_execution_usage,
+    observe_runpod_job,
+    record_execution,
+    start_execution_tracking,
+    stop_execution_tracking,
+)
+
+
+def test_runpod_jobs_are_attributed_to_the_current_request():
+    usage = start_execution_tracking()
+    try:
+        observe_runpod_job("asr", {"executionTime": 4000, "delayTime": 500})
+        observe_runpod_job("asr", {"executionTime": 1000, "delayTime": 12000})
+        record_execution("modal_stt", 2.0)
+    finally:
+        stop_execution_tracking()
+
+    assert usage.jobs == 3
+    assert usage.gpu_seconds == 7.0
+    assert usage.queue_seconds == 12.5
+    assert usage.cold_start is True
+    assert usage.upstream == "asr"
+    assert current_execution_usage() is None
+
+
+def test_recording_outside_a_request_is_a_no_op():
+    record_execution("asr", 1.0)
+    observe_runpod_job("asr", {})
+
+    assert current_execution_usage() is None
+
+
+def test_missing_job_timings_count_as_zero():
+    usage = start_execution_tracking()
+    try:
+        observe_runpod_job("asr", {"status": "FAILED"})
+    finally:
+        stop_execution_tracking()
+
+    assert usage.jobs == 1
+    assert usage.gpu_seconds == 0.0
+    assert usage.cold_start is False
+
+
+async def test_child_tasks_record_into_the_parent_request():
+    usage = start_execution_tracking()
+    try:
+        await asyncio.gather(
+            asyncio.create_task(asyncio.to_thread(record_execution, "asr", 1.0)),
+            asyncio.create_task(_record_later()),
+        )
+    finally:
+        stop_execution_tracking()
+
+    assert usage.gpu_seconds == 3.0
+
+
+async def _record_later():
+    await asyncio.sleep(0)
+    record_execution("asr", 2.0)
@@ -0,0 +1,58 @@
+"""Tests for sentence-aware text chunking."""
+
+from app.utils.sentences import chunk_text, split_sentences
+
+
+def test_splits_on_terminators_followed_by_space() -> None:
+    text = 'Oli otya? Ndi bulungi! "Weebale nnyo." Version 2.5 is out'
+    assert split_sentences(text) == [
+        "Oli otya?",
+        "Ndi bulungi!",
+        '"Weebale nnyo."',
+        "Version 2.5 is out",
+    ]
+
+
+def test_abbreviations_and_initials_are_not_boundaries() -> None:
+    text = "Dr. Okello met J. Mukasa at 9 a.m. today. They talked, e.g. about rain."
+    assert split_sentences(text, "eng") == [
+        "Dr. Okello met J. Mukasa at 9 a.m. today.",
+        "They talked, e.g. about rain.",
+    ]
+
+
+def test_line_breaks_end_sentences() -> None:
+    assert split_sentences("Title\n\nFirst line. Second") == [
+        "Title",
+        "First line.",
+        "Second",
+    ]
+
+
+def test_amharic_uses_ethiopic_full_stop() -> None:
+    text = "ሰላም ነው። እንዴት ነህ፧ ደህና ነኝ"
+    assert split_sentences(text, "amh") == ["ሰላም ነው።", "እንዴት ነህ፧", "ደህና ነኝ"]
+    assert len(split_sentences(text)) == 1
+
+
+def test_chunks_pack_whole_sentences() -> None:
+    sentences = [f"Sentence number {i} is here." for i in range(10)]
+    chunks = chunk_text(" ".join(sentences), max_chars=60)
+
+    assert " ".join(chunks) == " ".join(sentences)
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert all(chunk.endswith(".") for chunk in chunks)
+    assert len(chunks) == 5
+
+
+def test_long_sentences_are_cut_at_clauses_then_words() -> None:
+    clauses = "first part here, second part here, third part here"
+    chunks = chunk_text(clauses, max_chars=20)
+    assert chunks == ["first part here,", "second part here,", "third part here"]
+
+    words = " ".join(["word"] * 30)
+    chunks = chunk_text(words, max_chars=24)
+    assert all(len(chunk) <= 24 for chunk in chunks)
+    assert " ".join(chunks) == words
+
+    assert chunk_text("x" * 50, max_chars=20) == ["x" * 20, "x" * 20, "x" * 10]
@@ -0,0 +1,142 @@
+"""Tests for StreamingUpload (resumable upload fed while audio streams)."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils import storage
+from app.utils.storage import StreamingUpload
+
+
+class RecordingWriter:
+    def __init__(self, fail: bool = False, gate: threading.Event = None) -> None:
+        self.data = b""
+        self.writes = 0
+        self.closed = False
+        self.fail = fail
+        self.gate = gate
+
+    def write(self, data: bytes) -> int:
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail:
+            raise RuntimeError("upload failed")
+        self.writes += 1
+        self.data += data
+        return len(data)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_blob(writer: RecordingWriter) -> MagicMock:
+    blob = MagicMock()
+    blob.open = MagicMock(return_value=writer)
+    return blob
+
+
+async def test_writes_in_order_and_finalizes():
+    writer = RecordingWriter()
+    blob = make_blob(writer)
+    upload = StreamingUpload(blob, "audio/wav", chunk_size=262144)
+
+    for piece in (b"RIFF", b"", b"abc", b"def"):
+        await upload.write(piece)
+        await asyncio.sleep(0)
+
+    assert await upload.finish() is blob
+    assert writer.data == b"RIFFabcdef"
+    assert writer.closed
+    assert upload.bytes_written == 10
+    blob.open.assert_called_once_with(
+        "wb", chunk_size=262144, content_type="audio/wav", if_generation_match=0
+    )
+
+
+async def test_queued_pieces_are_coalesced():
+    writer = RecordingWriter()
+    upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+
+    # Queued before the drain task first runs: one write.
+    for piece in (b"a", b"b", b"c"):
+        await upload.write(piece)
+    await upload.finish()
+
+    assert writer.data == b"abc"
+    assert writer.writes == 1
+
+
+async def test_upload_error_surfaces_at_finish():
+    writer = RecordingWriter(fail=True)
+    upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+    await upload.write(b"abc")
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await upload.finish()
+    assert not writer.closed
+
+
+async def test_abort_never_finalizes():
+    writer = RecordingWriter()
+    upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+    await upload.write(b"abc")
+
+    await upload.abort()
+    await upload.abort()
+
+    assert not writer.closed
+
+
+async def test_write_waits_when_the_queue_is_full():
+    gate = threading.Event()
+    writer = RecordingWriter(gate=gate)
+    with patch.object(storage, "STREAMING_UPLOAD_MAX_PENDING", 2):
+        upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+    try:
+        await upload.write(b"a")
+        await asyncio.sleep(0.01)  # the drain task is now stuck in GCS
+        await upload.write(b"b")
+        await upload.write(b"c")
+
+        blocked = asyncio.create_task(upload.write(b"d"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await asyncio.wait_for(blocked, 1)
+        await upload.finish()
+    finally:
+        gate.set()
+
+    assert writer.data == b"abcd"
+
+
+async def test_write_raises_once_the_upload_failed():
+    writer = RecordingWriter(fail=True)
+    upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+    await upload.write(b"abc")
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(upload._task, 1)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await upload.write(b"def")
+    assert upload.bytes_written == 3
+
+
+async def test_full_queue_does_not_hang_after_a_failure():
+    gate = threading.Event()
+    writer = RecordingWriter(fail=True, gate=gate)
+    with patch.object(storage, "STREAMING_UPLOAD_MAX_PENDING", 1):
+        upload = StreamingUpload(make_blob(writer), "audio/wav", chunk_size=262144)
+    await upload.write(b"a")
+    await asyncio.sleep(0.01)
+    await upload.write(b"b")
+
+    blocked = asyncio.create_task(upload.write(b"c"))
+    await asyncio.sleep(0.01)
+    gate.set()
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await asyncio.wait_for(blocked, 1)
@@ -0,0 +1,140 @@
+"""
+Tests for Prompt Token Budgeting Module.
+
+This module contains tests for app/utils/token_budget.py. The tokenizer is
+patched out so counts follow the deterministic character heuristic.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import app.utils.token_budget as token_budget
+from app.utils.token_budget import (
+    count_message_tokens,
+    count_tokens,
+    fit_messages_to_budget,
+    prompt_token_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def heuristic_tokenizer(monkeypatch):
+    """Force the heuristic path and clear memoized counts between tests."""
+    monkeypatch.setattr(token_budget, "get_tokenizer", lambda: None)
+    count_tokens.cache_clear()
+    yield
+    count_tokens.cache_clear()
+
+
+def _history(pairs: int, size: int = 300) -> list:
+    messages = [{"role": "system", "content": "You are Sunflower."}]
+    for i in range(pairs):
+        messages.append({"role": "user", "content": f"q{i} " + "x" * size})
+        messages.append({"role": "assistant", "content": f"a{i} " + "y" * size})
+    messages.append({"role": "user", "content": "latest question"})
+    return messages
+
+
+class TestCountTokens:
+    """Tests for token counting."""
+
+    def test_empty_text_is_zero(self):
+        assert count_tokens("") == 0
+
+    def test_heuristic_rounds_up(self):
+        assert count_tokens("abcd") == 2
+
+    def test_uses_tokenizer_when_available(self, monkeypatch):
+        fake = SimpleNamespace(
+            encode=lambda text, add_special_tokens=False: SimpleNamespace(
+                ids=text.split()
+            )
+        )
+        monkeypatch.setattr(token_budget, "get_tokenizer", lambda: fake)
+        assert count_tokens("one two three") == 3
+
+    def test_message_count_includes_framing(self):
+        messages = [{"role": "user", "content": ""}]
+        assert count_message_tokens(messages) == (
+            token_budget.REPLY_PRIMING_TOKENS
+            + token_budget.MESSAGE_OVERHEAD_TOKENS
+            + count_tokens("user")
+        )
+
+
+class TestPromptTokenBudget:
+    """Tests for prompt_token_budget."""
+
+    def test_reserves_max_tokens(self, monkeypatch):
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 4096
+        )
+        assert prompt_token_budget(1000) == 3096
+
+    def test_defaults_to_configured_reserve(self, monkeypatch):
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 4096
+        )
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_completion_reserve_tokens", 96
+        )
+        assert prompt_token_budget() == 4000
+
+    def test_large_max_tokens_keeps_minimum_prompt(self, monkeypatch):
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 4096
+        )
+        monkeypatch.setattr(token_budget.settings, "sunflower_min_prompt_tokens", 512)
+        assert prompt_token_budget(5000) == 512
+        assert prompt_token_budget(4096) == 512
+
+    def test_minimum_prompt_capped_at_window(self, monkeypatch):
+        monkeypatch.setattr(
+            token_budget.settings, "sunflower_context_window_tokens", 1024
+        )
+        monkeypatch.setattr(token_budget.settings, "sunflower_min_prompt_tokens", 2048)
+        assert prompt_token_budget(5000) == 1024
+
+
+class TestFitMessagesToBudget:
+    """Tests for fit_messages_to_budget."""
+
+    def test_within_budget_unchanged(self):
+        messages = _history(2)
+        assert fit_messages_to_budget(messages, budget=10_000) == messages
+
+    def test_drops_oldest_pairs_first(self):
+        messages = _history(5)
+        trimmed = fit_messages_to_budget(messages, budget=400)
+
+        assert trimmed[0] == messages[0]
+        assert trimmed[-1] == messages[-1]
+        assert count_message_tokens(trimmed) <= 400
+        # The surviving history is the most recent turns, starting on a user turn.
+        assert trimmed[1]["role"] == "user"
+        assert trimmed[-2] == messages[-2]
+        assert "q0" not in " ".join(m["content"] for m in trimmed)
+
+    def test_memory_note_outlives_history(self):
+        messages = _history(3)
+        note = {"role": "system", "content": "Memory: user likes Luganda."}
+        messages.insert(1, note)
+
+        trimmed = fit_messages_to_budget(messages, budget=100)
+
+        assert note in trimmed
+        assert [m["role"] for m in trimmed] == ["system", "system", "user"]
+
+    def test_pinned_messages_kept_when_over_budget(self):
+        messages = [
+            {"role": "system", "content": "s" * 300},
+            {"role": "user", "content": "u" * 300},
+        ]
+        assert fit_messages_to_budget(messages, budget=10) == messages
+
+    def test_does_not_mutate_input(self):
+        messages = _history(4)
+        snapshot = [dict(m) for m in messages]
+        fit_messages_to_budget(messages, budget=200)
+        assert messages == snapshot
@@ -0,0 +1,127 @@
+"""
+Tests for the GCS audio upload helpers in app/utils/upload_audio_file_gcp.py.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydub.generators import Sine
+
+from app.utils import upload_audio_file_gcp
+from app.utils.upload_audio_file_gcp import (
+    open_audio_bucket_writer,
+    probe_audio_blob,
+    stream_audio_upload,
+)
+
+
+class _AsyncStream:
+    """Minimal ``UploadFile`` stand-in."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+@pytest.fixture
+def blob_writer(monkeypatch):
+    monkeypatch.setenv("AUDIO_CONTENT_BUCKET_NAME", "audio-bucket")
+    written = bytearray()
+    writer = MagicMock()
+    writer.write.side_effect = lambda chunk: written.extend(chunk)
+    client = MagicMock()
+    blob = client.bucket.return_value.blob.return_value
+    blob.open.return_value = writer
+    with patch.object(upload_audio_file_gcp, "_storage_client", client):
+        yield client, blob, writer, written
+
+
+async def test_stream_audio_upload_pipes_every_chunk(blob_writer):
+    client, blob, writer, written = blob_writer
+    data = bytes(range(256)) * 12_000  # ~3 MB, several reads
+
+    with patch.object(upload_audio_file_gcp, "PROBE_HEAD_BYTES", 1000), patch.object(
+        upload_audio_file_gcp, "PROBE_TAIL_BYTES", 500
+    ):
+        result = await stream_audio_upload(_AsyncStream(data), "x.wav", "audio/wav")
+
+    client.bucket.assert_called_once_with("audio-bucket")
+    assert blob.open.call_args.args == ("wb",)
+    assert blob.open.call_args.kwargs["content_type"] == "audio/wav"
+    assert bytes(written) == data
+    writer.close.assert_called_once()
+    assert result.blob_uri == "gs://audio-bucket/x.wav"
+    assert result.size == len(data)
+    assert result.head == data[:1000]
+    assert result.tail == data[-500:]
+
+
+async def test_stream_audio_upload_sends_prefix_first(blob_writer):
+    _, _, _, written = blob_writer
+
+    result = await stream_audio_upload(
+        _AsyncStream(b"-rest"), "x.wav", "audio/wav", prefix=b"head"
+    )
+
+    assert bytes(written) == b"head-rest"
+    assert result.size == 9
+    assert result.head == b"head-rest"
+
+
+async def test_stream_audio_upload_does_not_finalize_on_error(blob_writer):
+    _, _, writer, _ = blob_writer
+    writer.write.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        await stream_audio_upload(_AsyncStream(b"data"), "x.wav")
+
+    writer.close.assert_not_called()
+
+
+def _ranged_blob(data: bytes) -> MagicMock:
+    """Blob stand-in serving ``download_as_bytes`` ranges (end inclusive)."""
+    blob = MagicMock()
+    blob.size = len(data)
+    blob.download_as_bytes.side_effect = lambda start=0, end=None: data[
+        start : None if end is None else end + 1  # noqa: E203
+    ]
+    return blob
+
+
+def test_probe_audio_blob_reads_only_the_ends():
+    buffer = io.BytesIO()
+    Sine(440).to_audio_segment(duration=20_000).export(buffer, format="wav")
+    data = buffer.getvalue()
+    blob = _ranged_blob(data)
+    client = MagicMock()
+    client.bucket.return_value.get_blob.return_value = blob
+
+    with patch.object(upload_audio_file_gcp, "_storage_client", client):
+        probe = probe_audio_blob("x.wav", "audio-bucket")
+
+    client.bucket.assert_called_once_with("audio-bucket")
+    assert probe.size == len(data)
+    assert probe.duration_seconds == pytest.approx(20.0, abs=0.01)
+    fetched = sum(
+        len(data[c.kwargs["start"] : c.kwargs.get("end", len(data)) + 1])  # noqa: E203
+        for c in blob.download_as_bytes.call_args_list
+    )
+    assert fetched < len(data) / 2
+
+
+def test_probe_audio_blob_missing_returns_none():
+    client = MagicMock()
+    client.bucket.return_value.get_blob.return_value = None
+
+    with patch.object(upload_audio_file_gcp, "_storage_client", client):
+        assert probe_audio_blob("missing.wav", "audio-bucket") is None
+
+
+def test_open_audio_bucket_writer_never_overwrites(blob_writer):
+    _, blob, writer, _ = blob_writer
+
+    assert open_audio_bucket_writer("r.ndjson", "application/x-ndjson") is writer
+    assert blob.open.call_args.kwargs["if_generation_match"] == 0
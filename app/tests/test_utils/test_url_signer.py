@@ -0,0 +1,144 @@
+"""Tests for signed URL caching and batched signing."""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.url_signer import UrlSigner
+
+
+def make_blob(name: str = "audio/a.wav", bucket: str = "bucket") -> MagicMock:
+    blob = MagicMock()
+    blob.name = name
+    blob.bucket.name = bucket
+    blob.generate_signed_url.side_effect = lambda **kw: (
+        f"https://signed/{name}?method={kw['method']}&n={time.monotonic_ns()}"
+    )
+    return blob
+
+
+def test_get_urls_are_reused_until_the_margin() -> None:
+    signer = UrlSigner(margin_seconds=300)
+    blob = make_blob()
+
+    first = signer.sign(blob, expiry_minutes=30)
+    second = signer.sign(blob, expiry_minutes=30)
+
+    assert second.url == first.url
+    assert (first.cached, second.cached) == (False, True)
+    assert second.signing_ms == 0.0
+    assert blob.generate_signed_url.call_count == 1
+    assert signer.snapshot()["hits"] == 1
+
+    # Inside the margin the cached URL is too close to expiry: re-sign.
+    key = next(iter(signer._urls))
+    signer._urls[key] = (first.url, datetime.now(UTC) + timedelta(seconds=200))
+    third = signer.sign(blob, expiry_minutes=30)
+    assert third.cached is False
+    assert blob.generate_signed_url.call_count == 2
+
+
+def test_margin_never_exceeds_half_the_lifetime() -> None:
+    signer = UrlSigner(margin_seconds=3600)
+    blob = make_blob()
+
+    signer.sign(blob, expiry_minutes=10)
+    assert signer.sign(blob, expiry_minutes=10).cached is True
+
+
+def test_put_urls_and_other_expiries_are_signed_fresh() -> None:
+    signer = UrlSigner()
+    blob = make_blob()
+
+    signer.sign(blob, expiry_minutes=15, method="PUT", content_type="audio/wav")
+    signer.sign(blob, expiry_minutes=15, method="PUT", content_type="audio/wav")
+    signer.sign(blob, expiry_minutes=30)
+    signer.sign(blob, expiry_minutes=60)
+
+    assert blob.generate_signed_url.call_count == 4
+    put_kwargs = blob.generate_signed_url.call_args_list[0].kwargs
+    assert put_kwargs["content_type"] == "audio/wav"
+    assert signer.snapshot()["entries"] == 2
+
+
+def test_lru_evicts_oldest_entry() -> None:
+    signer = UrlSigner(max_entries=2)
+    blobs = [make_blob(f"audio/{i}.wav") for i in range(3)]
+    for blob in blobs:
+        signer.sign(blob, expiry_minutes=30)
+
+    assert signer.snapshot()["entries"] == 2
+    assert signer.sign(blobs[0], expiry_minutes=30).cached is False
+    assert signer.sign(blobs[2], expiry_minutes=30).cached is True
+
+
+def test_credentials_are_shared_and_refreshed_only_when_invalid() -> None:
+    credentials = MagicMock(valid=False, token="token-1")
+    credentials.refresh.side_effect = lambda request: setattr(
+        credentials, "valid", True
+    )
+    signer = UrlSigner()
+
+    with patch(
+        "app.utils.url_signer.default", return_value=(credentials, "project")
+    ) as default:
+        for i in range(3):
+            signer.sign(
+                make_blob(f"audio/{i}.wav"),
+                expiry_minutes=30,
+                service_account_email="sa@example.com",
+            )
+
+    default.assert_called_once()
+    credentials.refresh.assert_called_once()
+
+
+def test_signing_without_credentials_falls_back_to_library() -> None:
+    signer = UrlSigner()
+    blob = make_blob()
+
+    with patch("app.utils.url_signer.default", side_effect=Exception("no adc")):
+        signed = signer.sign(
+            blob, expiry_minutes=30, service_account_email="sa@example.com"
+        )
+
+    assert signed.url.startswith("https://signed/")
+    assert "access_token" not in blob.generate_signed_url.call_args.kwargs
+    assert signed.expires_at > datetime.now(UTC)
+
+
+async def test_sign_many_runs_concurrently_and_reports_failures() -> None:
+    signer = UrlSigner(max_concurrency=4)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_sign(**kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "https://signed/ok"
+
+    blobs = [make_blob(f"audio/{i}.wav") for i in range(4)]
+    for blob in blobs:
+        blob.generate_signed_url.side_effect = slow_sign
+    broken = make_blob("audio/broken.wav")
+    broken.generate_signed_url.side_effect = RuntimeError("signBlob denied")
+
+    results = await signer.sign_many(
+        [*blobs, broken], expiry_minutes=30, return_exceptions=True
+    )
+
+    assert [r.url for r in results[:4]] == ["https://signed/ok"] * 4
+    assert isinstance(results[4], RuntimeError)
+    assert peak > 1
+
+    with pytest.raises(RuntimeError):
+        await signer.sign_many([broken], expiry_minutes=30)
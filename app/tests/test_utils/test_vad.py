@@ -0,0 +1,62 @@
+"""Tests for the energy-based chunk planner in app/utils/vad.py."""
+
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from app.utils.vad import FRAME_MS, frame_energies, plan_chunks, silence_threshold
+
+
+def _speech_with_pauses(pauses_at_ms, total_ms, pause_ms=1200):
+    """Synthetic energies: loud everywhere except pauses starting at given ms."""
+    energies = [1000] * (total_ms // FRAME_MS)
+    for start in pauses_at_ms:
+        for frame in range(start // FRAME_MS, (start + pause_ms) // FRAME_MS):
+            energies[frame] = 10
+    return energies
+
+
+class TestPlanChunks:
+    def test_short_audio_is_one_span(self) -> None:
+        energies = [1000] * 100
+        assert plan_chunks(energies, 3000, target_ms=5000, max_ms=8000) == [(0, 3000)]
+
+    def test_cuts_inside_pauses(self) -> None:
+        energies = _speech_with_pauses([6000, 13000], total_ms=18000)
+
+        spans = plan_chunks(energies, 18000, target_ms=5000, max_ms=8000)
+
+        assert len(spans) == 3
+        assert 6000 <= spans[0][1] <= 7200
+        assert 13000 <= spans[1][1] <= 14200
+
+    def test_spans_are_contiguous_and_bounded(self) -> None:
+        energies = [1000 + (i % 7) for i in range(20000 // FRAME_MS)]
+
+        spans = plan_chunks(energies, 20000, target_ms=4000, max_ms=6000)
+
+        assert spans[0][0] == 0
+        assert spans[-1][1] == 20000
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            assert end == start
+        for start, end in spans:
+            assert end - start <= 6000
+        for start, end in spans[:-1]:
+            assert end - start >= 4000
+
+    def test_max_below_target_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            plan_chunks([], 1000, target_ms=500, max_ms=400)
+
+
+class TestEnergies:
+    def test_silence_is_below_threshold_and_tone_above(self) -> None:
+        tone = Sine(440).to_audio_segment(duration=600, volume=-10)
+        audio = AudioSegment.silent(duration=600) + tone
+
+        energies = frame_energies(audio)
+        threshold = silence_threshold(energies)
+
+        assert len(energies) == 1200 // FRAME_MS
+        assert all(e <= threshold for e in energies[: 600 // FRAME_MS])
+        assert all(e > threshold for e in energies[600 // FRAME_MS + 1 :])  # noqa: E203
@@ -0,0 +1,70 @@
+"""Tests for crossfaded WAV stitching."""
+
+import io
+import struct
+import wave
+
+import pytest
+
+from app.utils.wav_stitch import Crossfader, WavFormat, read_wav, stitch, wav_header
+
+FMT = WavFormat(channels=1, sample_width=2, frame_rate=1000)
+
+
+def make_wav(samples, fmt: WavFormat = FMT) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(fmt.channels)
+        wav.setsampwidth(fmt.sample_width)
+        wav.setframerate(fmt.frame_rate)
+        wav.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return buffer.getvalue()
+
+
+def samples(pcm: bytes):
+    return list(struct.unpack(f"<{len(pcm) // 2}h", pcm))
+
+
+def test_stitch_overlaps_clips_with_a_linear_fade() -> None:
+    fmt, wav = stitch([make_wav([1000] * 100), make_wav([-1000] * 100)], 10)
+
+    assert fmt == FMT
+    parsed_fmt, pcm = read_wav(wav)
+    assert parsed_fmt == FMT
+    out = samples(pcm)
+    # 10 ms at 1 kHz = 10 overlapping frames.
+    assert len(out) == 190
+    assert out[:90] == [1000] * 90
+    assert out[100:] == [-1000] * 90
+    seam = out[90:100]
+    assert seam == sorted(seam, reverse=True)
+    assert 1000 > seam[0] > seam[-1] > -1000
+
+
+def test_incremental_feed_matches_stitch() -> None:
+    clips = [[100] * 30, [200] * 5, [300] * 40]
+    fader = Crossfader(FMT, 10)
+    streamed = b"".join(fader.feed(read_wav(make_wav(c))[1]) for c in clips)
+    streamed += fader.flush()
+
+    _, wav = stitch([make_wav(c) for c in clips], 10)
+    assert streamed == read_wav(wav)[1]
+
+
+def test_zero_crossfade_concatenates() -> None:
+    _, wav = stitch([make_wav([1] * 3), make_wav([2] * 3)], 0)
+    assert samples(read_wav(wav)[1]) == [1, 1, 1, 2, 2, 2]
+
+
+def test_mismatched_formats_are_rejected() -> None:
+    other = WavFormat(channels=1, sample_width=2, frame_rate=2000)
+    with pytest.raises(ValueError):
+        stitch([make_wav([0] * 10), make_wav([0] * 10, other)], 10)
+
+
+def test_streaming_header_has_unknown_length() -> None:
+    header = wav_header(FMT)
+    assert len(header) == 44
+    assert header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+    assert struct.unpack("<I", header[40:44])[0] == 0xFFFFFFFF
+    assert struct.unpack("<I", wav_header(FMT, 200)[40:44])[0] == 200
@@ -1,10 +1,12 @@
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.crud.admin_monitoring import (
     get_all_logs_since,
+    get_execution_usage_since,
     get_logs_by_organization,
     get_logs_by_organization_type,
     get_logs_by_sector,
@@ -12,6 +14,8 @@ from app.crud.admin_monitoring import (
     get_usage_stats_all,
 )
 from app.schemas.monitoring import EndpointLog
+from app.services.billing_analytics import attribution
+from app.services.billing_analytics.ranges import floor_to_quantum
 from app.utils.monitoring_utils import (
     _bucket_format,
     _generate_labels,
@@ -163,6 +167,44 @@ async def get_admin_sector_stats(db: AsyncSession, sector: str, time_range: str
     }
 
 
+async def get_admin_execution_cost_stats(
+    db: AsyncSession,
+    billing,
+    time_range: str = "7d",
+    group_by: str = "user",
+):
+    """GPU-seconds and estimated cost per user, organization or endpoint.
+
+    ``billing`` is the BillingAnalyticsService; its provider records give the
+    effective rate per RunPod endpoint / mapped Modal app for the same period
+    (Modal apps are priced over the GPU-seconds recorded here).
+    """
+    td = parse_time_range(time_range)
+    start_date = datetime.now() - td
+    usage_rows = await get_execution_usage_since(db, start_date, group_by)
+
+    # Billing ranges are naive UTC; quantize so repeated calls share its cache.
+    end_utc = floor_to_quantum(
+        datetime.now(timezone.utc).replace(tzinfo=None),
+        settings.billing_cache_quantum_seconds,
+    )
+    recorded_seconds: defaultdict[str, float] = defaultdict(float)
+    for _, upstream, _, gpu_seconds, _, _ in usage_rows:
+        if upstream:
+            recorded_seconds[upstream] += float(gpu_seconds or 0.0)
+    billing_rates, warnings = await billing.execution_rates(
+        end_utc - td, end_utc, dict(recorded_seconds)
+    )
+
+    costs = attribution.attribute_costs(
+        usage_rows,
+        billing_rates,
+        settings.execution_cost_per_second,
+        settings.execution_default_cost_per_second,
+    )
+    return {"group_by": group_by, **costs, "warnings": warnings}
+
+
 def _build_chart_data(logs, fmt: str, start_date, td):  # noqa: C901
     """Build volume, latency, endpoint, and distribution chart data from logs."""
     daily_volume = defaultdict(int)
@@ -0,0 +1,80 @@
+"""
+Binary framing for streamed TTS audio.
+
+The SSE transport of ``response_mode=both`` base64-encodes every audio chunk
+into a JSON event, a third more bytes plus an encode/decode per chunk.
+Clients that send ``Accept: application/x-tts-frames`` instead get raw audio
+in a chunked HTTP body of frames::
+
+    +--------+----------------------+-----------------+
+    | type   | length               | payload         |
+    | 1 byte | 4 bytes, big-endian  | length bytes    |
+    +--------+----------------------+-----------------+
+
+    type 0x01 (AUDIO)    payload is WAV bytes; concatenated in order they
+                         form the audio file
+    type 0x02 (CONTROL)  payload is a UTF-8 JSON object: the final
+                         ``{"event": "complete", "audio_url": ...}`` or
+                         ``{"event": "error", "error": ...}``; always last
+
+Usage:
+    yield audio_frame(chunk)
+    ...
+    yield control_frame(final_response.model_dump(mode="json"))
+"""
+
+import json
+import struct
+from typing import Any, Dict, Iterator, Tuple
+
+FRAMES_MEDIA_TYPE = "application/x-tts-frames"
+
+FRAME_AUDIO = 0x01
+FRAME_CONTROL = 0x02
+
+_HEADER = struct.Struct(">BI")
+
+
+def audio_frame(data: bytes) -> bytes:
+    """An AUDIO frame carrying ``data``."""
+    return _HEADER.pack(FRAME_AUDIO, len(data)) + data
+
+
+def control_frame(message: Dict[str, Any]) -> bytes:
+    """A CONTROL frame carrying ``message`` as JSON."""
+    payload = json.dumps(message).encode("utf-8")
+    return _HEADER.pack(FRAME_CONTROL, len(payload)) + payload
+
+
+def wants_frames(accept: str) -> bool:
+    """True if an ``Accept`` header asks for the framed transport."""
+    return FRAMES_MEDIA_TYPE in (accept or "")
+
+
+def iter_frames(body: bytes) -> Iterator[Tuple[int, bytes]]:
+    """Decode a complete framed body into ``(type, payload)`` pairs.
+
+    Raises:
+        ValueError: If the body ends inside a frame.
+    """
+    offset = 0
+    while offset < len(body):
+        if offset + _HEADER.size > len(body):
+            raise ValueError("truncated frame header")
+        kind, length = _HEADER.unpack_from(body, offset)
+        offset += _HEADER.size
+        if offset + length > len(body):
+            raise ValueError("truncated frame payload")
+        yield kind, body[offset : offset + length]  # noqa: E203
+        offset += length
+
+
+__all__ = [
+    "FRAMES_MEDIA_TYPE",
+    "FRAME_AUDIO",
+    "FRAME_CONTROL",
+    "audio_frame",
+    "control_frame",
+    "iter_frames",
+    "wants_frames",
+]
@@ -0,0 +1,217 @@
+"""
+Server-side audio normalization before upstream ASR.
+
+Uploads often arrive as 44.1/48 kHz stereo WAV or high-bitrate MP3, while the
+ASR models only use 16 kHz mono. ``normalize_file`` re-encodes a recording
+to 16 kHz mono in a compact codec before it is uploaded or POSTed:
+
+    - ``opus``: Ogg Opus at ``STT_NORMALIZE_OPUS_BITRATE`` (smallest);
+    - ``flac``: lossless FLAC (for workers that cannot decode Opus).
+
+ffmpeg runs as an async subprocess, so the work happens outside the API
+process without blocking the event loop; at most
+``STT_NORMALIZE_MAX_CONCURRENCY`` encodes run at once per worker.
+
+Normalization is best effort: ``None`` is returned (and the original audio
+should be used) when ffmpeg is missing, fails, times out, or the result is
+not smaller than the input.
+
+Usage:
+    from app.utils.audio_normalize import normalize_file
+
+    normalized = await normalize_file("/tmp/upload.wav", codec="opus")
+    if normalized is not None:
+        path = normalized.path  # caller removes it
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NORMALIZED_SAMPLE_RATE = 16000
+NORMALIZED_CHANNELS = 1
+CODEC_EXTENSIONS = {"opus": ".ogg", "flac": ".flac"}
+SUBPROCESS_TIMEOUT_SECONDS = 300
+
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass
+class NormalizedAudio:
+    """A normalized copy of a recording and what it saved."""
+
+    path: str
+    codec: str
+    original_bytes: int
+    normalized_bytes: int
+    seconds: float
+
+    @property
+    def extension(self) -> str:
+        return CODEC_EXTENSIONS[self.codec]
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.normalized_bytes
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of the original size saved (0.0 - 1.0)."""
+        if not self.original_bytes:
+            return 0.0
+        return self.saved_bytes / self.original_bytes
+
+
+def ffmpeg_args(src: str, dst: str, codec: str, opus_bitrate: str) -> list:
+    """ffmpeg command line re-encoding ``src`` to 16 kHz mono ``codec``."""
+    if codec not in CODEC_EXTENSIONS:
+        raise ValueError(f"Unsupported normalization codec: {codec}")
+    args = [
+        "-nostdin",
+        "-v",
+        "error",
+        "-y",
+        "-i",
+        src,
+        "-vn",
+        "-ac",
+        str(NORMALIZED_CHANNELS),
+        "-ar",
+        str(NORMALIZED_SAMPLE_RATE),
+    ]
+    if codec == "opus":
+        args += ["-c:a", "libopus", "-b:a", opus_bitrate, "-application", "voip"]
+    else:
+        args += ["-c:a", "flac"]
+    return args + [dst]
+
+
+async def normalize_file(
+    src: str,
+    codec: Optional[str] = None,
+    opus_bitrate: Optional[str] = None,
+) -> Optional[NormalizedAudio]:
+    """Re-encode ``src`` to 16 kHz mono; the caller removes the new file.
+
+    Returns None when the original should be used instead.
+    """
+    codec = codec or settings.stt_normalize_codec
+    opus_bitrate = opus_bitrate or settings.stt_normalize_opus_bitrate
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        logger.warning("ffmpeg not found; skipping audio normalization")
+        return None
+
+    with tempfile.NamedTemporaryFile(
+        delete=False, suffix=CODEC_EXTENSIONS[codec]
+    ) as temp_file:
+        dst = temp_file.name
+    started = time.perf_counter()
+    async with _semaphore():
+        ok = await _run_ffmpeg(ffmpeg, ffmpeg_args(src, dst, codec, opus_bitrate))
+    try:
+        original_bytes = os.path.getsize(src)
+        normalized_bytes = os.path.getsize(dst) if ok else 0
+    except OSError:
+        ok = False
+    if not ok or not 0 < normalized_bytes < original_bytes:
+        _remove(dst)
+        return None
+    return NormalizedAudio(
+        path=dst,
+        codec=codec,
+        original_bytes=original_bytes,
+        normalized_bytes=normalized_bytes,
+        seconds=time.perf_counter() - started,
+    )
+
+
+async def normalize_bytes(
+    data: bytes,
+    extension: str = "",
+    codec: Optional[str] = None,
+    opus_bitrate: Optional[str] = None,
+) -> Optional[Tuple[bytes, NormalizedAudio]]:
+    """In-memory variant of ``normalize_file``; no files are left behind."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as temp_file:
+        src = temp_file.name
+    try:
+        await asyncio.to_thread(_write, src, data)
+        normalized = await normalize_file(src, codec, opus_bitrate)
+        if normalized is None:
+            return None
+        try:
+            return await asyncio.to_thread(_read, normalized.path), normalized
+        finally:
+            _remove(normalized.path)
+    finally:
+        _remove(src)
+
+
+async def _run_ffmpeg(ffmpeg: str, args: list) -> bool:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            ffmpeg,
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        logger.warning(f"ffmpeg normalization failed to start: {e}")
+        return False
+    try:
+        _, stderr = await asyncio.wait_for(
+            process.communicate(), timeout=SUBPROCESS_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.warning("ffmpeg normalization timed out")
+        return False
+    if process.returncode != 0:
+        logger.warning(
+            f"ffmpeg normalization failed: {stderr.decode(errors='replace')[:500]}"
+        )
+        return False
+    return True
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.stt_normalize_max_concurrency)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def _write(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+__all__ = ["NormalizedAudio", "ffmpeg_args", "normalize_bytes", "normalize_file"]
@@ -0,0 +1,138 @@
+"""
+CPU-bound audio operations run inside the audio worker pool.
+
+These are plain, picklable functions taking paths and returning small
+dataclasses, so ``app.services.audio_worker`` can run them in a separate
+process: audio never crosses the process boundary, only file names. Each call
+decodes with pydub (ffmpeg for compressed formats) and is blocking; do not
+call them from the event loop directly.
+
+The module only imports pydub and the dependency-free probing/VAD helpers so
+spawned workers start quickly.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from pydub import AudioSegment
+
+from app.utils.audio_probe import probe_duration
+from app.utils.vad import frame_energies, plan_chunks
+
+
+@dataclass
+class AudioInfo:
+    """Duration of a recording and whether it had to be decoded to get it."""
+
+    duration_seconds: float
+    decoded: bool = False
+
+
+@dataclass
+class TrimResult:
+    """Outcome of ``trim``; ``dst`` is only written when ``trimmed``."""
+
+    duration_seconds: float
+    trimmed: bool
+
+
+@dataclass
+class SplitAudio:
+    """Chunk files of a recording, in order, and the spans they cover (ms)."""
+
+    duration_ms: int
+    spans: List[Tuple[int, int]] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+
+
+def probe(path: str) -> AudioInfo:
+    """Duration from the container header, decoding only as a fallback.
+
+    Raises:
+        CouldntDecodeError: If the header is unreadable and decoding fails.
+    """
+    seconds = probe_duration(path)
+    if seconds is not None:
+        return AudioInfo(duration_seconds=seconds)
+    audio = AudioSegment.from_file(path)
+    return AudioInfo(duration_seconds=len(audio) / 1000, decoded=True)
+
+
+def trim(src: str, dst: str, max_seconds: float, export_format: str) -> TrimResult:
+    """Decode ``src`` and re-encode its first ``max_seconds`` to ``dst``."""
+    audio = AudioSegment.from_file(src)
+    duration_seconds = len(audio) / 1000
+    if duration_seconds <= max_seconds:
+        return TrimResult(duration_seconds=duration_seconds, trimmed=False)
+    audio[: int(max_seconds * 1000)].export(dst, format=export_format)
+    return TrimResult(duration_seconds=duration_seconds, trimmed=True)
+
+
+def transcode(
+    src: str, dst: str, export_format: str, bitrate: Optional[str] = None
+) -> str:
+    """Re-encode ``src`` as ``export_format``; returns ``dst``."""
+    AudioSegment.from_file(src).export(dst, format=export_format, bitrate=bitrate)
+    return dst
+
+
+def resample(
+    src: str,
+    dst: str,
+    frame_rate: int,
+    channels: int = 1,
+    export_format: str = "wav",
+) -> str:
+    """Convert ``src`` to ``frame_rate`` Hz with ``channels``; returns ``dst``."""
+    audio = AudioSegment.from_file(src)
+    audio.set_channels(channels).set_frame_rate(frame_rate).export(
+        dst, format=export_format
+    )
+    return dst
+
+
+def split(
+    src: str,
+    max_ms: int,
+    target_ms: int,
+    chunk_max_ms: int,
+    frame_rate: int,
+) -> SplitAudio:
+    """Cut ``src`` (up to ``max_ms``) in pauses into mono WAV chunk files.
+
+    ``duration_ms`` is the untrimmed length. The caller removes the chunk
+    files; they are removed here if exporting fails part way.
+    """
+    audio = AudioSegment.from_file(src)
+    result = SplitAudio(duration_ms=len(audio))
+    audio = audio[:max_ms]
+    result.spans = plan_chunks(
+        frame_energies(audio), len(audio), target_ms=target_ms, max_ms=chunk_max_ms
+    )
+    try:
+        for start, end in result.spans:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
+                result.paths.append(f.name)
+            audio[start:end].set_channels(1).set_frame_rate(frame_rate).export(
+                result.paths[-1], format="wav"
+            )
+    except BaseException:
+        for path in result.paths:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    return result
+
+
+__all__ = [
+    "AudioInfo",
+    "SplitAudio",
+    "TrimResult",
+    "probe",
+    "resample",
+    "split",
+    "transcode",
+    "trim",
+]
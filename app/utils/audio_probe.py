@@ -0,0 +1,440 @@
+"""
+Audio duration probing and lossless trimming.
+
+Decoding an upload to PCM (``AudioSegment.from_file``) just to read its
+length costs hundreds of MB of RAM and seconds of CPU for long recordings.
+``probe_duration`` reads the duration from container metadata instead:
+
+    - WAV (RIFF/RF64): ``data`` chunk size / byte rate
+    - FLAC: STREAMINFO total samples / sample rate
+    - MP3: Xing/Info or VBRI frame count, else the bitrate if the first
+      frames confirm it is constant (unknown otherwise)
+    - Ogg Vorbis/Opus: last page granule position / sample rate
+    - M4A/MP4: ``mvhd`` duration / timescale
+
+Anything else is handed to ``ffprobe`` when it is installed. ``None`` means
+the duration is unknown and the caller should decode.
+
+``probe_duration_from_bytes`` runs the same parsers on the first and last
+bytes of a stream (kept while it is uploaded elsewhere), so no local copy of
+the file is needed.
+
+``trim_stream_copy`` cuts a file to a maximum length with ``ffmpeg -c copy``
+(no re-encode); it returns False when ffmpeg is unavailable or fails.
+
+Usage:
+    from app.utils.audio_probe import probe_duration, trim_stream_copy
+
+    seconds = probe_duration("/tmp/upload.mp3")
+    if seconds is not None and seconds > limit:
+        trim_stream_copy("/tmp/upload.mp3", "/tmp/trimmed_upload.mp3", limit)
+"""
+
+import logging
+import os
+import shutil
+import struct
+import subprocess
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+# How far into the file to look for the first MPEG audio frame.
+MP3_SYNC_SEARCH_BYTES = 64 * 1024
+# Frames that must share one bitrate before an MP3 without a Xing/VBRI frame
+# count is measured as constant bitrate.
+MP3_CBR_CHECK_FRAMES = 32
+# How far from the end to look for the last Ogg page.
+OGG_TAIL_BYTES = 64 * 1024
+# Bytes a streaming caller should keep from the start and end of a file for
+# probe_duration_from_bytes (room for ID3 tags before the first MP3 frame).
+PROBE_HEAD_BYTES = 256 * 1024
+PROBE_TAIL_BYTES = OGG_TAIL_BYTES
+SUBPROCESS_TIMEOUT_SECONDS = 60
+
+_MP3_BITRATES = {
+    # (MPEG-1?, layer) -> kbps by bitrate index
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),  # MPEG-2.5
+}
+
+
+def probe_duration(path: str) -> Optional[float]:
+    """Return the duration of an audio file in seconds, or None if unknown."""
+    try:
+        duration = _parse_header(path)
+    except (OSError, struct.error, ValueError, IndexError) as e:
+        logger.debug(f"Header probe failed for {path}: {e}")
+        duration = None
+    if duration is None:
+        duration = _ffprobe_duration(path)
+    return duration
+
+
+def probe_duration_from_bytes(head: bytes, tail: bytes, size: int) -> Optional[float]:
+    """Like ``probe_duration`` for a stream of ``size`` bytes, from its ends.
+
+    Args:
+        head: The first bytes of the stream (ideally ``PROBE_HEAD_BYTES``).
+        tail: The last bytes of the stream (ideally ``PROBE_TAIL_BYTES``).
+        size: Total stream length.
+
+    Returns None (no ffprobe fallback) when the header is not in ``head``.
+    """
+    try:
+        return _parse(_HeadTailReader(head, tail, size), size)
+    except (struct.error, ValueError, IndexError) as e:
+        logger.debug(f"Header probe from bytes failed: {e}")
+        return None
+
+
+def trim_stream_copy(src: str, dst: str, max_seconds: float) -> bool:
+    """Write the first ``max_seconds`` of ``src`` to ``dst`` without re-encoding."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return False
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg,
+                "-v",
+                "error",
+                "-y",
+                "-i",
+                src,
+                "-t",
+                f"{max_seconds:.3f}",
+                "-map",
+                "0:a",
+                "-c",
+                "copy",
+                dst,
+            ],
+            capture_output=True,
+            timeout=SUBPROCESS_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"ffmpeg stream copy failed: {e}")
+        return False
+    if result.returncode != 0 or not os.path.exists(dst):
+        logger.warning(
+            f"ffmpeg stream copy failed: {result.stderr.decode(errors='replace')[:500]}"
+        )
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+    return True
+
+
+# ---- container parsers ----
+
+
+class _HeadTailReader:
+    """Read-only file over the two known ends of a stream.
+
+    Reads that fall in the unknown middle return no data, which the parsers
+    treat as a missing header.
+    """
+
+    def __init__(self, head: bytes, tail: bytes, size: int) -> None:
+        self._head = head
+        # Drop tail bytes that overlap the head in short streams.
+        overlap = len(head) + len(tail) - size
+        self._tail = tail[max(overlap, 0) :] if size > len(head) else b""  # noqa: E203
+        self._tail_start = size - len(self._tail)
+        self._size = size
+        self._position = 0
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, n: int = -1) -> bytes:
+        start = self._position
+        end = self._size if n is None or n < 0 else min(start + n, self._size)
+        if end <= len(self._head):
+            data = self._head[start:end]
+        elif start >= self._tail_start:
+            offset = start - self._tail_start
+            data = self._tail[offset : offset + end - start]  # noqa: E203
+        else:
+            data = self._head[start:end]
+        self._position = start + len(data)
+        return data
+
+
+def _parse_header(path: str) -> Optional[float]:
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        return _parse(f, size)
+
+
+def _parse(f: BinaryIO, size: int) -> Optional[float]:
+    start = _skip_id3v2(f)
+    f.seek(start)
+    magic = f.read(12)
+    f.seek(start)
+    if magic[:4] in (b"RIFF", b"RF64") and magic[8:12] == b"WAVE":
+        return _wav_duration(f, size)
+    if magic[:4] == b"fLaC":
+        return _flac_duration(f)
+    if magic[:4] == b"OggS":
+        return _ogg_duration(f, size)
+    if magic[4:8] == b"ftyp":
+        return _mp4_duration(f, size)
+    return _mp3_duration(f, start, size)
+
+
+def _skip_id3v2(f: BinaryIO) -> int:
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    tag_size = (
+        (header[6] & 0x7F) << 21
+        | (header[7] & 0x7F) << 14
+        | (header[8] & 0x7F) << 7
+        | (header[9] & 0x7F)
+    )
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + tag_size + footer
+
+
+def _wav_duration(f: BinaryIO, size: int) -> Optional[float]:
+    f.seek(12, os.SEEK_CUR)
+    byte_rate = None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_id = chunk[:4]
+        (chunk_size,) = struct.unpack("<I", chunk[4:])
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            (byte_rate,) = struct.unpack("<I", fmt[8:12])
+            f.seek(chunk_size & 1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            remaining = size - f.tell()
+            # Streamed or RF64 files carry a placeholder size.
+            if chunk_size in (0, 0xFFFFFFFF) or chunk_size > remaining:
+                chunk_size = remaining
+            return chunk_size / byte_rate
+        else:
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def _flac_duration(f: BinaryIO) -> Optional[float]:
+    header = f.read(8)
+    if header[4] & 0x7F != 0:  # first block must be STREAMINFO
+        return None
+    info = f.read(34)
+    packed = int.from_bytes(info[10:18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _ogg_duration(f: BinaryIO, size: int) -> Optional[float]:
+    first_page = f.read(4096)
+    segments = first_page[26]
+    packet = first_page[27 + segments :]  # noqa: E203
+    if packet[:7] == b"\x01vorbis":
+        (sample_rate,) = struct.unpack("<I", packet[12:16])
+        pre_skip = 0
+    elif packet[:8] == b"OpusHead":
+        (pre_skip,) = struct.unpack("<H", packet[10:12])
+        sample_rate = 48000  # Opus granule positions are always 48 kHz
+    else:
+        return None
+
+    f.seek(max(size - OGG_TAIL_BYTES, 0))
+    tail = f.read()
+    last_page = tail.rfind(b"OggS")
+    if last_page < 0 or not sample_rate:
+        return None
+    (granule,) = struct.unpack("<q", tail[last_page + 6 : last_page + 14])  # noqa: E203
+    if granule <= 0:
+        return None
+    return max(granule - pre_skip, 0) / sample_rate
+
+
+def _mp4_duration(f: BinaryIO, size: int) -> Optional[float]:
+    moov = _find_box(f, 0, size, b"moov")
+    if moov is None:
+        return None
+    mvhd = _find_box(f, moov[0], moov[1], b"mvhd")
+    if mvhd is None:
+        return None
+    f.seek(mvhd[0])
+    body = f.read(32)
+    if body[0] == 1:
+        timescale, duration = struct.unpack(">IQ", body[20:32])
+    else:
+        timescale, duration = struct.unpack(">II", body[12:20])
+    if not timescale:
+        return None
+    return duration / timescale
+
+
+def _find_box(f: BinaryIO, start: int, end: int, wanted: bytes):
+    """Return ``(body_start, body_end)`` of the first ``wanted`` box in range."""
+    position = start
+    while position + 8 <= end:
+        f.seek(position)
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        box_size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if box_size == 1:
+            (box_size,) = struct.unpack(">Q", f.read(8))
+            header_size = 16
+        elif box_size == 0:
+            box_size = end - position
+        if box_size < header_size:
+            return None
+        if box_type == wanted:
+            return position + header_size, position + box_size
+        position += box_size
+    return None
+
+
+def _mp3_frame(header: bytes):
+    """Parse an MPEG audio frame header; None if it is not a valid one."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    # Layer bits: 1 = Layer III, 2 = Layer II (Layer I is not supported).
+    if version == 1 or layer not in (1, 2) or rate_index == 3:
+        return None
+    if bitrate_index in (0, 15):
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, 3 if layer == 1 else 2)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    # Layer III frames hold 576 samples per granule, two granules in MPEG-1.
+    samples = 1152 if layer == 2 or mpeg1 else 576
+    length = samples // 8 * bitrate // sample_rate + padding
+    mono = (header[3] >> 6) == 3
+    if layer == 1:
+        side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    else:
+        side_info = 0
+    return {
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "samples": samples,
+        "length": length,
+        "side_info": side_info,
+    }
+
+
+def _mp3_duration(f: BinaryIO, start: int, size: int) -> Optional[float]:
+    f.seek(start)
+    buffer = f.read(MP3_SYNC_SEARCH_BYTES)
+    position = buffer.find(b"\xff")
+    while 0 <= position < len(buffer) - 4:
+        frame = _mp3_frame(buffer[position : position + 4])  # noqa: E203
+        # Require a second frame header to avoid false syncs in junk data.
+        following = position + frame["length"] if frame is not None else -1
+        if frame is not None and _mp3_frame(
+            buffer[following : following + 4]  # noqa: E203
+        ):
+            break
+        position = buffer.find(b"\xff", position + 1)
+    else:
+        return None
+
+    tag_at = position + 4 + frame["side_info"]
+    tag = buffer[tag_at : tag_at + 12]  # noqa: E203
+    if tag[:4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack(">I", tag[4:8])
+        if flags & 0x01:
+            (frames,) = struct.unpack(">I", tag[8:12])
+            return frames * frame["samples"] / frame["sample_rate"]
+    vbri = buffer[position + 36 : position + 54]  # noqa: E203
+    if vbri[:4] == b"VBRI":
+        (frames,) = struct.unpack(">I", vbri[14:18])
+        return frames * frame["samples"] / frame["sample_rate"]
+
+    # No frame count: only trust the first frame's bitrate if the following
+    # ones share it. A VBR file without a Xing header would otherwise be
+    # measured from whatever bitrate it happens to start with.
+    if not _mp3_constant_bitrate(buffer, position, frame["bitrate"]):
+        return None
+    audio_bytes = size - start - position
+    return audio_bytes * 8 / frame["bitrate"]
+
+
+def _mp3_constant_bitrate(buffer: bytes, position: int, bitrate: int) -> bool:
+    """True if the frames after ``position`` all have ``bitrate``.
+
+    Checks up to ``MP3_CBR_CHECK_FRAMES`` frames (at least two) within
+    ``buffer``.
+    """
+    checked = 0
+    while checked < MP3_CBR_CHECK_FRAMES:
+        frame = _mp3_frame(buffer[position : position + 4])  # noqa: E203
+        if frame is None:
+            # Running out of buffer after two matching frames is fine.
+            return checked >= 2 and position + 4 > len(buffer)
+        if frame["bitrate"] != bitrate:
+            return False
+        checked += 1
+        position += frame["length"]
+    return True
+
+
+def _ffprobe_duration(path: str) -> Optional[float]:
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        return None
+    try:
+        result = subprocess.run(
+            [
+                ffprobe,
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                path,
+            ],
+            capture_output=True,
+            timeout=SUBPROCESS_TIMEOUT_SECONDS,
+        )
+        return float(result.stdout.strip()) if result.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        logger.debug(f"ffprobe failed for {path}: {e}")
+        return None
+
+
+__all__ = [
+    "PROBE_HEAD_BYTES",
+    "PROBE_TAIL_BYTES",
+    "probe_duration",
+    "probe_duration_from_bytes",
+    "trim_stream_copy",
+]
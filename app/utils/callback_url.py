@@ -0,0 +1,113 @@
+"""
+Validation of client-supplied callback URLs.
+
+Job callbacks are POSTed from inside the VPC, so an arbitrary URL would let a
+caller reach the metadata server (169.254.169.254), localhost or private
+services, and read their status codes back from the job document.
+``resolve_callback_url`` resolves the host and accepts the URL only if every
+address it resolves to is publicly routable. Delivery re-checks the URL before
+each attempt (DNS can change after submission) and does not follow
+redirects, so a public URL cannot bounce the request inward.
+``pin_callback_url`` points the request at the address that passed the check,
+so a second DNS lookup by the HTTP client cannot swap in an internal one.
+
+``TRANSCRIPTION_JOB_CALLBACK_ALLOW_PRIVATE`` lifts the address check for
+local development.
+
+Usage:
+    from app.utils.callback_url import UnsafeCallbackURL, resolve_callback_url
+
+    try:
+        await resolve_callback_url(url)
+    except UnsafeCallbackURL as e:
+        ...
+"""
+
+import asyncio
+import ipaddress
+import socket
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+
+class UnsafeCallbackURL(ValueError):
+    """The callback URL is malformed or points at a non-public address."""
+
+
+def check_callback_url(url: str) -> str:
+    """Syntax check: an http(s) URL with a host.
+
+    Raises:
+        UnsafeCallbackURL: If it is not.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise UnsafeCallbackURL("'callback_url' must be an http(s) URL.")
+    return url
+
+
+async def resolve_callback_url(url: str) -> List[str]:
+    """Resolve the URL's host and require every address to be public.
+
+    Returns:
+        The resolved addresses.
+
+    Raises:
+        UnsafeCallbackURL: If the URL is malformed, does not resolve, or
+            resolves to a loopback, private, link-local, reserved or
+            otherwise non-global address.
+    """
+    parsed = urlparse(check_callback_url(url))
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            parsed.hostname, port, type=socket.SOCK_STREAM
+        )
+    except (OSError, ValueError):
+        raise UnsafeCallbackURL("'callback_url' host does not resolve.")
+
+    addresses = sorted({info[4][0] for info in infos})
+    if not addresses:
+        raise UnsafeCallbackURL("'callback_url' host does not resolve.")
+    if not settings.transcription_job_callback_allow_private:
+        for address in addresses:
+            if not _is_public(address):
+                raise UnsafeCallbackURL(
+                    "'callback_url' must resolve to a public address."
+                )
+    return addresses
+
+
+def pin_callback_url(url: str, address: str) -> Tuple[str, Dict[str, str], Dict]:
+    """Rewrite ``url`` to connect to ``address`` (from ``resolve_callback_url``).
+
+    Returns:
+        ``(url, headers, extensions)`` for the httpx request: the URL with the
+        host replaced by the address, the original ``Host`` header and, for
+        https, the original hostname for SNI and certificate verification.
+    """
+    parsed = urlparse(url)
+    userinfo, _, hostport = parsed.netloc.rpartition("@")
+    host = f"[{address}]" if ":" in address else address
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+    netloc = f"{userinfo}@{host}" if userinfo else host
+    extensions = {"sni_hostname": parsed.hostname} if parsed.scheme == "https" else {}
+    return parsed._replace(netloc=netloc).geturl(), {"Host": hostport}, extensions
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+__all__ = [
+    "UnsafeCallbackURL",
+    "check_callback_url",
+    "pin_callback_url",
+    "resolve_callback_url",
+]
@@ -0,0 +1,147 @@
+"""
+Per-request upstream execution usage.
+
+The monitoring middleware starts a tracker for every monitored request; code
+that runs inference records the GPU execution time, queue delay and cold
+start it caused, and the middleware stores the totals on the request's
+``endpoint_logs`` row next to the wall-clock ``time_taken``. Admin analytics
+turns those GPU-seconds into estimated cost per user, organization and
+endpoint (see ``app.services.billing_analytics.attribution``).
+
+RunPod jobs are recorded automatically through the RunPod job observer
+(``executionTime`` and ``delayTime`` from the final job status). Modal calls
+and Sunflower chat completions (RunPod's OpenAI route) report no execution
+details, so their wall-clock time is recorded instead.
+
+The tracker lives in a context variable, so usage is attributed to the
+request whose task (or child task) made the call; calls outside a monitored
+request are ignored. That includes work that outlives its request: async
+transcription jobs and batch tasks run after the middleware has written the
+log row, so their usage is not recorded. RunPod rates are unaffected (they
+divide by billed runtime); Modal rates mapped by EXECUTION_MODAL_APPS divide
+by recorded seconds, so they absorb it.
+
+Usage:
+    usage = start_execution_tracking()
+    try:
+        response = await call_next(request)
+    finally:
+        stop_execution_tracking()
+    log_row.gpu_seconds = usage.gpu_seconds
+"""
+
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExecutionUsage:
+    """Upstream execution attributed to one API request.
+
+    Attributes:
+        gpu_seconds: Total execution time across upstream jobs.
+        queue_seconds: Total time jobs waited for a worker (includes cold
+            starts).
+        cold_start: True if any job waited longer than the cold-start
+            threshold.
+        jobs: Number of upstream jobs recorded.
+        by_upstream: GPU-seconds per upstream (RunPod endpoint id or Modal
+            service name).
+    """
+
+    gpu_seconds: float = 0.0
+    queue_seconds: float = 0.0
+    cold_start: bool = False
+    jobs: int = 0
+    by_upstream: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def upstream(self) -> Optional[str]:
+        """The upstream that did most of the work, if any."""
+        if not self.by_upstream:
+            return None
+        return max(self.by_upstream, key=self.by_upstream.get)
+
+    def add(
+        self,
+        upstream: str,
+        gpu_seconds: float,
+        queue_seconds: float = 0.0,
+        cold_start: bool = False,
+    ) -> None:
+        self.gpu_seconds += gpu_seconds
+        self.queue_seconds += queue_seconds
+        self.cold_start = self.cold_start or cold_start
+        self.jobs += 1
+        self.by_upstream[upstream] = self.by_upstream.get(upstream, 0.0) + gpu_seconds
+
+
+_current_usage: ContextVar[Optional[ExecutionUsage]] = ContextVar(
+    "execution_usage", default=None
+)
+
+
+def start_execution_tracking() -> ExecutionUsage:
+    """Start attributing upstream usage in this context to a new tracker."""
+    usage = ExecutionUsage()
+    _current_usage.set(usage)
+    return usage
+
+
+def stop_execution_tracking() -> None:
+    _current_usage.set(None)
+
+
+def current_execution_usage() -> Optional[ExecutionUsage]:
+    return _current_usage.get()
+
+
+def record_execution(
+    upstream: str,
+    gpu_seconds: float,
+    queue_seconds: float = 0.0,
+    cold_start: Optional[bool] = None,
+) -> None:
+    """Attribute one upstream job to the current request (no-op outside one).
+
+    ``cold_start`` defaults to whether ``queue_seconds`` reached
+    EXECUTION_COLD_START_THRESHOLD_SECONDS.
+    """
+    usage = _current_usage.get()
+    if usage is None:
+        return
+    if cold_start is None:
+        cold_start = queue_seconds >= settings.execution_cold_start_threshold_seconds
+    usage.add(upstream, max(gpu_seconds, 0.0), max(queue_seconds, 0.0), cold_start)
+
+
+def _ms_to_seconds(value: Any) -> float:
+    return value / 1000.0 if isinstance(value, (int, float)) else 0.0
+
+
+def observe_runpod_job(endpoint_id: str, job_details: Dict[str, Any]) -> None:
+    """RunPod job observer: records ``executionTime`` and ``delayTime``."""
+    details = job_details or {}
+    record_execution(
+        endpoint_id or "runpod",
+        _ms_to_seconds(details.get("executionTime")),
+        _ms_to_seconds(details.get("delayTime")),
+    )
+
+
+__all__ = [
+    "ExecutionUsage",
+    "current_execution_usage",
+    "observe_runpod_job",
+    "record_execution",
+    "start_execution_tracking",
+    "stop_execution_tracking",
+]
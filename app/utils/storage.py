@@ -2,7 +2,7 @@
 GCP Storage Service
 
 Handles all interactions with Google Cloud Storage including:
-- Uploading audio files
+- Uploading audio files (whole, or streamed as a resumable upload)
 - Generating signed URLs
 - File management
 """
@@ -11,23 +11,118 @@ import asyncio
 import hashlib
 import logging
 import uuid
-from datetime import UTC, datetime, timedelta
-from typing import Optional
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import Any, List, Optional, Union
 
 from dotenv import load_dotenv
-from google.auth import default
-from google.auth.transport.requests import Request
 from google.cloud import storage
 from google.cloud.storage import Blob, Bucket
 
 from app.core.config import settings
 from app.models.enums import SpeakerID
+from app.utils.url_signer import SignedUrl, get_url_signer
 
 load_dotenv()
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Pieces a StreamingUpload queues before ``write`` waits for the upload.
+STREAMING_UPLOAD_MAX_PENDING = 32
+
+
+class StreamingUpload:
+    """
+    A resumable GCS upload fed while the audio is still being produced.
+
+    ``write`` queues the bytes; one background task hands them, in order, to
+    a ``BlobWriter`` in a worker thread, which sends each full ``chunk_size``
+    as one resumable-upload request, and ``finish`` only has to send the last
+    partial chunk. The queue holds at most ``STREAMING_UPLOAD_MAX_PENDING``
+    pieces: when GCS falls behind, ``write`` waits for room, so a slow upload
+    slows the producer down instead of buffering the whole file. Once the
+    upload has failed, ``write`` raises its error.
+    """
+
+    def __init__(self, blob: Blob, content_type: str, chunk_size: int) -> None:
+        self.blob = blob
+        self.bytes_written = 0
+        self._content_type = content_type
+        self._chunk_size = chunk_size
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(
+            maxsize=STREAMING_UPLOAD_MAX_PENDING
+        )
+        self._task = asyncio.create_task(self._drain())
+
+    async def write(self, data: bytes) -> None:
+        """Queue ``data`` for upload, waiting while the queue is full.
+
+        Raises:
+            Exception: Whatever failed while uploading, once it has.
+        """
+        self._raise_if_stopped()
+        if data:
+            await self._put(data)
+            self._raise_if_stopped()
+            self.bytes_written += len(data)
+
+    async def finish(self) -> Blob:
+        """Upload what is left and finalize the object.
+
+        Raises:
+            Exception: Whatever failed while uploading.
+        """
+        if not self._task.done():
+            await self._put(None)
+        await self._task
+        return self.blob
+
+    async def abort(self) -> None:
+        """Stop uploading; the unfinished resumable session just expires."""
+        self._task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await self._task
+
+    async def _put(self, item: Optional[bytes]) -> None:
+        # Wait for room, but not past the end of the upload task: nothing
+        # would ever make room once it has failed.
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            put.cancel()
+
+    def _raise_if_stopped(self) -> None:
+        if not self._task.done():
+            return
+        if not self._task.cancelled() and self._task.exception() is not None:
+            raise self._task.exception()
+        raise RuntimeError("The upload is no longer accepting data")
+
+    async def _drain(self) -> None:
+        # if_generation_match=0 (the object must not exist yet) makes the
+        # chunk requests safe for the client library to retry.
+        writer: Any = self.blob.open(
+            "wb",
+            chunk_size=self._chunk_size,
+            content_type=self._content_type,
+            if_generation_match=0,
+        )
+        done = False
+        while not done:
+            pieces: List[Optional[bytes]] = [await self._queue.get()]
+            while not self._queue.empty():
+                pieces.append(self._queue.get_nowait())
+            done = pieces[-1] is None
+            data = b"".join(piece for piece in pieces if piece)
+            if data:
+                await asyncio.to_thread(writer.write, data)
+        await asyncio.to_thread(writer.close)
+
 
 class GCPStorageService:
     """
@@ -131,12 +226,36 @@ class GCPStorageService:
             None, self.upload_audio, audio_data, file_name, content_type
         )
 
+    def open_streaming_upload(
+        self, file_name: str, content_type: str = "audio/wav"
+    ) -> StreamingUpload:
+        """
+        Start uploading audio whose bytes are still being produced.
+
+        Must be called from a running event loop.
+
+        Args:
+            file_name: Destination file path in bucket
+            content_type: MIME type of the audio
+
+        Returns:
+            A StreamingUpload to ``write`` to and then ``finish``
+        """
+        return StreamingUpload(
+            self.bucket.blob(file_name),
+            content_type,
+            chunk_size=settings.tts_stream_upload_chunk_kb * 1024,
+        )
+
     def generate_signed_url(
         self, blob: Blob, expiry_minutes: Optional[int] = None
     ) -> tuple[str, datetime]:
         """
         Generate a signed URL for a blob.
 
+        Still-valid URLs are reused and credentials are shared (see
+        ``app.utils.url_signer``); signing is blocking on a miss.
+
         Args:
             blob: The Blob to generate a URL for
             expiry_minutes: URL expiry time in minutes (defaults to settings)
@@ -144,40 +263,33 @@ class GCPStorageService:
         Returns:
             Tuple of (signed_url, expiry_datetime)
         """
-        expiry = expiry_minutes or settings.signed_url_expiry_minutes
-        expires_at = datetime.now(UTC) + timedelta(minutes=expiry)
-
-        # Generate signed URL with IAM-based signing for Cloud Run (no private key required)
-        signing_kwargs = {
-            "version": "v4",
-            "expiration": timedelta(minutes=expiry),
-            "method": "GET",
-        }
-
-        # Add service account email and access token for IAM-based signing
-        # When running in Cloud Run, we need to explicitly provide an access token
-        # to force the library to use the IAM signBlob API instead of trying to sign locally
-        if self._service_account_email:
-            try:
-                # Get default credentials and refresh to get access token
-                credentials, _ = default()
-                if not credentials.valid:
-                    credentials.refresh(Request())
-
-                signing_kwargs["service_account_email"] = self._service_account_email
-                signing_kwargs["access_token"] = credentials.token
-
-                logger.info(
-                    f"Using IAM-based signing with service account: {self._service_account_email}"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to get access token for IAM signing: {e}")
-                # Fall back to service account email only
-                signing_kwargs["service_account_email"] = self._service_account_email
-
-        signed_url = blob.generate_signed_url(**signing_kwargs)
-
-        return signed_url, expires_at
+        signed = get_url_signer().sign(
+            blob,
+            expiry_minutes or settings.signed_url_expiry_minutes,
+            service_account_email=self._service_account_email,
+        )
+        return signed.url, signed.expires_at
+
+    async def generate_signed_urls_async(
+        self, blobs: list[Blob], expiry_minutes: Optional[int] = None
+    ) -> list[Union[SignedUrl, Exception]]:
+        """
+        Sign several blobs concurrently, off the event loop.
+
+        Args:
+            blobs: The Blobs to generate URLs for
+            expiry_minutes: URL expiry time in minutes (defaults to settings)
+
+        Returns:
+            One SignedUrl per blob, in order; the exception for a blob that
+            could not be signed
+        """
+        return await get_url_signer().sign_many(
+            blobs,
+            expiry_minutes or settings.signed_url_expiry_minutes,
+            return_exceptions=True,
+            service_account_email=self._service_account_email,
+        )
 
     def get_signed_url_for_file(
         self, file_name: str, expiry_minutes: Optional[int] = None
@@ -0,0 +1,194 @@
+"""
+Prompt Token Budgeting Module.
+
+This module counts prompt tokens for the Sunflower model and trims chat
+history so a request fits the model's context window *before* it is sent.
+Without it, over-long conversations were only detected after RunPod rejected
+them, costing a full round-trip plus a compact retry.
+
+Token counting uses the Sunflower (Qwen) tokenizer when the optional
+``tokenizers`` package is installed and the tokenizer can be loaded. The
+tokenizer is loaded lazily on first use and cached for the process lifetime;
+if it is unavailable a conservative character-based estimate is used so
+budgeting still works (it just trims slightly earlier).
+
+Usage:
+    from app.utils.token_budget import fit_messages_to_budget
+
+    messages = fit_messages_to_budget(messages, max_completion_tokens=512)
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Qwen chat-template framing per message: "<|im_start|>{role}\n" ... "<|im_end|>\n".
+MESSAGE_OVERHEAD_TOKENS = 4
+# Tokens for the trailing "<|im_start|>assistant\n" generation prompt.
+REPLY_PRIMING_TOKENS = 3
+# Fallback estimate when the tokenizer is unavailable. Ugandan languages
+# tokenize worse than English on the Qwen vocabulary, so stay conservative.
+FALLBACK_CHARS_PER_TOKEN = 3.0
+
+
+@lru_cache(maxsize=None)
+def _load_tokenizer(name: str) -> Optional[Any]:
+    """Load and cache the tokenizer, or return None when unavailable.
+
+    Failures are cached too, so a missing package or an unreachable model hub
+    is only attempted once per process.
+    """
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:
+        logger.info(
+            "tokenizers package not installed; using heuristic prompt token counts"
+        )
+        return None
+
+    try:
+        tokenizer = Tokenizer.from_pretrained(name)
+        logger.info(f"Loaded tokenizer '{name}' for prompt budgeting")
+        return tokenizer
+    except Exception as e:  # noqa: BLE001 — budgeting must never break a request
+        logger.warning(
+            f"Could not load tokenizer '{name}' ({e}); "
+            "using heuristic prompt token counts"
+        )
+        return None
+
+
+def get_tokenizer() -> Optional[Any]:
+    """Return the cached Sunflower tokenizer, loading it on first call."""
+    return _load_tokenizer(settings.sunflower_tokenizer_name)
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Count the tokens in ``text``.
+
+    Results are memoized because conversation history is re-counted on every
+    turn of the same chat.
+    """
+    if not text:
+        return 0
+    tokenizer = get_tokenizer()
+    if tokenizer is not None:
+        return len(tokenizer.encode(text, add_special_tokens=False).ids)
+    return math.ceil(len(text) / FALLBACK_CHARS_PER_TOKEN)
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """Count the prompt tokens for a list of chat messages, including framing."""
+    return REPLY_PRIMING_TOKENS + sum(_framed_tokens(m) for m in messages)
+
+
+def prompt_token_budget(max_completion_tokens: Optional[int] = None) -> int:
+    """Tokens available for the prompt once the completion is reserved.
+
+    The reserve is clamped so at least ``sunflower_min_prompt_tokens`` stay
+    available; a ``max_tokens`` at or above the context window would
+    otherwise leave no room for any history.
+
+    Args:
+        max_completion_tokens: The request's ``max_tokens``; defaults to the
+            configured completion reserve when not set.
+    """
+    window = settings.sunflower_context_window_tokens
+    reserve = (
+        max_completion_tokens
+        if max_completion_tokens is not None
+        else settings.sunflower_completion_reserve_tokens
+    )
+    reserve = min(reserve, max(window - settings.sunflower_min_prompt_tokens, 0))
+    return max(window - reserve, 0)
+
+
+def fit_messages_to_budget(
+    messages: List[Dict[str, str]],
+    max_completion_tokens: Optional[int] = None,
+    budget: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """Trim conversation history so the prompt fits the token budget.
+
+    The first system message and the final message are always kept. Older
+    conversation turns are dropped first (a user turn together with the
+    assistant reply that follows it), then any extra system messages such as
+    memory notes. If the pinned messages alone exceed the
+    budget they are returned as-is and the upstream decides.
+
+    Args:
+        messages: Chat messages in OpenAI format. Not mutated.
+        max_completion_tokens: The request's ``max_tokens``, used to compute the
+            budget when ``budget`` is not given.
+        budget: Explicit prompt token budget (overrides the computed one).
+
+    Returns:
+        A new list of messages that fits the budget where possible.
+    """
+    if budget is None:
+        budget = prompt_token_budget(max_completion_tokens)
+
+    total = count_message_tokens(messages)
+    if total <= budget or len(messages) <= 2:
+        return list(messages)
+
+    first_system = 0 if messages[0].get("role") == "system" else None
+    last = len(messages) - 1
+    droppable = [
+        i
+        for i in range(len(messages))
+        if i != first_system and i != last and messages[i].get("role") != "system"
+    ]
+    # Extra system messages (memory notes) outlive raw history turns.
+    droppable += [
+        i
+        for i in range(len(messages))
+        if i != first_system and i != last and messages[i].get("role") == "system"
+    ]
+
+    dropped = set()
+    for index in droppable:
+        if total <= budget:
+            break
+        if index in dropped:
+            continue
+        dropped.add(index)
+        total -= _framed_tokens(messages[index])
+        # Never leave an orphaned assistant reply at the head of the history.
+        follower = index + 1
+        if (
+            messages[index].get("role") == "user"
+            and follower != last
+            and follower not in dropped
+            and messages[follower].get("role") == "assistant"
+        ):
+            dropped.add(follower)
+            total -= _framed_tokens(messages[follower])
+
+    trimmed = [m for i, m in enumerate(messages) if i not in dropped]
+    if total > budget:
+        logger.warning(
+            f"Prompt still exceeds budget after trimming history "
+            f"({total} > {budget} tokens)"
+        )
+    else:
+        logger.info(
+            f"Trimmed prompt history to fit token budget "
+            f"({len(messages)} -> {len(trimmed)} messages, {total}/{budget} tokens)"
+        )
+    return trimmed
+
+
+def _framed_tokens(message: Dict[str, str]) -> int:
+    """Tokens for one message including its chat-template framing."""
+    return (
+        MESSAGE_OVERHEAD_TOKENS
+        + count_tokens(message.get("role") or "")
+        + count_tokens(message.get("content") or "")
+    )
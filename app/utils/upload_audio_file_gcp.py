@@ -1,14 +1,55 @@
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
 
 from dotenv import load_dotenv
 from google.cloud import storage
 
+from app.utils.audio_probe import (
+    PROBE_HEAD_BYTES,
+    PROBE_TAIL_BYTES,
+    probe_duration_from_bytes,
+)
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Bytes sent per resumable-upload request; must be a multiple of 256 KiB.
+STREAM_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Size of each read from the incoming stream.
+STREAM_READ_SIZE = 1024 * 1024
+
+_storage_client: Optional[storage.Client] = None
+
+
+def _get_storage_client() -> storage.Client:
+    """Return a process-wide storage client (reuses its HTTP session)."""
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = storage.Client()
+    return _storage_client
+
+
+@dataclass
+class StreamedUpload:
+    """Result of ``stream_audio_upload``.
+
+    ``head`` and ``tail`` are the first and last bytes of the stream, kept
+    for ``probe_duration_from_bytes``; ``sha256`` is the hex digest of the
+    whole stream.
+    """
+
+    blob_name: str
+    blob_uri: str
+    size: int
+    head: bytes
+    tail: bytes
+    sha256: str = ""
+
 
 def _get_bucket_name() -> str:
     bucket_name = os.getenv("AUDIO_CONTENT_BUCKET_NAME")
@@ -18,15 +59,14 @@ def _get_bucket_name() -> str:
 
 
 def upload_audio_file(file_path: str) -> Optional[Tuple[str, str]]:
-    """Upload audio file to GCS as a private object.
+    """Upload audio file to GCS as a private object (blocking).
 
     Returns:
         Tuple[blob_name, gs_uri] when successful, otherwise None.
     """
     try:
-        storage_client = storage.Client()
         bucket_name = _get_bucket_name()
-        bucket = storage_client.bucket(bucket_name)
+        bucket = _get_storage_client().bucket(bucket_name)
 
         blob_name = os.path.basename(file_path)
         blob = bucket.blob(blob_name)
@@ -40,6 +80,153 @@ def upload_audio_file(file_path: str) -> Optional[Tuple[str, str]]:
         return None
 
 
+async def stream_audio_upload(
+    stream: Any,
+    blob_name: str,
+    content_type: Optional[str] = None,
+    chunk_size: int = STREAM_UPLOAD_CHUNK_SIZE,
+    prefix: bytes = b"",
+) -> StreamedUpload:
+    """Pipe an async stream into a GCS resumable upload, chunk by chunk.
+
+    Nothing is written to local disk: at most ``chunk_size`` bytes are
+    buffered before they are sent. The blocking chunk uploads run in a
+    worker thread.
+
+    Args:
+        stream: Object with an ``async read(size)`` method, e.g. an
+            ``UploadFile``.
+        blob_name: Name of the private object to create.
+        content_type: Content type stored on the object.
+        chunk_size: Bytes per resumable-upload request.
+        prefix: Bytes already read from ``stream``; they are uploaded first.
+
+    Raises:
+        Exception: If the upload fails; the partial upload is abandoned.
+    """
+    bucket_name = _get_bucket_name()
+    blob = _get_storage_client().bucket(bucket_name).blob(blob_name)
+    writer = await asyncio.to_thread(
+        blob.open,
+        "wb",
+        chunk_size=chunk_size,
+        content_type=content_type,
+        ignore_flush=True,
+    )
+
+    head = bytearray()
+    tail = b""
+    size = 0
+    digest = hashlib.sha256()
+    try:
+        chunk = prefix or await stream.read(STREAM_READ_SIZE)
+        while chunk:
+            digest.update(chunk)
+            if len(head) < PROBE_HEAD_BYTES:
+                head += chunk[: PROBE_HEAD_BYTES - len(head)]
+            tail = (tail + chunk)[-PROBE_TAIL_BYTES:]
+            size += len(chunk)
+            await asyncio.to_thread(writer.write, chunk)
+            chunk = await stream.read(STREAM_READ_SIZE)
+        await asyncio.to_thread(writer.close)
+    except BaseException:
+        # Leave the session unfinished; GCS discards it after a week.
+        logger.error(f"Streaming upload of {blob_name} failed after {size} bytes")
+        raise
+
+    return StreamedUpload(
+        blob_name=blob_name,
+        blob_uri=f"gs://{bucket_name}/{blob_name}",
+        size=size,
+        head=bytes(head),
+        tail=tail,
+        sha256=digest.hexdigest(),
+    )
+
+
+def get_audio_blob_fingerprint(blob_name: str) -> Optional[str]:
+    """Identify an audio blob's content from its GCS metadata (blocking).
+
+    Returns ``md5:<base64>``, or ``crc32c:<base64>:<size>`` for composite
+    objects that have no MD5; None if the blob does not exist or the lookup
+    fails. The object itself is not downloaded.
+    """
+    try:
+        blob = _get_storage_client().bucket(_get_bucket_name()).get_blob(blob_name)
+    except Exception as e:
+        logger.warning(f"Could not read metadata of audio blob {blob_name}: {e}")
+        return None
+    if blob is None:
+        return None
+    if blob.md5_hash:
+        return f"md5:{blob.md5_hash}"
+    if blob.crc32c:
+        return f"crc32c:{blob.crc32c}:{blob.size}"
+    return None
+
+
+@dataclass
+class BlobProbe:
+    """Size and (if the header could be parsed) duration of an audio blob."""
+
+    size: int
+    duration_seconds: Optional[float]
+
+
+def probe_audio_blob(
+    blob_name: str, bucket_name: Optional[str] = None
+) -> Optional[BlobProbe]:
+    """Probe an audio blob's duration with ranged reads (blocking).
+
+    Only the first ``PROBE_HEAD_BYTES`` and last ``PROBE_TAIL_BYTES`` of the
+    object are fetched, never the whole recording. Returns None if the blob
+    does not exist.
+    """
+    bucket = _get_storage_client().bucket(bucket_name or _get_bucket_name())
+    blob = bucket.get_blob(blob_name)
+    if blob is None:
+        return None
+    size = blob.size or 0
+    if not size:
+        return BlobProbe(size=0, duration_seconds=None)
+    head = blob.download_as_bytes(start=0, end=min(size, PROBE_HEAD_BYTES) - 1)
+    if size > PROBE_HEAD_BYTES:
+        tail = blob.download_as_bytes(start=max(0, size - PROBE_TAIL_BYTES))
+    else:
+        tail = head
+    return BlobProbe(
+        size=size, duration_seconds=probe_duration_from_bytes(head, tail, size)
+    )
+
+
+def read_audio_bucket_text(blob_name: str) -> Optional[str]:
+    """Download a small text object (e.g. a manifest) from the audio bucket.
+
+    Returns None if the blob does not exist (blocking).
+    """
+    blob = _get_storage_client().bucket(_get_bucket_name()).get_blob(blob_name)
+    if blob is None:
+        return None
+    return blob.download_as_text()
+
+
+def open_audio_bucket_writer(blob_name: str, content_type: str) -> Any:
+    """Open a resumable-upload writer for a new object (blocking).
+
+    Each ``write`` buffers up to STREAM_UPLOAD_CHUNK_SIZE; ``close`` commits.
+    The upload is conditional on the object not existing yet, so an existing
+    object is never overwritten (GCS answers 412 Precondition Failed).
+    """
+    blob = _get_storage_client().bucket(_get_bucket_name()).blob(blob_name)
+    return blob.open(
+        "w",
+        chunk_size=STREAM_UPLOAD_CHUNK_SIZE,
+        content_type=content_type,
+        ignore_flush=True,
+        if_generation_match=0,
+    )
+
+
 def delete_audio_file(blob_name: str) -> bool:
     """Delete uploaded audio blob from GCS."""
     try:
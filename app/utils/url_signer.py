@@ -0,0 +1,220 @@
+"""
+V4 signed-URL generation with credential reuse and a URL cache.
+
+On Cloud Run there is no private key, so every V4 URL is signed through the
+IAM ``signBlob`` API: one network round trip per URL, plus a credential
+refresh when callers built fresh credentials each time. ``UrlSigner``:
+
+    - keeps one set of default credentials per process and only refreshes
+      them when the access token has expired (under a lock, so concurrent
+      signers share the refresh);
+    - caches signed GET URLs per (bucket, object, expiry, service account)
+      and hands them out again until ``SIGNED_URL_CACHE_MARGIN_SECONDS``
+      before they expire (never past half their lifetime), so refreshing or
+      re-serving the same object does not re-sign;
+    - ``sign_many`` signs a batch concurrently in worker threads.
+
+``SignedUrl.signing_ms`` is 0 for cache hits, so callers can report signing
+latency in their ``timings_ms``.
+
+Usage:
+    from app.utils.url_signer import get_url_signer
+
+    signed = get_url_signer().sign(blob, expiry_minutes=30,
+                                   service_account_email=email)
+    url, expires_at = signed.url, signed.expires_at
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from google.auth import default
+from google.auth.transport.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SignedUrl:
+    """A signed URL, when it expires, and what producing it cost."""
+
+    url: str
+    expires_at: datetime
+    cached: bool = False
+    signing_ms: float = 0.0
+
+
+class UrlSigner:
+    """Signs GCS object URLs, reusing credentials and still-valid URLs."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        margin_seconds: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else settings.signed_url_cache_max_entries
+        )
+        self.margin_seconds = (
+            margin_seconds
+            if margin_seconds is not None
+            else settings.signed_url_cache_margin_seconds
+        )
+        self.max_concurrency = max_concurrency or settings.signed_url_max_concurrency
+        self._urls: "OrderedDict[Tuple, Tuple[str, datetime]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._credentials: Any = None
+        self._credentials_lock = threading.Lock()
+        self.hits = 0
+        self.signed = 0
+
+    def sign(
+        self,
+        blob: Any,
+        expiry_minutes: int,
+        service_account_email: Optional[str] = None,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+    ) -> SignedUrl:
+        """Signed URL for ``blob`` (blocking on a cache miss).
+
+        Only GET URLs are cached; upload (PUT) URLs are always fresh.
+        """
+        key = (
+            blob.bucket.name,
+            blob.name,
+            expiry_minutes,
+            service_account_email,
+        )
+        if method == "GET":
+            cached = self._cached(key, expiry_minutes)
+            if cached is not None:
+                return cached
+
+        started = time.monotonic()
+        expires_at = datetime.now(UTC) + timedelta(minutes=expiry_minutes)
+        signing_kwargs: Dict[str, Any] = {
+            "version": "v4",
+            "expiration": timedelta(minutes=expiry_minutes),
+            "method": method,
+        }
+        if content_type:
+            signing_kwargs["content_type"] = content_type
+        if service_account_email:
+            # Passing a token makes the library use IAM signBlob instead of
+            # trying to sign locally (Cloud Run has no private key).
+            signing_kwargs["service_account_email"] = service_account_email
+            token = self._access_token()
+            if token:
+                signing_kwargs["access_token"] = token
+        url = blob.generate_signed_url(**signing_kwargs)
+        signing_ms = (time.monotonic() - started) * 1000.0
+
+        with self._lock:
+            self.signed += 1
+            if method == "GET" and self.max_entries:
+                self._urls[key] = (url, expires_at)
+                self._urls.move_to_end(key)
+                while len(self._urls) > self.max_entries:
+                    self._urls.popitem(last=False)
+        return SignedUrl(url=url, expires_at=expires_at, signing_ms=signing_ms)
+
+    async def sign_async(self, blob: Any, expiry_minutes: int, **kwargs) -> SignedUrl:
+        """``sign`` in a worker thread."""
+        return await asyncio.to_thread(self.sign, blob, expiry_minutes, **kwargs)
+
+    async def sign_many(
+        self,
+        blobs: Sequence[Any],
+        expiry_minutes: int,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Union[SignedUrl, BaseException]]:
+        """Sign several blobs concurrently (at most ``max_concurrency``).
+
+        With ``return_exceptions`` a failed item yields its exception
+        instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def sign_one(blob: Any) -> SignedUrl:
+            async with semaphore:
+                return await self.sign_async(blob, expiry_minutes, **kwargs)
+
+        return list(
+            await asyncio.gather(
+                *(sign_one(blob) for blob in blobs),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cache counters for this process."""
+        with self._lock:
+            lookups = self.hits + self.signed
+            return {
+                "entries": len(self._urls),
+                "hits": self.hits,
+                "signed": self.signed,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+    # ---- internals ----
+
+    def _cached(self, key: Tuple, expiry_minutes: int) -> Optional[SignedUrl]:
+        margin = min(self.margin_seconds, expiry_minutes * 30)
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if (expires_at - datetime.now(UTC)).total_seconds() <= margin:
+                del self._urls[key]
+                return None
+            self._urls.move_to_end(key)
+            self.hits += 1
+        return SignedUrl(url=url, expires_at=expires_at, cached=True)
+
+    def _access_token(self) -> Optional[str]:
+        with self._credentials_lock:
+            try:
+                if self._credentials is None:
+                    self._credentials, _ = default()
+                if not self._credentials.valid:
+                    self._credentials.refresh(Request())
+                return self._credentials.token
+            except Exception as e:
+                logger.warning(f"Failed to get access token for IAM signing: {e}")
+                self._credentials = None
+                return None
+
+
+_url_signer: Optional[UrlSigner] = None
+
+
+def get_url_signer() -> UrlSigner:
+    """Return the process-wide UrlSigner."""
+    global _url_signer
+    if _url_signer is None:
+        _url_signer = UrlSigner()
+    return _url_signer
+
+
+def reset_url_signer() -> None:
+    """Reset the singleton (test helper)."""
+    global _url_signer
+    _url_signer = None
+
+
+__all__ = ["SignedUrl", "UrlSigner", "get_url_signer", "reset_url_signer"]
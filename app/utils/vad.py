@@ -0,0 +1,119 @@
+"""
+Energy-based voice activity detection for splitting long audio.
+
+Long recordings are transcribed as several chunks in parallel (see
+``app.services.chunked_transcription``). Cutting mid-word hurts accuracy, so
+chunk boundaries are placed in pauses:
+
+    1. ``frame_energies`` downmixes to 8 kHz mono and measures the RMS of
+       every ``FRAME_MS`` frame;
+    2. frames at or below ``silence_threshold`` (a multiple of the
+       recording's noise floor) count as silence;
+    3. ``plan_chunks`` walks the recording and, once a chunk has reached
+       ``target_ms``, cuts in the middle of the longest pause before
+       ``max_ms``; with no pause long enough it cuts at the quietest frame.
+
+CPU-only and dependency-free beyond pydub; an hour of audio takes a few
+seconds.
+
+Usage:
+    energies = frame_energies(audio)
+    spans = plan_chunks(energies, len(audio), target_ms=120_000, max_ms=180_000)
+    chunks = [audio[start:end] for start, end in spans]
+"""
+
+from typing import List, Sequence, Tuple
+
+from pydub import AudioSegment
+
+FRAME_MS = 30
+ANALYSIS_FRAME_RATE = 8000
+# Frames up to this multiple of the noise floor count as silence (~6 dB).
+SILENCE_RATIO = 2.0
+# Absolute floor so digital silence (RMS 0) still yields a usable threshold.
+MIN_SILENCE_RMS = 50
+# Pauses shorter than this are not preferred as cut points.
+MIN_SILENCE_MS = 300
+NOISE_FLOOR_PERCENTILE = 0.1
+
+
+def frame_energies(audio: AudioSegment, frame_ms: int = FRAME_MS) -> List[int]:
+    """RMS energy of each ``frame_ms`` frame of ``audio`` (blocking)."""
+    analysis = audio.set_channels(1).set_frame_rate(ANALYSIS_FRAME_RATE)
+    return [
+        analysis[position : position + frame_ms].rms  # noqa: E203
+        for position in range(0, len(analysis), frame_ms)
+    ]
+
+
+def silence_threshold(energies: Sequence[int]) -> float:
+    """RMS at or below which a frame is treated as silence."""
+    if not energies:
+        return MIN_SILENCE_RMS
+    ordered = sorted(energies)
+    noise_floor = ordered[int(NOISE_FLOOR_PERCENTILE * (len(ordered) - 1))]
+    return max(noise_floor * SILENCE_RATIO, MIN_SILENCE_RMS)
+
+
+def plan_chunks(
+    energies: Sequence[int],
+    duration_ms: int,
+    target_ms: int,
+    max_ms: int,
+    frame_ms: int = FRAME_MS,
+    min_silence_ms: int = MIN_SILENCE_MS,
+) -> List[Tuple[int, int]]:
+    """Split ``duration_ms`` of audio into ``(start_ms, end_ms)`` spans.
+
+    Every span except the last is between ``target_ms`` and ``max_ms`` long;
+    the last is at most ``max_ms``. Spans are contiguous and cover the whole
+    recording.
+    """
+    if max_ms < target_ms:
+        raise ValueError("max_ms must be at least target_ms")
+    threshold = silence_threshold(energies)
+    silent = [energy <= threshold for energy in energies]
+    min_run = max(min_silence_ms // frame_ms, 1)
+
+    spans: List[Tuple[int, int]] = []
+    start = 0
+    while duration_ms - start > max_ms:
+        low = (start + target_ms) // frame_ms
+        high = min((start + max_ms) // frame_ms, len(energies))
+        cut_frame = _best_cut(energies, silent, low, high, min_run)
+        cut = min(max(cut_frame * frame_ms, start + frame_ms), start + max_ms)
+        spans.append((start, cut))
+        start = cut
+    spans.append((start, duration_ms))
+    return spans
+
+
+def _best_cut(
+    energies: Sequence[int],
+    silent: Sequence[bool],
+    low: int,
+    high: int,
+    min_run: int,
+) -> int:
+    """Frame index to cut at within ``[low, high)``."""
+    if low >= high:
+        return low
+    best_start, best_length = -1, 0
+    run_start = None
+    for index in range(low, high + 1):
+        if index < high and silent[index]:
+            if run_start is None:
+                run_start = index
+            continue
+        if run_start is not None:
+            length = index - run_start
+            if length > best_length:
+                best_start, best_length = run_start, length
+            run_start = None
+    if best_length >= min_run:
+        return best_start + best_length // 2
+    window = energies[low:high]
+    return low + min(range(len(window)), key=window.__getitem__)
+
+
+__all__ = ["frame_energies", "plan_chunks", "silence_threshold"]
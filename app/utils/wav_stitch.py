@@ -0,0 +1,151 @@
+"""
+Joining PCM WAV clips with short crossfades.
+
+Long texts are synthesized as separate chunks (see
+``app.services.chunked_speech``); butting the clips together can click at
+the seams. ``Crossfader`` overlaps the end of each clip with the start of the
+next over ``crossfade_ms`` with a linear fade. It works incrementally, holding
+back only the overlap, so stitched audio can be streamed as chunks arrive:
+
+    fader = Crossfader(fmt, crossfade_ms=40)
+    yield wav_header(fmt)              # unknown length, for streaming
+    for clip in clips:
+        yield fader.feed(read_wav(clip)[1])
+    yield fader.flush()
+
+Only 16-bit PCM is faded; other sample widths are concatenated as-is.
+Standard library only.
+"""
+
+import io
+import struct
+import sys
+import wave
+from array import array
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+# RIFF/data size used in streamed headers, whose length is not known yet.
+STREAMING_SIZE = 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class WavFormat:
+    """PCM layout shared by every clip being stitched."""
+
+    channels: int
+    sample_width: int
+    frame_rate: int
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    def duration_seconds(self, pcm_bytes: int) -> float:
+        return pcm_bytes / self.frame_size / self.frame_rate
+
+
+def read_wav(data: bytes) -> Tuple[WavFormat, bytes]:
+    """Format and PCM frames of a WAV file.
+
+    Raises:
+        wave.Error: If ``data`` is not a PCM WAV file.
+    """
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        fmt = WavFormat(wav.getnchannels(), wav.getsampwidth(), wav.getframerate())
+        return fmt, wav.readframes(wav.getnframes())
+
+
+def wav_header(fmt: WavFormat, data_size: int = STREAMING_SIZE) -> bytes:
+    """44-byte PCM WAV header; the default size marks a streamed file."""
+    riff_size = STREAMING_SIZE if data_size == STREAMING_SIZE else 36 + data_size
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        riff_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        fmt.channels,
+        fmt.frame_rate,
+        fmt.frame_rate * fmt.frame_size,
+        fmt.frame_size,
+        fmt.sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+class Crossfader:
+    """Incrementally joins PCM clips, fading each seam over a short overlap."""
+
+    def __init__(self, fmt: WavFormat, crossfade_ms: float) -> None:
+        self.format = fmt
+        frames = int(fmt.frame_rate * crossfade_ms / 1000)
+        self._overlap = frames * fmt.frame_size if fmt.sample_width == 2 else 0
+        self._tail = b""
+
+    def feed(self, pcm: bytes) -> bytes:
+        """Add the next clip; returns the audio that is now final."""
+        pcm = pcm[: len(pcm) - len(pcm) % self.format.frame_size]
+        out = b""
+        if self._tail:
+            k = min(len(self._tail), len(pcm))
+            out = self._tail[: len(self._tail) - k]
+            # A clip shorter than the overlap is faded in as a whole and
+            # stays held back for the next seam.
+            seam = self._tail[len(self._tail) - k :]  # noqa: E203
+            pcm = _mix(seam, pcm[:k]) + pcm[k:]
+        keep = min(self._overlap, len(pcm))
+        self._tail = pcm[len(pcm) - keep :]  # noqa: E203
+        return out + pcm[: len(pcm) - keep]
+
+    def flush(self) -> bytes:
+        """The held-back end of the last clip."""
+        tail, self._tail = self._tail, b""
+        return tail
+
+
+def stitch(clips: Sequence[bytes], crossfade_ms: float) -> Tuple[WavFormat, bytes]:
+    """Join WAV clips into one WAV file.
+
+    Raises:
+        ValueError: If the clips do not share one PCM format.
+    """
+    fader = None
+    pcm = bytearray()
+    for clip in clips:
+        fmt, frames = read_wav(clip)
+        if fader is None:
+            fader = Crossfader(fmt, crossfade_ms)
+        elif fmt != fader.format:
+            raise ValueError(f"clip format {fmt} differs from {fader.format}")
+        pcm += fader.feed(frames)
+    if fader is None:
+        raise ValueError("no clips to stitch")
+    pcm += fader.flush()
+    return fader.format, wav_header(fader.format, len(pcm)) + bytes(pcm)
+
+
+def _mix(out_going: bytes, in_coming: bytes) -> bytes:
+    """Linear crossfade of two equal-length 16-bit PCM buffers."""
+    a = array("h", out_going)
+    b = array("h", in_coming)
+    if sys.byteorder == "big":
+        a.byteswap()
+        b.byteswap()
+    n = len(a)
+    mixed = array(
+        "h",
+        (
+            max(-32768, min(32767, int(a[i] + (b[i] - a[i]) * (i + 1) / (n + 1))))
+            for i in range(n)
+        ),
+    )
+    if sys.byteorder == "big":
+        mixed.byteswap()
+    return mixed.tobytes()
+
+
+__all__ = ["Crossfader", "WavFormat", "read_wav", "stitch", "wav_header"]
@@ -0,0 +1,114 @@
+"""Benchmark SSE framing for /tasks/chat/completions streams.
+
+Streams a synthetic Sunflower completion through ``_event_stream`` behind a
+Starlette ``StreamingResponse`` (the same path the chat router uses) and an
+in-process httpx ASGI client, then reports:
+
+* CPU time per streamed token (process CPU, server and client together),
+* end-to-end throughput in tokens per second, and
+* the number of SSE frames written.
+
+Each configuration is run with and without a coalescing window so the effect
+of ``CHAT_STREAM_COALESCE_MS`` can be compared on the same machine.
+
+Usage:
+    SECRET_KEY=x python scripts/bench_chat_stream.py --tokens 20000
+    SECRET_KEY=x python scripts/bench_chat_stream.py --token-interval-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.routers.chat import _event_stream  # noqa: E402
+
+WORDS = ("Oli ", "otya", "? ", "Webale ", "nnyo", ", ", "ssebo", ". ")
+
+
+def _deltas(tokens: int, interval: float):
+    for i in range(tokens):
+        if interval:
+            time.sleep(interval)
+        yield {"type": "delta", "content": WORDS[i % len(WORDS)]}
+    yield {
+        "type": "usage",
+        "usage": {"prompt_tokens": 10, "completion_tokens": tokens},
+    }
+
+
+def _app(tokens: int, interval: float, coalesce_ms: int, coalesce_chars: int):
+    async def stream(request):
+        gen = _deltas(tokens, interval)
+        return StreamingResponse(
+            _event_stream(
+                "chatcmpl-bench",
+                int(time.time()),
+                "Sunbird/Sunflower-14B",
+                next(gen),
+                gen,
+                [],
+                coalesce_ms=coalesce_ms,
+                coalesce_chars=coalesce_chars,
+            ),
+            media_type="text/event-stream",
+        )
+
+    return Starlette(routes=[Route("/stream", stream)])
+
+
+async def _run(tokens, interval, coalesce_ms, coalesce_chars):
+    app = _app(tokens, interval, coalesce_ms, coalesce_chars)
+    transport = httpx.ASGITransport(app=app)
+    frames = 0
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        async with c.stream("GET", "/stream") as response:
+            async for chunk in response.aiter_bytes():
+                frames += chunk.count(b"data: ")
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+    return cpu, wall, frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=10_000)
+    parser.add_argument(
+        "--token-interval-ms",
+        type=float,
+        default=0.0,
+        help="Simulated upstream delay between deltas (0 = as fast as possible).",
+    )
+    parser.add_argument("--coalesce-ms", type=int, default=20)
+    parser.add_argument("--coalesce-chars", type=int, default=256)
+    args = parser.parse_args()
+
+    interval = args.token_interval_ms / 1000.0
+    print(
+        f"{args.tokens} tokens, {args.token_interval_ms}ms between deltas\n"
+        f"{'mode':<26}{'frames':>8}{'CPU us/token':>14}{'tokens/s':>12}"
+    )
+    for label, window in (
+        ("per-delta", 0),
+        (f"coalesce {args.coalesce_ms}ms/{args.coalesce_chars}ch", args.coalesce_ms),
+    ):
+        cpu, wall, frames = asyncio.run(
+            _run(args.tokens, interval, window, args.coalesce_chars)
+        )
+        print(
+            f"{label:<26}{frames:>8}{cpu / args.tokens * 1e6:>14.1f}"
+            f"{args.tokens / wall:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()